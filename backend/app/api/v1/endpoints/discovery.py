@@ -5,12 +5,23 @@ Fetches real parcel geometries from Regrid's MVT vector tiles.
 Tiles are free (unlimited), only record queries count against quota.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
+from uuid import UUID
 import logging
 
+from app.db.base import get_db
 from app.core.arcgis_parcel_service import get_parcel_discovery_service, DiscoveryParcel
+from app.core.config import settings
+from app.core.dependencies import get_current_user_id
+from app.core.discovery_orchestrator import discovery_orchestrator
+from app.core.progress_bus import progress_bus, SSE_HEADERS
+from app.core.job_queue import job_queue, QueueFullError
+from app.models.background_job import BackgroundJob
+from app.schemas.discovery import DiscoveryJobRequest, DiscoveryJobResponse, DiscoveryStep
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +70,7 @@ async def query_parcels(request: DiscoveryQueryRequest):
         limit: Maximum number of parcels to return (default 500)
     """
     try:
-        logger.info(f"🔍 Discovery query: min_acres={request.min_acres}, max_acres={request.max_acres}, limit={request.limit}")
+        logger.info("🔍 Discovery query: min_acres=%s, max_acres=%s, limit=%s", request.min_acres, request.max_acres, request.limit)
         
         # Validate geometry
         geom_type = request.geometry.get("type")
@@ -78,7 +89,7 @@ async def query_parcels(request: DiscoveryQueryRequest):
             limit=request.limit,
         )
         
-        logger.info(f"✅ Found {len(parcels)} parcels")
+        logger.info("✅ Found %s parcels", len(parcels))
         
         # Convert to response format
         parcel_responses = [
@@ -104,7 +115,7 @@ async def query_parcels(request: DiscoveryQueryRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Discovery query error: {e}", exc_info=True)
+        logger.error("Discovery query error: %s", e, exc_info=True)
         return DiscoveryQueryResponse(
             success=False,
             parcels=[],
@@ -116,6 +127,7 @@ async def query_parcels(request: DiscoveryQueryRequest):
 class ProcessParcelsRequest(BaseModel):
     """Request to process selected parcels"""
     parcels: List[ParcelResponse]
+    scoring_prompt: Optional[str] = None  # Defaults to the user's default scoring prompt
 
 
 class ProcessParcelsResponse(BaseModel):
@@ -125,36 +137,161 @@ class ProcessParcelsResponse(BaseModel):
     job_id: Optional[str] = None
 
 
+def _bus_follows_jobs() -> bool:
+    """Whether queued jobs' progress events reach this process's bus (Redis, or an in-process worker)."""
+    return progress_bus.shared or settings.JOB_WORKER_IN_PROCESS
+
+
+async def _enqueue(db: Session, user_id: UUID, kind: str, payload: Dict[str, Any], size: int) -> BackgroundJob:
+    """Queue a job and open its progress channel so clients can subscribe right away."""
+    try:
+        job = job_queue.enqueue(db, user_id, kind, payload, size)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    # Otherwise no worker would ever finish the channel; events are streamed from the job row
+    if _bus_follows_jobs():
+        await progress_bus.publish(
+            discovery_orchestrator.progress_channel(user_id, job.id),
+            {"type": "queued", "message": "Waiting for a worker", "job_id": str(job.id)},
+        )
+    return job
+
+
 @router.post("/process", response_model=ProcessParcelsResponse)
-async def process_parcels(request: ProcessParcelsRequest):
+async def process_parcels(
+    request: ProcessParcelsRequest,
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
     """
     Process selected parcels for lead enrichment.
     
-    This endpoint queues the parcels for LLM enrichment to find contact information.
+    Queues a job that saves the parcels as properties and runs imagery,
+    scoring and enrichment on each. Follow it with
+    GET /discover/jobs/{job_id}/events or poll GET /discover/jobs/{job_id}.
     
     Args:
         parcels: List of parcels to process
     """
-    try:
-        logger.info(f"📋 Processing {len(request.parcels)} parcels for enrichment")
-        
-        if not request.parcels:
-            raise HTTPException(status_code=400, detail="No parcels provided")
-        
-        # TODO: Queue parcels for LLM enrichment
-        # For now, return a placeholder response
-        
-        return ProcessParcelsResponse(
-            success=True,
-            message=f"Queued {len(request.parcels)} parcels for enrichment",
-            job_id="pending_implementation",
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Process parcels error: {e}", exc_info=True)
-        return ProcessParcelsResponse(
-            success=False,
-            message=str(e),
+    logger.info("📋 Processing %s parcels for enrichment", len(request.parcels))
+    
+    if not request.parcels:
+        raise HTTPException(status_code=400, detail="No parcels provided")
+    
+    job = await _enqueue(
+        db,
+        current_user_id,
+        "process_parcels",
+        {
+            "parcels": [parcel.model_dump() for parcel in request.parcels],
+            "scoring_prompt": request.scoring_prompt,
+        },
+        size=len(request.parcels),
+    )
+    
+    return ProcessParcelsResponse(
+        success=True,
+        message=f"Queued {len(request.parcels)} parcels for enrichment",
+        job_id=str(job.id),
+    )
+
+
+@router.post("/jobs", response_model=DiscoveryJobResponse)
+async def create_discovery_job(
+    request: DiscoveryJobRequest,
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    """
+    Queue a discovery run over an area.
+    
+    Runs in a worker process; small runs (max_lots up to
+    JOB_INTERACTIVE_MAX_ITEMS) go ahead of large batch runs.
+    """
+    job = await _enqueue(
+        db,
+        current_user_id,
+        "discovery",
+        request.model_dump(mode="json"),
+        size=request.filters.max_lots,
+    )
+    
+    return DiscoveryJobResponse(
+        job_id=job.id,
+        status=DiscoveryStep.QUEUED,
+        message=f"Queued {request.mode.value} discovery",
+    )
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(
+    job_id: UUID,
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    """Status, queue position, latest progress event and result of a queued job."""
+    job = job_queue.get(db, job_id, current_user_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_queue.to_dict(job, job_queue.queue_position(db, job))
+
+
+@router.post("/jobs/{job_id}/cancel")
+async def cancel_job(
+    job_id: UUID,
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    """Cancel a queued job, or ask the worker running it to stop."""
+    job = job_queue.get(db, job_id, current_user_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status not in ("queued", "running"):
+        raise HTTPException(status_code=409, detail=f"Job already {job.status}")
+    
+    if job_queue.cancel(db, job) and _bus_follows_jobs():
+        # No worker will touch it - end its stream here
+        channel = discovery_orchestrator.progress_channel(current_user_id, job.id)
+        await progress_bus.publish(channel, {"type": "cancelled", "message": "Job cancelled"})
+        await progress_bus.finish(channel)
+    
+    return job_queue.to_dict(job)
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(
+    job_id: UUID,
+    current_user_id: UUID = Depends(get_current_user_id),
+    last_event_id: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Follow a discovery job's progress as Server-Sent Events.
+    
+    Works from any worker when the progress bus uses Redis. Reconnecting
+    clients send Last-Event-ID and get the events they missed, then live
+    events until the job completes. A comment heartbeat is sent while the
+    job is idle.
+    
+    With the in-process bus and a separate worker process, the stream follows
+    the job row instead: the latest progress event as of each worker
+    heartbeat, ending when the job finishes.
+    """
+    if not _bus_follows_jobs():
+        if not job_queue.get(db, job_id, current_user_id):
+            raise HTTPException(status_code=404, detail="Job not found")
+        return StreamingResponse(
+            job_queue.stream_events(job_id),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
         )
+    
+    channel = discovery_orchestrator.progress_channel(current_user_id, job_id)
+    if not await progress_bus.exists(channel):
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    
+    return StreamingResponse(
+        progress_bus.stream(channel, last_event_id),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
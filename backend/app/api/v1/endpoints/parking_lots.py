@@ -23,7 +23,7 @@ from app.schemas.parking_lot import (
     Coordinates,
     BusinessSummary,
 )
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_current_user_id
 
 router = APIRouter()
 
@@ -266,7 +266,7 @@ def get_parking_lots_for_map(
     max_lng: Optional[float] = Query(None),
     max_condition_score: Optional[float] = Query(None),
     has_business: Optional[bool] = Query(None),
-    current_user: User = Depends(get_current_user),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """
@@ -278,7 +278,7 @@ def get_parking_lots_for_map(
     # Base query with eager loading - single query for all data
     query = (
         db.query(ParkingLot)
-        .filter(ParkingLot.user_id == current_user.id)
+        .filter(ParkingLot.user_id == current_user_id)
         .options(
             selectinload(ParkingLot.business_associations)
             .joinedload(ParkingLotBusinessAssociation.business)
@@ -434,16 +434,16 @@ def get_parking_lot(
         # Debug logging
         import logging
         logger = logging.getLogger(__name__)
-        logger.info(f"📸 PropertyAnalysis found for {parking_lot_id}")
-        logger.info(f"   analysis_type: {property_analysis.analysis_type}")
-        logger.info(f"   total_tiles: {property_analysis.total_tiles}")
-        logger.info(f"   🔥 DB VALUES:")
-        logger.info(f"      total_asphalt_area_sqft: {property_analysis.total_asphalt_area_sqft}")
-        logger.info(f"      total_paved_area_sqft: {property_analysis.total_paved_area_sqft}")
-        logger.info(f"      private_asphalt_area_sqft: {property_analysis.private_asphalt_area_sqft}")
-        logger.info(f"      private_asphalt_geojson: {type(property_analysis.private_asphalt_geojson)} - {bool(property_analysis.private_asphalt_geojson)}")
-        logger.info(f"      surfaces_geojson: {type(property_analysis.surfaces_geojson)} - {bool(property_analysis.surfaces_geojson)}")
-        logger.info(f"   condition_score: {property_analysis.weighted_condition_score}")
+        logger.info("📸 PropertyAnalysis found for %s", parking_lot_id)
+        logger.info("   analysis_type: %s", property_analysis.analysis_type)
+        logger.info("   total_tiles: %s", property_analysis.total_tiles)
+        logger.info("   🔥 DB VALUES:")
+        logger.info("      total_asphalt_area_sqft: %s", property_analysis.total_asphalt_area_sqft)
+        logger.info("      total_paved_area_sqft: %s", property_analysis.total_paved_area_sqft)
+        logger.info("      private_asphalt_area_sqft: %s", property_analysis.private_asphalt_area_sqft)
+        logger.info("      private_asphalt_geojson: %s - %s", type(property_analysis.private_asphalt_geojson), bool(property_analysis.private_asphalt_geojson))
+        logger.info("      surfaces_geojson: %s - %s", type(property_analysis.surfaces_geojson), bool(property_analysis.surfaces_geojson))
+        logger.info("   condition_score: %s", property_analysis.weighted_condition_score)
         
         # Build property boundary info if available
         property_boundary_info = None
@@ -468,11 +468,11 @@ def get_parking_lot(
         # Get tiles if this is a tiled analysis (WITHOUT images for performance)
         tiles_data = []
         if property_analysis.analysis_type == "tiled":
-            logger.info(f"   🔍 Querying tiles for analysis: {property_analysis.id}")
+            logger.info("   🔍 Querying tiles for analysis: %s", property_analysis.id)
             tiles = db.query(AnalysisTile).filter(
                 AnalysisTile.property_analysis_id == property_analysis.id
             ).order_by(AnalysisTile.tile_index).all()
-            logger.info(f"   📊 Found {len(tiles)} tiles in database")
+            logger.info("   📊 Found %s tiles in database", len(tiles))
             
             for tile in tiles:
                 tiles_data.append({
@@ -592,11 +592,11 @@ def get_parking_lot(
     else:
         import logging
         logger = logging.getLogger(__name__)
-        logger.info(f"📸 No PropertyAnalysis found for {parking_lot_id}")
+        logger.info("📸 No PropertyAnalysis found for %s", parking_lot_id)
         
         # Fallback: Create property_analysis-like structure from ParkingLot's Regrid data
         if lot.regrid_parcel_id:
-            logger.info(f"   📦 Using Regrid data from ParkingLot model")
+            logger.info("   📦 Using Regrid data from ParkingLot model")
             
             # Build property boundary from Regrid polygon
             regrid_polygon_geojson = None
@@ -609,7 +609,7 @@ def get_parking_lot(
                             "coordinates": [list(regrid_geom.exterior.coords)]
                         }
                 except Exception as e:
-                    logger.warning(f"   Failed to convert Regrid polygon: {e}")
+                    logger.warning("   Failed to convert Regrid polygon: %s", e)
             
             response["property_analysis"] = {
                 "id": None,
@@ -695,7 +695,7 @@ def get_parking_lot_businesses(
 @router.get("/tiles/{tile_id}/image")
 def get_tile_image(
     tile_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """
@@ -712,7 +712,7 @@ def get_tile_image(
     # Verify user owns this tile's analysis
     analysis = db.query(PropertyAnalysis).filter(
         PropertyAnalysis.id == tile.property_analysis_id,
-        PropertyAnalysis.user_id == current_user.id
+        PropertyAnalysis.user_id == current_user_id
     ).first()
     
     if not analysis:
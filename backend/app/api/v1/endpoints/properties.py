@@ -1,7 +1,7 @@
 """
 Properties API - Renamed from parking_lots but keeps same URL structure for frontend compatibility.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Header
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, selectinload, joinedload
 from sqlalchemy import func
@@ -10,23 +10,22 @@ from uuid import UUID
 from geoalchemy2.shape import to_shape
 from pydantic import BaseModel
 from shapely.geometry import mapping
-import asyncio
 
-from app.db.base import get_db
+from app.db.base import get_db, SessionLocal
 from app.models.property import Property
 from app.models.property_business import PropertyBusiness
 from app.models.business import Business
 from app.models.user import User
 from app.models.scoring_prompt import ScoringPrompt
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_current_user_id
+from app.core.progress_bus import progress_bus, SSE_HEADERS
 from app.core.property_imagery_pipeline import property_imagery_pipeline
 from app.core.regrid_service import regrid_service
 from app.core.usage_tracking_service import usage_tracking_service
-from app.core.vlm_analysis_service import vlm_analysis_service
 from app.core.apollo_enrichment_service import apollo_enrichment_service
 from app.core.lead_enrichment_service import lead_enrichment_service
 from app.core.llm_enrichment_service import llm_enrichment_service, EnrichmentStep
-from app.core.property_classifier import classify_property
+from app.core.parcel_processing import stream_parcel_processing
 from geoalchemy2.shape import from_shape
 import json
 from shapely.geometry import Point
@@ -50,6 +49,7 @@ class AnalyzePropertyRequest(BaseModel):
     """Request to analyze a property with VLM."""
     scoring_prompt_id: Optional[str] = None  # ID of saved prompt, or None to use custom
     custom_prompt: Optional[str] = None  # Custom prompt text
+    bypass_cache: bool = False  # Re-run the VLM even if a cached score exists
 
 
 class RegridLookupResponse(BaseModel):
@@ -220,13 +220,13 @@ def get_properties_for_map(
     bounds_sw_lng: Optional[float] = Query(None),
     bounds_ne_lat: Optional[float] = Query(None),
     bounds_ne_lng: Optional[float] = Query(None),
-    current_user: User = Depends(get_current_user),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Get properties as GeoJSON for map display."""
     query = (
         db.query(Property)
-        .filter(Property.user_id == current_user.id)
+        .filter(Property.user_id == current_user_id)
         .options(
             selectinload(Property.businesses)
             .joinedload(PropertyBusiness.business)
@@ -625,375 +625,6 @@ async def preview_property_at_location(
     return response
 
 
-async def _process_parcel_stream(
-    property_id: UUID,
-    user_id: UUID,
-    scoring_prompt: Optional[str],
-    user_api_key: Optional[str],
-    db: Session,
-) -> AsyncGenerator[str, None]:
-    """
-    Stream parcel processing: Regrid → VLM → LLM Enrichment
-    Yields SSE-formatted progress messages.
-    """
-    start_time = datetime.utcnow()
-    total_cost = 0.0
-    total_tokens = 0
-    
-    def sse_message(data: dict) -> str:
-        return f"data: {json.dumps(data)}\n\n"
-    
-    # Get property
-    prop = db.query(Property).filter(Property.id == property_id).first()
-    if not prop:
-        yield sse_message({"type": "error", "message": "Property not found"})
-        return
-    
-    short_address = (prop.address or "Unknown")[:40]
-    
-    # ============================================================
-    # STEP 1: REGRID DATA - Fetch/update all fields including LBCS
-    # ============================================================
-    yield sse_message({
-        "type": "started",
-        "message": f"Processing: {short_address}",
-        "details": "Fetching property records"
-    })
-    await asyncio.sleep(0.05)
-    
-    # Check if we need to fetch Regrid data
-    if not prop.regrid_id or not prop.lbcs_structure:
-        yield sse_message({
-            "type": "regrid",
-            "message": "Querying Regrid for parcel data",
-        })
-        await asyncio.sleep(0.05)
-        
-        try:
-            centroid = to_shape(prop.centroid)
-            parcel = await regrid_service.get_parcel_by_coordinates(centroid.y, centroid.x)
-            
-            if parcel:
-                # Store ALL Regrid fields (same as discovery flow)
-                prop.regrid_id = parcel.parcel_id
-                prop.regrid_apn = parcel.apn
-                prop.regrid_owner = parcel.owner
-                prop.regrid_owner2 = parcel.owner2
-                prop.regrid_owner_type = parcel.owner_type
-                prop.regrid_owner_address = parcel.mail_address
-                prop.regrid_owner_city = parcel.mail_city
-                prop.regrid_owner_state = parcel.mail_state
-                prop.regrid_land_use = parcel.land_use
-                prop.regrid_zoning = parcel.zoning
-                prop.regrid_zoning_desc = parcel.zoning_description
-                prop.regrid_year_built = str(parcel.year_built) if parcel.year_built else None
-                prop.regrid_area_acres = parcel.area_acres
-                prop.regrid_num_units = parcel.num_units
-                prop.regrid_num_stories = parcel.num_stories
-                prop.regrid_struct_style = parcel.struct_style
-                
-                # LBCS codes (critical for classification)
-                prop.lbcs_structure = parcel.lbcs_structure
-                prop.lbcs_structure_desc = parcel.lbcs_structure_desc
-                prop.lbcs_activity = parcel.lbcs_activity
-                prop.lbcs_function = parcel.lbcs_function
-                prop.lbcs_ownership = parcel.lbcs_ownership
-                prop.lbcs_site = parcel.lbcs_site
-                
-                # Store polygon if available
-                if parcel.polygon:
-                    try:
-                        prop.polygon = from_shape(parcel.polygon, srid=4326)
-                    except Exception:
-                        pass
-                
-                yield sse_message({
-                    "type": "regrid_complete",
-                    "message": f"Found: {parcel.owner or 'Unknown owner'}",
-                    "details": f"LBCS: {parcel.lbcs_structure or 'N/A'}"
-                })
-                await asyncio.sleep(0.05)
-            else:
-                yield sse_message({
-                    "type": "regrid_warning",
-                    "message": "No Regrid parcel found at location",
-                })
-                await asyncio.sleep(0.05)
-                
-        except Exception as e:
-            logger.error(f"[ProcessParcel] Regrid error: {e}")
-            yield sse_message({
-                "type": "regrid_error",
-                "message": f"Regrid lookup failed: {str(e)[:50]}",
-            })
-    else:
-        yield sse_message({
-            "type": "regrid_complete",
-            "message": f"Using existing: {prop.regrid_owner or 'Unknown owner'}",
-            "details": f"LBCS: {prop.lbcs_structure or 'N/A'}"
-        })
-        await asyncio.sleep(0.05)
-    
-    # ============================================================
-    # STEP 2: CLASSIFY PROPERTY - Using LBCS codes
-    # ============================================================
-    yield sse_message({
-        "type": "classifying",
-        "message": "Classifying property type",
-    })
-    await asyncio.sleep(0.05)
-    
-    classification = classify_property(
-        usecode=prop.regrid_land_use or "",
-        usedesc=prop.regrid_land_use or "",
-        zoning=prop.regrid_zoning or "",
-        lbcs_structure=prop.lbcs_structure,
-        lbcs_activity=prop.lbcs_activity,
-    )
-    prop.property_category = classification.value
-    
-    category_display = classification.value.replace("_", " ").title()
-    yield sse_message({
-        "type": "classified",
-        "message": f"Property type: {category_display}",
-        "category": classification.value
-    })
-    await asyncio.sleep(0.05)
-    
-    # ============================================================
-    # STEP 3: SATELLITE IMAGERY
-    # ============================================================
-    if not prop.satellite_image_base64:
-        yield sse_message({
-            "type": "imagery",
-            "message": "Capturing satellite view",
-        })
-        await asyncio.sleep(0.05)
-        
-        try:
-            # Use polygon if available, otherwise centroid
-            if prop.polygon:
-                polygon = to_shape(prop.polygon)
-                imagery_result = await property_imagery_pipeline.get_property_image(
-                    polygon,
-                    address=prop.address
-                )
-            else:
-                centroid = to_shape(prop.centroid)
-                imagery_result = await property_imagery_pipeline.get_property_image(
-                    lat=centroid.y,
-                    lng=centroid.x,
-                    address=prop.address
-                )
-            
-            if imagery_result and imagery_result.success:
-                prop.satellite_image_base64 = imagery_result.image_base64
-                metadata = imagery_result.metadata or {}
-                prop.satellite_zoom = metadata.get("zoom_level")
-                if metadata.get("area_m2"):
-                    prop.area_m2 = metadata["area_m2"]
-                    prop.area_sqft = metadata["area_m2"] * 10.764
-                prop.status = "imagery_captured"
-                
-                yield sse_message({
-                    "type": "imagery_complete",
-                    "message": "Satellite imagery captured",
-                    "zoom": metadata.get("zoom_level")
-                })
-                await asyncio.sleep(0.05)
-            else:
-                yield sse_message({
-                    "type": "imagery_error",
-                    "message": "Failed to capture imagery"
-                })
-                await asyncio.sleep(0.05)
-                
-        except Exception as e:
-            logger.error(f"[ProcessParcel] Imagery error: {e}")
-            yield sse_message({
-                "type": "imagery_error",
-                "message": f"Imagery failed: {str(e)[:50]}"
-            })
-    else:
-        yield sse_message({
-            "type": "imagery_complete",
-            "message": "Using existing satellite imagery",
-        })
-        await asyncio.sleep(0.05)
-    
-    # ============================================================
-    # STEP 4: VLM ANALYSIS
-    # ============================================================
-    if prop.satellite_image_base64:
-        yield sse_message({
-            "type": "analyzing",
-            "message": "AI analyzing property",
-        })
-        await asyncio.sleep(0.05)
-        
-        try:
-            property_context = {
-                "address": prop.address,
-                "area_sqft": (float(prop.regrid_area_acres) * 43560) if prop.regrid_area_acres else None,
-                "property_type": classification.value,
-                "owner": prop.regrid_owner,
-            }
-            
-            vlm_result = await vlm_analysis_service.analyze_property(
-                image_base64=prop.satellite_image_base64,
-                property_context=property_context,
-                scoring_prompt=scoring_prompt,
-                user_api_key=user_api_key,
-            )
-            
-            if vlm_result and vlm_result.success:
-                prop.lead_score = vlm_result.lead_score
-                prop.lead_confidence = vlm_result.confidence
-                prop.analysis_notes = vlm_result.reasoning
-                prop.lead_quality = (
-                    'high' if vlm_result.lead_score >= 70
-                    else 'medium' if vlm_result.lead_score >= 40
-                    else 'low'
-                )
-                prop.analyzed_at = datetime.utcnow()
-                prop.status = "analyzed"
-                
-                if vlm_result.usage:
-                    total_cost += vlm_result.usage.cost or 0
-                    total_tokens += vlm_result.usage.total_tokens or 0
-                
-                # Store observations if available
-                if vlm_result.observations:
-                    prop.paved_percentage = vlm_result.observations.paved_area_pct
-                    prop.building_percentage = vlm_result.observations.building_pct
-                    prop.landscaping_percentage = vlm_result.observations.landscaping_pct
-                
-                score = vlm_result.lead_score or 0
-                score_label = "High" if score >= 70 else "Medium" if score >= 40 else "Low"
-                
-                yield sse_message({
-                    "type": "scoring",
-                    "message": f"Lead score: {score}/100 ({score_label})",
-                    "score": score,
-                    "reasoning": vlm_result.reasoning[:100] if vlm_result.reasoning else None
-                })
-                await asyncio.sleep(0.05)
-            else:
-                yield sse_message({
-                    "type": "analyzing_error",
-                    "message": f"VLM analysis failed: {vlm_result.error_message if vlm_result else 'Unknown error'}"
-                })
-                
-        except Exception as e:
-            logger.error(f"[ProcessParcel] VLM error: {e}")
-            yield sse_message({
-                "type": "analyzing_error",
-                "message": f"Analysis failed: {str(e)[:50]}"
-            })
-    
-    # ============================================================
-    # STEP 5: LLM ENRICHMENT - Find decision-maker contact
-    # ============================================================
-    if prop.lead_score is not None:
-        yield sse_message({
-            "type": "enriching",
-            "message": "Finding property manager",
-            "details": f"Strategy based on {category_display}"
-        })
-        await asyncio.sleep(0.05)
-        
-        try:
-            enrichment_result = await llm_enrichment_service.enrich(
-                address=prop.address or "",
-                property_type=classification.value,
-                owner_name=prop.regrid_owner,
-                lbcs_code=int(prop.lbcs_structure) if prop.lbcs_structure else None,
-            )
-            
-            # Always store enrichment steps
-            if enrichment_result.detailed_steps:
-                prop.enrichment_steps = json.dumps([
-                    step.to_dict() for step in enrichment_result.detailed_steps
-                ])
-            
-            if enrichment_result.success and enrichment_result.contact:
-                contact = enrichment_result.contact
-                prop.contact_name = contact.name
-                prop.contact_first_name = contact.first_name
-                prop.contact_last_name = contact.last_name
-                prop.contact_email = contact.email
-                prop.contact_phone = contact.phone
-                prop.contact_title = contact.title
-                prop.contact_company = enrichment_result.management_company
-                prop.contact_company_website = enrichment_result.management_website
-                prop.enrichment_source = "llm_enrichment"
-                prop.enrichment_status = "success"
-                prop.enrichment_confidence = enrichment_result.confidence
-                prop.enriched_at = datetime.utcnow()
-                
-                total_tokens += enrichment_result.tokens_used
-                
-                phone_display = contact.phone[:15] + "..." if contact.phone and len(contact.phone) > 15 else contact.phone
-                contact_msg = f"Contact found: {phone_display or contact.email or enrichment_result.management_company}"
-                
-                yield sse_message({
-                    "type": "contact_found",
-                    "message": contact_msg,
-                    "phone": contact.phone,
-                    "email": contact.email,
-                    "company": enrichment_result.management_company,
-                    "confidence": enrichment_result.confidence
-                })
-                await asyncio.sleep(0.05)
-            else:
-                prop.enrichment_status = "not_found"
-                total_tokens += enrichment_result.tokens_used
-                
-                yield sse_message({
-                    "type": "enrichment_complete",
-                    "message": "No contact info found",
-                    "steps_taken": len(enrichment_result.detailed_steps) if enrichment_result.detailed_steps else 0
-                })
-                await asyncio.sleep(0.05)
-                
-        except Exception as e:
-            logger.error(f"[ProcessParcel] Enrichment error: {e}")
-            prop.enrichment_status = "error"
-            yield sse_message({
-                "type": "enrichment_error",
-                "message": f"Enrichment failed: {str(e)[:50]}"
-            })
-    
-    # ============================================================
-    # COMPLETE
-    # ============================================================
-    db.commit()
-    db.refresh(prop)
-    
-    duration = (datetime.utcnow() - start_time).total_seconds()
-    
-    # Log usage
-    if total_tokens > 0:
-        usage_tracking_service.log_openrouter_call(
-            db=db,
-            user_id=user_id,
-            property_id=prop.id,
-            model=vlm_analysis_service.DEFAULT_MODEL,
-            tokens_used=total_tokens,
-            actual_cost=total_cost,
-            metadata={"operation": "process_parcel_stream"},
-        )
-    
-    yield sse_message({
-        "type": "complete",
-        "message": "Processing complete",
-        "stats": {
-            "lead_score": float(prop.lead_score) if prop.lead_score else None,
-            "has_contact": bool(prop.contact_email or prop.contact_phone),
-            "duration": f"{duration:.1f}s",
-            "cost": f"${total_cost:.4f}" if total_cost > 0 else None
-        }
-    })
 
 
 @router.post("/{property_id}/process/stream")
@@ -1002,6 +633,7 @@ async def process_parcel_stream(
     request: AnalyzePropertyRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    last_event_id: Optional[str] = Header(None),
 ):
     """
     Stream parcel processing following the full discovery flow:
@@ -1011,8 +643,14 @@ async def process_parcel_stream(
     4. Run VLM lead scoring
     5. Run LLM enrichment for decision-maker contact
     
-    Returns SSE stream with progress updates.
+    Returns SSE stream with progress updates. Processing runs as a background
+    job on the progress bus, so it continues if the client disconnects. While
+    a run is in progress, requests attach to it (replaying after
+    Last-Event-ID) instead of starting another; GET on the same path
+    re-attaches without a body.
     """
+    channel = f"parcel:{property_id}"
+    
     # Get property
     prop = db.query(Property).filter(
         Property.id == property_id,
@@ -1048,23 +686,62 @@ async def process_parcel_stream(
     if current_user.use_own_openrouter_key and current_user.openrouter_api_key:
         user_api_key = current_user.openrouter_api_key
     
-    return StreamingResponse(
-        _process_parcel_stream(
+    # Start a run unless one is in progress (double submit or reconnect) - then follow that one
+    if not progress_bus.is_running(channel):
+        await progress_bus.start(channel, _run_parcel_job(
             property_id=property_id,
             user_id=current_user.id,
             scoring_prompt=scoring_prompt,
             user_api_key=user_api_key,
-            db=db,
-        ),
+            bypass_cache=request.bypass_cache,
+        ))
+        last_event_id = None
+    
+    return StreamingResponse(
+        progress_bus.stream(channel, last_event_id),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        }
+        headers=SSE_HEADERS,
     )
 
 
+@router.get("/{property_id}/process/stream")
+async def resume_parcel_stream(
+    property_id: UUID,
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Re-attach to a parcel processing run (EventSource reconnects).
+    
+    Replays events after Last-Event-ID, then follows the run until it
+    completes. 404 if no run is in progress or recently finished.
+    """
+    owned = db.query(Property.id).filter(
+        Property.id == property_id,
+        Property.user_id == current_user_id
+    ).first()
+    channel = f"parcel:{property_id}"
+    if not owned or not await progress_bus.exists(channel):
+        raise HTTPException(status_code=404, detail="No processing run for this property")
+    
+    return StreamingResponse(
+        progress_bus.stream(channel, last_event_id),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+async def _run_parcel_job(**kwargs) -> AsyncGenerator[dict, None]:
+    """stream_parcel_processing with its own session (the job outlives the request)."""
+    db = SessionLocal()
+    try:
+        async for event in stream_parcel_processing(db=db, **kwargs):
+            yield event
+    finally:
+        db.close()
+
+
 @router.post("/{property_id}/analyze")
 async def analyze_property(
     property_id: UUID,
@@ -1109,19 +786,17 @@ async def analyze_property(
     if current_user.use_own_openrouter_key and current_user.openrouter_api_key:
         user_api_key = current_user.openrouter_api_key
     
-    # Collect results from stream
+    # Collect progress events
     results = []
-    async for msg in _process_parcel_stream(
+    async for event in stream_parcel_processing(
         property_id=property_id,
         user_id=current_user.id,
         scoring_prompt=scoring_prompt,
         user_api_key=user_api_key,
         db=db,
+        bypass_cache=request.bypass_cache,
     ):
-        # Parse SSE message
-        if msg.startswith("data: "):
-            data = json.loads(msg[6:].strip())
-            results.append(data)
+        results.append(event)
     
     # Return final state
     db.refresh(prop)
@@ -1200,9 +875,9 @@ async def enrich_property(
         elif 2600 <= lbcs_code < 2800:
             property_type = "industrial"
     
-    logger.info(f"LLM Enriching property {property_id}")
-    logger.info(f"  Address: {prop.address}")
-    logger.info(f"  Property type: {property_type}")
+    logger.info("LLM Enriching property %s", property_id)
+    logger.info("  Address: %s", prop.address)
+    logger.info("  Property type: %s", property_type)
     
     # Run LLM-powered enrichment
     result = await llm_enrichment_service.enrich(
@@ -1240,17 +915,17 @@ async def enrich_property(
         prop.enrichment_source = "llm_enrichment"
         prop.enrichment_status = "success"
         
-        logger.info(f"  ✅ LLM Enrichment successful")
-        logger.info(f"     Contact: {contact.name or 'N/A'}")
-        logger.info(f"     Email: {contact.email or 'N/A'}")
-        logger.info(f"     Phone: {contact.phone or 'N/A'}")
-        logger.info(f"     Company: {result.management_company or 'N/A'}")
-        logger.info(f"     Confidence: {result.confidence:.0%}")
+        logger.info("  ✅ LLM Enrichment successful")
+        logger.info("     Contact: %s", contact.name or 'N/A')
+        logger.info("     Email: %s", contact.email or 'N/A')
+        logger.info("     Phone: %s", contact.phone or 'N/A')
+        logger.info("     Company: %s", result.management_company or 'N/A')
+        logger.info("     Confidence: %.0f%%", result.confidence * 100)
     else:
         prop.enrichment_status = "not_found"
-        logger.info(f"  ⚠️ No contact found")
+        logger.info("  ⚠️ No contact found")
         if result.error_message:
-            logger.info(f"     Error: {result.error_message}")
+            logger.info("     Error: %s", result.error_message)
     
     db.commit()
     db.refresh(prop)
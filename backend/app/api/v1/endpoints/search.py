@@ -8,11 +8,14 @@ Provides unified search functionality:
 - Natural language search (Claude-parsed)
 - Category search (LBCS codes)
 - Brand search (Google Places)
+- Streaming search (SSE; state-wide brand grid search streams progressively)
 """
 
+import json
 import logging
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, HTTPException, Query, Body
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -21,6 +24,7 @@ from app.core.search_service import (
     SearchResult, SearchResultParcel, PROPERTY_CATEGORIES
 )
 from app.core.search_nlp_service import nlp_search_service
+from app.core.brand_search_service import brand_search_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -150,98 +154,18 @@ async def execute_search(request: SearchRequest):
     - brand: Search for franchise/brand locations
     - nlp: Natural language query (will be parsed first)
     """
-    logger.info(f"🔍 Search request: type={request.search_type}")
+    logger.info("🔍 Search request: type=%s", request.search_type)
     
     try:
-        # Handle NLP search type - parse first
-        if request.search_type == "nlp":
-            if not request.query:
-                raise HTTPException(status_code=400, detail="Query required for NLP search")
-            
-            # Parse the query
-            viewport_dict = None
-            if request.viewport:
-                viewport_dict = {
-                    "minLat": request.viewport.minLat,
-                    "maxLat": request.viewport.maxLat,
-                    "minLng": request.viewport.minLng,
-                    "maxLng": request.viewport.maxLng,
-                }
-            
-            parsed_query = await nlp_search_service.parse_query(
-                request.query,
-                current_viewport=viewport_dict,
-            )
-            
-            # Execute the parsed query
-            result = await search_service.search(
-                query=parsed_query,
-                preview_only=request.preview_only,
-            )
-        else:
-            # Build query from request
-            search_type = _map_search_type(request.search_type)
-            
-            filters = SearchFilters()
-            if request.filters:
-                filters = SearchFilters(
-                    category_id=request.filters.category_id,
-                    min_acres=request.filters.min_acres,
-                    max_acres=request.filters.max_acres,
-                )
-            
-            viewport_dict = None
-            if request.viewport:
-                viewport_dict = {
-                    "minLat": request.viewport.minLat,
-                    "maxLat": request.viewport.maxLat,
-                    "minLng": request.viewport.minLng,
-                    "maxLng": request.viewport.maxLng,
-                }
-            
-            point_dict = None
-            if request.point:
-                point_dict = {"lat": request.point.lat, "lng": request.point.lng}
-            
-            query = SearchQuery(
-                search_type=search_type,
-                point=point_dict,
-                polygon_geojson=request.polygon_geojson,
-                zip_code=request.zip_code,
-                viewport=viewport_dict,
-                state_code=request.state_code,
-                brand_name=request.brand_name,
-                filters=filters,
-                limit=request.limit,
-                offset=request.offset,
-            )
-            
-            result = await search_service.search(
-                query=query,
-                preview_only=request.preview_only,
-            )
+        query = await _build_search_query(request)
+        
+        result = await search_service.search(
+            query=query,
+            preview_only=request.preview_only,
+        )
         
         # Convert result to response
-        parcels = [
-            ParcelResponse(
-                parcel_id=p.parcel_id,
-                address=p.address,
-                owner=p.owner,
-                lat=p.lat,
-                lng=p.lng,
-                area_acres=p.area_acres,
-                area_sqft=p.area_sqft,
-                land_use=p.land_use,
-                zoning=p.zoning,
-                year_built=p.year_built,
-                polygon_geojson=p.polygon_geojson,
-                lbcs_activity=p.lbcs_activity,
-                lbcs_activity_desc=p.lbcs_activity_desc,
-                brand_name=p.brand_name,
-                place_id=p.place_id,
-            )
-            for p in result.parcels
-        ]
+        parcels = [_parcel_response(p) for p in result.parcels]
         
         return SearchResponse(
             success=result.success,
@@ -256,12 +180,146 @@ async def execute_search(request: SearchRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Search error: {e}")
+        logger.error("Search error: %s", e)
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/search/stream")
+async def execute_search_stream(request: SearchRequest):
+    """
+    Execute a search and stream results as Server-Sent Events.
+    
+    Brand searches scoped to a state run the grid search and stream
+    deduped locations as each cell finishes. Other searches send all
+    parcels in one "locations" event.
+    
+    Events:
+        {"type": "plan", ...}        - grid search plan (state brand search only)
+        {"type": "locations", "parcels": [...], "total": n}
+        {"type": "complete", "total": n, "stats": {...}}
+        {"type": "error", "message": str}
+    """
+    logger.info("🔍 Search stream request: type=%s", request.search_type)
+    
+    query = await _build_search_query(request)
+    
+    return StreamingResponse(
+        _search_stream(query),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+async def _search_stream(query: SearchQuery):
+    """SSE generator for execute_search_stream."""
+    
+    def sse_message(data: dict) -> str:
+        return f"data: {json.dumps(data)}\n\n"
+    
+    try:
+        if query.search_type == SearchType.BRAND and query.brand_name and query.state_code and not (query.viewport or query.zip_code):
+            async for event in brand_search_service.stream_brand_in_state(
+                brand_name=query.brand_name,
+                state_code=query.state_code,
+                limit=query.limit,
+            ):
+                if event["type"] == "locations":
+                    event = {**event, "parcels": [_parcel_response(p).model_dump() for p in event["parcels"]]}
+                yield sse_message(event)
+            return
+        
+        result = await search_service.search(query=query)
+        if not result.success:
+            yield sse_message({"type": "error", "message": result.error})
+            return
+        
+        yield sse_message({
+            "type": "locations",
+            "parcels": [_parcel_response(p).model_dump() for p in result.parcels],
+            "total": result.total_count,
+        })
+        yield sse_message({"type": "complete", "total": result.total_count, "stats": None})
+    except Exception as e:
+        logger.error("Search stream error: %s", e)
+        yield sse_message({"type": "error", "message": str(e)})
+
+
+async def _build_search_query(request: SearchRequest) -> SearchQuery:
+    """Build a SearchQuery from a request (NLP queries are parsed first)."""
+    viewport_dict = None
+    if request.viewport:
+        viewport_dict = {
+            "minLat": request.viewport.minLat,
+            "maxLat": request.viewport.maxLat,
+            "minLng": request.viewport.minLng,
+            "maxLng": request.viewport.maxLng,
+        }
+    
+    # Handle NLP search type - parse first
+    if request.search_type == "nlp":
+        if not request.query:
+            raise HTTPException(status_code=400, detail="Query required for NLP search")
+        
+        return await nlp_search_service.parse_query(
+            request.query,
+            current_viewport=viewport_dict,
+        )
+    
+    # Build query from request
+    search_type = _map_search_type(request.search_type)
+    
+    filters = SearchFilters()
+    if request.filters:
+        filters = SearchFilters(
+            category_id=request.filters.category_id,
+            min_acres=request.filters.min_acres,
+            max_acres=request.filters.max_acres,
+        )
+    
+    point_dict = None
+    if request.point:
+        point_dict = {"lat": request.point.lat, "lng": request.point.lng}
+    
+    return SearchQuery(
+        search_type=search_type,
+        point=point_dict,
+        polygon_geojson=request.polygon_geojson,
+        zip_code=request.zip_code,
+        viewport=viewport_dict,
+        state_code=request.state_code,
+        brand_name=request.brand_name,
+        filters=filters,
+        limit=request.limit,
+        offset=request.offset,
+    )
+
+
+def _parcel_response(p: SearchResultParcel) -> ParcelResponse:
+    return ParcelResponse(
+        parcel_id=p.parcel_id,
+        address=p.address,
+        owner=p.owner,
+        lat=p.lat,
+        lng=p.lng,
+        area_acres=p.area_acres,
+        area_sqft=p.area_sqft,
+        land_use=p.land_use,
+        zoning=p.zoning,
+        year_built=p.year_built,
+        polygon_geojson=p.polygon_geojson,
+        lbcs_activity=p.lbcs_activity,
+        lbcs_activity_desc=p.lbcs_activity_desc,
+        brand_name=p.brand_name,
+        place_id=p.place_id,
+    )
+
+
 @router.post("/search/parse-nlp", response_model=NLPParseResponse)
 async def parse_nlp_query(request: NLPParseRequest):
     """
@@ -290,6 +348,7 @@ async def parse_nlp_query(request: NLPParseRequest):
             "category_id": parsed.filters.category_id,
             "brand_name": parsed.brand_name,
             "zip_code": parsed.zip_code,
+            "county_fips": parsed.county_fips,
             "state_code": parsed.state_code,
             "min_acres": parsed.filters.min_acres,
             "max_acres": parsed.filters.max_acres,
@@ -300,7 +359,7 @@ async def parse_nlp_query(request: NLPParseRequest):
         message = None
         
         if parsed.search_type == SearchType.CATEGORY:
-            if not parsed.zip_code and not parsed.viewport and not parsed.polygon_geojson:
+            if not parsed.zip_code and not parsed.county_fips and not parsed.viewport and not parsed.polygon_geojson:
                 requires_input = True
                 message = "Please specify a location (ZIP code or draw an area on the map)"
         
@@ -314,7 +373,7 @@ async def parse_nlp_query(request: NLPParseRequest):
         )
         
     except Exception as e:
-        logger.error(f"NLP parse error: {e}")
+        logger.error("NLP parse error: %s", e)
         return NLPParseResponse(
             success=False,
             original_query=request.query,
@@ -12,6 +12,7 @@ from typing import Optional
 from app.db.base import get_db
 from app.models.user import User
 from app.core.dependencies import get_current_user
+from app.core.user_cache import user_cache
 
 router = APIRouter()
 
@@ -103,6 +104,7 @@ def update_profile(
         current_user.phone = request.phone
     
     db.commit()
+    user_cache.invalidate(current_user.id)
     db.refresh(current_user)
     
     return settings_to_response(current_user)
@@ -143,6 +145,7 @@ def update_openrouter_key(
         current_user.use_own_openrouter_key = False
     
     db.commit()
+    user_cache.invalidate(current_user.id)
     db.refresh(current_user)
     
     return settings_to_response(current_user)
@@ -158,6 +161,7 @@ def update_scoring_prompt(
     current_user.default_scoring_prompt = request.scoring_prompt
     
     db.commit()
+    user_cache.invalidate(current_user.id)
     db.refresh(current_user)
     
     return settings_to_response(current_user)
@@ -180,6 +184,7 @@ def change_password(
     current_user.hashed_password = get_password_hash(request.new_password)
     
     db.commit()
+    user_cache.invalidate(current_user.id)
     
     return {"message": "Password changed successfully"}
 
@@ -194,6 +199,7 @@ def delete_openrouter_key(
     current_user.use_own_openrouter_key = False
     
     db.commit()
+    user_cache.invalidate(current_user.id)
     db.refresh(current_user)
     
     return settings_to_response(current_user)
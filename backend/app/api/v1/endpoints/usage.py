@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 
@@ -6,6 +6,20 @@ from app.db.base import get_db
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.core.usage_tracking_service import usage_tracking_service
+from app.core.usage_recorder import usage_recorder
+from app.core.places_cache import places_cache
+from app.core.geocode_cache import geocode_cache
+from app.core.user_cache import user_cache
+from app.core.search_nlp_service import nlp_search_service
+from app.core.vlm_result_cache_service import vlm_result_cache_service
+from app.core.openrouter_client_pool import openrouter_client_pool
+from app.core.http_client_manager import http_clients
+from app.core.telemetry import telemetry
+from app.core.progress_bus import progress_bus
+from app.core.job_queue import job_queue
+from app.core.job_worker import job_worker
+from app.core.config import settings
+from app.core.discovery_orchestrator import discovery_orchestrator
 
 router = APIRouter()
 
@@ -45,3 +59,138 @@ async def get_daily_usage(
     """
     return usage_tracking_service.get_daily_usage(db, current_user.id, days)
 
+
+
+@router.get("/vlm-cache", response_model=Dict[str, Any])
+async def get_vlm_cache_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get VLM result cache statistics since server start.
+    
+    Returns:
+        - hits / misses / hit_rate_pct
+        - bypasses (requests with bypass_cache set)
+        - cost_saved (USD not spent thanks to cache hits)
+    """
+    return vlm_result_cache_service.get_stats()
+
+
+@router.get("/openrouter-pool", response_model=Dict[str, Any])
+async def get_openrouter_pool_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get OpenRouter client pool statistics (pooled clients, reuse hits, evictions).
+    """
+    return openrouter_client_pool.get_stats()
+
+
+@router.get("/recorder", response_model=Dict[str, Any])
+async def get_usage_recorder_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get buffered usage recorder statistics (buffered, flushed, failed flushes, dropped rows).
+    """
+    return usage_recorder.get_stats()
+
+
+@router.get("/places-cache", response_model=Dict[str, Any])
+async def get_places_cache_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get shared Google Places cache statistics, with hit rates per caller
+    (business_discovery, lead_enrichment, llm_enrichment).
+    """
+    return places_cache.get_stats()
+
+
+@router.get("/geocode-cache", response_model=Dict[str, Any])
+async def get_geocode_cache_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get geocode cache statistics (in-process and database hits, misses).
+    """
+    return geocode_cache.get_stats()
+
+
+@router.get("/user-cache", response_model=Dict[str, Any])
+async def get_user_cache_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get authenticated user cache statistics (hits, misses, invalidations).
+    """
+    return user_cache.get_stats()
+
+
+@router.get("/nlp-parser", response_model=Dict[str, Any])
+async def get_nlp_parser_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get search query parser statistics (parse cache hits, rule parses, LLM calls).
+    """
+    return nlp_search_service.get_stats()
+
+
+@router.get("/http-clients", response_model=Dict[str, Any])
+async def get_http_client_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get shared outbound HTTP client settings (per-provider limits, HTTP/2).
+    """
+    return http_clients.get_stats()
+
+
+@router.get("/progress-bus", response_model=Dict[str, Any])
+async def get_progress_bus_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get job progress bus statistics (backend, running jobs, subscribers).
+    """
+    return progress_bus.get_stats()
+
+
+@router.get("/jobs", response_model=Dict[str, Any])
+async def get_job_queue_stats(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Get background job queue statistics (queued, running, recent outcomes).
+    """
+    stats = job_queue.get_stats(db)
+    if settings.JOB_WORKER_IN_PROCESS:
+        stats["in_process_worker"] = job_worker.get_stats()
+    return stats
+
+
+@router.get("/providers", response_model=Dict[str, Any])
+async def get_provider_limit_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get outbound provider pacing state (token buckets, retries, 429s, circuit breakers).
+    """
+    return http_clients.get_limit_stats()
+
+
+@router.get("/traces/{job_id}", response_model=Dict[str, Any])
+async def get_job_trace(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the span trace of a recent discovery job (OTLP/JSON shape) and its stage breakdown.
+    """
+    job = discovery_orchestrator.get_job_status(job_id)
+    trace = telemetry.get_trace(job_id)
+    if not job or job.get("user_id") != str(current_user.id) or not trace:
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return {"breakdown": trace.breakdown(), "dropped_spans": trace.dropped_spans, **trace.to_otlp()}
@@ -17,6 +17,7 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
 from app.core.config import settings
+from app.core.http_client_manager import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -92,7 +93,6 @@ class ApolloEnrichmentService:
     
     def __init__(self):
         self.api_key = settings.APOLLO_API_KEY
-        self._client: Optional[httpx.AsyncClient] = None
         
         if self.api_key:
             logger.info("Apollo Enrichment Service initialized")
@@ -104,18 +104,18 @@ class ApolloEnrichmentService:
         """Check if Apollo API is configured."""
         return bool(self.api_key)
     
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Per-request headers (Apollo requires the API key in a header)."""
+        return {
+            "Content-Type": "application/json",
+            "Cache-Control": "no-cache",
+            "X-Api-Key": self.api_key or "",
+        }
+    
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    "Content-Type": "application/json",
-                    "Cache-Control": "no-cache",
-                    "X-Api-Key": self.api_key or "",  # Apollo requires API key in header
-                }
-            )
-        return self._client
+        """Shared Apollo client (managed by http_clients)."""
+        return http_clients.get("apollo")
     
     async def enrich_property_owner(
         self,
@@ -146,7 +146,7 @@ class ApolloEnrichmentService:
         
         # Clean up owner name
         clean_name = self._clean_company_name(owner_name)
-        logger.info(f"  [Apollo] Enriching owner: {clean_name}")
+        logger.info("  [Apollo] Enriching owner: %s", clean_name)
         
         total_credits = 0
         
@@ -156,7 +156,7 @@ class ApolloEnrichmentService:
             total_credits += 1  # Organization search uses 1 credit
             
             if not org_result:
-                logger.info(f"  [Apollo] No organization found for: {clean_name}")
+                logger.info("  [Apollo] No organization found for: %s", clean_name)
                 return EnrichmentResult(
                     success=False,
                     error_message=f"No organization found for '{clean_name}'",
@@ -167,14 +167,14 @@ class ApolloEnrichmentService:
             org_name = org_result.get("name")
             org_domain = org_result.get("primary_domain")
             
-            logger.info(f"  [Apollo] Found organization: {org_name} (domain: {org_domain})")
+            logger.info("  [Apollo] Found organization: %s (domain: %s)", org_name, org_domain)
             
             # Step 2: Search for people at organization with decision maker titles
             people = await self._search_people_at_org(org_id)
             # People search is free (doesn't consume credits)
             
             if not people:
-                logger.info(f"  [Apollo] No decision makers found at {org_name}")
+                logger.info("  [Apollo] No decision makers found at %s", org_name)
                 return EnrichmentResult(
                     success=False,
                     error_message=f"No decision makers found at '{org_name}'",
@@ -185,7 +185,7 @@ class ApolloEnrichmentService:
             
             # Step 3: Enrich the best match (first person returned)
             best_person = people[0]
-            logger.info(f"  [Apollo] Found contact: {best_person.get('name')} - {best_person.get('title')}")
+            logger.info("  [Apollo] Found contact: %s - %s", best_person.get('name'), best_person.get('title'))
             
             # Enrich to get email/phone (costs credits)
             enriched = await self._enrich_person(best_person.get("id"))
@@ -227,7 +227,7 @@ class ApolloEnrichmentService:
                     raw_response=enriched,
                 )
                 
-                logger.info(f"  [Apollo] ✅ Enrichment successful: {result.contact_name} ({result.contact_email})")
+                logger.info("  [Apollo] ✅ Enrichment successful: %s (%s)", result.contact_name, result.contact_email)
                 return result
             else:
                 # Return basic info from search even if enrichment fails
@@ -245,7 +245,7 @@ class ApolloEnrichmentService:
                 )
                 
         except Exception as e:
-            logger.error(f"  [Apollo] ❌ Enrichment error: {e}")
+            logger.error("  [Apollo] ❌ Enrichment error: %s", e)
             return EnrichmentResult(
                 success=False,
                 error_message=str(e),
@@ -264,7 +264,7 @@ class ApolloEnrichmentService:
         }
         
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, headers=self.headers)
             
             if response.status_code == 200:
                 data = response.json()
@@ -277,7 +277,7 @@ class ApolloEnrichmentService:
             simple_name = self._simplify_company_name(company_name)
             if simple_name != company_name:
                 payload["name"] = simple_name
-                response = await client.post(url, json=payload)
+                response = await client.post(url, json=payload, headers=self.headers)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -288,7 +288,7 @@ class ApolloEnrichmentService:
             return None
             
         except Exception as e:
-            logger.error(f"  [Apollo] Organization search error: {e}")
+            logger.error("  [Apollo] Organization search error: %s", e)
             return None
     
     async def _search_people_at_org(self, org_id: str) -> List[Dict]:
@@ -305,7 +305,7 @@ class ApolloEnrichmentService:
         }
         
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, headers=self.headers)
             
             if response.status_code == 200:
                 data = response.json()
@@ -315,7 +315,7 @@ class ApolloEnrichmentService:
             return []
             
         except Exception as e:
-            logger.error(f"  [Apollo] People search error: {e}")
+            logger.error("  [Apollo] People search error: %s", e)
             return []
     
     async def _enrich_person(self, person_id: str) -> Optional[Dict]:
@@ -331,7 +331,7 @@ class ApolloEnrichmentService:
         }
         
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, headers=self.headers)
             
             if response.status_code == 200:
                 data = response.json()
@@ -341,7 +341,7 @@ class ApolloEnrichmentService:
             return None
             
         except Exception as e:
-            logger.error(f"  [Apollo] Person enrichment error: {e}")
+            logger.error("  [Apollo] Person enrichment error: %s", e)
             return None
     
     def _clean_company_name(self, name: str) -> str:
@@ -487,22 +487,22 @@ class ApolloEnrichmentService:
             "per_page": min(max_results, 100),  # Apollo max is 100 per page
         }
         
-        logger.info(f"  [Apollo] Searching for contacts in {person_locations[0]}")
-        logger.info(f"  [Apollo] Titles: {', '.join(job_titles[:3])}...")
+        logger.info("  [Apollo] Searching for contacts in %s", person_locations[0])
+        logger.info("  [Apollo] Titles: %s...", ', '.join(job_titles[:3]))
         
         results: List[ContactSearchResult] = []
         
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, headers=self.headers)
             
             if response.status_code != 200:
-                logger.error(f"  [Apollo] Search failed: {response.status_code} - {response.text}")
+                logger.error("  [Apollo] Search failed: %s - %s", response.status_code, response.text)
                 return []
             
             data = response.json()
             people = data.get("people", [])
             
-            logger.info(f"  [Apollo] Found {len(people)} contacts")
+            logger.info("  [Apollo] Found %s contacts", len(people))
             
             for person in people:
                 # Extract company info
@@ -544,7 +544,7 @@ class ApolloEnrichmentService:
             return results
             
         except Exception as e:
-            logger.error(f"  [Apollo] Contact search error: {e}")
+            logger.error("  [Apollo] Contact search error: %s", e)
             return []
     
     async def enrich_contact(self, person_id: str) -> Optional[ContactSearchResult]:
@@ -592,11 +592,6 @@ class ApolloEnrichmentService:
             country=enriched.get("country"),
             raw_data=enriched,
         )
-    
-    async def close(self):
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
 
 
 # Singleton instance
@@ -23,6 +23,7 @@ import pyproj
 import mapbox_vector_tile as mvt
 
 from app.core.config import settings
+from app.core.http_client_manager import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +71,6 @@ class RegridTileService:
     MAX_CONCURRENT = 10
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=60.0)
         self.base_url = "https://tiles.regrid.com"
         self.token = settings.REGRID_TILESERVER_TOKEN or settings.REGRID_API_KEY
         self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT)
@@ -102,7 +102,7 @@ class RegridTileService:
             search_shape = shape(geometry)
             bounds = search_shape.bounds  # (minx, miny, maxx, maxy)
             
-            logger.info(f"Querying Regrid tiles for bounds: {bounds}")
+            logger.info("Querying Regrid tiles for bounds: %s", bounds)
             
             # Calculate tiles that cover the search area
             tiles = list(mercantile.tiles(
@@ -110,10 +110,10 @@ class RegridTileService:
                 zooms=self.ZOOM_LEVEL
             ))
             
-            logger.info(f"Need {len(tiles)} tiles at zoom {self.ZOOM_LEVEL}")
+            logger.info("Need %s tiles at zoom %s", len(tiles), self.ZOOM_LEVEL)
             
             if len(tiles) > self.MAX_TILES:
-                logger.warning(f"Too many tiles ({len(tiles)}), limiting to {self.MAX_TILES}")
+                logger.warning("Too many tiles (%s), limiting to %s", len(tiles), self.MAX_TILES)
                 tiles = tiles[:self.MAX_TILES]
             
             # Fetch all tiles concurrently
@@ -121,7 +121,7 @@ class RegridTileService:
             seen_ids: Set[str] = set()
             
             # Batch fetch tiles with progress logging
-            logger.info(f"Fetching {len(tiles)} tiles (max {self.MAX_CONCURRENT} concurrent)...")
+            logger.info("Fetching %s tiles (max %s concurrent)...", len(tiles), self.MAX_CONCURRENT)
             
             tasks = [self._fetch_tile(tile, search_shape) for tile in tiles]
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -145,12 +145,12 @@ class RegridTileService:
                         seen_ids.add(parcel.id)
                         all_parcels.append(parcel)
             
-            logger.info(f"Tiles: {tiles_with_data} with data, {tiles_empty} empty, {tiles_error} errors")
-            logger.info(f"Found {len(all_parcels)} unique parcels")
+            logger.info("Tiles: %s with data, %s empty, %s errors", tiles_with_data, tiles_empty, tiles_error)
+            logger.info("Found %s unique parcels", len(all_parcels))
             
             # Filter by acreage (client-side)
             filtered = self._filter_by_size(all_parcels, min_acres, max_acres)
-            logger.info(f"After size filter ({min_acres}-{max_acres} acres): {len(filtered)} parcels")
+            logger.info("After size filter (%s-%s acres): %s parcels", min_acres, max_acres, len(filtered))
             
             # Sort by acreage descending (largest first)
             filtered.sort(key=lambda p: p.acreage, reverse=True)
@@ -158,7 +158,7 @@ class RegridTileService:
             return filtered[:limit]
             
         except Exception as e:
-            logger.error(f"Error querying Regrid tiles: {e}", exc_info=True)
+            logger.error("Error querying Regrid tiles: %s", e, exc_info=True)
             return []
     
     async def _fetch_tile(
@@ -180,7 +180,7 @@ class RegridTileService:
             url = f"{self.base_url}/api/v1/parcels/{tile.z}/{tile.x}/{tile.y}.mvt"
             params = {"token": self.token}
             
-            response = await self.client.get(url, params=params)
+            response = await http_clients.get("tiles").get(url, params=params)
             
             if response.status_code == 204:
                 # No content - tile has no parcels (coverage gap or empty area)
@@ -188,7 +188,7 @@ class RegridTileService:
                 return []
             
             if response.status_code != 200:
-                logger.debug(f"Tile {tile} returned {response.status_code}")
+                logger.debug("Tile %s returned %s", tile, response.status_code)
                 return []
             
             if not response.content:
@@ -219,14 +219,14 @@ class RegridTileService:
                 if parcel:
                     parcels.append(parcel)
             
-            logger.debug(f"Tile {tile}: {len(parcels)} parcels")
+            logger.debug("Tile %s: %s parcels", tile, len(parcels))
             return parcels
             
         except httpx.TimeoutException:
-            logger.debug(f"Timeout fetching tile {tile}")
+            logger.debug("Timeout fetching tile %s", tile)
             return []
         except Exception as e:
-            logger.debug(f"Error fetching tile {tile}: {type(e).__name__}: {e}")
+            logger.debug("Error fetching tile %s: %s: %s", tile, type(e).__name__, e)
             return []
     
     def _parse_feature(
@@ -291,7 +291,7 @@ class RegridTileService:
             )
             
         except Exception as e:
-            logger.debug(f"Error parsing feature: {e}")
+            logger.debug("Error parsing feature: %s", e)
             return None
     
     def _mvt_to_wgs84(
@@ -334,7 +334,7 @@ class RegridTileService:
             return None
             
         except Exception as e:
-            logger.debug(f"Error converting coordinates: {e}")
+            logger.debug("Error converting coordinates: %s", e)
             return None
     
     def _calculate_acreage(self, geom: Polygon | MultiPolygon) -> float:
@@ -374,10 +374,6 @@ class RegridTileService:
                 continue
             filtered.append(p)
         return filtered
-    
-    async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
 
 
 # Singleton instance
@@ -2,8 +2,10 @@ import logging
 from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from geoalchemy2.shape import to_shape
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
+import numpy as np
 import uuid
 
 from app.models.parking_lot import ParkingLot
@@ -28,6 +30,11 @@ class AssociationService:
     NAME_SIMILARITY_WEIGHT = 20
     ADJACENCY_WEIGHT = 10
     
+    # Batch mode
+    BATCH_SIZE = 500  # Lots per lateral-join query
+    NEARBY_LIMIT = 20  # Candidate businesses per lot
+    MAX_MATCHES_PER_LOT = 3
+    
     def associate_parking_lots_with_businesses(
         self,
         parking_lot_ids: List[uuid.UUID],
@@ -45,7 +52,7 @@ class AssociationService:
             "total_match_score": 0,
         }
         
-        logger.info(f"   🔗 Processing {len(parking_lot_ids)} parking lots...")
+        logger.info("   🔗 Processing %s parking lots...", len(parking_lot_ids))
         
         for idx, lot_id in enumerate(parking_lot_ids):
             try:
@@ -64,12 +71,12 @@ class AssociationService:
                     primary = associations[0]
                     biz = db.query(Business).filter(Business.id == primary.business_id).first()
                     if biz and idx < 5:  # Log first 5
-                        logger.info(f"      [{idx+1}] Lot matched to: {biz.name} (score: {primary.match_score:.1f}, dist: {primary.distance_meters:.0f}m)")
+                        logger.info("      [%s] Lot matched to: %s (score: %.1f, dist: %.0fm)", idx+1, biz.name, primary.match_score, primary.distance_meters)
                 else:
                     stats["no_business_found"] += 1
                     
             except Exception as e:
-                logger.error(f"      ❌ Failed to associate lot {lot_id}: {e}")
+                logger.error("      ❌ Failed to associate lot %s: %s", lot_id, e)
                 stats["no_business_found"] += 1
         
         db.commit()
@@ -80,13 +87,223 @@ class AssociationService:
         else:
             stats["avg_match_score"] = 0
         
-        logger.info(f"   📊 Association summary:")
-        logger.info(f"      Lots with business: {stats['lots_with_business']}/{len(parking_lot_ids)}")
-        logger.info(f"      Total associations: {stats['associations_made']}")
-        logger.info(f"      No match found: {stats['no_business_found']}")
+        logger.info("   📊 Association summary:")
+        logger.info("      Lots with business: %s/%s", stats['lots_with_business'], len(parking_lot_ids))
+        logger.info("      Total associations: %s", stats['associations_made'])
+        logger.info("      No match found: %s", stats['no_business_found'])
+        
+        return stats
+    
+    def associate_parking_lots_with_businesses_batch(
+        self,
+        parking_lot_ids: List[uuid.UUID],
+        db: Session,
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Set-based version of associate_parking_lots_with_businesses.
+
+        Per batch: one LATERAL KNN query returns the candidate businesses
+        for every lot inline, scoring runs over numpy arrays, and the top
+        matches are written with a single multi-row insert. Scores and
+        stats match the per-lot path.
+        """
+        batch_size = batch_size or self.BATCH_SIZE
+        stats = {
+            "total_parking_lots": len(parking_lot_ids),
+            "associations_made": 0,
+            "lots_with_business": 0,
+            "no_business_found": 0,
+            "total_match_score": 0,
+        }
+        
+        logger.info("   🔗 Processing %s parking lots in batches of %s...", len(parking_lot_ids), batch_size)
+        
+        logged = 0
+        for start in range(0, len(parking_lot_ids), batch_size):
+            lot_ids = list(parking_lot_ids[start:start + batch_size])
+            try:
+                candidates = self._find_nearby_businesses_batch(lot_ids, db)
+                rows = self._score_candidates(candidates)
+                
+                if rows:
+                    db.execute(
+                        pg_insert(ParkingLotBusinessAssociation).on_conflict_do_nothing(),
+                        [{k: v for k, v in row.items() if not k.startswith("_")} for row in rows],
+                    )
+                
+                matched_lots = {row["parking_lot_id"] for row in rows}
+                stats["associations_made"] += len(rows)
+                stats["lots_with_business"] += len(matched_lots)
+                stats["no_business_found"] += len(lot_ids) - len(matched_lots)
+                stats["total_match_score"] += sum(row["match_score"] for row in rows)
+                
+                # Log first 5 primary matches (names come back with the candidates)
+                for row in rows:
+                    if logged >= 5:
+                        break
+                    if row["is_primary"]:
+                        logged += 1
+                        logger.info("      [%s] Lot matched to: %s (score: %.1f, dist: %.0fm)", logged, row['_business_name'], row['match_score'], row['distance_meters'])
+            except Exception as e:
+                logger.error("      ❌ Failed to associate batch of %s lots: %s", len(lot_ids), e)
+                db.rollback()
+                stats["no_business_found"] += len(lot_ids)
+        
+        db.commit()
+        
+        if stats["associations_made"] > 0:
+            stats["avg_match_score"] = stats["total_match_score"] / stats["associations_made"]
+        else:
+            stats["avg_match_score"] = 0
+        
+        logger.info("   📊 Association summary:")
+        logger.info("      Lots with business: %s/%s", stats['lots_with_business'], len(parking_lot_ids))
+        logger.info("      Total associations: %s", stats['associations_made'])
+        logger.info("      No match found: %s", stats['no_business_found'])
         
         return stats
     
+    def _find_nearby_businesses_batch(
+        self,
+        parking_lot_ids: List[uuid.UUID],
+        db: Session
+    ) -> List[Any]:
+        """
+        Candidate businesses for many lots in one round-trip.
+
+        Rows are (lot_id, operator_name, business_id, business_name,
+        category, distance_meters), nearest first within each lot.
+        """
+        if not parking_lot_ids:
+            return []
+        
+        # <-> drives the KNN index; ST_DWithin on geography keeps the meter cutoff exact
+        query = text(f"""
+            SELECT
+                l.id AS lot_id,
+                l.operator_name,
+                nb.id AS business_id,
+                nb.name AS business_name,
+                nb.category,
+                nb.distance_meters
+            FROM {ParkingLot.__tablename__} l
+            CROSS JOIN LATERAL (
+                SELECT
+                    b.id,
+                    b.name,
+                    b.category,
+                    ST_Distance(b.geometry::geography, l.centroid::geography) AS distance_meters
+                FROM businesses b
+                WHERE ST_DWithin(
+                    b.geometry::geography,
+                    l.centroid::geography,
+                    :max_distance
+                )
+                ORDER BY b.geometry::geometry <-> l.centroid::geometry
+                LIMIT :nearby_limit
+            ) nb
+            WHERE l.id = ANY(:lot_ids)
+            ORDER BY l.id, nb.distance_meters
+        """)
+        
+        return db.execute(query, {
+            "lot_ids": list(parking_lot_ids),
+            "max_distance": self.MAX_DISTANCE_METERS,
+            "nearby_limit": self.NEARBY_LIMIT,
+        }).all()
+    
+    def _score_candidates(self, candidates: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Vectorized _calculate_match_score over (lot, business) candidate rows.
+
+        Returns insert-ready association dicts (top MAX_MATCHES_PER_LOT per
+        lot, first is primary). Each dict also carries "_business_name"
+        for logging, which is dropped before the insert.
+        """
+        if not candidates:
+            return []
+        
+        n = len(candidates)
+        lot_ids = [row.lot_id for row in candidates]
+        distances = np.fromiter((float(row.distance_meters) for row in candidates), dtype=np.float64, count=n)
+        
+        # 1. Distance score - same buckets as _calculate_match_score
+        distance_scores = np.select(
+            [
+                distances <= self.CLOSE_DISTANCE_METERS,
+                distances <= self.MEDIUM_DISTANCE_METERS,
+                distances <= 60,
+                distances <= self.MAX_DISTANCE_METERS,
+            ],
+            [
+                self.DISTANCE_WEIGHT,
+                self.DISTANCE_WEIGHT * 0.75,
+                self.DISTANCE_WEIGHT * 0.5,
+                self.DISTANCE_WEIGHT * 0.25,
+            ],
+            default=0.0,
+        )
+        
+        # 2. Category score - keyword scan once per distinct category
+        category_fractions: Dict[Optional[str], float] = {}
+        for row in candidates:
+            if row.category not in category_fractions:
+                category_fractions[row.category] = self._category_fraction(row.category)
+        category_weights = np.fromiter((category_fractions[row.category] for row in candidates), dtype=np.float64, count=n)
+        category_scores = category_weights * self.CATEGORY_WEIGHT
+        
+        # 3. Name similarity - elementwise token_sort_ratio in one native call
+        has_names = np.fromiter((bool(row.operator_name and row.business_name) for row in candidates), dtype=bool, count=n)
+        similarities = np.zeros(n, dtype=np.float64)
+        if has_names.any():
+            idx = np.flatnonzero(has_names)
+            similarities[idx] = process.cpdist(
+                [candidates[i].operator_name.lower() for i in idx],
+                [candidates[i].business_name.lower() for i in idx],
+                scorer=fuzz.token_sort_ratio,
+                workers=-1,
+            ) / 100.0
+        name_scores = np.select(
+            [similarities > 0.8, similarities > 0.5],
+            [self.NAME_SIMILARITY_WEIGHT, self.NAME_SIMILARITY_WEIGHT * 0.5],
+            default=0.0,
+        )
+        
+        # 4. Adjacency - not available yet (see _calculate_match_score)
+        scores = distance_scores + category_scores + name_scores
+        
+        # Highest score first within each lot; ties keep nearest-first order
+        lot_codes = np.unique(np.array([str(lot_id) for lot_id in lot_ids]), return_inverse=True)[1]
+        order = np.lexsort((np.arange(n), -scores, lot_codes))
+        
+        rows: List[Dict[str, Any]] = []
+        kept_per_lot: Dict[Any, int] = {}
+        for i in order:
+            if scores[i] <= 0:
+                continue
+            lot_id = lot_ids[i]
+            kept = kept_per_lot.get(lot_id, 0)
+            if kept >= self.MAX_MATCHES_PER_LOT:
+                continue
+            kept_per_lot[lot_id] = kept + 1
+            
+            row = candidates[i]
+            rows.append({
+                "id": uuid.uuid4(),
+                "parking_lot_id": lot_id,
+                "business_id": row.business_id,
+                "match_score": float(scores[i]),
+                "distance_meters": float(distances[i]),
+                "association_method": "operator_match" if similarities[i] > 0.8 else "spatial_proximity",
+                "category_weight": float(category_weights[i]),
+                "name_similarity": float(similarities[i]) if has_names[i] else None,
+                "is_primary": kept == 0,
+                "_business_name": row.business_name,
+            })
+        
+        return rows
+    
     def _find_business_matches(
         self,
         parking_lot_id: uuid.UUID,
@@ -215,27 +432,7 @@ class AssociationService:
         score += distance_score
         
         # 2. Category relevance score (30 points max)
-        category_score = 0
-        if business.category:
-            category_lower = business.category.lower()
-            
-            # Check high priority categories
-            for keyword in RELEVANT_CATEGORIES.get("high", []):
-                if keyword in category_lower:
-                    category_score = self.CATEGORY_WEIGHT
-                    break
-            
-            # Check medium priority if not high
-            if category_score == 0:
-                for keyword in RELEVANT_CATEGORIES.get("medium", []):
-                    if keyword in category_lower:
-                        category_score = self.CATEGORY_WEIGHT * 0.66
-                        break
-            
-            # Low priority fallback
-            if category_score == 0:
-                category_score = self.CATEGORY_WEIGHT * 0.33
-        
+        category_score = self.CATEGORY_WEIGHT * self._category_fraction(business.category)
         score += category_score
         details["category_weight"] = category_score / self.CATEGORY_WEIGHT
         
@@ -266,6 +463,26 @@ class AssociationService:
         
         return score, details
     
+    @staticmethod
+    def _category_fraction(category: Optional[str]) -> float:
+        """Share of CATEGORY_WEIGHT earned by a business category (0 if unknown)."""
+        if not category:
+            return 0
+        category_lower = category.lower()
+        
+        # Check high priority categories
+        for keyword in RELEVANT_CATEGORIES.get("high", []):
+            if keyword in category_lower:
+                return 1.0
+        
+        # Check medium priority if not high
+        for keyword in RELEVANT_CATEGORIES.get("medium", []):
+            if keyword in category_lower:
+                return 0.66
+        
+        # Low priority fallback
+        return 0.33
+    
     def get_primary_business_for_parking_lot(
         self,
         parking_lot_id: uuid.UUID,
@@ -78,7 +78,8 @@ class BoundaryService:
     def __init__(self):
         self._cache: Dict[str, List[Dict]] = {}
         self._loaded: Dict[str, bool] = {}
-        logger.info(f"BoundaryService initialized, KML dir: {self.KML_DIR}")
+        self._id_index: Dict[str, Dict[str, Dict]] = {}
+        logger.info("BoundaryService initialized, KML dir: %s", self.KML_DIR)
     
     def get_available_layers(self) -> List[Dict[str, Any]]:
         """Get list of available boundary layers"""
@@ -96,6 +97,11 @@ class BoundaryService:
             })
         return layers
     
+    def is_layer_available(self, layer_id: str) -> bool:
+        """Whether the KML file for a layer is deployed"""
+        config = self.BOUNDARY_TYPES.get(layer_id)
+        return bool(config) and (self.KML_DIR / config["file"]).exists()
+    
     def _parse_coordinates(self, coord_text: str) -> List[List[float]]:
         """Parse KML coordinate string to list of [lng, lat] pairs"""
         coords = []
@@ -197,10 +203,10 @@ class BoundaryService:
         file_path = self.KML_DIR / config["file"]
         
         if not file_path.exists():
-            logger.error(f"KML file not found: {file_path}")
+            logger.error("KML file not found: %s", file_path)
             return []
         
-        logger.info(f"Loading boundary layer: {layer_id} from {file_path}")
+        logger.info("Loading boundary layer: %s from %s", layer_id, file_path)
         
         features = []
         try:
@@ -234,11 +240,11 @@ class BoundaryService:
                     # Clear element to save memory
                     elem.clear()
             
-            logger.info(f"Loaded {len(features)} features from {layer_id}")
+            logger.info("Loaded %s features from %s", len(features), layer_id)
             self._loaded[layer_id] = True
             
         except Exception as e:
-            logger.error(f"Error loading {layer_id}: {e}", exc_info=True)
+            logger.error("Error loading %s: %s", layer_id, e, exc_info=True)
             return []
         
         return features
@@ -339,14 +345,15 @@ class BoundaryService:
     
     def get_boundary_by_id(self, layer_id: str, boundary_id: str) -> Optional[Dict]:
         """Get a specific boundary by its ID"""
-        all_features = self.get_layer(layer_id).get("features", [])
-        
-        for feature in all_features:
-            props = feature.get("properties", {})
-            if props.get("id") == boundary_id:
-                return feature
-        
-        return None
+        index = self._id_index.get(layer_id)
+        if index is None:
+            index = {}
+            for feature in self.get_layer(layer_id).get("features", []):
+                # First feature wins, as with a linear scan
+                index.setdefault(feature.get("properties", {}).get("id"), feature)
+            self._id_index[layer_id] = index
+        
+        return index.get(boundary_id)
     
     def get_boundary_at_point(
         self, 
@@ -368,7 +375,7 @@ class BoundaryService:
         all_features = self.get_layer(layer_id).get("features", [])
         point = Point(lng, lat)  # Shapely uses (x, y) = (lng, lat)
         
-        logger.info(f"Finding {layer_id} boundary at ({lat}, {lng})")
+        logger.info("Finding %s boundary at (%s, %s)", layer_id, lat, lng)
         
         for feature in all_features:
             geom_dict = feature.get("geometry", {})
@@ -382,14 +389,14 @@ class BoundaryService:
                 # Check if point is inside
                 if geom.contains(point):
                     props = feature.get("properties", {})
-                    logger.info(f"Found: {props.get('name', 'Unknown')}")
+                    logger.info("Found: %s", props.get('name', 'Unknown'))
                     return feature
                     
             except Exception as e:
                 # Skip invalid geometries
                 continue
         
-        logger.info(f"No {layer_id} boundary found at ({lat}, {lng})")
+        logger.info("No %s boundary found at (%s, %s)", layer_id, lat, lng)
         return None
     
     def get_boundary_info_at_point(
@@ -443,9 +450,11 @@ class BoundaryService:
         if layer_id:
             self._cache.pop(layer_id, None)
             self._loaded.pop(layer_id, None)
+            self._id_index.pop(layer_id, None)
         else:
             self._cache.clear()
             self._loaded.clear()
+            self._id_index.clear()
 
 
 # Singleton instance
@@ -6,18 +6,27 @@ Supports searching within viewport, ZIP code, or state.
 
 Key Features:
 - Text search for brand names (McDonald's, Starbucks, etc.)
-- Grid search for larger areas (state-level)
-- Rate limiting and caching
+- Grid search for larger areas (state-level): adaptive quadtree over the
+  state polygon, searched concurrently under a shared rate limit and a
+  per-search cost budget, streamed back as locations are found
 """
 
 import logging
 import asyncio
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+import time
+from typing import Optional, List, Dict, Any, AsyncIterator, Set, Tuple
+from dataclasses import dataclass, asdict
 import httpx
+from shapely.geometry import shape, Point
+from shapely.geometry.base import BaseGeometry
+from shapely.prepared import prep, PreparedGeometry
 
 from app.core.config import settings
+from app.core.http_client_manager import http_clients
 from app.core.search_service import SearchResultParcel
+from app.core.spatial_tiling import QuadtreePlanner, SearchCell
+from app.core.boundary_service import get_boundary_service
+from app.core.county_service import US_STATES
 
 logger = logging.getLogger(__name__)
 
@@ -76,15 +85,80 @@ STATE_CENTERS = {
     "WY": (42.755966, -107.302490),
 }
 
+STATE_FIPS = {abbr: fips for fips, abbr in US_STATES.items()}
+
+
+class RequestRateLimiter:
+    """Spaces requests at least 1/max_qps apart across all callers."""
+    
+    def __init__(self, max_qps: float):
+        self.interval = 1.0 / max_qps if max_qps > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class BrandGridStats:
+    """Coverage and cost of one state-wide brand search."""
+    state_area_km2: float = 0.0
+    request_budget: int = 0
+    cells_queried: int = 0
+    cells_saturated: int = 0
+    cells_split: int = 0
+    cells_stopped_early: int = 0  # Paging stopped because pages were mostly already-seen places
+    cells_skipped_budget: int = 0  # Never sent a request because the budget ran out
+    max_depth: int = 0
+    text_search_calls: int = 0
+    results_unique: int = 0
+    results_outside_state: int = 0
+    seed_results: int = 0  # Found by the statewide seed query
+    
+    @property
+    def estimated_cost_usd(self) -> float:
+        return round(self.text_search_calls * settings.PLACES_TEXT_SEARCH_COST_USD, 4)
+    
+    @property
+    def budget_exhausted(self) -> bool:
+        return self.text_search_calls >= self.request_budget
+    
+    @property
+    def partial(self) -> bool:
+        """Some of the state was left unsearched for lack of budget."""
+        return self.cells_skipped_budget > 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["estimated_cost_usd"] = self.estimated_cost_usd
+        data["budget_exhausted"] = self.budget_exhausted
+        data["partial"] = self.partial
+        return data
+
 
 class BrandSearchService:
     """
     Service to search for businesses by brand name using Google Places API.
     """
     
+    # Text Search paging (20 results per page, 3 pages max)
+    PAGE_SIZE = 20
+    MAX_PAGES = 3
+    PAGE_TOKEN_DELAY_SECONDS = 2.0
+    
     def __init__(self):
         self.api_key = settings.GOOGLE_MAPS_KEY
         self.base_url = "https://maps.googleapis.com/maps/api/place"
+        self._rate_limiter = RequestRateLimiter(settings.BRAND_SEARCH_MAX_QPS)
+        self._state_polygons: Dict[str, BaseGeometry] = {}
     
     @property
     def is_configured(self) -> bool:
@@ -125,7 +199,7 @@ class BrandSearchService:
             50000  # Max 50km radius
         )
         
-        logger.info(f"🏢 Brand search: '{brand_name}' in viewport (radius: {radius_m/1000:.1f}km)")
+        logger.info("🏢 Brand search: '%s' in viewport (radius: %.1fkm)", brand_name, radius_m/1000)
         
         return await self._text_search(
             query=brand_name,
@@ -156,7 +230,7 @@ class BrandSearchService:
             logger.warning("Google Maps API key not configured")
             return []
         
-        logger.info(f"🏢 Brand search: '{brand_name}' in ZIP {zip_code}")
+        logger.info("🏢 Brand search: '%s' in ZIP %s", brand_name, zip_code)
         
         # Use text search with ZIP code as location bias
         return await self._text_search(
@@ -173,7 +247,8 @@ class BrandSearchService:
         """
         Search for a brand within a state.
         
-        WARNING: This can be expensive - uses grid search with multiple API calls.
+        Collects stream_brand_in_state; see there for how the grid search
+        is bounded.
         
         Args:
             brand_name: Name of the brand/franchise
@@ -183,29 +258,281 @@ class BrandSearchService:
         Returns:
             List of SearchResultParcel
         """
+        results: List[SearchResultParcel] = []
+        async for event in self.stream_brand_in_state(brand_name, state_code, limit=limit):
+            if event["type"] == "locations":
+                results.extend(event["parcels"])
+        return results
+    
+    async def stream_brand_in_state(
+        self,
+        brand_name: str,
+        state_code: str,
+        limit: int = 100,
+        max_cost_usd: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Grid search for a brand across a state, yielding results as cells finish.
+        
+        A statewide query runs first, so the brand's most prominent locations
+        come back even when the budget is small. The state polygon
+        (BoundaryService "states" layer) is then covered with the coarsest
+        quadtree cells that fit the Text Search radius limit, ordered so
+        cells holding seed results go first and the rest spread across the
+        state (a budget too small for every cell thins the grid evenly
+        rather than covering one end of the state). Cells are searched
+        concurrently (BRAND_SEARCH_MAX_CONCURRENT) through the
+        shared rate limiter; a cell stops paging once a page is mostly
+        places already seen, and a cell that returns the full 60 results
+        is split for the next wave. Every request counts against the cost
+        budget; once it is spent the search ends with what it has and the
+        complete event is marked partial.
+        
+        Falls back to a single state-biased search (always partial) when no
+        state polygon is available.
+        
+        Yields dicts:
+            {"type": "plan", "state", "cells", "request_budget"}
+            {"type": "locations", "cell_id", "parcels": [SearchResultParcel], "total"}
+            {"type": "complete", "total", "partial", "stats"}
+            {"type": "error", "message"}
+        """
         if not self.is_configured:
             logger.warning("Google Maps API key not configured")
-            return []
+            yield {"type": "error", "message": "Google Maps API key not configured"}
+            return
         
         state_code = state_code.upper()
-        center = STATE_CENTERS.get(state_code)
+        if state_code not in STATE_CENTERS:
+            logger.warning("Unknown state code: %s", state_code)
+            yield {"type": "error", "message": f"Unknown state code: {state_code}"}
+            return
         
-        if not center:
-            logger.warning(f"Unknown state code: {state_code}")
-            return []
+        logger.info("🏢 Brand search: '%s' in state %s", brand_name, state_code)
         
-        logger.info(f"🏢 Brand search: '{brand_name}' in state {state_code}")
-        logger.warning(f"   ⚠️ State-level search is expensive - consider using viewport or ZIP")
+        polygon = await self._get_state_polygon(state_code)
+        if polygon is None:
+            logger.warning("   ⚠️ No boundary for %s - falling back to a single state-biased search", state_code)
+            center = STATE_CENTERS[state_code]
+            results = await self._text_search(
+                query=f"{brand_name} in {state_code}",
+                center_lat=center[0],
+                center_lng=center[1],
+                radius_m=200000,  # 200km radius
+                limit=limit,
+            )
+            if results:
+                yield {"type": "locations", "cell_id": None, "parcels": results, "total": len(results)}
+            yield {"type": "complete", "total": len(results), "partial": True, "stats": None}
+            return
         
-        # Use a single search with state name for now
-        # Full grid search would be too expensive
-        return await self._text_search(
-            query=f"{brand_name} in {state_code}",
-            center_lat=center[0],
-            center_lng=center[1],
-            radius_m=200000,  # 200km radius
-            limit=limit,
+        max_cost_usd = max_cost_usd if max_cost_usd is not None else settings.BRAND_SEARCH_MAX_COST_USD
+        planner = QuadtreePlanner(
+            polygon,
+            max_radius_m=settings.PLACES_TILE_MAX_RADIUS_M,
+            min_side_m=settings.BRAND_SEARCH_MIN_SIDE_M,
+        )
+        inside = prep(polygon)
+        stats = BrandGridStats(
+            state_area_km2=round(planner.area_km2, 1),
+            request_budget=max(1, int(max_cost_usd / settings.PLACES_TEXT_SEARCH_COST_USD)),
+        )
+        semaphore = asyncio.Semaphore(settings.BRAND_SEARCH_MAX_CONCURRENT)
+        seen_place_ids: Set[str] = set()
+        total = 0
+        
+        wave = planner.initial_cells()
+        logger.info(
+            "   🗺️  %s initial cells over %.0f km², budget %s requests ($%.2f)",
+            len(wave), stats.state_area_km2, stats.request_budget, max_cost_usd
+        )
+        yield {"type": "plan", "state": state_code, "cells": len(wave), "request_budget": stats.request_budget}
+        
+        client = http_clients.get("google")
+        
+        # Statewide seed: Google ranks by prominence, so this finds the
+        # brand's main metros and tells the grid where to look first
+        center = STATE_CENTERS[state_code]
+        seed_places, _, _ = await self._page_search(
+            client, f"{brand_name} in {state_code}", center[0], center[1], 200000, seen_place_ids, stats,
+        )
+        stats.results_unique += len(seed_places)
+        located = self._locate(seed_places, brand_name, inside, stats)[:limit]
+        stats.seed_results = len(located)
+        total += len(located)
+        if located:
+            yield {"type": "locations", "cell_id": None, "parcels": located, "total": total}
+        wave = planner.spread_order(wave, [(result.lng, result.lat) for result in located])
+        
+        while wave and total < limit and not stats.budget_exhausted:
+            # Every cell needs at least one request
+            remaining = stats.request_budget - stats.text_search_calls
+            if len(wave) > remaining:
+                stats.cells_skipped_budget += len(wave) - remaining
+                wave = wave[:remaining]
+                
+            tasks = [
+                asyncio.create_task(self._search_cell(client, brand_name, cell, seen_place_ids, stats, semaphore))
+                for cell in wave
+            ]
+            next_wave: List[SearchCell] = []
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    cell, places, saturated, requests = await finished
+                    if not requests:
+                        # Earlier cells' paging spent the budget first
+                        stats.cells_skipped_budget += 1
+                        continue
+                    stats.cells_queried += 1
+                    stats.max_depth = max(stats.max_depth, cell.depth)
+                    stats.results_unique += len(places)
+                        
+                    if saturated:
+                        stats.cells_saturated += 1
+                        if planner.can_split(cell):
+                            stats.cells_split += 1
+                            next_wave.extend(planner.split(cell))
+                        
+                    located = self._locate(places, brand_name, inside, stats)[:limit - total]
+                    total += len(located)
+                    if located:
+                        yield {"type": "locations", "cell_id": cell.cell_id, "parcels": located, "total": total}
+                    if total >= limit:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                
+            wave = next_wave
+        
+        if wave and total < limit:
+            stats.cells_skipped_budget += len(wave)
+        
+        logger.info(
+            "   Found %s locations for '%s' in %s: %s cells (%s saturated, depth %s, %s skipped), %s requests (~$%.2f), %s outside state",
+            total, brand_name, state_code, stats.cells_queried, stats.cells_saturated, stats.max_depth, stats.cells_skipped_budget, stats.text_search_calls, stats.estimated_cost_usd, stats.results_outside_state
         )
+        yield {"type": "complete", "total": total, "partial": stats.partial, "stats": stats.to_dict()}
+    
+    async def _search_cell(
+        self,
+        client: httpx.AsyncClient,
+        brand_name: str,
+        cell: SearchCell,
+        seen_place_ids: Set[str],
+        stats: BrandGridStats,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[SearchCell, List[Dict[str, Any]], bool, int]:
+        """
+        Page through one cell's Text Search results.
+        
+        Returns (cell, places not seen before, saturated, requests sent);
+        see _page_search.
+        """
+        async with semaphore:
+            new_places, saturated, requests = await self._page_search(
+                client, brand_name, cell.center_lat, cell.center_lng, cell.radius_m, seen_place_ids, stats,
+            )
+        return cell, new_places, saturated, requests
+    
+    async def _page_search(
+        self,
+        client: httpx.AsyncClient,
+        query: str,
+        center_lat: float,
+        center_lng: float,
+        radius_m: float,
+        seen_place_ids: Set[str],
+        stats: BrandGridStats,
+    ) -> Tuple[List[Dict[str, Any]], bool, int]:
+        """
+        Page through one Text Search while the request budget lasts.
+        
+        Returns (places not seen before, saturated, requests sent). A
+        search is saturated when it returned every page and the last one
+        was full and still mostly new - there are more locations than one
+        search can return.
+        """
+        new_places: List[Dict[str, Any]] = []
+        next_page_token = None
+        requests = 0
+        saturated = False
+        
+        while requests < self.MAX_PAGES:
+            if stats.budget_exhausted:
+                break
+            stats.text_search_calls += 1
+            requests += 1
+            
+            if next_page_token:
+                # Google requires a short delay before using next_page_token
+                await asyncio.sleep(self.PAGE_TOKEN_DELAY_SECONDS)
+            
+            try:
+                places, next_page_token = await self._fetch_page(
+                    client, query, center_lat, center_lng, radius_m, next_page_token,
+                )
+            except Exception as e:
+                logger.warning("   Search '%s' near %.4f,%.4f failed: %s", query, center_lat, center_lng, e)
+                break
+            
+            fresh = [p for p in places if p.get("place_id") and p["place_id"] not in seen_place_ids]
+            seen_place_ids.update(p["place_id"] for p in fresh)
+            new_places.extend(fresh)
+            
+            if len(fresh) < len(places) * settings.BRAND_SEARCH_MIN_NEW_RATIO:
+                stats.cells_stopped_early += 1
+                break
+            if requests == self.MAX_PAGES and len(places) >= self.PAGE_SIZE:
+                saturated = True
+            if not next_page_token:
+                break
+        
+        return new_places, saturated, requests
+    
+    def _locate(
+        self,
+        places: List[Dict[str, Any]],
+        brand_name: str,
+        inside: PreparedGeometry,
+        stats: BrandGridStats,
+    ) -> List[SearchResultParcel]:
+        """Convert places to results, dropping those outside the state polygon."""
+        located = []
+        for place in places:
+            result = self._place_to_result(place, brand_name)
+            if not result:
+                continue
+            if not inside.contains(Point(result.lng, result.lat)):
+                stats.results_outside_state += 1
+                continue
+            located.append(result)
+        return located
+    
+    async def _get_state_polygon(self, state_code: str) -> Optional[BaseGeometry]:
+        """State boundary from the BoundaryService "states" layer (cached)."""
+        if state_code in self._state_polygons:
+            return self._state_polygons[state_code]
+        
+        fips = STATE_FIPS.get(state_code)
+        if not fips:
+            return None
+        
+        try:
+            # First call parses the states KML - keep it off the event loop
+            feature = await asyncio.to_thread(get_boundary_service().get_boundary_by_id, "states", fips)
+        except Exception as e:
+            logger.warning("State boundary lookup failed for %s: %s", state_code, e)
+            return None
+        if not feature or not feature.get("geometry"):
+            return None
+        
+        polygon = shape(feature["geometry"])
+        if not polygon.is_valid:
+            polygon = polygon.buffer(0)
+        self._state_polygons[state_code] = polygon
+        return polygon
     
     async def _text_search(
         self,
@@ -224,63 +551,81 @@ class BrandSearchService:
         next_page_token = None
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                while len(results) < limit:
-                    url = f"{self.base_url}/textsearch/json"
-                    
-                    params = {
-                        "query": query,
-                        "key": self.api_key,
-                    }
+            client = http_clients.get("google")
+            while len(results) < limit:
+                places, next_page_token = await self._fetch_page(
+                    client, query, center_lat, center_lng, radius_m, next_page_token,
+                )
                     
-                    if next_page_token:
-                        params["pagetoken"] = next_page_token
-                    elif center_lat and center_lng:
-                        params["location"] = f"{center_lat},{center_lng}"
-                        if radius_m:
-                            params["radius"] = int(radius_m)
+                for place in places:
+                    result = self._place_to_result(place, query)
+                    if result:
+                        results.append(result)
                     
-                    response = await client.get(url, params=params)
+                if not next_page_token:
+                    break
                     
-                    if response.status_code != 200:
-                        logger.error(f"Google Places API error: {response.status_code}")
-                        break
-                    
-                    data = response.json()
-                    status = data.get("status")
-                    
-                    if status == "ZERO_RESULTS":
-                        logger.info(f"   No results found for '{query}'")
-                        break
-                    
-                    if status not in ("OK", "ZERO_RESULTS"):
-                        logger.error(f"Google Places API status: {status}")
-                        break
-                    
-                    places = data.get("results", [])
-                    
-                    for place in places:
-                        result = self._place_to_result(place, query)
-                        if result:
-                            results.append(result)
-                    
-                    next_page_token = data.get("next_page_token")
-                    
-                    if not next_page_token:
-                        break
-                    
-                    # Google requires a short delay before using next_page_token
-                    await asyncio.sleep(2)
+                # Google requires a short delay before using next_page_token
+                await asyncio.sleep(self.PAGE_TOKEN_DELAY_SECONDS)
                 
-                logger.info(f"   Found {len(results)} locations for '{query}'")
-                return results[:limit]
+            logger.info("   Found %s locations for '%s'", len(results), query)
+            return results[:limit]
                 
         except Exception as e:
-            logger.error(f"Google Places search error: {e}")
+            logger.error("Google Places search error: %s", e)
             import traceback
             traceback.print_exc()
             return results
     
+    async def _fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        query: str,
+        center_lat: Optional[float],
+        center_lng: Optional[float],
+        radius_m: Optional[float],
+        page_token: Optional[str],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        One Text Search page through the shared rate limiter.
+        
+        Returns (places, next_page_token); API errors are logged and
+        return an empty page.
+        """
+        url = f"{self.base_url}/textsearch/json"
+        
+        params = {
+            "query": query,
+            "key": self.api_key,
+        }
+        
+        if page_token:
+            params["pagetoken"] = page_token
+        elif center_lat and center_lng:
+            params["location"] = f"{center_lat},{center_lng}"
+            if radius_m:
+                params["radius"] = int(radius_m)
+        
+        await self._rate_limiter.wait()
+        response = await client.get(url, params=params)
+        
+        if response.status_code != 200:
+            logger.error("Google Places API error: %s", response.status_code)
+            return [], None
+        
+        data = response.json()
+        status = data.get("status")
+        
+        if status == "ZERO_RESULTS":
+            logger.info("   No results found for '%s'", query)
+            return [], None
+        
+        if status != "OK":
+            logger.error("Google Places API status: %s", status)
+            return [], None
+        
+        return data.get("results", []), data.get("next_page_token")
+    
     def _place_to_result(
         self,
         place: Dict[str, Any],
@@ -311,7 +656,7 @@ class BrandSearchService:
                 place_id=place.get("place_id"),
             )
         except Exception as e:
-            logger.debug(f"Failed to parse place: {e}")
+            logger.debug("Failed to parse place: %s", e)
             return None
 
 
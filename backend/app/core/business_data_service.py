@@ -8,6 +8,7 @@ from geoalchemy2.shape import from_shape
 import uuid
 
 from app.core.config import settings
+from app.core.http_client_manager import http_clients
 from app.models.business import Business
 
 logger = logging.getLogger(__name__)
@@ -95,11 +96,11 @@ class BusinessDataService:
             logger.warning("   ⚠️  Google Places API key not configured")
             return []
         
-        logger.info(f"   📡 Querying Google Places API (max: {max_businesses})...")
+        logger.info("   📡 Querying Google Places API (max: %s)...", max_businesses)
         
         try:
             businesses = await self._query_google_places(area_polygon, categories, max_businesses)
-            logger.info(f"   ✅ Google Places: {len(businesses)} businesses found")
+            logger.info("   ✅ Google Places: %s businesses found", len(businesses))
             
             # Log category breakdown
             categories_count = {}
@@ -108,11 +109,11 @@ class BusinessDataService:
                 categories_count[cat] = categories_count.get(cat, 0) + 1
             
             for cat, count in sorted(categories_count.items(), key=lambda x: -x[1])[:5]:
-                logger.info(f"      - {cat}: {count}")
+                logger.info("      - %s: %s", cat, count)
             
             return businesses
         except Exception as e:
-            logger.error(f"   ❌ Google Places query failed: {e}")
+            logger.error("   ❌ Google Places query failed: %s", e)
             return []
     
     async def load_businesses_near_point(
@@ -132,30 +133,30 @@ class BusinessDataService:
         
         businesses = []
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                url,
-                params={
-                    "location": f"{latitude},{longitude}",
-                    "radius": radius_meters,
-                    "key": self.google_places_key,
-                }
-            )
+        client = http_clients.get("google")
+        response = await client.get(
+            url,
+            params={
+                "location": f"{latitude},{longitude}",
+                "radius": radius_meters,
+                "key": self.google_places_key,
+            }
+        )
             
-            if response.status_code != 200:
-                logger.error(f"Google Places API returned {response.status_code}")
-                return []
+        if response.status_code != 200:
+            logger.error("Google Places API returned %s", response.status_code)
+            return []
             
-            data = response.json()
+        data = response.json()
             
-            if data.get("status") not in ["OK", "ZERO_RESULTS"]:
-                logger.error(f"Google Places API error: {data.get('status')}")
-                return []
+        if data.get("status") not in ["OK", "ZERO_RESULTS"]:
+            logger.error("Google Places API error: %s", data.get('status'))
+            return []
             
-            for item in data.get("results", []):
-                business = await self._parse_google_place(item)
-                if business:
-                    businesses.append(business)
+        for item in data.get("results", []):
+            business = await self._parse_google_place(item)
+            if business:
+                businesses.append(business)
         
         return businesses
     
@@ -199,63 +200,63 @@ class BusinessDataService:
                 "supermarket",
             ]
         
-        logger.info(f"      Searching {len(queries)} categories...")
+        logger.info("      Searching %s categories...", len(queries))
         
         businesses = []
         seen_place_ids = set()
         
         url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for query in queries:
-                if len(businesses) >= max_businesses:
-                    logger.info(f"      Reached max_businesses limit ({max_businesses})")
-                    break
+        client = http_clients.get("google")
+        for query in queries:
+            if len(businesses) >= max_businesses:
+                logger.info("      Reached max_businesses limit (%s)", max_businesses)
+                break
                 
-                try:
-                    response = await client.get(
-                        url,
-                        params={
-                            "query": query,
-                            "location": f"{centroid.y},{centroid.x}",
-                            "radius": int(radius),
-                            "key": self.google_places_key,
-                        }
-                    )
+            try:
+                response = await client.get(
+                    url,
+                    params={
+                        "query": query,
+                        "location": f"{centroid.y},{centroid.x}",
+                        "radius": int(radius),
+                        "key": self.google_places_key,
+                    }
+                )
                     
-                    if response.status_code != 200:
-                        continue
+                if response.status_code != 200:
+                    continue
                     
-                    data = response.json()
+                data = response.json()
                     
-                    if data.get("status") not in ["OK", "ZERO_RESULTS"]:
-                        continue
+                if data.get("status") not in ["OK", "ZERO_RESULTS"]:
+                    continue
                     
-                    for item in data.get("results", []):
-                        if len(businesses) >= max_businesses:
-                            break
+                for item in data.get("results", []):
+                    if len(businesses) >= max_businesses:
+                        break
                             
-                        place_id = item.get("place_id")
-                        if place_id in seen_place_ids:
-                            continue
-                        seen_place_ids.add(place_id)
+                    place_id = item.get("place_id")
+                    if place_id in seen_place_ids:
+                        continue
+                    seen_place_ids.add(place_id)
                         
-                        # Check if within polygon
-                        location = item.get("geometry", {}).get("location", {})
-                        lat = location.get("lat")
-                        lng = location.get("lng")
+                    # Check if within polygon
+                    location = item.get("geometry", {}).get("location", {})
+                    lat = location.get("lat")
+                    lng = location.get("lng")
                         
-                        if lat and lng:
-                            point = Point(lng, lat)
-                            if not poly.contains(point):
-                                continue
+                    if lat and lng:
+                        point = Point(lng, lat)
+                        if not poly.contains(point):
+                            continue
                             
-                            business = await self._parse_google_place(item, client)
-                            if business:
-                                businesses.append(business)
+                        business = await self._parse_google_place(item, client)
+                        if business:
+                            businesses.append(business)
                 
-                except Exception as e:
-                    logger.warning(f"Failed to query '{query}': {e}")
+            except Exception as e:
+                logger.warning("Failed to query '%s': %s", query, e)
         
         return businesses
     
@@ -307,12 +308,12 @@ class BusinessDataService:
                             elif "administrative_area_level_2" in types:
                                 business.county = component.get("long_name")
                 except Exception as e:
-                    logger.debug(f"Failed to get place details: {e}")
+                    logger.debug("Failed to get place details: %s", e)
             
             return business
             
         except Exception as e:
-            logger.warning(f"Failed to parse Google Place: {e}")
+            logger.warning("Failed to parse Google Place: %s", e)
             return None
     
     async def _get_place_details(
@@ -379,7 +380,7 @@ class BusinessDataService:
                 db.add(db_business)
                 saved.append(db_business)
             except Exception as e:
-                logger.error(f"Failed to save business: {e}")
+                logger.error("Failed to save business: %s", e)
         
         db.commit()
         
@@ -8,17 +8,73 @@ This is the first step in the business-first discovery pipeline:
 1. Find businesses by type → 2. Find their parking lots → 3. Evaluate condition
 """
 
+import asyncio
 import logging
 import httpx
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+from contextvars import ContextVar
+from typing import List, Dict, Any, Optional, Tuple, Set, Callable, Union
+from dataclasses import dataclass, field, asdict
 from enum import Enum
-from shapely.geometry import Point
+from shapely.geometry import Point, Polygon, MultiPolygon
+from shapely.prepared import prep
 
 from app.core.config import settings
+from app.core.http_client_manager import http_clients
+from app.core.places_cache import places_cache
+from app.core.spatial_tiling import QuadtreePlanner, SearchCell
 
 logger = logging.getLogger(__name__)
 
+TIER_ORDER = {"premium": 0, "high": 1, "standard": 2}
+
+
+@dataclass
+class _SpendCap:
+    """Places spend cap for one discovery; Details for its results are held back from searching."""
+    limit_usd: float
+    details_reserved: int  # Details calls kept affordable before any further Text Search
+
+
+# Per-discovery API call counter and spend cap (set by discover_in_polygon, inherited by its tasks)
+_api_calls: ContextVar[Optional[Dict[str, int]]] = ContextVar("places_api_calls", default=None)
+_spend_cap: ContextVar[Optional[_SpendCap]] = ContextVar("places_spend_cap", default=None)
+
+
+def _call_cost(kind: str) -> float:
+    return settings.PLACES_DETAILS_COST_USD if kind == "details" else settings.PLACES_TEXT_SEARCH_COST_USD
+
+
+def _places_spend(counter: Dict[str, int]) -> float:
+    return sum(_call_cost(kind) * calls for kind, calls in counter.items())
+
+
+def _can_afford(counter: Dict[str, int], kind: str) -> bool:
+    cap = _spend_cap.get()
+    if cap is None:
+        return True
+    held = 0.0
+    if kind != "details":
+        held = max(0, cap.details_reserved - counter.get("details", 0)) * settings.PLACES_DETAILS_COST_USD
+    return _places_spend(counter) + _call_cost(kind) + held <= cap.limit_usd + 1e-9
+
+
+def _reserve_api_call(kind: str) -> bool:
+    """Count a request about to be sent; False (not sent) if it would pass the spend cap."""
+    counter = _api_calls.get()
+    if counter is None:
+        return True
+    if not _can_afford(counter, kind):
+        return False
+    counter[kind] = counter.get(kind, 0) + 1
+    return True
+
+
+def _release_api_call(kind: str) -> None:
+    """Undo a reservation whose request was cancelled before it completed."""
+    counter = _api_calls.get()
+    if counter is not None and counter.get(kind):
+        counter[kind] -= 1
+
 
 class BusinessTier(str, Enum):
     """Business priority tiers for lead scoring."""
@@ -148,6 +204,47 @@ class DiscoveredBusiness:
         return bool(self.phone or self.website)
 
 
+@dataclass
+class TilingStats:
+    """Coverage and cost of one polygon discovery."""
+    polygon_area_km2: float = 0.0
+    cells_queried: int = 0
+    cells_saturated: int = 0
+    cells_split: int = 0
+    cells_revisited: int = 0  # Searched again deeper because more results were still needed
+    max_depth: int = 0
+    text_search_calls: int = 0  # Actual API calls (cache hits excluded)
+    details_calls: int = 0
+    results_raw: int = 0  # Sum of per-cell results (before dedupe)
+    results_unique: int = 0
+    results_outside_polygon: int = 0
+    results_skipped: int = 0  # Rejected by skip_place_ids (e.g. already processed)
+    results_selected: int = 0
+    spend_limit_usd: Optional[float] = None
+    cells_skipped_budget: int = 0  # Left unsearched because the spend cap was reached
+    
+    @property
+    def unique_per_search_call(self) -> float:
+        return round(self.results_unique / self.text_search_calls, 2) if self.text_search_calls else 0.0
+    
+    @property
+    def estimated_cost_usd(self) -> float:
+        return round(_places_spend({"text_search": self.text_search_calls, "details": self.details_calls}), 4)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["unique_per_search_call"] = self.unique_per_search_call
+        data["estimated_cost_usd"] = self.estimated_cost_usd
+        return data
+
+
+@dataclass
+class PolygonDiscoveryResult:
+    """Businesses found inside a polygon plus tiling stats."""
+    businesses: List[DiscoveredBusiness]
+    stats: TilingStats
+
+
 class BusinessFirstDiscoveryService:
     """
     Service to discover businesses by type for lead generation.
@@ -156,9 +253,34 @@ class BusinessFirstDiscoveryService:
     and retrieves their contact information.
     """
     
+    # Max concurrent Text Search queries (across all tiers)
+    MAX_CONCURRENT_QUERIES = 6
+    
+    # Max concurrent Place Details lookups
+    MAX_CONCURRENT_DETAILS = 10
+    
+    # Caller name for shared Places cache hit rates
+    CACHE_CALLER = "business_discovery"
+    DETAILS_FIELDS = "formatted_phone_number,website,name,formatted_address"
+    
+    # Waits before each attempt to use a next_page_token (usually live after ~1-2s)
+    PAGE_TOKEN_DELAYS = (1.0, 1.0, 2.0)
+    
+    # Text Search pagination: 20 results per page, at most 3 pages (60 results)
+    PAGE_SIZE = 20
+    MAX_PAGES_PER_QUERY = 3
+    
+    # New in-polygon results per Text Search assumed when sizing a spend cap (conservative)
+    CAP_RESULTS_PER_SEARCH = 5
+    
     def __init__(self):
         self.google_places_key = settings.GOOGLE_PLACES_KEY
         self.base_url = "https://maps.googleapis.com/maps/api/place"
+        self._query_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUERIES)
+        self._details_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DETAILS)
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        return http_clients.get("google")
     
     async def discover_businesses(
         self,
@@ -169,10 +291,15 @@ class BusinessFirstDiscoveryService:
         business_type_ids: Optional[List[str]] = None,
         max_per_tier: int = 20,
         max_total: int = 50,
+        fetch_details: bool = True,
     ) -> List[DiscoveredBusiness]:
         """
         Discover businesses in an area, prioritized by tier.
         
+        All text searches run concurrently; results are merged in tier/query
+        priority order (same ordering and cut-offs as a serial search), and
+        Place Details are then fetched concurrently for the selected places only.
+        
         Args:
             center_lat: Center latitude of search area
             center_lng: Center longitude of search area
@@ -181,6 +308,7 @@ class BusinessFirstDiscoveryService:
             business_type_ids: Specific business type IDs to search (e.g., ["hoa", "apartments"])
             max_per_tier: Maximum businesses per tier
             max_total: Maximum total businesses to return
+            fetch_details: Look up phone/website now (False: caller attaches them later)
         
         Returns:
             List of DiscoveredBusiness sorted by tier (premium first)
@@ -189,146 +317,250 @@ class BusinessFirstDiscoveryService:
             logger.error("Google Places API key not configured")
             return []
         
-        all_businesses: List[DiscoveredBusiness] = []
-        seen_place_ids: set = set()
+        businesses, _, _ = await self._discover_in_circle(
+            center_lat=center_lat,
+            center_lng=center_lng,
+            radius_meters=radius_meters,
+            tiers=tiers,
+            business_type_ids=business_type_ids,
+            max_per_tier=max_per_tier,
+            max_total=max_total,
+            fetch_details=fetch_details,
+        )
         
-        # Determine which queries to use
+        logger.info(
+            "Discovered %s businesses: premium=%s, high=%s, standard=%s",
+            len(businesses), len([b for b in businesses if b.tier == BusinessTier.PREMIUM]), len([b for b in businesses if b.tier == BusinessTier.HIGH]), len([b for b in businesses if b.tier == BusinessTier.STANDARD])
+        )
+        
+        return businesses
+    
+    async def _discover_in_circle(
+        self,
+        center_lat: float,
+        center_lng: float,
+        radius_meters: int,
+        tiers: Optional[List[BusinessTier]],
+        business_type_ids: Optional[List[str]],
+        max_per_tier: int,
+        max_total: int,
+        fetch_details: bool,
+    ) -> Tuple[List[DiscoveredBusiness], bool, bool]:
+        """
+        discover_businesses plus (saturated, has_more): saturated if a query
+        returned every page and the last one was full (Google has more than
+        one search can return); has_more if higher caps could select more here
+        (a query stopped with pages left, a query was skipped, or a cap was hit).
+        """
+        # Determine which queries to use, in priority order
         if business_type_ids:
-            # Use specific business types
+            # Use specific business types, searched in tier order (premium first)
             tier_queries = get_queries_for_type_ids(business_type_ids)
-            # Search in tier order (premium first)
             search_order = [BusinessTier.PREMIUM, BusinessTier.HIGH, BusinessTier.STANDARD]
-            
-            for tier in search_order:
-                if len(all_businesses) >= max_total:
-                    break
-                
-                if tier not in tier_queries:
-                    continue
-                
-                tier_businesses = await self._search_tier(
-                    center_lat=center_lat,
-                    center_lng=center_lng,
-                    radius_meters=radius_meters,
-                    tier=tier,
-                    queries=tier_queries[tier],
-                    max_results=max_per_tier,
-                    seen_place_ids=seen_place_ids,
-                )
-                
-                for business in tier_businesses:
-                    if len(all_businesses) >= max_total:
-                        break
-                    all_businesses.append(business)
-                    seen_place_ids.add(business.places_id)
+            plan = [(tier, tier_queries[tier]) for tier in search_order if tier in tier_queries]
         else:
             # Use tiers (default: all)
             if tiers is None:
                 tiers = [BusinessTier.PREMIUM, BusinessTier.HIGH, BusinessTier.STANDARD]
+            plan = [(tier, get_queries_for_tier(tier)) for tier in tiers]
+        
+        selected, saturated, has_more = await self._search_tiers(
+            plan=plan,
+            center_lat=center_lat,
+            center_lng=center_lng,
+            radius_meters=radius_meters,
+            max_per_tier=max_per_tier,
+            max_total=max_total,
+        )
+        
+        # Details (phone, website) for the selected places, concurrently, order preserved
+        businesses = await asyncio.gather(*[
+            self._create_business_from_place(place=place, tier=tier, query=query, fetch_details=fetch_details)
+            for tier, query, place in selected
+        ])
+        return [b for b in businesses if b], saturated, has_more
+    
+    async def _search_tiers(
+        self,
+        plan: List[Tuple[BusinessTier, List[str]]],
+        center_lat: float,
+        center_lng: float,
+        radius_meters: int,
+        max_per_tier: int,
+        max_total: int,
+    ) -> Tuple[List[Tuple[BusinessTier, str, Dict[str, Any]]], bool, bool]:
+        """
+        Run every (tier, query) text search concurrently and merge in priority order.
+        
+        Queries are started in priority order (the semaphore is FIFO) and any
+        still pending are cancelled as soon as the higher-priority results
+        already decide the merged selection.
+        
+        Returns:
+            ([(tier, query, place)], saturated, has_more) - deduped by place_id,
+            at most max_per_tier per tier and max_total overall; saturated if
+            any finished query was cut off by the page limit, has_more if
+            higher caps could select more
+        """
+        tasks = {
+            asyncio.create_task(self._search_query(
+                query=query,
+                center_lat=center_lat,
+                center_lng=center_lng,
+                radius_meters=radius_meters,
+                max_results=max_per_tier,
+            )): (tier, query)
+            for tier, queries in plan
+            for query in queries
+        }
+        results: Dict[Tuple[BusinessTier, str], List[Dict[str, Any]]] = {}
+        saturated = has_more = False
+        
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        results[tasks[task]], query_saturated, query_more = task.result()
+                        saturated = saturated or query_saturated
+                        has_more = has_more or query_more
+                    except Exception as e:
+                        logger.warning("Error searching for '%s': %s", tasks[task][1], e)
+                        results[tasks[task]] = []
+                
+                _, decided = self._merge_tier_results(plan, results, max_per_tier, max_total)
+                if decided:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        if pending:
+            logger.info("Skipped %s lower-priority queries (enough results)", len(pending))
+        
+        selected, _ = self._merge_tier_results(plan, results, max_per_tier, max_total)
+        tier_full = any(
+            sum(1 for t, _, _ in selected if t == tier) >= max_per_tier for tier, _ in plan
+        )
+        has_more = has_more or bool(pending) or len(selected) >= max_total or tier_full
+        return selected, saturated, has_more
+    
+    @staticmethod
+    def _merge_tier_results(
+        plan: List[Tuple[BusinessTier, List[str]]],
+        results: Dict[Tuple[BusinessTier, str], List[Dict[str, Any]]],
+        max_per_tier: int,
+        max_total: int,
+    ) -> Tuple[List[Tuple[BusinessTier, str, Dict[str, Any]]], bool]:
+        """
+        Merge per-query results exactly as a serial tier-by-tier search would.
+        
+        Returns:
+            (selection, decided) - decided is False while a query that could
+            still change the selection has not finished
+        """
+        selected: List[Tuple[BusinessTier, str, Dict[str, Any]]] = []
+        seen_place_ids: set = set()
+        
+        for tier, queries in plan:
+            if len(selected) >= max_total:
+                return selected, True
             
-            for tier in tiers:
-                if len(all_businesses) >= max_total:
+            tier_count = 0
+            for query in queries:
+                if tier_count >= max_per_tier or len(selected) >= max_total:
                     break
+                if (tier, query) not in results:
+                    return selected, False
                 
-                tier_businesses = await self._search_tier(
-                    center_lat=center_lat,
-                    center_lng=center_lng,
-                    radius_meters=radius_meters,
-                    tier=tier,
-                    queries=get_queries_for_tier(tier),
-                    max_results=max_per_tier,
-                    seen_place_ids=seen_place_ids,
-                )
-                
-                for business in tier_businesses:
-                    if len(all_businesses) >= max_total:
+                for place in results[(tier, query)]:
+                    if tier_count >= max_per_tier or len(selected) >= max_total:
                         break
-                    all_businesses.append(business)
-                    seen_place_ids.add(business.places_id)
-        
-        logger.info(
-            f"Discovered {len(all_businesses)} businesses: "
-            f"premium={len([b for b in all_businesses if b.tier == BusinessTier.PREMIUM])}, "
-            f"high={len([b for b in all_businesses if b.tier == BusinessTier.HIGH])}, "
-            f"standard={len([b for b in all_businesses if b.tier == BusinessTier.STANDARD])}"
-        )
+                    place_id = place["place_id"]
+                    if place_id in seen_place_ids:
+                        continue
+                    selected.append((tier, query, place))
+                    seen_place_ids.add(place_id)
+                    tier_count += 1
         
-        return all_businesses
+        return selected, True
     
-    async def _search_tier(
+    async def _search_query(
         self,
+        query: str,
         center_lat: float,
         center_lng: float,
         radius_meters: int,
-        tier: BusinessTier,
-        queries: List[str],
         max_results: int,
-        seen_place_ids: set,
-        max_pages_per_query: int = 3,  # Google allows up to 3 pages (60 results)
-    ) -> List[DiscoveredBusiness]:
-        """
-        Search for businesses in a specific tier using provided queries.
-        Supports pagination to get more results.
+    ) -> Tuple[List[Dict[str, Any]], bool, bool]:
         """
+        Text search one query, following pagination until it alone has
+        max_results usable places (place_id + location) or pages run out.
         
-        tier_businesses: List[DiscoveredBusiness] = []
+        Returns (places, saturated, has_more) - saturated when the last
+        allowed page was read and was full, so there are more results than
+        one query can return; has_more when it stopped with pages left.
         
-        for query in queries:
-            if len(tier_businesses) >= max_results:
-                break
+        Pages come from the shared Places cache when possible. If the next
+        page is not cached and the cached page's next_page_token is too old
+        to trust, the query is re-run uncached from page 1 for a fresh token chain.
+        """
+        async with self._query_semaphore:
+            places: List[Dict[str, Any]] = []
+            seen: set = set()
+            next_page_token = None
+            token_stale = False
+            use_cache = True
+            saturated = False
+            page = 0
             
             try:
-                # First page
-                results, next_page_token = await self._text_search(
-                    query=query,
-                    center_lat=center_lat,
-                    center_lng=center_lng,
-                    radius_meters=radius_meters,
-                )
-                
-                pages_fetched = 1
-                
-                while True:
-                    for place in results:
-                        place_id = place.get("place_id")
-                        if not place_id or place_id in seen_place_ids:
-                            continue
-                        
-                        if len(tier_businesses) >= max_results:
-                            break
-                        
-                        # Get detailed info including phone/website
-                        business = await self._create_business_from_place(
-                            place=place,
-                            tier=tier,
-                            query=query,
-                        )
-                        
-                        if business:
-                            tier_businesses.append(business)
-                            seen_place_ids.add(place_id)
-                    
-                    # Check if we have enough or need more
-                    if len(tier_businesses) >= max_results:
+                while page < self.MAX_PAGES_PER_QUERY:
+                    if page > 0 and not next_page_token:
                         break
                     
-                    # Fetch next page if available
-                    if next_page_token and pages_fetched < max_pages_per_query:
+                    key = places_cache.text_search_key(query, center_lat, center_lng, radius_meters, page)
+                    cached = places_cache.get_text_search(self.CACHE_CALLER, key) if use_cache else None
+                    
+                    if cached:
+                        results, next_page_token = cached.results, cached.next_page_token
+                        token_stale = cached.token_age_seconds() > settings.PLACES_PAGE_TOKEN_MAX_AGE_SECONDS
+                    elif page > 0 and token_stale:
+                        # Token from a cached page has likely expired - start over uncached
+                        use_cache = False
+                        places, seen, next_page_token, token_stale, page = [], set(), None, False, 0
+                        continue
+                    else:
                         results, next_page_token = await self._text_search(
                             query=query,
                             center_lat=center_lat,
                             center_lng=center_lng,
                             radius_meters=radius_meters,
-                            next_page_token=next_page_token,
+                            next_page_token=next_page_token if page > 0 else None,
                         )
-                        pages_fetched += 1
-                    else:
+                        if results:
+                            places_cache.put_text_search(key, results, next_page_token)
+                        token_stale = False
+                    
+                    for place in results:
+                        place_id = place.get("place_id")
+                        location = place.get("geometry", {}).get("location", {})
+                        if not place_id or place_id in seen or location.get("lat") is None or location.get("lng") is None:
+                            continue
+                        places.append(place)
+                        seen.add(place_id)
+                    
+                    saturated = page == self.MAX_PAGES_PER_QUERY - 1 and len(results) >= self.PAGE_SIZE
+                    if len(places) >= max_results:
                         break
-                        
+                    page += 1
             except Exception as e:
-                logger.warning(f"Error searching for '{query}': {e}")
-        
-        return tier_businesses
+                # Keep pages already fetched
+                logger.warning("Error searching for '%s': %s", query, e)
+            
+            has_more = saturated or (len(places) >= max_results and bool(next_page_token))
+            return places, saturated, has_more
     
     async def _text_search(
         self,
@@ -345,8 +577,6 @@ class BusinessFirstDiscoveryService:
             Tuple of (results, next_page_token)
             next_page_token is None if no more pages
         """
-        import asyncio
-        
         url = f"{self.base_url}/textsearch/json"
         
         params = {
@@ -356,61 +586,91 @@ class BusinessFirstDiscoveryService:
         if next_page_token:
             # When using pagetoken, no other params needed
             params["pagetoken"] = next_page_token
-            # Google requires a short delay before using next_page_token
-            await asyncio.sleep(2)
+            # A fresh token is rejected (INVALID_REQUEST) until Google activates it -
+            # poll briefly instead of a fixed sleep
+            token_delays = self.PAGE_TOKEN_DELAYS
         else:
             params["query"] = query
             params["location"] = f"{center_lat},{center_lng}"
             params["radius"] = radius_meters
+            token_delays = (0.0,)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
+        client = await self._get_client()
+        for attempt, delay in enumerate(token_delays):
+            if delay:
+                await asyncio.sleep(delay)
+            if not _reserve_api_call("text_search"):
+                return [], None
+            try:
+                # 429/5xx are retried with backoff by the shared transport
+                response = await client.get(url, params=params)
+            except asyncio.CancelledError:
+                # Skipped lower-priority query - don't charge for it
+                _release_api_call("text_search")
+                raise
             
             if response.status_code != 200:
-                logger.error(f"Places API error: {response.status_code}")
+                logger.error("Places API error: %s", response.status_code)
                 return [], None
             
             data = response.json()
-            
-            if data.get("status") != "OK":
-                if data.get("status") != "ZERO_RESULTS":
-                    logger.warning(f"Places API status: {data.get('status')}")
-                return [], None
-            
-            results = data.get("results", [])
-            token = data.get("next_page_token")
-            
-            return results, token
+            if data.get("status") != "INVALID_REQUEST" or attempt == len(token_delays) - 1:
+                break
+        
+        if data.get("status") != "OK":
+            if data.get("status") != "ZERO_RESULTS":
+                logger.warning("Places API status: %s", data.get('status'))
+            return [], None
+        
+        results = data.get("results", [])
+        token = data.get("next_page_token")
+        
+        return results, token
     
     async def _get_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
-        """Get detailed place info including phone and website."""
-        
+        """Get detailed place info including phone and website (via shared Places cache)."""
+        return await places_cache.details(
+            self.CACHE_CALLER,
+            place_id,
+            self.DETAILS_FIELDS,
+            lambda: self._fetch_place_details(place_id),
+        )
+    
+    async def _fetch_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
         url = f"{self.base_url}/details/json"
         
         params = {
             "place_id": place_id,
-            "fields": "formatted_phone_number,website,name,formatted_address",
+            "fields": self.DETAILS_FIELDS,
             "key": self.google_places_key,
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
-            
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            
-            if data.get("status") != "OK":
+        async with self._details_semaphore:
+            if not _reserve_api_call("details"):
                 return None
-            
-            return data.get("result")
+            client = await self._get_client()
+            try:
+                response = await client.get(url, params=params)
+            except asyncio.CancelledError:
+                _release_api_call("details")
+                raise
+        
+        if response.status_code != 200:
+            return None
+        
+        data = response.json()
+        
+        if data.get("status") != "OK":
+            return None
+        
+        return data.get("result")
     
     async def _create_business_from_place(
         self,
         place: Dict[str, Any],
         tier: BusinessTier,
         query: str,
+        fetch_details: bool = True,
     ) -> Optional[DiscoveredBusiness]:
         """Create DiscoveredBusiness from Places API response."""
         
@@ -426,7 +686,7 @@ class BusinessFirstDiscoveryService:
                 return None
             
             # Get detailed info (phone, website)
-            details = await self._get_place_details(place_id)
+            details = await self._get_place_details(place_id) if fetch_details else None
             
             phone = None
             website = None
@@ -451,64 +711,199 @@ class BusinessFirstDiscoveryService:
             )
             
         except Exception as e:
-            logger.warning(f"Error creating business from place: {e}")
+            logger.warning("Error creating business from place: %s", e)
             return None
     
     async def discover_in_polygon(
         self,
-        polygon_coords: List[tuple],
+        polygon: Union[List[tuple], Polygon, MultiPolygon],
         tiers: Optional[List[BusinessTier]] = None,
-        max_per_tier: int = 20,
+        business_type_ids: Optional[List[str]] = None,
         max_total: int = 50,
-    ) -> List[DiscoveredBusiness]:
+        skip_place_ids: Optional[Callable[[List[str]], Set[str]]] = None,
+        max_cells: Optional[int] = None,
+        max_cost_usd: Optional[float] = None,
+    ) -> PolygonDiscoveryResult:
         """
-        Discover businesses within a polygon area.
+        Discover businesses within a polygon using adaptive quadtree tiling.
         
-        Uses the polygon centroid as search center with appropriate radius.
+        The polygon is covered with the coarsest cells whose search circle fits
+        the Text Search radius limit. Cells are searched concurrently, each
+        paging and selecting only as deep as the results still needed to reach
+        max_total. While more are needed, a cell that stopped with results
+        left is searched again deeper (earlier pages come from the cache), and
+        a cell where a query filled its last allowed page is saturated (there
+        are more results than one search returns) and is split into four.
+        Stops once max_total businesses are selected, max_cells are used or
+        the Places spend reaches max_cost_usd. Under a spend cap, max_total is
+        lowered to what the cap can cover, Place Details for max_total results
+        are reserved before any search, and requests that would pass the cap
+        are not sent.
         
         Args:
-            polygon_coords: List of (lng, lat) tuples defining polygon
+            polygon: Shapely (Multi)Polygon or list of (lng, lat) tuples
             tiers: Which tiers to search
-            max_per_tier: Max per tier
-            max_total: Max total
+            business_type_ids: Specific business type IDs to search
+            max_total: Max businesses to return
+            skip_place_ids: Optional callback returning place_ids to leave out
+                (e.g. already processed); they don't count toward max_total
+            max_cells: Max cells to query (default PLACES_TILE_MAX_CELLS)
+            max_cost_usd: Places spend cap at PLACES_*_COST_USD (None = uncapped)
         
         Returns:
-            List of DiscoveredBusiness within the polygon
+            PolygonDiscoveryResult - businesses inside the polygon (tier order,
+            details attached) and coverage/cost stats
         """
-        from shapely.geometry import Polygon as ShapelyPolygon
-        
-        polygon = ShapelyPolygon(polygon_coords)
-        centroid = polygon.centroid
-        
-        # Calculate radius from polygon bounds
-        bounds = polygon.bounds  # (minx, miny, maxx, maxy)
-        lat_range = bounds[3] - bounds[1]
-        lng_range = bounds[2] - bounds[0]
-        
-        # Convert to meters (approximate)
-        radius_lat = lat_range * 111000 / 2
-        radius_lng = lng_range * 111000 / 2
-        radius_meters = int(max(radius_lat, radius_lng) * 1.2)  # 20% buffer
-        
-        # Search
-        businesses = await self.discover_businesses(
-            center_lat=centroid.y,
-            center_lng=centroid.x,
-            radius_meters=min(radius_meters, 50000),  # Max 50km
-            tiers=tiers,
-            max_per_tier=max_per_tier,
-            max_total=max_total,
+        if not isinstance(polygon, (Polygon, MultiPolygon)):
+            polygon = Polygon(polygon)
+        max_cells = max_cells or settings.PLACES_TILE_MAX_CELLS
+        
+        planner = QuadtreePlanner(
+            polygon,
+            max_radius_m=settings.PLACES_TILE_MAX_RADIUS_M,
+            min_side_m=settings.PLACES_TILE_MIN_SIDE_M,
         )
+        inside = prep(polygon)
+        query_cap = self.PAGE_SIZE * self.MAX_PAGES_PER_QUERY
+        stats = TilingStats(polygon_area_km2=round(planner.area_km2, 2), spend_limit_usd=max_cost_usd)
+        
+        if not self.google_places_key:
+            logger.error("Google Places API key not configured")
+            return PolygonDiscoveryResult(businesses=[], stats=stats)
         
-        # Filter to only businesses within polygon
-        filtered = [
-            b for b in businesses
-            if polygon.contains(b.location)
-        ]
+        cap = None
+        if max_cost_usd is not None:
+            # Each result needs its Details plus a share of the searches that find it
+            per_result = settings.PLACES_DETAILS_COST_USD + settings.PLACES_TEXT_SEARCH_COST_USD / self.CAP_RESULTS_PER_SEARCH
+            affordable = int(max_cost_usd // per_result)
+            if affordable < max_total:
+                logger.info("   💸 Places cap $%.2f covers %s of %s results", max_cost_usd, affordable, max_total)
+                max_total = affordable
+            cap = _SpendCap(limit_usd=max_cost_usd, details_reserved=max_total)
         
-        logger.info(f"Filtered to {len(filtered)} businesses within polygon")
+        counter: Dict[str, int] = {}
+        token = _api_calls.set(counter)
+        cap_token = _spend_cap.set(cap)
         
-        return filtered
+        def can_afford_wave() -> bool:
+            return _can_afford(counter, "text_search")
+        
+        seen_place_ids: Set[str] = set()
+        selected: List[DiscoveredBusiness] = []
+        # (cell, results taken from it so far - None until first searched)
+        wave: List[Tuple[SearchCell, Optional[int]]] = [(cell, None) for cell in planner.initial_cells()]
+        
+        try:
+            while wave and len(selected) < max_total and can_afford_wave():
+                # Each cell takes at most what is still needed beyond what it already gave;
+                # new cells count toward max_cells, deeper revisits don't
+                needed = max_total - len(selected)
+                new_cells = max_cells - stats.cells_queried
+                batch: List[Tuple[SearchCell, Optional[int], int]] = []
+                for cell, taken in wave:
+                    if taken is None:
+                        if new_cells <= 0:
+                            continue
+                        new_cells -= 1
+                    batch.append((cell, taken, (taken or 0) + needed))
+                if not batch:
+                    break
+                logger.info(
+                    "   🗺️  Searching %s cells (depth %s, ~%.1fkm), %s results needed",
+                    len(batch), batch[0][0].depth, batch[0][0].side_m / 1000, needed
+                )
+                
+                results = await asyncio.gather(*[
+                    self._discover_in_circle(
+                        center_lat=cell.center_lat,
+                        center_lng=cell.center_lng,
+                        radius_meters=cell.radius_m,
+                        tiers=tiers,
+                        business_type_ids=business_type_ids,
+                        max_per_tier=min(query_cap, target),
+                        max_total=target,
+                        fetch_details=False,
+                    )
+                    for cell, _, target in batch
+                ], return_exceptions=True)
+                
+                next_wave: List[Tuple[SearchCell, Optional[int]]] = []
+                candidates: List[DiscoveredBusiness] = []
+                
+                for (cell, taken, target), outcome in zip(batch, results):
+                    if taken is None:
+                        stats.cells_queried += 1
+                    else:
+                        stats.cells_revisited += 1
+                    stats.max_depth = max(stats.max_depth, cell.depth)
+                    
+                    if isinstance(outcome, Exception):
+                        logger.warning("   Cell %s search failed: %s", cell.cell_id, outcome)
+                        continue
+                    cell_results, saturated, has_more = outcome
+                    
+                    stats.results_raw += len(cell_results)
+                    for business in cell_results:
+                        if business.places_id in seen_place_ids:
+                            continue
+                        seen_place_ids.add(business.places_id)
+                        stats.results_unique += 1
+                        if not inside.contains(business.location):
+                            stats.results_outside_polygon += 1
+                            continue
+                        candidates.append(business)
+                    
+                    if saturated:
+                        stats.cells_saturated += 1
+                        if planner.can_split(cell):
+                            stats.cells_split += 1
+                            next_wave.extend((child, None) for child in planner.split(cell))
+                    elif has_more and min(query_cap, target) < query_cap:
+                        # Capped by what was needed - page deeper if still short after this wave
+                        next_wave.append((cell, len(cell_results)))
+                
+                if skip_place_ids and candidates:
+                    skip = skip_place_ids([b.places_id for b in candidates])
+                    stats.results_skipped += sum(1 for b in candidates if b.places_id in skip)
+                    candidates = [b for b in candidates if b.places_id not in skip]
+                
+                selected.extend(candidates)
+                wave = next_wave
+            
+            if wave and len(selected) < max_total and stats.cells_queried < max_cells and not can_afford_wave():
+                stats.cells_skipped_budget = len(wave)
+                logger.info("   💸 Places spend cap $%.2f reached - %s cells not searched", max_cost_usd, len(wave))
+            
+            # Tier priority first, discovery order within a tier
+            selected.sort(key=lambda b: TIER_ORDER.get(b.tier.value, len(TIER_ORDER)))
+            selected = selected[:max_total]
+            
+            # Details only for what we actually return
+            await asyncio.gather(*[self._attach_details(b) for b in selected])
+        finally:
+            stats.text_search_calls = counter.get("text_search", 0)
+            stats.details_calls = counter.get("details", 0)
+            _spend_cap.reset(cap_token)
+            _api_calls.reset(token)
+        
+        stats.results_selected = len(selected)
+        logger.info(
+            "   🗺️  Tiling: %s cells (%s saturated, depth %s), %s searches, %s unique (%s/call), %s outside polygon, %s selected",
+            stats.cells_queried, stats.cells_saturated, stats.max_depth, stats.text_search_calls, stats.results_unique, stats.unique_per_search_call, stats.results_outside_polygon, stats.results_selected
+        )
+        
+        return PolygonDiscoveryResult(businesses=selected, stats=stats)
+    
+    async def _attach_details(self, business: DiscoveredBusiness) -> None:
+        """Fill in phone/website for a business found with fetch_details=False."""
+        try:
+            details = await self._get_place_details(business.places_id)
+        except Exception as e:
+            logger.warning("Error fetching details for %s: %s", business.places_id, e)
+            return
+        if details:
+            business.phone = details.get("formatted_phone_number")
+            business.website = details.get("website")
 
 
 # Singleton instance
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 import secrets
 
 
@@ -18,9 +18,34 @@ class Settings(BaseSettings):
     
     # Business Contact Data (Google Places is primary)
     GOOGLE_PLACES_KEY: Optional[str] = None
+    # Shared in-process Places cache. Google's terms only allow temporary caching of
+    # Places content (place_id may be kept indefinitely), so keep TTLs short.
+    PLACES_CACHE_ENABLED: bool = True
+    PLACES_CACHE_MAX_ENTRIES: int = 5000
+    PLACES_TEXT_SEARCH_TTL_SECONDS: int = 900  # 15 min - covers repeated fetches within a discovery job
+    PLACES_DETAILS_TTL_SECONDS: int = 86400  # 24 h
+    PLACES_PAGE_TOKEN_MAX_AGE_SECONDS: int = 120  # Older cached next_page_tokens are refreshed before use
+    # Adaptive tiling for polygon business discovery (quadtree over the search area)
+    PLACES_TILE_MAX_RADIUS_M: float = 50000.0  # Largest cell search radius (Text Search limit)
+    PLACES_TILE_MIN_SIDE_M: float = 400.0  # Saturated cells smaller than this are not split further
+    PLACES_TILE_MAX_CELLS: int = 24  # Max cells queried per discovery (API budget guard)
+    PLACES_TEXT_SEARCH_COST_USD: float = 0.032  # Per Text Search request (for budgets/estimates)
+    PLACES_DETAILS_COST_USD: float = 0.017  # Per Place Details request with contact fields (for budgets/estimates)
+    # State-wide brand grid search (Google Maps key)
+    BRAND_SEARCH_MAX_CONCURRENT: int = 6  # Cells searched at once
+    BRAND_SEARCH_MAX_QPS: float = 10.0  # Text Search requests per second (shared across searches)
+    BRAND_SEARCH_MAX_COST_USD: float = 2.0  # Text Search budget per state search (~62 requests)
+    BRAND_SEARCH_MIN_SIDE_M: float = 5000.0  # Saturated cells smaller than this are not split
+    BRAND_SEARCH_MIN_NEW_RATIO: float = 0.2  # Stop paging a cell when a page is mostly already-seen places
     
     # Satellite Imagery
     GOOGLE_MAPS_KEY: Optional[str] = None
+    # Geocoding cache (Google's terms allow caching lat/lng for up to 30 days)
+    GEOCODE_CACHE_ENABLED: bool = True
+    GEOCODE_CACHE_TTL_DAYS: int = 30  # Forward and reverse results (Google allows caching lat/lng for at most 30 days)
+    GEOCODE_NEGATIVE_TTL_HOURS: int = 24  # ZERO_RESULTS answers
+    GEOCODE_CACHE_MAX_ENTRIES: int = 2000  # In-process layer in front of the geocode_cache table
+    GEOCODE_CACHE_PURGE_INTERVAL_HOURS: int = 1  # Expired geocode_cache rows are deleted at most this often
     
     # Object Storage (optional - for storing images)
     SUPABASE_STORAGE_URL: Optional[str] = None
@@ -58,6 +83,12 @@ class Settings(BaseSettings):
     # OpenRouter API (for Vision Language Models - GPT-4o, Claude, etc.)
     # Get key from: https://openrouter.ai/keys
     OPENROUTER_API_KEY: Optional[str] = None
+    OPENROUTER_CLIENT_POOL_MAX_SIZE: int = 64  # Max per-key clients kept (system key + BYO user keys)
+    OPENROUTER_CLIENT_IDLE_SECONDS: int = 900  # Drop per-key clients unused for this long
+    NLP_PARSE_CACHE_MAX_ENTRIES: int = 1000  # Parsed search queries kept in-process (rule + LLM parses)
+    
+    # Outbound provider pacing (token buckets, retries, circuit breakers - see provider_limits.py)
+    PROVIDER_LIMITS_ENABLED: bool = True
     
     # Apollo.io API (for Lead Enrichment - find decision maker contacts)
     # Get key from: https://app.apollo.io/settings/integrations/api
@@ -72,17 +103,50 @@ class Settings(BaseSettings):
     # Wide image settings for property analysis
     WIDE_IMAGE_RADIUS_METERS: float = 150.0  # Radius around business for wide image
     WIDE_IMAGE_SIZE: int = 640  # Image dimension (640x640)
-    
+
+    # VLM image preprocessing (crop to parcel + resize before sending to the VLM)
+    VLM_IMAGE_PREPROCESSING_ENABLED: bool = True
+    VLM_IMAGE_CROP_PADDING_PERCENT: float = 10.0  # Padding around parcel bbox when cropping
+    # Policy tiers by parcel area - first tier with area <= max_area_m2 wins (None = no limit)
+    # Override via env as JSON, e.g. VLM_IMAGE_POLICY='[{"max_area_m2": null, "detail": "high", "max_tiles": 4, "jpeg_quality": 85}]'
+    VLM_IMAGE_POLICY: List[Dict[str, Any]] = [
+        {"max_area_m2": 2000, "detail": "low", "max_tiles": 1, "jpeg_quality": 80},  # Small lots (~0.5 acre)
+        {"max_area_m2": 20000, "detail": "high", "max_tiles": 4, "jpeg_quality": 85},  # Up to ~5 acres
+        {"max_area_m2": None, "detail": "high", "max_tiles": 6, "jpeg_quality": 90},  # Large sites
+    ]
+
+    # VLM result cache (reuse scores for identical image + prompt + model)
+    VLM_RESULT_CACHE_ENABLED: bool = True
+    VLM_RESULT_CACHE_TTL_DAYS: int = 30  # Entries older than this are treated as misses
+
+    # Usage tracking (buffered UsageLog writes)
+    USAGE_FLUSH_MAX_ROWS: int = 200  # Flush when this many rows are buffered
+    USAGE_FLUSH_INTERVAL_SECONDS: float = 5.0  # ...or at least this often
+    USAGE_BUFFER_MAX_ROWS: int = 10000  # Hard cap while the DB is unreachable; oldest rows are dropped
+
     # Security
     SECRET_KEY: str = ""
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
+    USER_CACHE_TTL_SECONDS: float = 60.0  # get_current_user row cache; 0 disables
+    USER_CACHE_MAX_ENTRIES: int = 1000
     
     # App
     ENVIRONMENT: str = "development"
     API_V1_PREFIX: str = "/api/v1"
     PORT: int = 5000  # Server port
     
+    # Logging (see logging_config.py)
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # "json" (one object per line) or "text"
+    # Per-module overrides, e.g. LOG_LEVELS='{"app.core.regrid_service": "DEBUG", "httpx": "WARNING"}'
+    LOG_LEVELS: Dict[str, str] = {"httpx": "WARNING", "httpcore": "WARNING", "openai": "WARNING"}
+    # Repetitive INFO/DEBUG lines (same call site): first LOG_SAMPLE_BURST per window, then 1 in LOG_SAMPLE_RATE
+    LOG_SAMPLE_BURST: int = 20
+    LOG_SAMPLE_WINDOW_SECONDS: float = 10.0
+    LOG_SAMPLE_RATE: int = 100  # 0 = drop everything past the burst
+    LOG_QUEUE_MAX_RECORDS: int = 10000  # Records waiting for the writer thread; overflow is dropped and counted
+    
     # CORS
     CORS_ORIGINS: List[str] = [
         "https://app.worksight.biz",
@@ -94,6 +158,34 @@ class Settings(BaseSettings):
     DEFAULT_MIN_LOT_AREA_M2: float = 200.0  # Minimum 200 m²
     DEFAULT_MAX_CONDITION_SCORE: float = 70.0  # Lower = worse condition
     DEFAULT_MIN_MATCH_SCORE: float = 50.0  # Minimum business match confidence
+
+    # Job progress event bus (SSE fan-out with Last-Event-ID replay, see progress_bus.py)
+    PROGRESS_BUS_BACKEND: str = "memory"  # "memory" (single worker) or "redis" (shared across workers)
+    REDIS_URL: Optional[str] = None  # e.g. redis://localhost:6379/0
+    PROGRESS_BUS_MAX_EVENTS: int = 1000  # Events retained per job channel for replay
+    PROGRESS_BUS_RETENTION_SECONDS: float = 900.0  # Keep finished job channels this long for reconnects
+    PROGRESS_HEARTBEAT_SECONDS: float = 15.0  # SSE keep-alive comment interval when a job is idle
+
+    # Background job queue (background_jobs table, consumed by `python -m app.worker`)
+    JOB_WORKER_CONCURRENCY: int = 2  # Jobs running at once per worker process
+    JOB_WORKER_IN_PROCESS: bool = False  # Also run a worker inside the API process (single box / development)
+    JOB_MAX_RUNNING_PER_USER: int = 1  # Across all workers; a user's other jobs wait so one user can't fill the workers
+    JOB_MAX_QUEUED_PER_USER: int = 20  # Enqueue is rejected beyond this
+    JOB_INTERACTIVE_MAX_ITEMS: int = 5  # Jobs this small (parcels / max lots) run ahead of batch jobs
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0  # Idle worker poll interval
+    JOB_HEARTBEAT_SECONDS: float = 10.0  # Running jobs' heartbeat / progress / cancellation check
+    JOB_STALE_SECONDS: float = 120.0  # Running jobs without a heartbeat this long are requeued (worker died)
+    JOB_SHUTDOWN_GRACE_SECONDS: float = 120.0  # On shutdown, running jobs get this long to finish before they are cancelled
+
+    # Discovery spend budgets (see discovery_budget.py); 0 = no cap
+    DISCOVERY_JOB_BUDGET_USD: float = 5.0  # Per job, unless the request sets filters.max_budget_usd
+    USER_DAILY_BUDGET_USD: float = 50.0  # Per user per UTC day, across all jobs (from usage rollups)
+    BUDGET_LOW_DETAIL_AT: float = 0.5  # Fraction of budget spent before VLM images drop to low detail
+    BUDGET_ENRICH_HIGH_SCORES_AT: float = 0.75  # Fraction spent before enrichment is limited to high scores
+    BUDGET_ENRICH_MIN_SCORE: int = 70  # Lead score still enriched once limited
+    BUDGET_VLM_ESTIMATE_USD: float = 0.01  # Assumed VLM cost per call until the job has seen actual costs
+    BUDGET_PLACES_SHARE: float = 0.3  # Most of the job budget that Places business discovery may spend
+    BUDGET_ENRICHMENT_ESTIMATE_USD: float = 0.08  # Assumed cost per lead enrichment (~4 small LLM calls + ~3 Places requests)
     
     class Config:
         env_file = ".env"
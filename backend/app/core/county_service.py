@@ -7,12 +7,27 @@ Provides US county data for search:
 - FIPS code mapping
 
 Data source: US Census Bureau TIGER/Line
+
+The county list is a bundled gazetteer (data/us_counties.tsv, built by
+build_county_gazetteer.py) loaded at startup into an in-memory prefix +
+n-gram index; boundaries come from the local counties KML layer.
+The deploy builds the gazetteer when it is missing, and startup fails
+outside development without it; the Census API fallback for the county
+list is a development convenience. TIGERweb serves boundaries the KML
+layer lacks.
 """
 
+import asyncio
+import bisect
+import csv
+import heapq
 import logging
-from typing import Optional, List, Dict, Any
+from pathlib import Path
+from typing import Optional, List, Dict, Any, FrozenSet, Iterable
 from dataclasses import dataclass
-import httpx
+
+from app.core.boundary_service import get_boundary_service
+from app.core.http_client_manager import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -58,73 +73,222 @@ STATE_NAMES = {
     "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming", "PR": "Puerto Rico",
 }
 
+# Name suffixes tried when a caller passes a bare county name
+COUNTY_SUFFIXES = ("county", "parish", "borough", "census area", "municipality", "city and borough", "city")
+
+
+def county_from_fips(fips: str, name: str) -> County:
+    """Build a County from its 5-digit FIPS code and name (e.g. "Dallas County")."""
+    state_fips = fips[:2]
+    state_abbr = US_STATES.get(state_fips, "")
+    return County(
+        fips=fips,
+        name=name,
+        state=state_abbr,
+        state_fips=state_fips,
+        full_name=f"{name}, {state_abbr}",
+    )
+
+
+class CountyIndex:
+    """
+    Autocomplete index over the county list.
+    
+    Sorted lowercase names / full names answer prefix matches with bisect;
+    2- and 3-gram postings narrow "contains" matches to a few candidates.
+    Scores match the original linear scan in search().
+    """
+    
+    def __init__(self, counties: List[County]):
+        self.counties = counties
+        self.by_fips: Dict[str, County] = {c.fips: c for c in counties}
+        self._names_lower = [c.name.lower() for c in counties]
+        self._full_lower = [c.full_name.lower() for c in counties]
+        
+        self._names = sorted((name, i) for i, name in enumerate(self._names_lower))
+        self._name_keys = [name for name, _ in self._names]
+        self._full_names = sorted((full, i) for i, full in enumerate(self._full_lower))
+        self._full_keys = [full for full, _ in self._full_names]
+        
+        by_state: Dict[str, List[int]] = {}
+        grams: Dict[str, set] = {}
+        for i, county in enumerate(counties):
+            by_state.setdefault(county.state.lower(), []).append(i)
+            full = self._full_lower[i]
+            for n in (2, 3):
+                for j in range(len(full) - n + 1):
+                    grams.setdefault(full[j:j + n], set()).add(i)
+        self._by_state = by_state
+        self._grams: Dict[str, FrozenSet[int]] = {gram: frozenset(ids) for gram, ids in grams.items()}
+    
+    def __len__(self) -> int:
+        return len(self.counties)
+    
+    def search(self, query: str, limit: int = 20) -> List[County]:
+        query_lower = query.lower().strip()
+        if len(query_lower) < 2:
+            return []
+        
+        scores: Dict[int, int] = {}
+        
+        def offer(ids: Iterable[int], score: int) -> None:
+            for i in ids:
+                if score > scores.get(i, 0):
+                    scores[i] = score
+        
+        # Exact match on county name / starts with query
+        for i in self._prefix(self._names, self._name_keys, query_lower):
+            offer((i,), 100 if self._names_lower[i] == query_lower else 80)
+        # Full name starts with query
+        offer(self._prefix(self._full_names, self._full_keys, query_lower), 70)
+        # State abbreviation match
+        offer(self._by_state.get(query_lower, ()), 60)
+        # Contains query
+        offer(self._containing(query_lower), 40)
+        
+        # Sort by score desc, then alphabetically
+        top = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], self.counties[item[0]].full_name))
+        return [self.counties[i] for i, _ in top]
+    
+    @staticmethod
+    def _prefix(pairs: List[tuple], keys: List[str], prefix: str) -> List[int]:
+        lo = bisect.bisect_left(keys, prefix)
+        hi = bisect.bisect_left(keys, prefix + "\uffff", lo)
+        return [pairs[j][1] for j in range(lo, hi)]
+    
+    def _containing(self, query_lower: str) -> List[int]:
+        n = 2 if len(query_lower) == 2 else 3
+        postings = sorted(
+            (self._grams.get(query_lower[j:j + n], frozenset()) for j in range(len(query_lower) - n + 1)),
+            key=len,
+        )
+        if not postings[0]:
+            return []
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return []
+        return [i for i in candidates if query_lower in self._full_lower[i]]
+    
+    def find(self, name: str, state: str) -> Optional[County]:
+        """Exact county for a name + state ("Dallas", "Dallas County", "Orleans Parish")."""
+        state_ids = self._by_state.get(state.lower().strip(), ())
+        name_lower = " ".join(name.lower().split())
+        candidates = [name_lower] + [f"{name_lower} {suffix}" for suffix in COUNTY_SUFFIXES]
+        for candidate in candidates:
+            for i in state_ids:
+                if self._names_lower[i] == candidate:
+                    return self.counties[i]
+        return None
+
 
 class CountyService:
     """
     Service for US county data.
     
-    Uses Census Bureau TIGERweb API for county data and boundaries.
+    County list and boundaries come from local data files; Census Bureau
+    APIs are the fallback when those are not deployed.
     """
     
+    # Bundled gazetteer (fips<TAB>name), see build_county_gazetteer.py
+    GAZETTEER_PATH = Path(__file__).parent.parent.parent / "data" / "us_counties.tsv"
+    
     def __init__(self):
-        self._counties_cache: Optional[List[County]] = None
+        self._index: Optional[CountyIndex] = None
         self._boundaries_cache: Dict[str, Dict] = {}
     
+    def load_gazetteer(self, path: Optional[Path] = None, required: bool = False) -> int:
+        """
+        Load the bundled county gazetteer and build the search index.
+        
+        Called at startup (required outside development). Returns the
+        number of counties loaded; a missing file raises FileNotFoundError
+        when required, otherwise returns 0 and get_all_counties falls back
+        to the Census API.
+        """
+        path = Path(path) if path else self.GAZETTEER_PATH
+        if not path.exists():
+            if required:
+                raise FileNotFoundError(
+                    f"County gazetteer not found at {path}. Build it with: python build_county_gazetteer.py"
+                )
+            logger.error(
+                "❌ County gazetteer not found at %s - county search will call the Census API. "
+                "Build it with: python build_county_gazetteer.py", path
+            )
+            return 0
+        
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f, delimiter="\t")
+            counties = [county_from_fips(row["fips"], row["name"]) for row in reader]
+        
+        self._set_counties(counties)
+        logger.info("Loaded %s US counties from %s", len(counties), path.name)
+        return len(counties)
+    
+    def _set_counties(self, counties: List[County]) -> None:
+        # Sort by state, then county name
+        counties.sort(key=lambda c: (c.state, c.name))
+        self._index = CountyIndex(counties)
+    
+    async def _get_index(self) -> CountyIndex:
+        if self._index is None:
+            await self.get_all_counties()
+        return self._index or CountyIndex([])
+    
     async def get_all_counties(self) -> List[County]:
         """
         Get list of all US counties.
         
-        Uses Census Bureau API to fetch county list.
-        Results are cached after first call.
+        Served from the gazetteer loaded at startup; if it was not loaded,
+        tries the file again and then the Census Bureau API.
         """
-        if self._counties_cache:
-            return self._counties_cache
+        if self._index:
+            return self._index.counties
         
+        if self.load_gazetteer():
+            return self._index.counties
+        
+        counties = await self.fetch_census_counties()
+        if not counties:
+            return self._get_fallback_counties()
+        
+        self._set_counties(counties)
+        logger.info("Loaded %s US counties from Census API", len(counties))
+        return self._index.counties
+    
+    async def fetch_census_counties(self) -> List[County]:
+        """Fetch the county list from the Census Bureau API (empty list on failure)."""
         try:
             # Fetch from Census Bureau API
             url = "https://api.census.gov/data/2020/dec/pl?get=NAME&for=county:*"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
+            client = http_clients.get("census")
+            response = await client.get(url)
                 
-                if response.status_code != 200:
-                    logger.warning(f"Census API error: {response.status_code}")
-                    return self._get_fallback_counties()
+            if response.status_code != 200:
+                logger.warning("Census API error: %s", response.status_code)
+                return []
                 
-                data = response.json()
+            data = response.json()
                 
-                # Parse response: [["NAME", "state", "county"], ["Autauga County, Alabama", "01", "001"], ...]
-                counties = []
-                for row in data[1:]:  # Skip header row
-                    name_full = row[0]  # "County Name, State Name"
-                    state_fips = row[1]
-                    county_fips = row[2]
+            # Parse response: [["NAME", "state", "county"], ["Autauga County, Alabama", "01", "001"], ...]
+            counties = []
+            for row in data[1:]:  # Skip header row
+                name_full = row[0]  # "County Name, State Name"
                     
-                    # Parse name
-                    parts = name_full.split(", ")
-                    county_name = parts[0] if parts else name_full
+                # Parse name
+                parts = name_full.split(", ")
+                county_name = parts[0] if parts else name_full
                     
-                    state_abbr = US_STATES.get(state_fips, "")
-                    fips = f"{state_fips}{county_fips}"
-                    
-                    counties.append(County(
-                        fips=fips,
-                        name=county_name,
-                        state=state_abbr,
-                        state_fips=state_fips,
-                        full_name=f"{county_name}, {state_abbr}",
-                    ))
-                
-                # Sort by state, then county name
-                counties.sort(key=lambda c: (c.state, c.name))
+                counties.append(county_from_fips(f"{row[1]}{row[2]}", county_name))
                 
-                self._counties_cache = counties
-                logger.info(f"Loaded {len(counties)} US counties from Census API")
-                return counties
+            return counties
                 
         except Exception as e:
-            logger.error(f"Failed to fetch counties from Census API: {e}")
-            return self._get_fallback_counties()
+            logger.error("Failed to fetch counties from Census API: %s", e)
+            return []
     
     def _get_fallback_counties(self) -> List[County]:
         """Return a minimal fallback list of major counties."""
@@ -146,43 +310,11 @@ class CountyService:
         Returns:
             List of matching counties
         """
-        counties = await self.get_all_counties()
-        
         if not query or len(query) < 2:
             return []
         
-        query_lower = query.lower().strip()
-        
-        # Score matches
-        scored = []
-        for county in counties:
-            score = 0
-            name_lower = county.name.lower()
-            full_lower = county.full_name.lower()
-            
-            # Exact match on county name
-            if name_lower == query_lower:
-                score = 100
-            # Starts with query
-            elif name_lower.startswith(query_lower):
-                score = 80
-            # Full name starts with query
-            elif full_lower.startswith(query_lower):
-                score = 70
-            # State abbreviation match
-            elif county.state.lower() == query_lower:
-                score = 60
-            # Contains query
-            elif query_lower in full_lower:
-                score = 40
-            
-            if score > 0:
-                scored.append((score, county))
-        
-        # Sort by score desc, then alphabetically
-        scored.sort(key=lambda x: (-x[0], x[1].full_name))
-        
-        return [c for _, c in scored[:limit]]
+        index = await self._get_index()
+        return index.search(query, limit)
     
     async def get_county_boundary(
         self,
@@ -200,8 +332,20 @@ class CountyService:
         if fips in self._boundaries_cache:
             return self._boundaries_cache[fips]
         
+        boundary_service = get_boundary_service()
+        if boundary_service.is_layer_available("counties"):
+            try:
+                # First call parses the counties KML - keep it off the event loop
+                feature = await asyncio.to_thread(boundary_service.get_boundary_by_id, "counties", fips)
+                if feature and feature.get("geometry"):
+                    self._boundaries_cache[fips] = feature["geometry"]
+                    return feature["geometry"]
+                logger.warning("No local boundary for FIPS %s - trying TIGERweb", fips)
+            except Exception as e:
+                logger.warning("Local county boundary lookup failed for %s: %s", fips, e)
+        
         try:
-            # Use Census TIGERweb for boundaries
+            # Fallback: Census TIGERweb
             # This is the cartographic boundary (simplified, good for display)
             state_fips = fips[:2]
             county_fips = fips[2:]
@@ -215,41 +359,41 @@ class CountyService:
                 f"&outSR=4326"
             )
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
+            client = http_clients.get("census")
+            response = await client.get(url)
                 
-                if response.status_code != 200:
-                    logger.warning(f"TIGERweb boundary fetch failed: {response.status_code}")
-                    return None
+            if response.status_code != 200:
+                logger.warning("TIGERweb boundary fetch failed: %s", response.status_code)
+                return None
                 
-                data = response.json()
+            data = response.json()
                 
-                features = data.get("features", [])
-                if not features:
-                    logger.warning(f"No boundary found for FIPS {fips}")
-                    return None
+            features = data.get("features", [])
+            if not features:
+                logger.warning("No boundary found for FIPS %s", fips)
+                return None
                 
-                # Get the geometry from first feature
-                geometry = features[0].get("geometry")
+            # Get the geometry from first feature
+            geometry = features[0].get("geometry")
                 
-                if geometry:
-                    self._boundaries_cache[fips] = geometry
+            if geometry:
+                self._boundaries_cache[fips] = geometry
                     
-                return geometry
+            return geometry
                 
         except Exception as e:
-            logger.error(f"Failed to fetch county boundary for {fips}: {e}")
+            logger.error("Failed to fetch county boundary for %s: %s", fips, e)
             return None
     
     async def get_county_by_fips(self, fips: str) -> Optional[County]:
         """Get a county by its FIPS code."""
-        counties = await self.get_all_counties()
-        
-        for county in counties:
-            if county.fips == fips:
-                return county
-        
-        return None
+        index = await self._get_index()
+        return index.by_fips.get(fips)
+    
+    async def find_county(self, name: str, state: str) -> Optional[County]:
+        """Get a county by name and state abbreviation."""
+        index = await self._get_index()
+        return index.find(name, state)
 
 
 # Singleton
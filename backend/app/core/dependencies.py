@@ -2,54 +2,83 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Optional
+from uuid import UUID
 from app.db.base import get_db
 from app.models.user import User
 from app.core.security import decode_access_token
+from app.core.user_cache import user_cache
 
 security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user from JWT token."""
+def _user_id_from_credentials(credentials: Optional[HTTPAuthorizationCredentials]) -> str:
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
     token = credentials.credentials
     payload = decode_access_token(token)
-    
+
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
     user_id: str = payload.get("sub")
     if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
-    
-    user = db.query(User).filter(User.id == user_id).first()
+    return user_id
+
+
+def _load_user(user_id: str, db: Session) -> User:
+    """Cached snapshot of the user (detached), loading and caching it on a miss."""
+    user = user_cache.get(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
-    
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+            )
+        user_cache.put(user)
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user",
         )
-    
     return user
 
+
+async def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """Get current authenticated user from JWT token."""
+    user_id = _user_id_from_credentials(credentials)
+    user = _load_user(user_id, db)
+    if user not in db:
+        # Cache hit: attach a copy of the snapshot without a SELECT
+        user = db.merge(user, load=False)
+    return user
+
+
+async def get_current_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: Session = Depends(get_db)
+) -> UUID:
+    """
+    Authenticated user's id only, for endpoints that just scope queries by user.
+
+    Same checks as get_current_user; on a cache hit the session is never used.
+    """
+    user_id = _user_id_from_credentials(credentials)
+    return _load_user(user_id, db).id
@@ -0,0 +1,214 @@
+"""
+Discovery Spend Budget
+
+Live spend tracking and enforcement for one discovery job, instead of only
+finding out the cost from log_discovery_job afterwards:
+
+- Paid calls are charged as they happen: actual OpenRouter cost for VLM
+  calls (VLMUsageInfo.cost), PLACES_*_COST_USD for Places, the SERVICE_INFO
+  estimate for Static Maps and BUDGET_ENRICHMENT_ESTIMATE_USD for enrichment
+  (enrichment reports no cost, so it is budgeted here but not billed)
+- The limit is the job budget (filters.max_budget_usd or
+  DISCOVERY_JOB_BUDGET_USD), capped by what is left of the user's
+  USER_DAILY_BUDGET_USD today
+- As spend approaches the limit the job degrades in order: low image detail
+  for the VLM, then enrichment only for high scores, then it stops before a
+  property it can no longer afford
+- snapshot() is attached to progress events so clients see remaining budget
+
+The user's daily spend is read once at job start, so two jobs of the same
+user running at once can each spend up to the remainder (the job queue runs
+one job per user by default).
+"""
+
+import logging
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Optional, Dict, Any
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.usage_recorder import usage_recorder
+from app.core.usage_tracking_service import SERVICE_INFO
+from app.models.usage_daily_rollup import UsageDailyRollup
+
+logger = logging.getLogger(__name__)
+
+
+class BudgetLevel(str, Enum):
+    """Degradation steps, in the order they are applied."""
+    NORMAL = "normal"
+    LOW_DETAIL = "low_detail"  # VLM images requested at low detail
+    ENRICH_HIGH_SCORES = "enrich_high_scores"  # Low-scoring leads are not enriched
+    EXHAUSTED = "exhausted"  # No further properties are processed
+
+
+LEVEL_MESSAGES = {
+    BudgetLevel.LOW_DETAIL: "Budget {pct}% used - using low image detail",
+    BudgetLevel.ENRICH_HIGH_SCORES: "Budget {pct}% used - enriching high scores only",
+    BudgetLevel.EXHAUSTED: "Budget reached - stopping",
+}
+
+
+def user_spent_today(db: Session, user_id: UUID) -> float:
+    """User's recorded spend for the current UTC day, across all services."""
+    usage_recorder.flush()  # Include rows still sitting in the buffer
+    total = db.query(func.sum(UsageDailyRollup.total_cost)).filter(
+        UsageDailyRollup.user_id == user_id,
+        UsageDailyRollup.day == datetime.now(timezone.utc).date(),
+    ).scalar()
+    return float(total or 0)
+
+
+class DiscoveryBudget:
+    """Spend tracker and degradation policy for one job."""
+
+    def __init__(self, job_limit: Optional[float], user_remaining: Optional[float] = None):
+        """
+        Args:
+            job_limit: Per-job cap in USD (None = uncapped)
+            user_remaining: What is left of the user's daily budget (None = uncapped)
+        """
+        caps = {name: max(0.0, cap) for name, cap in (("job", job_limit), ("user", user_remaining)) if cap is not None}
+        self.limited_by = min(caps, key=caps.get) if caps else None
+        self.limit = caps[self.limited_by] if caps else None
+        self.spent = 0.0
+        self.by_service: Dict[str, float] = {}
+        self.vlm_calls = 0
+        self.vlm_cost = 0.0
+        self.enrichments_skipped = 0
+        self._reported_level = BudgetLevel.NORMAL
+
+    @classmethod
+    def for_job(cls, db: Session, user_id: UUID, max_budget_usd: Optional[float] = None) -> "DiscoveryBudget":
+        job_limit = max_budget_usd if max_budget_usd is not None else settings.DISCOVERY_JOB_BUDGET_USD
+        user_remaining = None
+        if settings.USER_DAILY_BUDGET_USD > 0:
+            try:
+                user_remaining = settings.USER_DAILY_BUDGET_USD - user_spent_today(db, user_id)
+            except Exception as e:
+                db.rollback()
+                logger.warning("⚠️ Could not read today's spend for user %s: %s", user_id, e)
+        return cls(job_limit or None, user_remaining)
+
+    # ============ Charging ============
+
+    def charge(self, service: str, cost: float) -> None:
+        if cost <= 0:
+            return
+        self.spent += cost
+        self.by_service[service] = self.by_service.get(service, 0.0) + cost
+
+    def charge_estimate(self, service: str, calls: int = 1) -> None:
+        """Charge the SERVICE_INFO per-call estimate (per-request services only)."""
+        info = SERVICE_INFO.get(service, {})
+        if info.get("billing") == "per_request":
+            self.charge(service, info["estimate_per_call"] * calls)
+
+    def charge_vlm(self, vlm_result) -> None:
+        """Charge a VLM call's actual OpenRouter cost (cache hits are free)."""
+        if vlm_result is None or vlm_result.cached or not vlm_result.usage:
+            return
+        self.vlm_calls += 1
+        self.vlm_cost += vlm_result.usage.cost
+        self.charge("openrouter", vlm_result.usage.cost)
+
+    def charge_places(self, text_search_calls: int, details_calls: int) -> None:
+        """Places requests actually sent (cache hits excluded)."""
+        self.charge(
+            "google_places",
+            text_search_calls * settings.PLACES_TEXT_SEARCH_COST_USD + details_calls * settings.PLACES_DETAILS_COST_USD,
+        )
+
+    def charge_enrichment(self) -> None:
+        """One lead enrichment, at the flat per-lead estimate."""
+        self.charge("llm_enrichment", settings.BUDGET_ENRICHMENT_ESTIMATE_USD)
+
+    def charge_imagery(self) -> None:
+        """Satellite image fetched (Static Maps is billed; ESRI tiles are free)."""
+        if settings.GOOGLE_MAPS_KEY:
+            self.charge_estimate("google_satellite")
+
+    # ============ Policy ============
+
+    @property
+    def remaining(self) -> Optional[float]:
+        return None if self.limit is None else max(0.0, self.limit - self.spent)
+
+    @property
+    def places_cap(self) -> Optional[float]:
+        """Places discovery spend cap: a fixed share of the limit, within what is left."""
+        if self.limit is None:
+            return None
+        return min(self.remaining, self.limit * settings.BUDGET_PLACES_SHARE)
+
+    @property
+    def vlm_estimate(self) -> float:
+        """Expected cost of the next VLM call (observed average once there is one)."""
+        return self.vlm_cost / self.vlm_calls if self.vlm_calls else settings.BUDGET_VLM_ESTIMATE_USD
+
+    @property
+    def property_estimate(self) -> float:
+        """Expected cost to image and score one more property."""
+        satellite = SERVICE_INFO["google_satellite"]["estimate_per_call"] if settings.GOOGLE_MAPS_KEY else 0.0
+        return satellite + self.vlm_estimate
+
+    @property
+    def level(self) -> BudgetLevel:
+        if self.limit is None:
+            return BudgetLevel.NORMAL
+        if self.remaining < self.property_estimate or self.remaining <= 0:
+            return BudgetLevel.EXHAUSTED
+        used = self.spent / self.limit
+        if used >= settings.BUDGET_ENRICH_HIGH_SCORES_AT:
+            return BudgetLevel.ENRICH_HIGH_SCORES
+        if used >= settings.BUDGET_LOW_DETAIL_AT:
+            return BudgetLevel.LOW_DETAIL
+        return BudgetLevel.NORMAL
+
+    @property
+    def exhausted(self) -> bool:
+        return self.level == BudgetLevel.EXHAUSTED
+
+    def image_detail(self, requested: str) -> str:
+        """VLM image detail to use: low once the budget is degrading."""
+        return "low" if self.level != BudgetLevel.NORMAL else requested
+
+    def allow_enrichment(self, lead_score: Optional[int]) -> bool:
+        """Whether to enrich a scored lead; skipped leads are counted."""
+        allowed = self.limit is None or (
+            self.remaining >= settings.BUDGET_ENRICHMENT_ESTIMATE_USD
+            and (self.level in (BudgetLevel.NORMAL, BudgetLevel.LOW_DETAIL)
+                 or (lead_score or 0) >= settings.BUDGET_ENRICH_MIN_SCORE)
+        )
+        if not allowed:
+            self.enrichments_skipped += 1
+        return allowed
+
+    def take_level_change(self) -> Optional[Dict[str, Any]]:
+        """A "budget" progress event if the level moved since the last call, else None."""
+        level = self.level
+        if level == self._reported_level:
+            return None
+        self._reported_level = level
+        pct = round(100 * self.spent / self.limit) if self.limit else 100
+        logger.info("💸 Budget %s: $%.4f of $%.2f spent", level.value, self.spent, self.limit or 0)
+        return {
+            "type": "budget",
+            "message": LEVEL_MESSAGES[level].format(pct=pct),
+            "level": level.value,
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "limit_usd": round(self.limit, 4) if self.limit is not None else None,
+            "spent_usd": round(self.spent, 4),
+            "remaining_usd": round(self.remaining, 4) if self.remaining is not None else None,
+            "limited_by": self.limited_by,
+            "level": self.level.value,
+            "enrichments_skipped": self.enrichments_skipped,
+            "by_service": {service: round(cost, 4) for service, cost in self.by_service.items()},
+        }
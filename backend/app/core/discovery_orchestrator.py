@@ -23,11 +23,13 @@ from app.core.apollo_enrichment_service import apollo_enrichment_service, Contac
 from app.core.lead_enrichment_service import lead_enrichment_service
 from app.core.llm_enrichment_service import llm_enrichment_service
 from app.core.config import settings
+from app.core.telemetry import telemetry
+from app.core.discovery_budget import DiscoveryBudget
 
 # Clean property imagery pipeline
 from app.core.property_imagery_pipeline import property_imagery_pipeline
 from app.core.regrid_service import regrid_service
-from app.core.vlm_analysis_service import vlm_analysis_service
+from app.core.vlm_result_cache_service import vlm_result_cache_service
 import os
 import math
 
@@ -38,8 +40,6 @@ class DiscoveryMode(str, Enum):
     CONTACT_FIRST = "contact_first"  # Find contacts via Apollo → find their properties via Regrid → VLM
     REGRID_FIRST = "regrid_first"  # Query Regrid directly by LBCS codes → VLM scoring → Enrichment
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -116,36 +116,44 @@ class DiscoveryOrchestrator:
         self._jobs[job_key]["business_type_ids"] = business_type_ids
         self._jobs[job_key]["scoring_prompt"] = scoring_prompt
         
-        try:
-            if mode == DiscoveryMode.CONTACT_FIRST:
-                await self._run_contact_first_pipeline(
-                    job_id, user_id, filters, db,
-                    city=city,
-                    state=state,
-                    job_titles=job_titles,
-                    industries=industries,
-                    scoring_prompt=scoring_prompt,
-                )
-            elif mode == DiscoveryMode.REGRID_FIRST:
-                await self._run_regrid_first_pipeline(
-                    job_id, user_id, area_polygon, filters, db,
-                    property_categories=property_categories,
-                    scoring_prompt=scoring_prompt,
-                    min_acres=min_acres,
-                    max_acres=max_acres,
-                )
-            else:
-                await self._run_business_first_pipeline(
-                    job_id, user_id, area_polygon, filters, db,
-                    tiers=tiers,
-                    business_type_ids=business_type_ids,
-                    scoring_prompt=scoring_prompt,
-                )
-        except Exception as e:
-            logger.error(f"❌ Discovery pipeline failed: {e}")
-            import traceback
-            traceback.print_exc()
-            self._update_job(job_key, DiscoveryStep.FAILED, error=str(e))
+        budget = self._init_budget(job_key, user_id, filters, db)
+        if budget.exhausted:
+            logger.warning("💸 Discovery not started - no budget left (%s)", budget.limited_by)
+            self._update_job(job_key, DiscoveryStep.FAILED, error=self._budget_error(budget))
+            return
+        
+        with telemetry.job(job_key, pipeline=mode.value) as trace:
+            try:
+                if mode == DiscoveryMode.CONTACT_FIRST:
+                    await self._run_contact_first_pipeline(
+                        job_id, user_id, filters, db,
+                        city=city,
+                        state=state,
+                        job_titles=job_titles,
+                        industries=industries,
+                        scoring_prompt=scoring_prompt,
+                    )
+                elif mode == DiscoveryMode.REGRID_FIRST:
+                    await self._run_regrid_first_pipeline(
+                        job_id, user_id, area_polygon, filters, db,
+                        property_categories=property_categories,
+                        scoring_prompt=scoring_prompt,
+                        min_acres=min_acres,
+                        max_acres=max_acres,
+                    )
+                else:
+                    await self._run_business_first_pipeline(
+                        job_id, user_id, area_polygon, filters, db,
+                        tiers=tiers,
+                        business_type_ids=business_type_ids,
+                        scoring_prompt=scoring_prompt,
+                    )
+            except Exception as e:
+                logger.error("❌ Discovery pipeline failed: %s", e)
+                import traceback
+                traceback.print_exc()
+                self._update_job(job_key, DiscoveryStep.FAILED, error=str(e))
+        self._jobs[job_key]["stages"] = trace.breakdown()
     
     async def stream_discovery(
         self,
@@ -169,43 +177,56 @@ class DiscoveryOrchestrator:
         """
         Stream discovery progress via async generator.
         Yields user-friendly progress messages as the discovery runs.
+        Every event carries the job's budget snapshot (remaining spend).
         """
         job_key = str(job_id)
         self.initialize_job(job_id, user_id)
+        budget = self._init_budget(job_key, user_id, filters, db)
+        if budget.exhausted:
+            error = self._budget_error(budget)
+            self._update_job(job_key, DiscoveryStep.FAILED, error=error)
+            yield {"type": "error", "message": error, "budget": budget.snapshot()}
+            return
         
-        try:
-            if mode == DiscoveryMode.REGRID_FIRST:
-                async for progress in self._stream_regrid_first_pipeline(
-                    job_id, user_id, area_polygon, filters, db,
-                    property_categories=property_categories,
-                    scoring_prompt=scoring_prompt,
-                    min_acres=min_acres,
-                    max_acres=max_acres,
-                ):
-                    yield progress
-            elif mode == DiscoveryMode.CONTACT_FIRST:
-                # Fallback to non-streaming for now
-                yield {"type": "started", "message": "Starting contact-first discovery..."}
-                await self._run_contact_first_pipeline(
-                    job_id, user_id, filters, db,
-                    city=city, state=state, job_titles=job_titles, industries=industries,
-                    scoring_prompt=scoring_prompt,
-                )
-                yield {"type": "complete", "message": "Discovery complete!"}
-            else:
-                # Fallback to non-streaming for business-first
-                yield {"type": "started", "message": "Starting business-first discovery..."}
-                await self._run_business_first_pipeline(
-                    job_id, user_id, area_polygon, filters, db,
-                    tiers=tiers, business_type_ids=business_type_ids, scoring_prompt=scoring_prompt,
-                )
-                yield {"type": "complete", "message": "Discovery complete!"}
-        except Exception as e:
-            logger.error(f"Discovery pipeline failed: {e}")
-            import traceback
-            traceback.print_exc()
-            self._update_job(job_key, DiscoveryStep.FAILED, error=str(e))
-            yield {"type": "error", "message": f"Discovery failed: {str(e)}"}
+        with telemetry.job(job_key, pipeline=mode.value) as trace:
+            try:
+                if mode == DiscoveryMode.REGRID_FIRST:
+                    async for progress in self._stream_regrid_first_pipeline(
+                        job_id, user_id, area_polygon, filters, db,
+                        property_categories=property_categories,
+                        scoring_prompt=scoring_prompt,
+                        min_acres=min_acres,
+                        max_acres=max_acres,
+                    ):
+                        yield {**progress, "budget": budget.snapshot()}
+                elif mode == DiscoveryMode.CONTACT_FIRST:
+                    # Fallback to non-streaming for now
+                    yield {"type": "started", "message": "Starting contact-first discovery...", "budget": budget.snapshot()}
+                    await self._run_contact_first_pipeline(
+                        job_id, user_id, filters, db,
+                        city=city, state=state, job_titles=job_titles, industries=industries,
+                        scoring_prompt=scoring_prompt,
+                    )
+                    yield {"type": "complete", "message": "Discovery complete!", "stages": trace.breakdown(), "budget": budget.snapshot()}
+                else:
+                    # Fallback to non-streaming for business-first
+                    yield {"type": "started", "message": "Starting business-first discovery...", "budget": budget.snapshot()}
+                    await self._run_business_first_pipeline(
+                        job_id, user_id, area_polygon, filters, db,
+                        tiers=tiers, business_type_ids=business_type_ids, scoring_prompt=scoring_prompt,
+                    )
+                    yield {"type": "complete", "message": "Discovery complete!", "stages": trace.breakdown(), "budget": budget.snapshot()}
+            except Exception as e:
+                logger.error("Discovery pipeline failed: %s", e)
+                import traceback
+                traceback.print_exc()
+                self._update_job(job_key, DiscoveryStep.FAILED, error=str(e))
+                yield {"type": "error", "message": f"Discovery failed: {str(e)}", "budget": budget.snapshot()}
+    
+    @staticmethod
+    def progress_channel(user_id: UUID, job_id: UUID) -> str:
+        """Progress bus channel for a job (scoped by user so subscribers need no job lookup)."""
+        return f"discovery:{user_id}:{job_id}"
     
     async def _stream_regrid_first_pipeline(
         self,
@@ -237,16 +258,14 @@ class DiscoveryOrchestrator:
             "message": f"Starting property discovery...",
             "details": f"Searching for {category_display} properties"
         }
-        logger.info(f"[Stream] Sending: {msg['type']} - {msg['message']}")
+        logger.debug("[Stream] Sending: %s - %s", msg['type'], msg['message'])
         yield msg
-        await asyncio.sleep(0.1)  # Allow event to be sent
         
         # ============ Step 1: Build LBCS queries ============
         yield {
             "type": "searching",
             "message": f"Analyzing {category_display} classification codes..."
         }
-        await asyncio.sleep(0.1)
         
         if not property_categories:
             property_categories = [PropertyCategoryEnum.MULTI_FAMILY.value]
@@ -295,9 +314,8 @@ class DiscoveryOrchestrator:
             "message": f"Searching property records in {location_desc}...",
             "details": "Querying Regrid database"
         }
-        logger.info(f"[Stream] Sending: {msg['type']} - {msg['message']}")
+        logger.debug("[Stream] Sending: %s - %s", msg['type'], msg['message'])
         yield msg
-        await asyncio.sleep(0.1)
         
         self._update_job(job_key, DiscoveryStep.QUERYING_REGRID)
         
@@ -329,17 +347,20 @@ class DiscoveryOrchestrator:
                 if len(batch_parcels) >= batch_size:
                     break
                 
-                field_parcels = await regrid_service.search_parcels_by_lbcs(
-                    lbcs_ranges=ranges,
-                    county_fips=county_fips,
-                    state_code=state_code,
-                    zip_code=zip_code,
-                    max_results=batch_size,
-                    lbcs_field=lbcs_field,
-                    min_acres=min_acres,
-                    max_acres=max_acres,
-                    offset=current_offset,
-                )
+                with telemetry.span("regrid.query", lbcs_field=lbcs_field, offset=current_offset) as span:
+                    field_parcels = await regrid_service.search_parcels_by_lbcs(
+                        lbcs_ranges=ranges,
+                        county_fips=county_fips,
+                        state_code=state_code,
+                        zip_code=zip_code,
+                        max_results=batch_size,
+                        lbcs_field=lbcs_field,
+                        min_acres=min_acres,
+                        max_acres=max_acres,
+                        offset=current_offset,
+                        validate_geometry=False,  # Checked below, only for parcels we keep
+                    )
+                    span.set(parcels=len(field_parcels))
                 
                 for parcel in field_parcels:
                     if parcel.parcel_id not in seen_parcel_ids:
@@ -349,19 +370,19 @@ class DiscoveryOrchestrator:
             if not batch_parcels:
                 # No more results from Regrid
                 exhausted_regrid = True
-                logger.info(f"[Stream] Regrid exhausted after {total_fetched} parcels")
+                logger.info("[Stream] Regrid exhausted after %s parcels", total_fetched)
                 break
             
             total_fetched += len(batch_parcels)
             
             # Filter out existing parcels
             for parcel in batch_parcels:
-                if parcel.parcel_id not in existing_regrid_ids:
+                if parcel.parcel_id in existing_regrid_ids:
+                    total_skipped += 1
+                elif parcel.has_valid_geometry:
                     new_parcels.append(parcel)
                     if len(new_parcels) >= filters.max_lots:
                         break
-                else:
-                    total_skipped += 1
             
             # Update progress
             if total_skipped > 0 and page > 0:
@@ -370,12 +391,11 @@ class DiscoveryOrchestrator:
                     "message": f"Fetching more records... ({total_skipped} already processed)",
                     "details": f"Found {len(new_parcels)} new so far"
                 }
-                await asyncio.sleep(0.1)
             
             # Move to next page
             current_offset += batch_size
             
-            logger.info(f"[Stream] Page {page+1}: fetched {len(batch_parcels)}, new={len(new_parcels)}, skipped={total_skipped}")
+            logger.info("[Stream] Page %s: fetched %s, new=%s, skipped=%s", page+1, len(batch_parcels), len(new_parcels), total_skipped)
         
         # Fallback to usedesc search if no LBCS results
         if not new_parcels and total_fetched == 0:
@@ -383,7 +403,6 @@ class DiscoveryOrchestrator:
                 "type": "searching",
                 "message": "No LBCS matches, trying alternative search..."
             }
-            await asyncio.sleep(0.1)
             
             usedesc_patterns = []
             for cat_str in property_categories:
@@ -397,16 +416,19 @@ class DiscoveryOrchestrator:
                     usedesc_patterns.extend(["warehouse", "industrial"])
             
             if usedesc_patterns:
-                fallback_parcels = await regrid_service.search_parcels_by_usedesc(
-                    patterns=usedesc_patterns,
-                    county_fips=county_fips,
-                    state_code=state_code,
-                    zip_code=zip_code,
-                    max_results=filters.max_lots * 2,
-                )
+                with telemetry.span("regrid.query", usedesc=True) as span:
+                    fallback_parcels = await regrid_service.search_parcels_by_usedesc(
+                        patterns=usedesc_patterns,
+                        county_fips=county_fips,
+                        state_code=state_code,
+                        zip_code=zip_code,
+                        max_results=filters.max_lots * 2,
+                        validate_geometry=False,
+                    )
+                    span.set(parcels=len(fallback_parcels))
                 # Filter fallback results too
                 for parcel in fallback_parcels:
-                    if parcel.parcel_id not in existing_regrid_ids:
+                    if parcel.parcel_id not in existing_regrid_ids and parcel.has_valid_geometry:
                         new_parcels.append(parcel)
                         if len(new_parcels) >= filters.max_lots:
                             break
@@ -418,15 +440,17 @@ class DiscoveryOrchestrator:
                 msg = {
                     "type": "complete",
                     "message": f"All {total_fetched} matching properties already processed",
-                    "stats": {"found": total_fetched, "new": 0, "skipped": total_skipped}
+                    "stats": {"found": total_fetched, "new": 0, "skipped": total_skipped},
+                    "stages": telemetry.current_breakdown(),
                 }
             else:
                 msg = {
                     "type": "complete",
                     "message": "No properties found matching criteria",
-                    "stats": {"found": 0, "processed": 0, "enriched": 0}
+                    "stats": {"found": 0, "processed": 0, "enriched": 0},
+                    "stages": telemetry.current_breakdown(),
                 }
-            logger.info(f"[Stream] Sending: {msg['type']} - {msg['message']}")
+            logger.debug("[Stream] Sending: %s - %s", msg['type'], msg['message'])
             yield msg
             self._update_job(job_key, DiscoveryStep.COMPLETED)
             return
@@ -441,9 +465,8 @@ class DiscoveryOrchestrator:
             "details": f"{total_skipped} already in database" if total_skipped > 0 else None,
             "total": len(new_parcels)
         }
-        logger.info(f"[Stream] Sending: {msg['type']} - {msg['message']}")
+        logger.debug("[Stream] Sending: %s - %s", msg['type'], msg['message'])
         yield msg
-        await asyncio.sleep(0.1)
         
         self._jobs[job_key]["progress"].properties_found = len(new_parcels)
         
@@ -461,8 +484,16 @@ class DiscoveryOrchestrator:
         analyzed_count = 0
         enriched_count = 0
         vlm_total_cost = 0.0
+        budget = self._budget(job_key)
         
         for idx, parcel in enumerate(new_parcels):
+            level_event = budget.take_level_change()
+            if level_event:
+                yield level_event
+            if budget.exhausted:
+                logger.warning("💸 Budget reached - stopping after %s of %s", idx, len(new_parcels))
+                break
+            
             try:
                 processed_count += 1
                 short_address = (parcel.address or "Unknown")[:35]
@@ -475,7 +506,6 @@ class DiscoveryOrchestrator:
                     "address": parcel.address,
                     "owner": parcel.owner
                 }
-                await asyncio.sleep(0.05)
                 
                 centroid = parcel.centroid
                 
@@ -539,7 +569,6 @@ class DiscoveryOrchestrator:
                     "current": idx + 1,
                     "total": len(new_parcels)
                 }
-                await asyncio.sleep(0.05)
                 
                 try:
                     imagery_result = await property_imagery_pipeline.get_property_image(
@@ -549,6 +578,7 @@ class DiscoveryOrchestrator:
                     )
                     
                     if imagery_result and imagery_result.success:
+                        budget.charge_imagery()
                         # Access metadata dict for zoom and area
                         metadata = imagery_result.metadata or {}
                         db_property.satellite_zoom_level = metadata.get("zoom_level", 20)
@@ -561,9 +591,8 @@ class DiscoveryOrchestrator:
                             "current": idx + 1,
                             "total": len(new_parcels)
                         }
-                        await asyncio.sleep(0.05)
                         
-                        image_base64 = imagery_result.image_base64
+                        image_base64 = imagery_result.vlm_image_base64
                         if image_base64:
                             property_context = {
                                 "address": parcel.address,
@@ -572,12 +601,15 @@ class DiscoveryOrchestrator:
                                 "owner": parcel.owner,
                             }
                             
-                            vlm_result = await vlm_analysis_service.analyze_property(
+                            vlm_result = await vlm_result_cache_service.analyze_property(
                                 image_base64=image_base64,
                                 property_context=property_context,
                                 scoring_prompt=scoring_prompt,
                                 user_api_key=user_api_key,
+                                bypass_cache=filters.bypass_vlm_cache,
+                                image_detail=budget.image_detail(imagery_result.vlm_image_detail),
                             )
+                            budget.charge_vlm(vlm_result)
                             
                             if vlm_result and vlm_result.success:
                                 db_property.lead_score = vlm_result.lead_score
@@ -604,83 +636,90 @@ class DiscoveryOrchestrator:
                                     "current": idx + 1,
                                     "total": len(new_parcels)
                                 }
-                                await asyncio.sleep(0.05)
                                 
-                                # Enrichment
-                                yield {
-                                    "type": "enriching",
-                                    "message": "Finding property manager...",
-                                    "current": idx + 1,
-                                    "total": len(new_parcels)
-                                }
-                                await asyncio.sleep(0.05)
+                                # Enrichment (only high scores once the budget is running low)
+                                if budget.allow_enrichment(score):
+                                    yield {
+                                        "type": "enriching",
+                                        "message": "Finding property manager...",
+                                        "current": idx + 1,
+                                        "total": len(new_parcels)
+                                    }
                                 
-                                try:
-                                    enrichment_result = await llm_enrichment_service.enrich(
-                                        address=parcel.address or "",
-                                        property_type=classification.value,
-                                        owner_name=parcel.owner,
-                                        lbcs_code=int(parcel.lbcs_structure) if parcel.lbcs_structure else None,
-                                    )
+                                    try:
+                                        enrichment_result = await llm_enrichment_service.enrich(
+                                            address=parcel.address or "",
+                                            property_type=classification.value,
+                                            owner_name=parcel.owner,
+                                            lbcs_code=int(parcel.lbcs_structure) if parcel.lbcs_structure else None,
+                                        )
+                                        budget.charge_enrichment()
                                     
-                                    # Store enrichment steps
-                                    import json
-                                    if enrichment_result.detailed_steps:
-                                        db_property.enrichment_steps = json.dumps([
-                                            step.to_dict() for step in enrichment_result.detailed_steps
-                                        ])
+                                        # Store enrichment steps
+                                        import json
+                                        if enrichment_result.detailed_steps:
+                                            db_property.enrichment_steps = json.dumps([
+                                                step.to_dict() for step in enrichment_result.detailed_steps
+                                            ])
                                     
-                                    if enrichment_result.success and enrichment_result.contact:
-                                        contact = enrichment_result.contact
-                                        db_property.contact_name = contact.name
-                                        db_property.contact_first_name = contact.first_name
-                                        db_property.contact_last_name = contact.last_name
-                                        db_property.contact_email = contact.email
-                                        db_property.contact_phone = contact.phone
-                                        db_property.contact_title = contact.title
-                                        db_property.contact_company = enrichment_result.management_company
-                                        db_property.contact_company_website = enrichment_result.management_website
-                                        db_property.enrichment_source = "llm_enrichment"
-                                        db_property.enrichment_status = "success"
-                                        db_property.enriched_at = datetime.utcnow()
-                                        enriched_count += 1
+                                        if enrichment_result.success and enrichment_result.contact:
+                                            contact = enrichment_result.contact
+                                            db_property.contact_name = contact.name
+                                            db_property.contact_first_name = contact.first_name
+                                            db_property.contact_last_name = contact.last_name
+                                            db_property.contact_email = contact.email
+                                            db_property.contact_phone = contact.phone
+                                            db_property.contact_title = contact.title
+                                            db_property.contact_company = enrichment_result.management_company
+                                            db_property.contact_company_website = enrichment_result.management_website
+                                            db_property.enrichment_source = "llm_enrichment"
+                                            db_property.enrichment_status = "success"
+                                            db_property.enriched_at = datetime.utcnow()
+                                            enriched_count += 1
                                         
-                                        phone_display = contact.phone[:15] + "..." if contact.phone and len(contact.phone) > 15 else contact.phone
-                                        contact_msg = f"Contact found: {phone_display or contact.email or enrichment_result.management_company}"
-                                        logger.info(f"[Stream] Sending: contact_found - {contact_msg}")
-                                        yield {
-                                            "type": "contact_found",
-                                            "message": contact_msg,
-                                            "phone": contact.phone,
-                                            "email": contact.email,
-                                            "company": enrichment_result.management_company,
-                                            "current": idx + 1,
-                                            "total": len(new_parcels)
-                                        }
-                                        await asyncio.sleep(0.05)
-                                    else:
-                                        db_property.enrichment_status = "not_found"
-                                        logger.info(f"[Stream] Sending: progress - No contact info found for {parcel.address}")
-                                        yield {
-                                            "type": "progress",
-                                            "message": "No contact info found",
-                                            "current": idx + 1,
-                                            "total": len(new_parcels)
-                                        }
-                                        await asyncio.sleep(0.05)
+                                            phone_display = contact.phone[:15] + "..." if contact.phone and len(contact.phone) > 15 else contact.phone
+                                            contact_msg = f"Contact found: {phone_display or contact.email or enrichment_result.management_company}"
+                                            logger.debug("[Stream] Sending: contact_found - %s", contact_msg)
+                                            yield {
+                                                "type": "contact_found",
+                                                "message": contact_msg,
+                                                "phone": contact.phone,
+                                                "email": contact.email,
+                                                "company": enrichment_result.management_company,
+                                                "current": idx + 1,
+                                                "total": len(new_parcels)
+                                            }
+                                        else:
+                                            db_property.enrichment_status = "not_found"
+                                            logger.debug("[Stream] Sending: progress - No contact info found for %s", parcel.address)
+                                            yield {
+                                                "type": "progress",
+                                                "message": "No contact info found",
+                                                "current": idx + 1,
+                                                "total": len(new_parcels)
+                                            }
                                         
-                                except Exception as enrich_err:
-                                    logger.warning(f"Enrichment error: {enrich_err}")
-                                    db_property.enrichment_status = "error"
+                                    except Exception as enrich_err:
+                                        logger.warning("Enrichment error: %s", enrich_err)
+                                        db_property.enrichment_status = "error"
+                                else:
+                                    db_property.enrichment_status = "skipped_budget"
+                                    yield {
+                                        "type": "progress",
+                                        "message": "Skipped contact search (budget)",
+                                        "current": idx + 1,
+                                        "total": len(new_parcels)
+                                    }
                                 
                 except Exception as img_err:
-                    logger.warning(f"Imagery/VLM error: {img_err}")
+                    logger.warning("Imagery/VLM error: %s", img_err)
                     db_property.status = "imagery_failed"
                 
-                db.commit()
+                with telemetry.span("db.commit", parcel_id=parcel.parcel_id):
+                    db.commit()
                 
             except Exception as e:
-                logger.error(f"Error processing parcel: {e}")
+                logger.error("Error processing parcel: %s", e)
                 db.rollback()
                 continue
         
@@ -702,6 +741,9 @@ class DiscoveryOrchestrator:
             properties_analyzed=analyzed_count,
             businesses_loaded=0,
             vlm_total_cost=vlm_total_cost,
+            imagery_cost_est=budget.by_service.get("google_satellite", 0.0),
+            enrichment_cost_est=budget.by_service.get("llm_enrichment", 0.0),
+            metadata={"budget": budget.snapshot()},
         )
         
         complete_msg = {
@@ -713,9 +755,10 @@ class DiscoveryOrchestrator:
                 "enriched": enriched_count,
                 "duration": f"{duration:.1f}s",
                 "cost": f"${vlm_total_cost:.4f}"
-            }
+            },
+            "stages": telemetry.current_breakdown(),
         }
-        logger.info(f"[Stream] Sending: complete - {processed_count} found, {analyzed_count} analyzed, {enriched_count} enriched")
+        logger.info("[Stream] Sending: complete - %s found, %s analyzed, %s enriched", processed_count, analyzed_count, enriched_count)
         yield complete_msg
     
     async def _run_business_first_pipeline(
@@ -770,139 +813,69 @@ class DiscoveryOrchestrator:
         
         logger.info("")
         logger.info("=" * 60)
-        logger.info(f"🚀 BUSINESS-FIRST DISCOVERY PIPELINE STARTED")
-        logger.info(f"   Job ID: {job_id}")
-        logger.info(f"   User ID: {user_id}")
-        logger.info(f"   Max results: {filters.max_lots}")
-        logger.info(f"   Tiers: {tier_desc}")
+        logger.info("🚀 BUSINESS-FIRST DISCOVERY PIPELINE STARTED")
+        logger.info("   Job ID: %s", job_id)
+        logger.info("   User ID: %s", user_id)
+        logger.info("   Max results: %s", filters.max_lots)
+        logger.info("   Tiers: %s", tier_desc)
         if business_type_ids:
-            logger.info(f"   Business types: {', '.join(business_type_ids)}")
+            logger.info("   Business types: %s", ', '.join(business_type_ids))
         logger.info("=" * 60)
         
-        # Get polygon centroid and bounds
         poly = shape(area_polygon)
-        centroid = poly.centroid
-        bounds = poly.bounds  # (minx, miny, maxx, maxy)
-        
-        # Calculate search radius from bounds
-        lat_range = bounds[3] - bounds[1]
-        lng_range = bounds[2] - bounds[0]
-        radius_meters = int(max(lat_range, lng_range) * 111000 / 2 * 1.2)
-        radius_meters = min(radius_meters, 50000)  # Cap at 50km
         
         # ============ Step 1: Discover businesses by type ============
         logger.info("")
         logger.info("🏢 STEP 1: Discovering businesses by type...")
         self._update_job(job_key, DiscoveryStep.LOADING_BUSINESSES)
         
-        # SMART FETCHING: Keep fetching until we have enough NEW businesses
-        # Google Places allows up to 60 results per query (3 pages x 20 each)
-        # If no new businesses found, expand the search radius
-        max_fetch_attempts = 3
-        max_radius_expansions = 3  # How many times to expand radius
-        fetch_batch_size = max(30, filters.max_lots * 3)  # Fetch 3x what we need per batch
+        # Places spend is capped up front (BUDGET_PLACES_SHARE of the job budget)
+        # so tiling leaves the rest for imagery, scoring and enrichment
+        budget = self._budget(job_key)
         
-        discovered_businesses = []
-        total_skipped = 0
-        all_seen_place_ids = set()
-        current_radius = radius_meters
-        
-        for radius_expansion in range(max_radius_expansions + 1):
-            if len(discovered_businesses) >= filters.max_lots:
-                break
-            
-            if radius_expansion > 0:
-                # Expand radius by 50% each time
-                current_radius = int(current_radius * 1.5)
-                current_radius = min(current_radius, 50000)  # Cap at 50km
-                logger.info(f"   🔄 Expanding search radius to {current_radius/1000:.1f}km")
-            
-            found_new_in_radius = False
-            
-            for attempt in range(max_fetch_attempts):
-                if len(discovered_businesses) >= filters.max_lots:
-                    break
-                
-                # Fetch a batch of businesses
-                batch = await business_first_discovery_service.discover_businesses(
-            center_lat=centroid.y,
-            center_lng=centroid.x,
-                    radius_meters=current_radius,
+        # Adaptive tiling: cover the polygon with quadtree cells, split cells whose
+        # searches come back saturated, skip businesses that were already processed
+        discovery = await business_first_discovery_service.discover_in_polygon(
+            polygon=poly,
             tiers=tier_enums,
             business_type_ids=business_type_ids,
-                    max_per_tier=max(20, fetch_batch_size // 2),  # More per tier for pagination
-                    max_total=fetch_batch_size,
-                )
-                
-                # Check for new businesses we haven't seen in this session
-                new_in_batch = [b for b in batch if b.places_id not in all_seen_place_ids]
-                for b in new_in_batch:
-                    all_seen_place_ids.add(b.places_id)
-                
-                if not new_in_batch:
-                    logger.info(f"   📭 No more businesses in area (radius: {current_radius/1000:.1f}km)")
-                    break
-                
-                # Check which ones are already processed in DB
-                already_processed = self._get_already_processed_places_ids(
-                    places_ids=[b.places_id for b in new_in_batch],
-                    db=db,
-                )
-                
-                # Separate new vs already processed
-                new_businesses = [b for b in new_in_batch if b.places_id not in already_processed]
-                batch_skipped = len(new_in_batch) - len(new_businesses)
-                total_skipped += batch_skipped
-                
-                # Add new businesses to our result list
-                for business in new_businesses:
-                    if len(discovered_businesses) >= filters.max_lots:
-                        break
-                    discovered_businesses.append(business)
-                    found_new_in_radius = True
-                
-                logger.info(f"   📥 Batch {attempt + 1}: {len(new_in_batch)} found, {len(new_businesses)} new, {batch_skipped} skipped")
-                
-                # If we got less than expected, we've likely exhausted results at this radius
-                if len(new_in_batch) < fetch_batch_size // 2:
-                    break
-            
-            # If we found new businesses at this radius, don't expand further unless needed
-            if found_new_in_radius and len(discovered_businesses) >= filters.max_lots:
-                break
-            
-            # If no new businesses found at current radius, try expanding
-            if not found_new_in_radius and radius_expansion < max_radius_expansions:
-                continue
-            elif not found_new_in_radius:
-                logger.info(f"   ⚠️ No new businesses found even after expanding radius to {current_radius/1000:.1f}km")
+            max_total=filters.max_lots,
+            skip_place_ids=lambda place_ids: self._get_already_processed_places_ids(
+                places_ids=place_ids,
+                db=db,
+            ),
+            max_cost_usd=budget.places_cap,
+        )
+        discovered_businesses = discovery.businesses
+        budget.charge_places(discovery.stats.text_search_calls, discovery.stats.details_calls)
+        total_skipped = discovery.stats.results_skipped
         
         skipped_count = total_skipped
         
         if skipped_count > 0:
-            logger.info(f"   ♻️  Total skipped (already processed): {skipped_count}")
+            logger.info("   ♻️  Total skipped (already processed): %s", skipped_count)
         
         # Count by tier
         premium_count = len([b for b in discovered_businesses if b.tier == BusinessTier.PREMIUM])
         high_count = len([b for b in discovered_businesses if b.tier == BusinessTier.HIGH])
         standard_count = len([b for b in discovered_businesses if b.tier == BusinessTier.STANDARD])
         
-        logger.info(f"   ✅ Found {len(discovered_businesses)} NEW businesses to process:")
-        logger.info(f"      🏆 Premium (Apartments/Condos): {premium_count}")
-        logger.info(f"      ⭐ High (Shopping/Hotels): {high_count}")
-        logger.info(f"      📍 Standard (Other): {standard_count}")
+        logger.info("   ✅ Found %s NEW businesses to process:", len(discovered_businesses))
+        logger.info("      🏆 Premium (Apartments/Condos): %s", premium_count)
+        logger.info("      ⭐ High (Shopping/Hotels): %s", high_count)
+        logger.info("      📍 Standard (Other): %s", standard_count)
         if skipped_count > 0:
-            logger.info(f"      ♻️  Already processed (skipped): {skipped_count}")
+            logger.info("      ♻️  Already processed (skipped): %s", skipped_count)
         
         self._jobs[job_key]["progress"].businesses_loaded = len(discovered_businesses)
         self._jobs[job_key]["progress"].businesses_skipped = skipped_count
         
         if not discovered_businesses:
             if skipped_count > 0:
-                logger.warning(f"   ⚠️  All {skipped_count} businesses in this area already processed")
-                logger.info(f"   💡 Tip: Try a different area or expand the search radius")
+                logger.warning("   ⚠️  All %s businesses in this area already processed", skipped_count)
+                logger.info("   💡 Tip: Try a different area or expand the search radius")
             else:
-            logger.warning("   ⚠️  No businesses found in area")
+                logger.warning("   ⚠️  No businesses found in area")
             self._update_job(job_key, DiscoveryStep.COMPLETED)
             return
         
@@ -918,8 +891,15 @@ class DiscoveryOrchestrator:
         parking_lot_ids: List[UUID] = []
         
         for idx, business in enumerate(discovered_businesses):
+            level_event = budget.take_level_change()
+            if level_event:
+                logger.info("   💸 %s", level_event["message"])
+            if budget.exhausted:
+                logger.warning("💸 Budget reached - stopping after %s of %s", idx, len(discovered_businesses))
+                break
+            
             try:
-                logger.info(f"   [{idx+1}/{len(discovered_businesses)}] {business.name} ({business.tier.value})")
+                logger.info("   [%s/%s] %s (%s)", idx+1, len(discovered_businesses), business.name, business.tier.value)
                 
                 # Save business to database
                 existing_business = db.query(Business).filter(
@@ -965,12 +945,12 @@ class DiscoveryOrchestrator:
                 if existing_lot:
                     # Use existing parking lot, skip re-analysis
                     db_property = existing_lot
-                    logger.info(f"      ♻️  Using existing parking lot (already analyzed)")
+                    logger.info("      ♻️  Using existing parking lot (already analyzed)")
                     parking_lot_ids.append(db_property.id)
                     
                     # Skip to next business if already evaluated
                     if db_property.status == "analyzed":
-                        logger.info(f"      ✅ Already evaluated, skipping")
+                        logger.info("      ✅ Already evaluated, skipping")
                         continue
                 else:
                     # Create placeholder parking lot (actual area will come from SAM analysis)
@@ -1006,7 +986,7 @@ class DiscoveryOrchestrator:
                 
                 # ============ Step 1: Get Property Boundary from Regrid ============
                 # Use ADDRESS-based lookup (more accurate than point lookup)
-                logger.info(f"      🗺️  Fetching property boundary from Regrid by ADDRESS...")
+                logger.info("      🗺️  Fetching property boundary from Regrid by ADDRESS...")
                 
                 property_boundary = None
                 regrid_parcel = None
@@ -1021,19 +1001,19 @@ class DiscoveryOrchestrator:
                     
                     if regrid_parcel and regrid_parcel.has_valid_geometry:
                         property_boundary = regrid_parcel.polygon
-                        logger.info(f"      ✅ Got Regrid boundary: {regrid_parcel.area_m2:,.0f} m²")
-                        logger.info(f"         Owner: {regrid_parcel.owner}")
-                        logger.info(f"         Regrid Address: {regrid_parcel.address}")
-                        logger.info(f"         Business Address: {business.address[:50]}...")
+                        logger.info("      ✅ Got Regrid boundary: %.0f m²", regrid_parcel.area_m2)
+                        logger.info("         Owner: %s", regrid_parcel.owner)
+                        logger.info("         Regrid Address: %s", regrid_parcel.address)
+                        logger.info("         Business Address: %s...", business.address[:50])
                     else:
-                        logger.warning(f"      ❌ No Regrid parcel found - SKIPPING (need exact boundary)")
+                        logger.warning("      ❌ No Regrid parcel found - SKIPPING (need exact boundary)")
                 except Exception as e:
-                    logger.warning(f"      ❌ Regrid lookup failed: {e} - SKIPPING")
+                    logger.warning("      ❌ Regrid lookup failed: %s - SKIPPING", e)
                 
                 # ============ Step 2: REQUIRE Regrid Boundary ============
                 # Without exact property boundary, we can't accurately detect private asphalt
                 if not property_boundary:
-                    logger.warning(f"      ⏭️  Skipping {business.name} - no Regrid coverage in this area")
+                    logger.warning("      ⏭️  Skipping %s - no Regrid coverage in this area", business.name)
                     # Mark as skipped but keep in DB for potential future analysis
                     db_property.status = "skipped_no_boundary"
                     db_property.status_error = "Regrid has no parcel data for this location"
@@ -1041,7 +1021,7 @@ class DiscoveryOrchestrator:
                     continue
                 
                 # ============ Step 3: Get Property Satellite Image ============
-                logger.info(f"      🎯 Fetching property satellite imagery...")
+                logger.info("      🎯 Fetching property satellite imagery...")
                 
                 imagery_result = await property_imagery_pipeline.get_property_image(
                     lat=business.latitude,
@@ -1053,6 +1033,7 @@ class DiscoveryOrchestrator:
                 )
                 
                 if imagery_result.success:
+                    budget.charge_imagery()
                     # Store Regrid data directly on parking lot
                     if regrid_parcel:
                         db_property.regrid_id = regrid_parcel.parcel_id
@@ -1087,9 +1068,9 @@ class DiscoveryOrchestrator:
                         
                         # Log LBCS codes for debugging
                         if regrid_parcel.lbcs_structure:
-                            logger.info(f"      🏷️  LBCS Structure: {regrid_parcel.lbcs_structure} ({regrid_parcel.lbcs_structure_desc or 'N/A'})")
+                            logger.info("      🏷️  LBCS Structure: %s (%s)", regrid_parcel.lbcs_structure, regrid_parcel.lbcs_structure_desc or 'N/A')
                         if regrid_parcel.num_units:
-                            logger.info(f"      🏢 Units: {regrid_parcel.num_units}")
+                            logger.info("      🏢 Units: %s", regrid_parcel.num_units)
                         
                         # Store polygon as Geography
                         if regrid_parcel.polygon:
@@ -1107,16 +1088,17 @@ class DiscoveryOrchestrator:
                     
                     evaluated_count += 1
                     
-                    logger.info(f"      ✅ Imagery captured: {imagery_result.image_size[0]}x{imagery_result.image_size[1]} px")
-                    logger.info(f"         Property area: {imagery_result.area_sqft:,.0f} sqft")
-                    logger.info(f"         Regrid owner: {regrid_parcel.owner if regrid_parcel else 'N/A'}")
-                    logger.info(f"         Land use: {regrid_parcel.land_use if regrid_parcel else 'N/A'}")
+                    logger.info("      ✅ Imagery captured: %sx%s px", imagery_result.image_size[0], imagery_result.image_size[1])
+                    logger.info("         Property area: %.0f sqft", imagery_result.area_sqft)
+                    logger.info("         Regrid owner: %s", regrid_parcel.owner if regrid_parcel else 'N/A')
+                    logger.info("         Land use: %s", regrid_parcel.land_use if regrid_parcel else 'N/A')
                     
                     # ============ Step 4: VLM Analysis for Lead Scoring ============
-                    logger.info(f"      🤖 Running VLM analysis for lead scoring...")
+                    logger.info("      🤖 Running VLM analysis for lead scoring...")
                     
-                    vlm_result = await vlm_analysis_service.analyze_property(
-                        image_base64=imagery_result.image_base64,
+                    vlm_result = await vlm_result_cache_service.analyze_property(
+                        image_base64=imagery_result.vlm_image_base64,
+                        image_detail=budget.image_detail(imagery_result.vlm_image_detail),
                         scoring_prompt=scoring_prompt,
                         property_context={
                             "address": business.address,
@@ -1127,7 +1109,9 @@ class DiscoveryOrchestrator:
                             "business_type": business.tier.value,
                         },
                         user_api_key=user_openrouter_key,  # Use user's key if enabled
+                        bypass_cache=filters.bypass_vlm_cache,
                     )
+                    budget.charge_vlm(vlm_result)
                     
                     if vlm_result.success:
                         # Store VLM results
@@ -1157,76 +1141,82 @@ class DiscoveryOrchestrator:
                         vlm_analyzed_count += 1
                         if vlm_result.usage:
                             vlm_total_cost += vlm_result.usage.cost
-                        logger.info(f"      🎯 VLM Score: {vlm_result.lead_score}/100 ({db_property.lead_quality})")
-                        logger.info(f"         Confidence: {vlm_result.confidence}%")
-                        logger.info(f"         Reasoning: {vlm_result.reasoning[:100]}...")
+                        logger.info("      🎯 VLM Score: %s/100 (%s)", vlm_result.lead_score, db_property.lead_quality)
+                        logger.info("         Confidence: %s%%", vlm_result.confidence)
+                        logger.info("         Reasoning: %s...", vlm_result.reasoning[:100])
                         if vlm_result.observations:
-                            logger.info(f"         Paved: {vlm_result.observations.paved_area_pct}% | Buildings: {vlm_result.observations.building_pct}%")
+                            logger.info("         Paved: %s%% | Buildings: %s%%", vlm_result.observations.paved_area_pct, vlm_result.observations.building_pct)
                             if vlm_result.observations.visible_issues:
-                                logger.info(f"         Issues: {', '.join(vlm_result.observations.visible_issues[:3])}")
+                                logger.info("         Issues: %s", ', '.join(vlm_result.observations.visible_issues[:3]))
                         
                         # ============ Step 5: LLM-Powered Lead Enrichment ============
-                        # Use LLM to intelligently find Property Manager contact data
-                        logger.info(f"      📇 LLM-powered enrichment to find Property Manager...")
+                        # Only high scores once the budget is running low
+                        if budget.allow_enrichment(vlm_result.lead_score):
+                            # Use LLM to intelligently find Property Manager contact data
+                            logger.info("      📇 LLM-powered enrichment to find Property Manager...")
                         
-                        # Determine property type from LBCS or business type
-                        prop_type = business.tier.value
-                        if regrid_parcel and regrid_parcel.lbcs_structure:
-                            if 1200 <= regrid_parcel.lbcs_structure < 1300:
-                                prop_type = "multi_family"
-                            elif 2100 <= regrid_parcel.lbcs_structure < 2200:
-                                prop_type = "office"
-                            elif 2200 <= regrid_parcel.lbcs_structure < 2300:
-                                prop_type = "retail"
+                            # Determine property type from LBCS or business type
+                            prop_type = business.tier.value
+                            if regrid_parcel and regrid_parcel.lbcs_structure:
+                                if 1200 <= regrid_parcel.lbcs_structure < 1300:
+                                    prop_type = "multi_family"
+                                elif 2100 <= regrid_parcel.lbcs_structure < 2200:
+                                    prop_type = "office"
+                                elif 2200 <= regrid_parcel.lbcs_structure < 2300:
+                                    prop_type = "retail"
                         
-                        enrichment_result = await llm_enrichment_service.enrich(
-                            address=business.address,
-                            property_type=prop_type,
-                            owner_name=regrid_parcel.owner if regrid_parcel else None,
-                            lbcs_code=regrid_parcel.lbcs_structure if regrid_parcel else None,
-                        )
+                            enrichment_result = await llm_enrichment_service.enrich(
+                                address=business.address,
+                                property_type=prop_type,
+                                owner_name=regrid_parcel.owner if regrid_parcel else None,
+                                lbcs_code=regrid_parcel.lbcs_structure if regrid_parcel else None,
+                            )
+                            budget.charge_enrichment()
                         
-                        # Store enrichment steps for UI (always save detailed steps with URLs)
-                        import json
-                        if enrichment_result.detailed_steps:
-                            # Store detailed steps as JSON (includes URL, source, confidence)
-                            db_property.enrichment_steps = json.dumps([
-                                step.to_dict() for step in enrichment_result.detailed_steps
-                            ])
-                            # Log simple flow for console
-                            flow_parts = [step.to_simple_string() for step in enrichment_result.detailed_steps]
-                            logger.info(f"         Flow: {' → '.join(flow_parts)}")
-                        elif enrichment_result.steps:
-                            # Fallback to simple steps if no detailed steps
-                            db_property.enrichment_steps = json.dumps(enrichment_result.steps)
-                            logger.info(f"         Flow: {' → '.join(enrichment_result.steps)}")
+                            # Store enrichment steps for UI (always save detailed steps with URLs)
+                            import json
+                            if enrichment_result.detailed_steps:
+                                # Store detailed steps as JSON (includes URL, source, confidence)
+                                db_property.enrichment_steps = json.dumps([
+                                    step.to_dict() for step in enrichment_result.detailed_steps
+                                ])
+                                # Log simple flow for console
+                                flow_parts = [step.to_simple_string() for step in enrichment_result.detailed_steps]
+                                logger.info("         Flow: %s", ' → '.join(flow_parts))
+                            elif enrichment_result.steps:
+                                # Fallback to simple steps if no detailed steps
+                                db_property.enrichment_steps = json.dumps(enrichment_result.steps)
+                                logger.info("         Flow: %s", ' → '.join(enrichment_result.steps))
                         
-                        if enrichment_result.success and enrichment_result.contact:
-                            contact = enrichment_result.contact
-                            db_property.contact_name = contact.name
-                            db_property.contact_first_name = contact.first_name
-                            db_property.contact_last_name = contact.last_name
-                            db_property.contact_email = contact.email
-                            db_property.contact_phone = contact.phone
-                            db_property.contact_title = contact.title
-                            db_property.contact_company = enrichment_result.management_company
-                            db_property.contact_company_website = enrichment_result.management_website
-                            db_property.enriched_at = datetime.utcnow()
-                            db_property.enrichment_source = "llm_enrichment"
-                            db_property.enrichment_status = "success"
+                            if enrichment_result.success and enrichment_result.contact:
+                                contact = enrichment_result.contact
+                                db_property.contact_name = contact.name
+                                db_property.contact_first_name = contact.first_name
+                                db_property.contact_last_name = contact.last_name
+                                db_property.contact_email = contact.email
+                                db_property.contact_phone = contact.phone
+                                db_property.contact_title = contact.title
+                                db_property.contact_company = enrichment_result.management_company
+                                db_property.contact_company_website = enrichment_result.management_website
+                                db_property.enriched_at = datetime.utcnow()
+                                db_property.enrichment_source = "llm_enrichment"
+                                db_property.enrichment_status = "success"
                             
-                            logger.info(f"      ✅ Contact found: {contact.name or contact.phone or contact.email}")
-                            logger.info(f"         Confidence: {enrichment_result.confidence:.0%}")
-                            if enrichment_result.management_company:
-                                logger.info(f"         Company: {enrichment_result.management_company}")
-                else:
-                            db_property.enrichment_status = "not_found"
-                            if enrichment_result.error_message:
-                                logger.info(f"      ⚠️ Enrichment: {enrichment_result.error_message}")
+                                logger.info("      ✅ Contact found: %s", contact.name or contact.phone or contact.email)
+                                logger.info("         Confidence: %.0f%%", enrichment_result.confidence * 100)
+                                if enrichment_result.management_company:
+                                    logger.info("         Company: %s", enrichment_result.management_company)
+                            else:
+                                db_property.enrichment_status = "not_found"
+                                if enrichment_result.error_message:
+                                    logger.info("      ⚠️ Enrichment: %s", enrichment_result.error_message)
+                        else:
+                            logger.info("      💸 Skipping enrichment (budget)")
+                            db_property.enrichment_status = "skipped_budget"
                     else:
-                        logger.warning(f"      ⚠️ VLM analysis failed: {vlm_result.error_message}")
+                        logger.warning("      ⚠️ VLM analysis failed: %s", vlm_result.error_message)
                 else:
-                    logger.warning(f"      ❌ Imagery failed: {imagery_result.error_message}")
+                    logger.warning("      ❌ Imagery failed: %s", imagery_result.error_message)
                     db_property.status_error = imagery_result.error_message
                     db_property.status = "failed"
                 
@@ -1237,7 +1227,7 @@ class DiscoveryOrchestrator:
                 await asyncio.sleep(0.3)
                 
             except Exception as e:
-                logger.error(f"      ❌ Error processing business: {e}")
+                logger.error("      ❌ Error processing business: %s", e)
                 import traceback
                 traceback.print_exc()
                 db.rollback()
@@ -1253,7 +1243,7 @@ class DiscoveryOrchestrator:
         high_value_count = self._count_high_value_leads(parking_lot_ids, filters, db)
         self._jobs[job_key]["progress"].high_value_leads = high_value_count
         
-        logger.info(f"   ✅ Found {high_value_count} high-value leads")
+        logger.info("   ✅ Found %s high-value leads", high_value_count)
         
         # ============ Complete ============
         self._update_job(job_key, DiscoveryStep.COMPLETED)
@@ -1263,29 +1253,29 @@ class DiscoveryOrchestrator:
         
         logger.info("")
         logger.info("=" * 60)
-        logger.info(f"✅ BUSINESS-FIRST DISCOVERY COMPLETED")
-        logger.info(f"   Job ID: {job_id}")
-        logger.info(f"   Duration: {elapsed:.1f} seconds")
-        logger.info(f"   Businesses processed: {len(discovered_businesses)} new")
+        logger.info("✅ BUSINESS-FIRST DISCOVERY COMPLETED")
+        logger.info("   Job ID: %s", job_id)
+        logger.info("   Duration: %.1f seconds", elapsed)
+        logger.info("   Businesses processed: %s new", len(discovered_businesses))
         if skipped_count > 0:
-            logger.info(f"   Businesses skipped: {skipped_count} (already processed)")
-        logger.info(f"   Properties processed: {processed_count}")
-        logger.info(f"   Properties with imagery: {evaluated_count}")
-        logger.info(f"   Properties analyzed (VLM): {vlm_analyzed_count}")
-        logger.info(f"   VLM total cost: ${vlm_total_cost:.4f}")
-        logger.info(f"   High-value leads: {high_value_count}")
+            logger.info("   Businesses skipped: %s (already processed)", skipped_count)
+        logger.info("   Properties processed: %s", processed_count)
+        logger.info("   Properties with imagery: %s", evaluated_count)
+        logger.info("   Properties analyzed (VLM): %s", vlm_analyzed_count)
+        logger.info("   VLM total cost: $%.4f", vlm_total_cost)
+        logger.info("   High-value leads: %s", high_value_count)
         
         # Count enriched leads
         enriched_count = db.query(Property).filter(
             Property.id.in_(parking_lot_ids),
             Property.enrichment_status == "success"
         ).count()
-        logger.info(f"   Leads with contact data: {enriched_count}/{vlm_analyzed_count}")
+        logger.info("   Leads with contact data: %s/%s", enriched_count, vlm_analyzed_count)
         
-        logger.info(f"   By tier:")
-        logger.info(f"      🏆 Premium: {premium_count}")
-        logger.info(f"      ⭐ High: {high_count}")
-        logger.info(f"      📍 Standard: {standard_count}")
+        logger.info("   By tier:")
+        logger.info("      🏆 Premium: %s", premium_count)
+        logger.info("      ⭐ High: %s", high_count)
+        logger.info("      📍 Standard: %s", standard_count)
         logger.info("=" * 60)
         logger.info("")
         
@@ -1299,7 +1289,11 @@ class DiscoveryOrchestrator:
             properties_analyzed=vlm_analyzed_count,
             businesses_loaded=len(discovered_businesses),
             vlm_total_cost=vlm_total_cost,  # Actual cost from OpenRouter
+            places_cost_est=budget.by_service.get("google_places", 0.0),
+            imagery_cost_est=budget.by_service.get("google_satellite", 0.0),
+            enrichment_cost_est=budget.by_service.get("llm_enrichment", 0.0),
             metadata={
+                "budget": budget.snapshot(),
                 "high_value_leads": high_value_count,
                 "associations_made": processed_count,
                 "businesses_skipped": skipped_count,
@@ -1310,6 +1304,7 @@ class DiscoveryOrchestrator:
                     "high": high_count,
                     "standard": standard_count,
                 },
+                "tiling": discovery.stats.to_dict(),
             }
         )
     
@@ -1355,11 +1350,11 @@ class DiscoveryOrchestrator:
         
         logger.info("")
         logger.info("=" * 60)
-        logger.info(f"🚀 CONTACT-FIRST DISCOVERY PIPELINE STARTED")
-        logger.info(f"   Job ID: {job_id}")
-        logger.info(f"   User ID: {user_id}")
-        logger.info(f"   Location: {city or 'Any'}, {state or 'Any'}")
-        logger.info(f"   Max results: {filters.max_lots}")
+        logger.info("🚀 CONTACT-FIRST DISCOVERY PIPELINE STARTED")
+        logger.info("   Job ID: %s", job_id)
+        logger.info("   User ID: %s", user_id)
+        logger.info("   Location: %s, %s", city or 'Any', state or 'Any')
+        logger.info("   Max results: %s", filters.max_lots)
         logger.info("=" * 60)
         
         # Check if Apollo is configured
@@ -1389,7 +1384,7 @@ class DiscoveryOrchestrator:
             self._update_job(job_key, DiscoveryStep.COMPLETED)
             return
         
-        logger.info(f"   ✅ Found {len(contacts)} contacts from Apollo")
+        logger.info("   ✅ Found %s contacts from Apollo", len(contacts))
         self._jobs[job_key]["progress"].contacts_found = len(contacts)
         
         # Group contacts by company (we'll search Regrid once per company)
@@ -1400,7 +1395,7 @@ class DiscoveryOrchestrator:
                 companies[company_name] = []
             companies[company_name].append(contact)
         
-        logger.info(f"   📊 Contacts grouped into {len(companies)} unique companies")
+        logger.info("   📊 Contacts grouped into %s unique companies", len(companies))
         
         # ============ Step 2: Search Regrid for properties owned by each company ============
         logger.info("")
@@ -1420,7 +1415,7 @@ class DiscoveryOrchestrator:
             if len(all_leads) >= filters.max_lots:
                 break
             
-            logger.info(f"   [{companies_searched + 1}/{len(companies)}] Searching: {company_name}")
+            logger.info("   [%s/%s] Searching: %s", companies_searched + 1, len(companies), company_name)
             
             # Search Regrid for properties owned by this company
             parcels = await regrid_service.search_parcels_by_owner(
@@ -1433,10 +1428,10 @@ class DiscoveryOrchestrator:
             companies_searched += 1
             
             if not parcels:
-                logger.info(f"      ❌ No properties found")
+                logger.info("      ❌ No properties found")
                 continue
             
-            logger.info(f"      ✅ Found {len(parcels)} properties")
+            logger.info("      ✅ Found %s properties", len(parcels))
             
             # Get the best contact for this company (first one, usually has highest rank)
             primary_contact = company_contacts[0]
@@ -1455,7 +1450,7 @@ class DiscoveryOrchestrator:
             self._update_job(job_key, DiscoveryStep.COMPLETED)
             return
         
-        logger.info(f"   ✅ Total: {len(all_leads)} property-contact matches")
+        logger.info("   ✅ Total: %s property-contact matches", len(all_leads))
         
         # ============ Step 3: Get imagery and VLM score for each property ============
         logger.info("")
@@ -1465,12 +1460,20 @@ class DiscoveryOrchestrator:
         analyzed_count = 0
         vlm_total_cost = 0.0
         property_ids = []
+        budget = self._budget(job_key)
         
         for idx, (contact, parcel) in enumerate(all_leads):
+            level_event = budget.take_level_change()
+            if level_event:
+                logger.info("   💸 %s", level_event["message"])
+            if budget.exhausted:
+                logger.warning("💸 Budget reached - stopping after %s of %s", idx, len(all_leads))
+                break
+            
             try:
-                logger.info(f"   [{idx+1}/{len(all_leads)}] {parcel.address or parcel.parcel_id}")
-                logger.info(f"      Contact: {contact.name} ({contact.email})")
-                logger.info(f"      Company: {contact.company_name}")
+                logger.info("   [%s/%s] %s", idx+1, len(all_leads), parcel.address or parcel.parcel_id)
+                logger.info("      Contact: %s (%s)", contact.name, contact.email)
+                logger.info("      Company: %s", contact.company_name)
                 
                 # Check if property already exists
                 existing_property = db.query(Property).filter(
@@ -1479,9 +1482,9 @@ class DiscoveryOrchestrator:
                 ).first()
                 
                 if existing_property:
-                    logger.info(f"      ♻️ Property already exists, updating contact info")
+                    logger.info("      ♻️ Property already exists, updating contact info")
                     db_property = existing_property
-                    else:
+                else:
                     # Create new property
                     from shapely.geometry import Point
                     centroid = parcel.centroid if parcel.centroid else Point(0, 0)
@@ -1545,7 +1548,7 @@ class DiscoveryOrchestrator:
                     db_property.regrid_polygon = from_shape(parcel.polygon, srid=4326)
                 
                 # Get satellite imagery
-                logger.info(f"      📷 Fetching satellite imagery...")
+                logger.info("      📷 Fetching satellite imagery...")
                 
                 imagery_result = await property_imagery_pipeline.get_property_image(
                     lat=parcel.centroid.y if parcel.centroid else 0,
@@ -1557,6 +1560,7 @@ class DiscoveryOrchestrator:
                 )
                 
                 if imagery_result.success:
+                    budget.charge_imagery()
                     db_property.satellite_image_base64 = imagery_result.image_base64
                     db_property.satellite_zoom_level = str(imagery_result.metadata.get('zoom', 20))
                     db_property.area_m2 = imagery_result.area_sqm
@@ -1564,13 +1568,14 @@ class DiscoveryOrchestrator:
                     db_property.satellite_fetched_at = datetime.utcnow()
                     db_property.status = "imagery_captured"
                     
-                    logger.info(f"      ✅ Imagery captured: {imagery_result.image_size[0]}x{imagery_result.image_size[1]} px")
+                    logger.info("      ✅ Imagery captured: %sx%s px", imagery_result.image_size[0], imagery_result.image_size[1])
                     
                     # Run VLM analysis
-                    logger.info(f"      🤖 Running VLM analysis...")
+                    logger.info("      🤖 Running VLM analysis...")
                     
-                    vlm_result = await vlm_analysis_service.analyze_property(
-                        image_base64=imagery_result.image_base64,
+                    vlm_result = await vlm_result_cache_service.analyze_property(
+                        image_base64=imagery_result.vlm_image_base64,
+                        image_detail=budget.image_detail(imagery_result.vlm_image_detail),
                         scoring_prompt=scoring_prompt,
                         property_context={
                             "address": parcel.address,
@@ -1581,7 +1586,9 @@ class DiscoveryOrchestrator:
                             "contact_company": contact.company_name,
                         },
                         user_api_key=user_openrouter_key,
+                        bypass_cache=filters.bypass_vlm_cache,
                     )
+                    budget.charge_vlm(vlm_result)
                     
                     if vlm_result.success:
                         db_property.lead_score = vlm_result.lead_score
@@ -1603,11 +1610,11 @@ class DiscoveryOrchestrator:
                         if vlm_result.usage:
                             vlm_total_cost += vlm_result.usage.cost
                         
-                        logger.info(f"      🎯 VLM Score: {vlm_result.lead_score}/100 ({db_property.lead_quality})")
-                else:
-                        logger.warning(f"      ⚠️ VLM analysis failed: {vlm_result.error_message}")
+                        logger.info("      🎯 VLM Score: %s/100 (%s)", vlm_result.lead_score, db_property.lead_quality)
+                    else:
+                        logger.warning("      ⚠️ VLM analysis failed: %s", vlm_result.error_message)
                 else:
-                    logger.warning(f"      ⚠️ Imagery failed: {imagery_result.error_message}")
+                    logger.warning("      ⚠️ Imagery failed: %s", imagery_result.error_message)
                     db_property.status = "failed"
                     db_property.status_error = imagery_result.error_message
                 
@@ -1618,7 +1625,7 @@ class DiscoveryOrchestrator:
                 await asyncio.sleep(0.3)
                 
             except Exception as e:
-                logger.error(f"      ❌ Error processing property: {e}")
+                logger.error("      ❌ Error processing property: %s", e)
                 import traceback
                 traceback.print_exc()
                 db.rollback()
@@ -1631,7 +1638,7 @@ class DiscoveryOrchestrator:
         high_value_count = self._count_high_value_leads(property_ids, filters, db)
         self._jobs[job_key]["progress"].high_value_leads = high_value_count
         
-        logger.info(f"   ✅ Found {high_value_count} high-value leads")
+        logger.info("   ✅ Found %s high-value leads", high_value_count)
         
         # ============ Complete ============
         self._update_job(job_key, DiscoveryStep.COMPLETED)
@@ -1641,15 +1648,15 @@ class DiscoveryOrchestrator:
         
         logger.info("")
         logger.info("=" * 60)
-        logger.info(f"✅ CONTACT-FIRST DISCOVERY COMPLETED")
-        logger.info(f"   Job ID: {job_id}")
-        logger.info(f"   Duration: {elapsed:.1f} seconds")
-        logger.info(f"   Contacts found: {len(contacts)}")
-        logger.info(f"   Companies searched: {companies_searched}")
-        logger.info(f"   Properties found: {len(all_leads)}")
-        logger.info(f"   Properties analyzed: {analyzed_count}")
-        logger.info(f"   VLM total cost: ${vlm_total_cost:.4f}")
-        logger.info(f"   High-value leads: {high_value_count}")
+        logger.info("✅ CONTACT-FIRST DISCOVERY COMPLETED")
+        logger.info("   Job ID: %s", job_id)
+        logger.info("   Duration: %.1f seconds", elapsed)
+        logger.info("   Contacts found: %s", len(contacts))
+        logger.info("   Companies searched: %s", companies_searched)
+        logger.info("   Properties found: %s", len(all_leads))
+        logger.info("   Properties analyzed: %s", analyzed_count)
+        logger.info("   VLM total cost: $%.4f", vlm_total_cost)
+        logger.info("   High-value leads: %s", high_value_count)
         logger.info("=" * 60)
         logger.info("")
         
@@ -1663,7 +1670,9 @@ class DiscoveryOrchestrator:
             properties_analyzed=analyzed_count,
             businesses_loaded=0,
             vlm_total_cost=vlm_total_cost,
+            imagery_cost_est=budget.by_service.get("google_satellite", 0.0),
             metadata={
+                "budget": budget.snapshot(),
                 "mode": "contact_first",
                 "contacts_found": len(contacts),
                 "companies_searched": companies_searched,
@@ -1707,12 +1716,12 @@ class DiscoveryOrchestrator:
         logger.info("")
         logger.info("=" * 60)
         logger.info("🏢 REGRID-FIRST DISCOVERY PIPELINE STARTED")
-        logger.info(f"   Job ID: {job_id}")
-        logger.info(f"   User ID: {user_id}")
-        logger.info(f"   Max results: {filters.max_lots}")
-        logger.info(f"   Categories: {property_categories}")
+        logger.info("   Job ID: %s", job_id)
+        logger.info("   User ID: %s", user_id)
+        logger.info("   Max results: %s", filters.max_lots)
+        logger.info("   Categories: %s", property_categories)
         if min_acres or max_acres:
-            logger.info(f"   Size filter: {min_acres or 0} - {max_acres or '∞'} acres")
+            logger.info("   Size filter: %s - %s acres", min_acres or 0, max_acres or '∞')
         logger.info("=" * 60)
         
         # ============ Step 1: Build LBCS queries from categories ============
@@ -1740,9 +1749,9 @@ class DiscoveryOrchestrator:
                     lbcs_queries[field] = []
                 lbcs_queries[field].extend(ranges)
                 
-                logger.info(f"   📋 {cat.value}: LBCS {field} ranges {ranges}")
+                logger.info("   📋 %s: LBCS %s ranges %s", cat.value, field, ranges)
             except ValueError:
-                logger.warning(f"   ⚠️ Unknown category: {cat_str}")
+                logger.warning("   ⚠️ Unknown category: %s", cat_str)
         
         # Backwards compatibility - flat list of ranges
         lbcs_ranges = []
@@ -1766,7 +1775,7 @@ class DiscoveryOrchestrator:
             state_code = props.get("state")
             county_fips = props.get("county_fips")
         
-        logger.info(f"   📍 Geographic filter: ZIP={zip_code}, State={state_code}, FIPS={county_fips}")
+        logger.info("   📍 Geographic filter: ZIP=%s, State=%s, FIPS=%s", zip_code, state_code, county_fips)
         
         # ============ Step 2: Query Regrid with Pagination ============
         logger.info("")
@@ -1799,19 +1808,22 @@ class DiscoveryOrchestrator:
                 if len(batch_parcels) >= batch_size:
                     break
                 
-                logger.info(f"   Querying {lbcs_field} with ranges: {ranges} (offset: {current_offset})")
-                
-                field_parcels = await regrid_service.search_parcels_by_lbcs(
-                    lbcs_ranges=ranges,
-                    county_fips=county_fips,
-                    state_code=state_code,
-                    zip_code=zip_code,
-                    max_results=batch_size,
-                    lbcs_field=lbcs_field,
-                    min_acres=min_acres,
-                    max_acres=max_acres,
-                    offset=current_offset,
-                )
+                logger.info("   Querying %s with ranges: %s (offset: %s)", lbcs_field, ranges, current_offset)
+                
+                with telemetry.span("regrid.query", lbcs_field=lbcs_field, offset=current_offset) as span:
+                    field_parcels = await regrid_service.search_parcels_by_lbcs(
+                        lbcs_ranges=ranges,
+                        county_fips=county_fips,
+                        state_code=state_code,
+                        zip_code=zip_code,
+                        max_results=batch_size,
+                        lbcs_field=lbcs_field,
+                        min_acres=min_acres,
+                        max_acres=max_acres,
+                        offset=current_offset,
+                        validate_geometry=False,  # Checked below, only for parcels we keep
+                    )
+                    span.set(parcels=len(field_parcels))
                 
                 for parcel in field_parcels:
                     if parcel.parcel_id not in seen_parcel_ids:
@@ -1819,7 +1831,7 @@ class DiscoveryOrchestrator:
                         batch_parcels.append(parcel)
             
             if not batch_parcels:
-                logger.info(f"   Regrid exhausted after {total_fetched} parcels")
+                logger.info("   Regrid exhausted after %s parcels", total_fetched)
                 break
             
             total_fetched += len(batch_parcels)
@@ -1827,15 +1839,15 @@ class DiscoveryOrchestrator:
             # Filter out existing parcels
             batch_new = 0
             for parcel in batch_parcels:
-                if parcel.parcel_id not in existing_regrid_ids:
+                if parcel.parcel_id in existing_regrid_ids:
+                    total_skipped += 1
+                elif parcel.has_valid_geometry:
                     new_parcels.append(parcel)
                     batch_new += 1
                     if len(new_parcels) >= filters.max_lots:
                         break
-                else:
-                    total_skipped += 1
             
-            logger.info(f"   Page {page+1}: fetched {len(batch_parcels)}, new={batch_new}, total_new={len(new_parcels)}, skipped={total_skipped}")
+            logger.info("   Page %s: fetched %s, new=%s, total_new=%s, skipped=%s", page+1, len(batch_parcels), batch_new, len(new_parcels), total_skipped)
             current_offset += batch_size
         
         # Fallback to usedesc search if no LBCS results
@@ -1856,22 +1868,25 @@ class DiscoveryOrchestrator:
                     usedesc_patterns.extend(["church", "school", "hospital"])
             
             if usedesc_patterns:
-                fallback_parcels = await regrid_service.search_parcels_by_usedesc(
-                    patterns=usedesc_patterns,
-                    county_fips=county_fips,
-                    state_code=state_code,
-                    zip_code=zip_code,
-                    max_results=filters.max_lots * 2,
-                )
+                with telemetry.span("regrid.query", usedesc=True) as span:
+                    fallback_parcels = await regrid_service.search_parcels_by_usedesc(
+                        patterns=usedesc_patterns,
+                        county_fips=county_fips,
+                        state_code=state_code,
+                        zip_code=zip_code,
+                        max_results=filters.max_lots * 2,
+                        validate_geometry=False,
+                    )
+                    span.set(parcels=len(fallback_parcels))
                 for parcel in fallback_parcels:
-                    if parcel.parcel_id not in existing_regrid_ids:
+                    if parcel.parcel_id not in existing_regrid_ids and parcel.has_valid_geometry:
                         new_parcels.append(parcel)
                         if len(new_parcels) >= filters.max_lots:
                             break
         
         if not new_parcels:
             if total_fetched > 0:
-                logger.warning(f"   ⚠️ All {total_fetched} parcels already processed. Try a different area.")
+                logger.warning("   ⚠️ All %s parcels already processed. Try a different area.", total_fetched)
             else:
                 logger.warning("   ⚠️ No parcels found matching criteria")
             self._update_job(job_key, DiscoveryStep.COMPLETED)
@@ -1881,12 +1896,12 @@ class DiscoveryOrchestrator:
         if len(new_parcels) > filters.max_lots:
             new_parcels = new_parcels[:filters.max_lots]
         
-        logger.info(f"   ✅ Found {len(new_parcels)} NEW parcels to process (fetched {total_fetched}, skipped {total_skipped})")
+        logger.info("   ✅ Found %s NEW parcels to process (fetched %s, skipped %s)", len(new_parcels), total_fetched, total_skipped)
         self._jobs[job_key]["progress"].properties_found = len(new_parcels)
         
         # ============ Step 3: Process each parcel ============
         logger.info("")
-        logger.info(f"📷 STEP 3: Processing {len(new_parcels)} parcels...")
+        logger.info("📷 STEP 3: Processing %s parcels...", len(new_parcels))
         self._update_job(job_key, DiscoveryStep.PROCESSING_PARCELS)
         
         property_ids = []
@@ -1903,13 +1918,21 @@ class DiscoveryOrchestrator:
             user_api_key = user.openrouter_api_key
             logger.info("   🔑 Using user's OpenRouter API key")
         
+        budget = self._budget(job_key)
         for idx, parcel in enumerate(new_parcels):
+            level_event = budget.take_level_change()
+            if level_event:
+                logger.info("   💸 %s", level_event["message"])
+            if budget.exhausted:
+                logger.warning("💸 Budget reached - stopping after %s of %s", idx, len(new_parcels))
+                break
+            
             try:
                 processed_count += 1
-                logger.info(f"")
-                logger.info(f"   [{idx + 1}/{len(new_parcels)}] {parcel.address or parcel.parcel_id}")
-                logger.info(f"      Owner: {parcel.owner or 'Unknown'}")
-                logger.info(f"      LBCS Structure: {parcel.lbcs_structure} ({parcel.lbcs_structure_desc or 'N/A'})")
+                logger.info("")
+                logger.info("   [%s/%s] %s", idx + 1, len(new_parcels), parcel.address or parcel.parcel_id)
+                logger.info("      Owner: %s", parcel.owner or 'Unknown')
+                logger.info("      LBCS Structure: %s (%s)", parcel.lbcs_structure, parcel.lbcs_structure_desc or 'N/A')
                 
                 centroid = parcel.centroid
                 
@@ -1974,7 +1997,7 @@ class DiscoveryOrchestrator:
                 db_property.property_category = category.value
                 
                 # ============ Fetch Satellite Imagery ============
-                logger.info(f"      📷 Fetching satellite imagery...")
+                logger.info("      📷 Fetching satellite imagery...")
                 
                 imagery_result = await property_imagery_pipeline.get_property_image(
                     lat=centroid.y,
@@ -1983,6 +2006,7 @@ class DiscoveryOrchestrator:
                 )
                 
                 if imagery_result.success:
+                    budget.charge_imagery()
                     db_property.satellite_image_base64 = imagery_result.image_base64
                     db_property.satellite_zoom_level = str(imagery_result.metadata.get('zoom', 20))
                     db_property.satellite_fetched_at = datetime.utcnow()
@@ -1992,14 +2016,15 @@ class DiscoveryOrchestrator:
                     
                     self._jobs[job_key]["progress"].properties_found = processed_count
                     
-                    logger.info(f"      ✅ Imagery captured: {imagery_result.image_size[0]}x{imagery_result.image_size[1]} px")
-                    logger.info(f"         Property area: {imagery_result.area_sqft:,.0f} sqft")
+                    logger.info("      ✅ Imagery captured: %sx%s px", imagery_result.image_size[0], imagery_result.image_size[1])
+                    logger.info("         Property area: %.0f sqft", imagery_result.area_sqft)
                     
                     # ============ VLM Analysis ============
-                    logger.info(f"      🤖 Running VLM analysis...")
+                    logger.info("      🤖 Running VLM analysis...")
                     
-                    vlm_result = await vlm_analysis_service.analyze_property(
-                        image_base64=imagery_result.image_base64,
+                    vlm_result = await vlm_result_cache_service.analyze_property(
+                        image_base64=imagery_result.vlm_image_base64,
+                        image_detail=budget.image_detail(imagery_result.vlm_image_detail),
                         scoring_prompt=scoring_prompt,
                         property_context={
                             "address": parcel.address,
@@ -2008,7 +2033,9 @@ class DiscoveryOrchestrator:
                             "land_use": parcel.land_use,
                         },
                         user_api_key=user_api_key,
+                        bypass_cache=filters.bypass_vlm_cache,
                     )
+                    budget.charge_vlm(vlm_result)
                     
                     if vlm_result.success:
                         db_property.lead_score = vlm_result.lead_score
@@ -2030,60 +2057,66 @@ class DiscoveryOrchestrator:
                         if vlm_result.usage:
                             vlm_total_cost += vlm_result.usage.cost
                         
-                        logger.info(f"      🎯 VLM Score: {vlm_result.lead_score}/100 ({db_property.lead_quality})")
+                        logger.info("      🎯 VLM Score: %s/100 (%s)", vlm_result.lead_score, db_property.lead_quality)
                         
                         # ============ LLM-Powered Enrichment ============
-                        # Use LLM to intelligently find Property Manager contact data
-                        logger.info(f"      📇 LLM-powered enrichment to find Property Manager...")
-                        self._update_job(job_key, DiscoveryStep.ENRICHING_LEADS)
+                        # Only high scores once the budget is running low
+                        if budget.allow_enrichment(vlm_result.lead_score):
+                            # Use LLM to intelligently find Property Manager contact data
+                            logger.info("      📇 LLM-powered enrichment to find Property Manager...")
+                            self._update_job(job_key, DiscoveryStep.ENRICHING_LEADS)
                         
-                        enrichment_result = await llm_enrichment_service.enrich(
-                            address=parcel.address or "",
-                            property_type=category.value,
-                            owner_name=parcel.owner,
-                            lbcs_code=parcel.lbcs_structure,
-                        )
+                            enrichment_result = await llm_enrichment_service.enrich(
+                                address=parcel.address or "",
+                                property_type=category.value,
+                                owner_name=parcel.owner,
+                                lbcs_code=parcel.lbcs_structure,
+                            )
+                            budget.charge_enrichment()
                         
-                        # Store enrichment steps for UI (detailed steps with URLs)
-                        import json
-                        if enrichment_result.detailed_steps:
-                            # Store detailed steps as JSON (includes URL, source, confidence)
-                            db_property.enrichment_steps = json.dumps([
-                                step.to_dict() for step in enrichment_result.detailed_steps
-                            ])
-                            flow_parts = [step.to_simple_string() for step in enrichment_result.detailed_steps]
-                            logger.info(f"         Flow: {' → '.join(flow_parts)}")
-                        elif enrichment_result.steps:
-                            # Fallback to simple steps if no detailed steps
-                            db_property.enrichment_steps = json.dumps(enrichment_result.steps)
-                            logger.info(f"         Flow: {' → '.join(enrichment_result.steps)}")
+                            # Store enrichment steps for UI (detailed steps with URLs)
+                            import json
+                            if enrichment_result.detailed_steps:
+                                # Store detailed steps as JSON (includes URL, source, confidence)
+                                db_property.enrichment_steps = json.dumps([
+                                    step.to_dict() for step in enrichment_result.detailed_steps
+                                ])
+                                flow_parts = [step.to_simple_string() for step in enrichment_result.detailed_steps]
+                                logger.info("         Flow: %s", ' → '.join(flow_parts))
+                            elif enrichment_result.steps:
+                                # Fallback to simple steps if no detailed steps
+                                db_property.enrichment_steps = json.dumps(enrichment_result.steps)
+                                logger.info("         Flow: %s", ' → '.join(enrichment_result.steps))
                         
-                        if enrichment_result.success and enrichment_result.contact:
-                            contact = enrichment_result.contact
-                            db_property.contact_name = contact.name
-                            db_property.contact_first_name = contact.first_name
-                            db_property.contact_last_name = contact.last_name
-                            db_property.contact_email = contact.email
-                            db_property.contact_phone = contact.phone
-                            db_property.contact_title = contact.title
-                            db_property.contact_company = enrichment_result.management_company
-                            db_property.contact_company_website = enrichment_result.management_website
-                            db_property.enriched_at = datetime.utcnow()
-                            db_property.enrichment_source = "llm_enrichment"
-                            db_property.enrichment_status = "success"
-                            enriched_count += 1
-                            logger.info(f"      ✅ Found contact: {contact.name or contact.phone or contact.email}")
-                            logger.info(f"         Confidence: {enrichment_result.confidence:.0%}")
-                            if enrichment_result.management_company:
-                                logger.info(f"         Company: {enrichment_result.management_company}")
+                            if enrichment_result.success and enrichment_result.contact:
+                                contact = enrichment_result.contact
+                                db_property.contact_name = contact.name
+                                db_property.contact_first_name = contact.first_name
+                                db_property.contact_last_name = contact.last_name
+                                db_property.contact_email = contact.email
+                                db_property.contact_phone = contact.phone
+                                db_property.contact_title = contact.title
+                                db_property.contact_company = enrichment_result.management_company
+                                db_property.contact_company_website = enrichment_result.management_website
+                                db_property.enriched_at = datetime.utcnow()
+                                db_property.enrichment_source = "llm_enrichment"
+                                db_property.enrichment_status = "success"
+                                enriched_count += 1
+                                logger.info("      ✅ Found contact: %s", contact.name or contact.phone or contact.email)
+                                logger.info("         Confidence: %.0f%%", enrichment_result.confidence * 100)
+                                if enrichment_result.management_company:
+                                    logger.info("         Company: %s", enrichment_result.management_company)
+                            else:
+                                db_property.enrichment_status = "not_found"
+                                if enrichment_result.error_message:
+                                    logger.info("      ⚠️ Enrichment: %s", enrichment_result.error_message)
                         else:
-                            db_property.enrichment_status = "not_found"
-                            if enrichment_result.error_message:
-                                logger.info(f"      ⚠️ Enrichment: {enrichment_result.error_message}")
+                            logger.info("      💸 Skipping enrichment (budget)")
+                            db_property.enrichment_status = "skipped_budget"
                     else:
-                        logger.warning(f"      ⚠️ VLM analysis failed: {vlm_result.error_message}")
+                        logger.warning("      ⚠️ VLM analysis failed: %s", vlm_result.error_message)
                 else:
-                    logger.warning(f"      ⚠️ Imagery failed: {imagery_result.error_message}")
+                    logger.warning("      ⚠️ Imagery failed: %s", imagery_result.error_message)
                     db_property.status = "failed"
                     db_property.status_error = imagery_result.error_message
                 
@@ -2094,7 +2127,7 @@ class DiscoveryOrchestrator:
                 await asyncio.sleep(0.3)
                 
             except Exception as e:
-                logger.error(f"      ❌ Error processing parcel: {e}")
+                logger.error("      ❌ Error processing parcel: %s", e)
                 import traceback
                 traceback.print_exc()
                 db.rollback()
@@ -2107,15 +2140,15 @@ class DiscoveryOrchestrator:
         
         logger.info("")
         logger.info("=" * 60)
-        logger.info(f"✅ REGRID-FIRST DISCOVERY COMPLETED")
-        logger.info(f"   Job ID: {job_id}")
-        logger.info(f"   Duration: {elapsed:.1f} seconds")
-        logger.info(f"   Categories: {property_categories}")
-        logger.info(f"   Parcels fetched: {total_fetched} (skipped {total_skipped})")
-        logger.info(f"   Parcels processed: {processed_count}")
-        logger.info(f"   Parcels analyzed: {analyzed_count}")
-        logger.info(f"   Leads enriched: {enriched_count}")
-        logger.info(f"   VLM total cost: ${vlm_total_cost:.4f}")
+        logger.info("✅ REGRID-FIRST DISCOVERY COMPLETED")
+        logger.info("   Job ID: %s", job_id)
+        logger.info("   Duration: %.1f seconds", elapsed)
+        logger.info("   Categories: %s", property_categories)
+        logger.info("   Parcels fetched: %s (skipped %s)", total_fetched, total_skipped)
+        logger.info("   Parcels processed: %s", processed_count)
+        logger.info("   Parcels analyzed: %s", analyzed_count)
+        logger.info("   Leads enriched: %s", enriched_count)
+        logger.info("   VLM total cost: $%.4f", vlm_total_cost)
         logger.info("=" * 60)
         logger.info("")
         
@@ -2129,7 +2162,10 @@ class DiscoveryOrchestrator:
             properties_analyzed=analyzed_count,
             businesses_loaded=0,
             vlm_total_cost=vlm_total_cost,
+            imagery_cost_est=budget.by_service.get("google_satellite", 0.0),
+            enrichment_cost_est=budget.by_service.get("llm_enrichment", 0.0),
             metadata={
+                "budget": budget.snapshot(),
                 "mode": "regrid_first",
                 "property_categories": property_categories,
                 "parcels_processed": processed_count,
@@ -2217,6 +2253,25 @@ class DiscoveryOrchestrator:
             self._jobs[job_key]["error"] = error
             self._jobs[job_key]["progress"].errors.append(error)
     
+    def _init_budget(self, job_key: str, user_id: UUID, filters: DiscoveryFilters, db: Session) -> DiscoveryBudget:
+        """Create the job's spend budget (job cap, capped by the user's remaining daily budget)."""
+        budget = DiscoveryBudget.for_job(db, user_id, filters.max_budget_usd)
+        self._jobs[job_key]["budget"] = budget
+        return budget
+    
+    def _budget(self, job_key: str) -> DiscoveryBudget:
+        """The job's budget; uncapped if the pipeline was started without one."""
+        job = self._jobs.setdefault(job_key, {})
+        if "budget" not in job:
+            job["budget"] = DiscoveryBudget(None)
+        return job["budget"]
+    
+    @staticmethod
+    def _budget_error(budget: DiscoveryBudget) -> str:
+        if budget.limited_by == "user":
+            return "Daily spend budget reached - try again tomorrow or raise USER_DAILY_BUDGET_USD"
+        return "Job budget is too small to process any properties"
+    
     def get_job_status(self, job_id: UUID) -> Optional[Dict[str, Any]]:
         """Get current job status."""
         job_key = str(job_id)
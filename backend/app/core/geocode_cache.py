@@ -0,0 +1,248 @@
+"""
+Geocode Cache
+
+Two-tier cache for geocoding results, shared by every caller of
+GeocodingService:
+
+- In-process LRU (GEOCODE_CACHE_MAX_ENTRIES) for repeat lookups within a worker
+- geocode_cache table so results survive restarts and are shared across workers
+
+Keys:
+- Forward: normalized address (lowercased, punctuation stripped, street
+  suffixes abbreviated, trailing country dropped) so "123 Main Street, Austin, TX, USA"
+  and "123 main st austin tx" hit the same entry
+- Reverse: lat,lng rounded to 5 decimals (~1 m)
+
+ZERO_RESULTS answers are cached too, with a short TTL, so typos and
+unknown places are not re-queried on every keystroke.
+
+Only lat/lng and the place ID are cached, for at most 30 days (what
+Google's terms allow); expired rows are purged at most once per
+GEOCODE_CACHE_PURGE_INTERVAL_HOURS, piggybacked on a store.
+"""
+
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Tuple
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.geocode_cache import GeocodeCacheEntry
+
+logger = logging.getLogger(__name__)
+
+FORWARD = "forward"
+REVERSE = "reverse"
+
+REVERSE_ROUND_DECIMALS = 5
+MAX_TTL_DAYS = 30  # Google's limit on caching geocoded coordinates
+
+_ADDRESS_ABBREVIATIONS = {
+    "street": "st", "avenue": "ave", "boulevard": "blvd", "road": "rd",
+    "drive": "dr", "lane": "ln", "court": "ct", "place": "pl",
+    "parkway": "pkwy", "highway": "hwy", "circle": "cir", "terrace": "ter",
+    "suite": "ste", "apartment": "apt", "building": "bldg",
+    "north": "n", "south": "s", "east": "e", "west": "w",
+    "northeast": "ne", "northwest": "nw", "southeast": "se", "southwest": "sw",
+}
+_COUNTRY_SUFFIXES = ("usa", "us", "united states", "united states of america")
+
+
+@dataclass
+class GeocodeResult:
+    """One geocoded location."""
+    lat: float
+    lng: float
+    formatted_address: Optional[str] = None
+    place_id: Optional[str] = None
+
+
+def normalize_address(address: str) -> str:
+    """Canonical form of an address for cache keys."""
+    text = address.lower()
+    text = re.sub(r"[^\w\s,]", " ", text)
+    parts = [" ".join(part.split()) for part in text.split(",")]
+    parts = [part for part in parts if part]
+    while parts and parts[-1] in _COUNTRY_SUFFIXES:
+        parts.pop()
+    tokens = " ".join(parts).split()
+    return " ".join(_ADDRESS_ABBREVIATIONS.get(token, token) for token in tokens)
+
+
+def reverse_query(lat: float, lng: float) -> str:
+    return f"{lat:.{REVERSE_ROUND_DECIMALS}f},{lng:.{REVERSE_ROUND_DECIMALS}f}"
+
+
+def _cache_key(direction: str, query: str) -> str:
+    return hashlib.sha256(f"{direction}:{query}".encode("utf-8")).hexdigest()
+
+
+class GeocodeCache:
+    """LRU + Postgres cache of forward and reverse geocoding results."""
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        ttl_days: Optional[int] = None,
+        negative_ttl_hours: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.enabled = enabled if enabled is not None else settings.GEOCODE_CACHE_ENABLED
+        self.ttl_seconds = min(ttl_days if ttl_days is not None else settings.GEOCODE_CACHE_TTL_DAYS, MAX_TTL_DAYS) * 86400
+        self.negative_ttl_seconds = (
+            negative_ttl_hours if negative_ttl_hours is not None else settings.GEOCODE_NEGATIVE_TTL_HOURS
+        ) * 3600
+        self.max_entries = max_entries if max_entries is not None else settings.GEOCODE_CACHE_MAX_ENTRIES
+        self.purge_interval_seconds = settings.GEOCODE_CACHE_PURGE_INTERVAL_HOURS * 3600
+        self._last_purge = 0.0
+
+        # cache_key -> (result or None for ZERO_RESULTS, expires_at epoch seconds), LRU order
+        self._memory: "OrderedDict[str, Tuple[Optional[GeocodeResult], float]]" = OrderedDict()
+
+        self._memory_hits = 0
+        self._db_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._purged = 0
+        self._errors = 0
+
+    def get(self, direction: str, query: str) -> Tuple[bool, Optional[GeocodeResult]]:
+        """
+        Look up a cached answer.
+
+        Returns (found, result); (True, None) is a cached ZERO_RESULTS.
+        """
+        if not self.enabled:
+            return False, None
+
+        cache_key = _cache_key(direction, query)
+
+        entry = self._memory.get(cache_key)
+        if entry:
+            if entry[1] > time.time():
+                self._memory.move_to_end(cache_key)
+                self._memory_hits += 1
+                return True, entry[0]
+            del self._memory[cache_key]
+
+        db = SessionLocal()
+        try:
+            row = db.query(GeocodeCacheEntry).filter(
+                GeocodeCacheEntry.cache_key == cache_key,
+                GeocodeCacheEntry.expires_at > datetime.now(timezone.utc),
+            ).first()
+            if not row:
+                self._misses += 1
+                return False, None
+
+            row.hit_count = (row.hit_count or 0) + 1
+            db.commit()
+
+            result = None
+            if row.status == "OK" and row.lat is not None and row.lng is not None:
+                result = GeocodeResult(lat=float(row.lat), lng=float(row.lng), place_id=row.place_id)
+            self._remember(cache_key, result, row.expires_at.timestamp())
+            self._db_hits += 1
+            return True, result
+        except Exception as e:
+            db.rollback()
+            self._errors += 1
+            self._misses += 1
+            logger.warning("  [Geocode cache] Lookup failed: %s", e)
+            return False, None
+        finally:
+            db.close()
+
+    def put(self, direction: str, query: str, result: Optional[GeocodeResult]) -> None:
+        """
+        Store an answer (result=None stores a ZERO_RESULTS with the negative TTL).
+
+        Only lat/lng and place_id are kept, in memory as in the table.
+        """
+        if not self.enabled:
+            return
+
+        cache_key = _cache_key(direction, query)
+        ttl = self.ttl_seconds if result else self.negative_ttl_seconds
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+        if result:
+            result = GeocodeResult(lat=result.lat, lng=result.lng, place_id=result.place_id)
+        self._remember(cache_key, result, expires_at.timestamp())
+
+        values = {
+            "cache_key": cache_key,
+            "direction": direction,
+            "query": query,
+            "status": "OK" if result else "ZERO_RESULTS",
+            "lat": result.lat if result else None,
+            "lng": result.lng if result else None,
+            "place_id": result.place_id if result else None,
+            "expires_at": expires_at,
+        }
+
+        db = SessionLocal()
+        try:
+            stmt = insert(GeocodeCacheEntry).values(**values)
+            update_cols = {k: stmt.excluded[k] for k in values if k != "cache_key"}
+            update_cols["created_at"] = datetime.now(timezone.utc)
+            stmt = stmt.on_conflict_do_update(index_elements=["cache_key"], set_=update_cols)
+            db.execute(stmt)
+            db.commit()
+            self._stores += 1
+            if time.time() - self._last_purge >= self.purge_interval_seconds:
+                self.purge_expired(db)
+        except Exception as e:
+            db.rollback()
+            self._errors += 1
+            logger.warning("  [Geocode cache] Store failed: %s", e)
+        finally:
+            db.close()
+
+    def purge_expired(self, db: Session) -> int:
+        """Delete expired rows; returns how many were removed."""
+        self._last_purge = time.time()
+        removed = db.query(GeocodeCacheEntry).filter(
+            GeocodeCacheEntry.expires_at <= datetime.now(timezone.utc),
+        ).delete(synchronize_session=False)
+        db.commit()
+        self._purged += removed
+        if removed:
+            logger.info("  [Geocode cache] Purged %s expired entries", removed)
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters since startup."""
+        hits = self._memory_hits + self._db_hits
+        lookups = hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "ttl_days": self.ttl_seconds // 86400,
+            "negative_ttl_hours": self.negative_ttl_seconds // 3600,
+            "memory_entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "memory_hits": self._memory_hits,
+            "db_hits": self._db_hits,
+            "misses": self._misses,
+            "hit_rate_pct": round(100.0 * hits / lookups, 1) if lookups else 0.0,
+            "stores": self._stores,
+            "purged": self._purged,
+            "errors": self._errors,
+        }
+
+    def _remember(self, cache_key: str, result: Optional[GeocodeResult], expires_at: float) -> None:
+        self._memory[cache_key] = (result, expires_at)
+        self._memory.move_to_end(cache_key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# Singleton instance
+geocode_cache = GeocodeCache()
@@ -1,18 +1,24 @@
+import asyncio
 import logging
-import httpx
 from typing import Optional, Dict, Any
 from shapely.geometry import Polygon, box
 from app.core.config import settings
+from app.core.http_client_manager import http_clients
+from app.core.boundary_service import get_boundary_service
+from app.core.county_service import county_service
+from app.core.geocode_cache import geocode_cache, GeocodeResult, normalize_address, reverse_query, FORWARD, REVERSE
 
 logger = logging.getLogger(__name__)
 
+GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+
 
 class GeocodingService:
     """Service to convert ZIP codes and counties to GeoJSON polygons."""
-    
+
     def __init__(self):
         self.google_key = settings.GOOGLE_MAPS_KEY
-    
+
     async def get_area_polygon(
         self,
         area_type: str,
@@ -21,12 +27,12 @@ class GeocodingService:
     ) -> Optional[Dict[str, Any]]:
         """
         Convert ZIP code or county to GeoJSON polygon.
-        
+
         Args:
             area_type: "zip" or "county"
             value: ZIP code or county name
             state: State code (required for county)
-            
+
         Returns:
             GeoJSON polygon or None
         """
@@ -38,105 +44,169 @@ class GeocodingService:
             return await self._get_county_polygon(value, state)
         else:
             raise ValueError(f"Unknown area_type: {area_type}")
-    
+
     async def _get_zip_polygon(self, zip_code: str) -> Optional[Dict[str, Any]]:
-        """Get polygon for a ZIP code using geocoding + approximate bounds."""
-        
+        """Get polygon for a ZIP code - ZCTA boundary layer first, geocoded box otherwise."""
+
+        boundary_service = get_boundary_service()
+        if boundary_service.is_layer_available("zips"):
+            try:
+                # First call parses the ZIP KML - keep it off the event loop
+                feature = await asyncio.to_thread(boundary_service.get_boundary_by_id, "zips", zip_code.strip())
+                if feature and feature.get("geometry"):
+                    return feature["geometry"]
+            except Exception as e:
+                logger.warning("   ⚠️  ZIP boundary lookup failed for %s: %s", zip_code, e)
+
         # First, geocode the ZIP code to get center point
         center = await self._geocode_address(f"{zip_code}, USA")
-        
+
         if not center:
-            logger.error(f"Failed to geocode ZIP code: {zip_code}")
+            logger.error("Failed to geocode ZIP code: %s", zip_code)
             return None
-        
+
         # Create approximate polygon (ZIP codes are roughly 5-10 km across)
-        # This is an approximation - for production, use Census Bureau TIGER data
+        # Only used when the ZIP boundary layer is not deployed
         lat, lng = center["lat"], center["lng"]
-        
+
         # Approximate 5km radius in degrees
         lat_offset = 0.045  # ~5km
         lng_offset = 0.055  # ~5km (varies by latitude)
-        
+
         polygon = box(
             lng - lng_offset,
             lat - lat_offset,
             lng + lng_offset,
             lat + lat_offset
         )
-        
+
         return {
             "type": "Polygon",
             "coordinates": [list(polygon.exterior.coords)]
         }
-    
+
     async def _get_county_polygon(self, county: str, state: str) -> Optional[Dict[str, Any]]:
-        """Get polygon for a county using geocoding + approximate bounds."""
-        
+        """Get polygon for a county - county boundary by FIPS first, geocoded box otherwise."""
+
+        match = await county_service.find_county(county, state)
+        if match:
+            # Local counties layer (TIGERweb only if the layer is not deployed)
+            boundary = await county_service.get_county_boundary(match.fips)
+            if boundary:
+                return boundary
+
         # Geocode the county
         center = await self._geocode_address(f"{county} County, {state}, USA")
-        
+
         if not center:
-            logger.error(f"Failed to geocode county: {county}, {state}")
+            logger.error("Failed to geocode county: %s, %s", county, state)
             return None
-        
+
         lat, lng = center["lat"], center["lng"]
-        
+
         # Counties are larger - approximate 30km radius
         lat_offset = 0.27  # ~30km
         lng_offset = 0.33  # ~30km
-        
+
         polygon = box(
             lng - lng_offset,
             lat - lat_offset,
             lng + lng_offset,
             lat + lat_offset
         )
-        
+
         return {
             "type": "Polygon",
             "coordinates": [list(polygon.exterior.coords)]
         }
-    
+
+    async def geocode(self, address: str) -> Optional[GeocodeResult]:
+        """Forward geocode an address (cached by normalized address)."""
+        query = normalize_address(address)
+        found, cached = geocode_cache.get(FORWARD, query)
+        if found:
+            logger.info("   📍 Geocode cache hit: %s", address)
+            return cached
+
+        logger.info("   📍 Geocoding: %s", address)
+        ok, result = await self._request({"address": address})
+        if ok:
+            geocode_cache.put(FORWARD, query, result)
+        return result
+
+    async def reverse_geocode(self, lat: float, lng: float) -> Optional[GeocodeResult]:
+        """Reverse geocode a point (cached by lat,lng rounded to ~1 m)."""
+        query = reverse_query(lat, lng)
+        found, cached = geocode_cache.get(REVERSE, query)
+        if found:
+            return cached
+
+        logger.info("   📍 Reverse geocoding: %s", query)
+        ok, result = await self._request({"latlng": query})
+        if ok:
+            geocode_cache.put(REVERSE, query, result)
+        return result
+
     async def _geocode_address(self, address: str) -> Optional[Dict[str, float]]:
         """Geocode an address to lat/lng."""
+        result = await self.geocode(address)
+        if not result:
+            return None
+        return {"lat": result.lat, "lng": result.lng}
+
+    async def _request(self, params: Dict[str, str]):
+        """
+        Call the Geocoding API.
+
+        Returns (cacheable, result): OK and ZERO_RESULTS are cacheable
+        answers; errors and missing keys are not.
+        """
         if not self.google_key:
             logger.warning("   ⚠️  GOOGLE_MAPS_KEY not configured")
-            return None
-        
-        url = "https://maps.googleapis.com/maps/api/geocode/json"
-        
-        logger.info(f"   📍 Geocoding: {address}")
-        
+            return False, None
+
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    url,
-                    params={"address": address, "key": self.google_key}
-                )
-                
-                logger.info(f"   📡 Geocoding response status: {response.status_code}")
-                
-                data = response.json()
-                
-                if data.get("status") != "OK":
-                    logger.error(f"   ❌ Geocoding error: {data.get('status')} - {data.get('error_message', 'No message')}")
-                    return None
-                
-                results = data.get("results", [])
-                if not results:
-                    logger.error(f"   ❌ No geocoding results found")
-                    return None
-                
-                location = results[0].get("geometry", {}).get("location", {})
-                lat, lng = location.get("lat"), location.get("lng")
-                
-                logger.info(f"   ✅ Geocoded to: {lat}, {lng}")
-                
-                return {"lat": lat, "lng": lng}
-                
+            response = await http_clients.get("google").get(
+                GEOCODE_URL,
+                params={**params, "key": self.google_key}
+            )
+
+            logger.info("   📡 Geocoding response status: %s", response.status_code)
+
+            data = response.json()
+            status = data.get("status")
+
+            if status == "ZERO_RESULTS":
+                logger.error("   ❌ No geocoding results found")
+                return True, None
+
+            if status != "OK":
+                logger.error("   ❌ Geocoding error: %s - %s", status, data.get('error_message', 'No message'))
+                return False, None
+
+            results = data.get("results", [])
+            if not results:
+                logger.error("   ❌ No geocoding results found")
+                return True, None
+
+            first = results[0]
+            location = first.get("geometry", {}).get("location", {})
+            lat, lng = location.get("lat"), location.get("lng")
+            if lat is None or lng is None:
+                return False, None
+
+            logger.info("   ✅ Geocoded to: %s, %s", lat, lng)
+
+            return True, GeocodeResult(
+                lat=lat,
+                lng=lng,
+                formatted_address=first.get("formatted_address"),
+                place_id=first.get("place_id"),
+            )
+
         except Exception as e:
-            logger.error(f"   ❌ Geocoding failed: {e}")
-            return None
+            logger.error("   ❌ Geocoding failed: %s", e)
+            return False, None
 
 
 # Singleton instance
@@ -0,0 +1,205 @@
+"""
+HTTP Client Manager
+
+One long-lived httpx.AsyncClient per outbound provider (Regrid, Google,
+OpenRouter, Apollo, tile servers, Census/TIGERweb), shared by every
+service. Replaces per-call `async with httpx.AsyncClient()` blocks and
+per-service clients, so repeat requests reuse warm TCP+TLS connections.
+
+- HTTP/2 where the h2 package is installed (multiplexed requests per host)
+- Per-provider connection limits and keep-alive pools
+- Per-provider rate limits, retries and circuit breaker (see provider_limits)
+- open() / close() are called from the app lifespan
+
+Callers must never close a managed client. Per-caller credentials (the
+Apollo key header) are passed per request, not set on the shared client.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Callable
+
+import httpx
+
+from app.core.config import settings
+from app.core.provider_limits import ProviderPolicy, ProviderGuard, GuardedTransport
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass
+class ProviderConfig:
+    """Connection settings for one outbound provider."""
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    max_connections: int = 20
+    max_keepalive: int = 10
+    keepalive_expiry: float = 30.0
+    headers: Dict[str, str] = field(default_factory=dict)
+    policy: ProviderPolicy = field(default_factory=ProviderPolicy)
+
+
+# Business websites, apartments.com, Yelp - some block non-browser user agents
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
+
+
+PROVIDERS: Dict[str, ProviderConfig] = {
+    # Regrid API (query / point / typeahead): ~10 req/s per token
+    "regrid": ProviderConfig(
+        timeout=30.0, max_connections=20, max_keepalive=10,
+        policy=ProviderPolicy(rate_per_second=10, burst=10, max_concurrency_per_host=8),
+    ),
+    # Places, Geocoding, Static Maps: 6,000 QPM per API
+    "google": ProviderConfig(
+        timeout=30.0, max_connections=50, max_keepalive=20,
+        policy=ProviderPolicy(rate_per_second=50, burst=50, max_concurrency_per_host=25),
+    ),
+    # Long completions (VLM scoring, LLM enrichment); completions are side-effect free, retry POSTs
+    "openrouter": ProviderConfig(
+        timeout=120.0, max_connections=100, max_keepalive=20,
+        policy=ProviderPolicy(rate_per_second=20, burst=40, max_concurrency_per_host=50, retry_unsafe_methods=True),
+    ),
+    # Apollo: ~50 req/min on standard plans; POSTs spend credits, so only 429s are retried
+    "apollo": ProviderConfig(
+        timeout=30.0, max_connections=10, max_keepalive=5,
+        policy=ProviderPolicy(rate_per_second=0.8, burst=5, max_concurrency_per_host=4),
+    ),
+    # Regrid tileserver, imagery tiles - many small concurrent GETs
+    "tiles": ProviderConfig(
+        timeout=60.0, max_connections=32, max_keepalive=16,
+        policy=ProviderPolicy(rate_per_second=50, burst=32, max_concurrency_per_host=16),
+    ),
+    # TIGERweb, Census API
+    "census": ProviderConfig(
+        timeout=30.0, max_connections=10, max_keepalive=5,
+        policy=ProviderPolicy(rate_per_second=5, burst=10, max_concurrency_per_host=5),
+    ),
+    # Scraped websites (many hosts, little reuse per host) - no shared quota or breaker
+    "web": ProviderConfig(
+        timeout=30.0, max_connections=50, max_keepalive=10, headers=BROWSER_HEADERS,
+        policy=ProviderPolicy(max_concurrency_per_host=4, max_retries=1, breaker_threshold=0),
+    ),
+    "default": ProviderConfig(timeout=30.0, max_connections=20, max_keepalive=10),
+}
+
+
+def network_transport(cfg: ProviderConfig) -> httpx.AsyncHTTPTransport:
+    """Pooled HTTP/2 transport sized by the provider config."""
+    return httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=cfg.max_connections,
+            max_keepalive_connections=cfg.max_keepalive,
+            keepalive_expiry=cfg.keepalive_expiry,
+        ),
+    )
+
+
+class HTTPClientManager:
+    """Registry of shared, lifespan-managed httpx clients keyed by provider."""
+
+    def __init__(self, providers: Optional[Dict[str, ProviderConfig]] = None):
+        self.providers = providers or PROVIDERS
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._guards: Dict[str, ProviderGuard] = {}
+        self._created = 0
+        # Builds the innermost transport per provider (benchmarks swap in stand-ins)
+        self.transport_factory: Optional[Callable[[str, ProviderConfig], httpx.AsyncBaseTransport]] = None
+
+    def get(self, provider: str = "default") -> httpx.AsyncClient:
+        """
+        Get the shared client for a provider.
+
+        Args:
+            provider: Key in PROVIDERS (unknown keys use "default")
+
+        Returns:
+            Shared httpx.AsyncClient - do not close it
+        """
+        if provider not in self.providers:
+            provider = "default"
+        client = self._clients.get(provider)
+        if client is None or client.is_closed:
+            client = self._build(provider)
+            self._clients[provider] = client
+        return client
+
+    def open(self) -> None:
+        """Create all provider clients up front (app startup)."""
+        for provider in self.providers:
+            self.get(provider)
+        logger.info("HTTP clients ready: %s (http2=%s)", ', '.join(self.providers), HTTP2_AVAILABLE)
+
+    async def close(self) -> None:
+        """Close every provider client (app shutdown)."""
+        for provider, client in self._clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("Error closing HTTP client for %s: %s", provider, e)
+        self._clients.clear()
+        logger.info("HTTP clients closed")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "open_clients": sorted(p for p, c in self._clients.items() if not c.is_closed),
+            "clients_created": self._created,
+            "providers": {
+                name: {
+                    "timeout": cfg.timeout,
+                    "max_connections": cfg.max_connections,
+                    "max_keepalive": cfg.max_keepalive,
+                }
+                for name, cfg in self.providers.items()
+            },
+        }
+
+    def get_limit_stats(self) -> Dict[str, Any]:
+        """Rate limiter / retry / circuit breaker state per provider."""
+        return {
+            "enabled": settings.PROVIDER_LIMITS_ENABLED,
+            "providers": {name: guard.get_stats() for name, guard in self._guards.items()},
+        }
+
+    def _guard(self, provider: str) -> ProviderGuard:
+        guard = self._guards.get(provider)
+        if guard is None:
+            guard = ProviderGuard(provider, self.providers[provider].policy)
+            self._guards[provider] = guard
+        return guard
+
+    def _build(self, provider: str) -> httpx.AsyncClient:
+        cfg = self.providers[provider]
+        self._created += 1
+        if self.transport_factory:
+            transport = self.transport_factory(provider, cfg)
+        else:
+            transport = network_transport(cfg)
+        if settings.PROVIDER_LIMITS_ENABLED:
+            transport = GuardedTransport(self._guard(provider), transport)
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(cfg.timeout, connect=cfg.connect_timeout),
+            headers=cfg.headers or None,
+        )
+
+
+# Singleton instance
+http_clients = HTTPClientManager()
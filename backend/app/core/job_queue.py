@@ -0,0 +1,337 @@
+"""
+Background Job Queue
+
+Postgres-backed queue (background_jobs table) for discovery and parcel
+processing jobs, so they run in worker processes (python -m app.worker)
+instead of on the API event loop and DB pool:
+
+- Claims use SELECT ... FOR UPDATE SKIP LOCKED, so any number of workers
+  can poll the table without blocking each other or double-claiming
+- Priority: jobs with at most JOB_INTERACTIVE_MAX_ITEMS items (parcels,
+  max lots) are interactive and run ahead of batch jobs
+- Fair share: within a priority, users with fewer running jobs go first,
+  and no user runs more than JOB_MAX_RUNNING_PER_USER jobs at once (a soft
+  limit - two workers claiming in the same instant can each take one)
+- Cancellation: queued jobs are cancelled immediately; running jobs get
+  cancel_requested and their worker cancels them at its next heartbeat
+- Running jobs heartbeat; a job whose worker stops heartbeating is requeued
+  (or failed after max_attempts claims). Handler errors are not retried,
+  since retries would repeat paid API calls
+- stream_events follows a job from its row, for API processes whose
+  progress bus can't see the worker's events
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.background_job import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+ACTIVE_STATUSES = ("queued", "running")
+FINAL_EVENT_TYPES = ("complete", "error", "cancelled")
+
+
+class QueueFullError(Exception):
+    """User already has JOB_MAX_QUEUED_PER_USER jobs waiting."""
+
+
+# Highest-priority queued job whose user is under the running limit; users with
+# fewer running jobs first, then oldest. Locked rows (being claimed by another
+# worker) are skipped rather than waited on.
+_CLAIM_SQL = text("""
+    WITH running AS (
+        SELECT user_id, COUNT(*) AS n
+        FROM background_jobs
+        WHERE status = 'running'
+        GROUP BY user_id
+    ),
+    candidate AS (
+        SELECT j.id
+        FROM background_jobs j
+        LEFT JOIN running r ON r.user_id = j.user_id
+        WHERE j.status = 'queued'
+          AND COALESCE(r.n, 0) < :max_running_per_user
+        ORDER BY j.priority, COALESCE(r.n, 0), j.created_at
+        LIMIT 1
+        FOR UPDATE OF j SKIP LOCKED
+    )
+    UPDATE background_jobs
+    SET status = 'running',
+        worker_id = :worker_id,
+        attempts = attempts + 1,
+        started_at = NOW(),
+        heartbeat_at = NOW()
+    FROM candidate
+    WHERE background_jobs.id = candidate.id
+    RETURNING background_jobs.id
+""")
+
+_REQUEUE_STALE_SQL = text("""
+    UPDATE background_jobs
+    SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+        error = CASE WHEN attempts >= max_attempts THEN 'Worker stopped responding' ELSE error END,
+        finished_at = CASE WHEN attempts >= max_attempts THEN NOW() ELSE NULL END,
+        worker_id = NULL
+    WHERE status = 'running'
+      AND heartbeat_at < NOW() - make_interval(secs => :stale_seconds)
+    RETURNING id, status
+""")
+
+
+class JobQueue:
+    """Enqueue, claim and settle background jobs."""
+
+    # ============ API side ============
+
+    def priority_for(self, size: int) -> int:
+        return PRIORITY_INTERACTIVE if size <= settings.JOB_INTERACTIVE_MAX_ITEMS else PRIORITY_BATCH
+
+    def enqueue(self, db: Session, user_id: UUID, kind: str, payload: Dict[str, Any], size: int) -> BackgroundJob:
+        """
+        Queue a job.
+
+        Args:
+            kind: Handler name ("discovery", "process_parcels")
+            payload: JSON-serializable handler arguments
+            size: Work items (parcels, max lots) - small jobs get interactive priority
+
+        Raises:
+            QueueFullError: the user already has JOB_MAX_QUEUED_PER_USER queued jobs
+        """
+        queued = db.query(BackgroundJob).filter(
+            BackgroundJob.user_id == user_id,
+            BackgroundJob.status == "queued",
+        ).count()
+        if queued >= settings.JOB_MAX_QUEUED_PER_USER:
+            raise QueueFullError(f"{queued} jobs already queued - wait for some to finish")
+
+        job = BackgroundJob(
+            user_id=user_id,
+            kind=kind,
+            payload=payload,
+            priority=self.priority_for(size),
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        logger.info("📥 Queued %s job %s (priority %s, %s items)", kind, job.id, job.priority, size)
+        return job
+
+    def get(self, db: Session, job_id: UUID, user_id: UUID) -> Optional[BackgroundJob]:
+        return db.query(BackgroundJob).filter(
+            BackgroundJob.id == job_id,
+            BackgroundJob.user_id == user_id,
+        ).first()
+
+    def cancel(self, db: Session, job: BackgroundJob) -> bool:
+        """
+        Cancel a queued job now, or ask the worker to cancel a running one.
+
+        Returns True if the job was cancelled immediately (it was queued).
+        """
+        if job.status == "queued":
+            # Guard against a worker claiming it in the meantime
+            cancelled = db.query(BackgroundJob).filter(
+                BackgroundJob.id == job.id,
+                BackgroundJob.status == "queued",
+            ).update({
+                "status": "cancelled",
+                "finished_at": datetime.now(timezone.utc),
+            }, synchronize_session=False)
+            if cancelled:
+                db.commit()
+                db.refresh(job)
+                return True
+            db.refresh(job)
+        if job.status == "running":
+            job.cancel_requested = True
+            db.commit()
+        return False
+
+    def queue_position(self, db: Session, job: BackgroundJob) -> Optional[int]:
+        """Queued jobs ahead of this one (ignores per-user limits), or None if not queued."""
+        if job.status != "queued":
+            return None
+        return db.query(BackgroundJob).filter(
+            BackgroundJob.status == "queued",
+            (BackgroundJob.priority < job.priority)
+            | ((BackgroundJob.priority == job.priority) & (BackgroundJob.created_at < job.created_at)),
+        ).count()
+
+    def to_dict(self, job: BackgroundJob, position: Optional[int] = None) -> Dict[str, Any]:
+        return {
+            "job_id": str(job.id),
+            "kind": job.kind,
+            "status": job.status,
+            "priority": "interactive" if job.priority <= PRIORITY_INTERACTIVE else "batch",
+            "queue_position": position,
+            "cancel_requested": job.cancel_requested,
+            "attempts": job.attempts,
+            "progress": job.progress,
+            "result": job.result,
+            "error": job.error,
+            "created_at": job.created_at.isoformat() if job.created_at else None,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        }
+
+    async def stream_events(self, job_id: UUID) -> AsyncIterator[str]:
+        """
+        SSE frames built from the job row, for when the worker's progress bus
+        events don't reach this process (in-process bus, separate worker).
+
+        Sends the job's latest progress event whenever it changes (workers
+        store it at each heartbeat) and ends once the job is finished. There
+        are no event ids: a reconnect gets the current state.
+        """
+        last_payload = None
+        idle_since = time.monotonic()
+        while True:
+            row = await asyncio.to_thread(self._read_progress, job_id)
+            if row is None:
+                return
+            status, event = row
+            payload = json.dumps(event, default=str)
+            if event is not None and payload != last_payload:
+                last_payload = payload
+                idle_since = time.monotonic()
+                yield f"data: {payload}\n\n"
+            if status not in ACTIVE_STATUSES:
+                return
+            if time.monotonic() - idle_since >= settings.PROGRESS_HEARTBEAT_SECONDS:
+                idle_since = time.monotonic()
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+
+    @staticmethod
+    def _read_progress(job_id: UUID) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(status, event to show) for a job; finished jobs without a final event get one."""
+        db = SessionLocal()
+        try:
+            job = db.get(BackgroundJob, job_id)
+            if job is None:
+                return None
+            event = job.progress
+            if job.status == "queued" and event is None:
+                event = {"type": "queued", "message": "Waiting for a worker", "job_id": str(job.id)}
+            elif job.status == "cancelled" and (event or {}).get("type") not in FINAL_EVENT_TYPES:
+                event = {"type": "cancelled", "message": "Job cancelled"}
+            elif job.status == "failed" and (event or {}).get("type") not in FINAL_EVENT_TYPES:
+                event = {"type": "error", "message": f"Job failed: {job.error}"}
+            return job.status, event
+        finally:
+            db.close()
+
+    # ============ Worker side ============
+
+    def claim(self, db: Session, worker_id: str) -> Optional[BackgroundJob]:
+        """Atomically take the next runnable job, or None."""
+        row = db.execute(_CLAIM_SQL, {
+            "worker_id": worker_id,
+            "max_running_per_user": settings.JOB_MAX_RUNNING_PER_USER,
+        }).first()
+        db.commit()
+        if row is None:
+            return None
+        return db.get(BackgroundJob, row.id)
+
+    def heartbeat(self, db: Session, progress: Dict[UUID, Optional[Dict[str, Any]]]) -> List[UUID]:
+        """
+        Refresh running jobs' heartbeats and latest progress.
+
+        Returns ids of jobs whose cancellation was requested.
+        """
+        if not progress:
+            return []
+        now = datetime.now(timezone.utc)
+        for job_id, event in progress.items():
+            values: Dict[str, Any] = {"heartbeat_at": now}
+            if event is not None:
+                values["progress"] = event
+            db.query(BackgroundJob).filter(
+                BackgroundJob.id == job_id,
+                BackgroundJob.status == "running",
+            ).update(values, synchronize_session=False)
+        cancel_ids = [row.id for row in db.query(BackgroundJob.id).filter(
+            BackgroundJob.id.in_(list(progress)),
+            BackgroundJob.cancel_requested.is_(True),
+        )]
+        db.commit()
+        return cancel_ids
+
+    def finish(
+        self,
+        db: Session,
+        job_id: UUID,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        progress: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Settle a running job as completed, failed or cancelled."""
+        values: Dict[str, Any] = {
+            "status": status,
+            "result": result,
+            "error": error,
+            "finished_at": datetime.now(timezone.utc),
+        }
+        if progress is not None:
+            values["progress"] = progress
+        db.query(BackgroundJob).filter(
+            BackgroundJob.id == job_id,
+            BackgroundJob.status == "running",
+        ).update(values, synchronize_session=False)
+        db.commit()
+
+    def release(self, db: Session, job_id: UUID) -> None:
+        """Put a job back in the queue (worker shut down before it started); the claim isn't counted."""
+        db.query(BackgroundJob).filter(
+            BackgroundJob.id == job_id,
+            BackgroundJob.status == "running",
+        ).update({
+            "status": "queued",
+            "worker_id": None,
+            "attempts": BackgroundJob.attempts - 1,
+        }, synchronize_session=False)
+        db.commit()
+
+    def requeue_stale(self, db: Session) -> int:
+        """Requeue (or fail) running jobs whose worker stopped heartbeating."""
+        rows = db.execute(_REQUEUE_STALE_SQL, {"stale_seconds": settings.JOB_STALE_SECONDS}).all()
+        db.commit()
+        for row in rows:
+            logger.warning("⚠️ Job %s lost its worker - %s", row.id, "requeued" if row.status == "queued" else "failed")
+        return len(rows)
+
+    def get_stats(self, db: Session) -> Dict[str, Any]:
+        counts = dict(db.execute(text("""
+            SELECT status, COUNT(*) FROM background_jobs
+            WHERE status IN ('queued', 'running') OR finished_at > NOW() - INTERVAL '1 day'
+            GROUP BY status
+        """)).all())
+        return {
+            "queued": counts.get("queued", 0),
+            "running": counts.get("running", 0),
+            "last_24h": {s: n for s, n in counts.items() if s not in ACTIVE_STATUSES},
+            "max_running_per_user": settings.JOB_MAX_RUNNING_PER_USER,
+            "max_queued_per_user": settings.JOB_MAX_QUEUED_PER_USER,
+            "interactive_max_items": settings.JOB_INTERACTIVE_MAX_ITEMS,
+        }
+
+
+# Singleton instance
+job_queue = JobQueue()
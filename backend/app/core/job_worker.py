@@ -0,0 +1,388 @@
+"""
+Background Job Worker
+
+Runs queued jobs (see job_queue.py) in a process separate from the API:
+`python -m app.worker`, or inside the API process with JOB_WORKER_IN_PROCESS.
+
+- Claims up to JOB_WORKER_CONCURRENCY jobs at a time and runs each as an
+  asyncio task with its own DB session
+- Handlers publish progress to the job's progress bus channel (followed via
+  GET /discover/jobs/{job_id}/events); the latest event is also stored on the
+  job row at each heartbeat for clients that poll instead
+- Heartbeats pick up cancellation requests
+- On shutdown the worker stops claiming and lets running jobs finish for up
+  to JOB_SHUTDOWN_GRACE_SECONDS. Jobs still running after that are cancelled:
+  one that hasn't published any progress yet is released back to the queue,
+  one that has (and so may have made paid API calls) is failed rather than
+  run again
+
+Progress published from a separate worker process reaches API subscribers
+live only with PROGRESS_BUS_BACKEND=redis; with the in-process bus the API
+streams each job from its row instead (latest event per heartbeat).
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Optional, Dict, Any, Callable, Awaitable
+from uuid import UUID
+
+from geoalchemy2.shape import from_shape
+from shapely.geometry import shape, Point
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.models.background_job import BackgroundJob
+from app.models.property import Property
+from app.models.scoring_prompt import ScoringPrompt
+from app.models.user import User
+from app.schemas.discovery import DiscoveryFilters
+from app.core.config import settings
+from app.core.job_queue import job_queue
+from app.core.progress_bus import progress_bus
+from app.core.discovery_orchestrator import discovery_orchestrator, DiscoveryMode
+from app.core.parcel_processing import stream_parcel_processing
+
+logger = logging.getLogger(__name__)
+
+# stream_discovery keyword arguments accepted from a discovery job payload
+DISCOVERY_ARGS = (
+    "tiers", "business_type_ids", "scoring_prompt", "city", "state", "job_titles",
+    "industries", "property_categories", "min_acres", "max_acres",
+)
+
+
+class JobFailedError(Exception):
+    """Handler failed after already publishing its own error event."""
+
+
+class JobContext:
+    """What a handler gets: the job, its session, and a progress publisher."""
+
+    def __init__(self, job: BackgroundJob, db: Session):
+        self.job_id: UUID = job.id
+        self.user_id: UUID = job.user_id
+        self.kind: str = job.kind
+        self.payload: Dict[str, Any] = job.payload
+        self.db = db
+        self.channel = discovery_orchestrator.progress_channel(job.user_id, job.id)
+        self.last_event: Optional[Dict[str, Any]] = None
+        self.progress_dirty = False
+
+    async def publish(self, event: Dict[str, Any]) -> None:
+        self.last_event = event
+        self.progress_dirty = True
+        await progress_bus.publish(self.channel, event)
+
+
+# ============ Handlers ============
+
+async def run_discovery_job(ctx: JobContext) -> Dict[str, Any]:
+    """Discovery pipeline (any mode) for one area."""
+    payload = ctx.payload
+    complete = None
+    async for event in discovery_orchestrator.stream_discovery(
+        ctx.job_id,
+        ctx.user_id,
+        payload.get("area_polygon") or {},
+        DiscoveryFilters(**(payload.get("filters") or {})),
+        ctx.db,
+        mode=DiscoveryMode(payload.get("mode") or DiscoveryMode.BUSINESS_FIRST.value),
+        **{arg: payload.get(arg) for arg in DISCOVERY_ARGS},
+    ):
+        await ctx.publish(event)
+        if event.get("type") == "error":
+            raise JobFailedError(event.get("message") or "Discovery failed")
+        if event.get("type") == "complete":
+            complete = event
+
+    result = {k: v for k, v in (complete or {}).items() if k not in ("type", "message")}
+    job = discovery_orchestrator.get_job_status(ctx.job_id)
+    if job and job.get("progress") is not None:
+        result["progress"] = job["progress"].model_dump(mode="json")
+    return result
+
+
+def _parcel_property(db: Session, user_id: UUID, parcel: Dict[str, Any]) -> Property:
+    """Saved property for a discovered parcel (matched on regrid_id), created if new."""
+    regrid_id = parcel.get("regrid_id") or parcel.get("id")
+    prop = None
+    if regrid_id:
+        prop = db.query(Property).filter(
+            Property.user_id == user_id,
+            Property.regrid_id == regrid_id,
+        ).first()
+    if prop:
+        return prop
+
+    centroid = parcel.get("centroid") or {}
+    geometry = shape(parcel["geometry"]) if parcel.get("geometry") else None
+    if "lat" in centroid and "lng" in centroid:
+        point = Point(centroid["lng"], centroid["lat"])
+    elif geometry is not None:
+        point = geometry.centroid
+    else:
+        raise ValueError(f"Parcel {regrid_id} has no location")
+
+    prop = Property(
+        user_id=user_id,
+        centroid=from_shape(point, srid=4326),
+        address=parcel.get("address"),
+        regrid_id=regrid_id,
+        regrid_apn=parcel.get("apn"),
+        regrid_owner=parcel.get("owner"),
+        regrid_area_acres=parcel.get("acreage"),
+        discovery_source="parcel_discovery",
+        status="discovered",
+    )
+    if geometry is not None and geometry.geom_type == "Polygon":
+        prop.regrid_polygon = from_shape(geometry, srid=4326)
+    db.add(prop)
+    db.commit()
+    db.refresh(prop)
+    return prop
+
+
+async def run_process_parcels_job(ctx: JobContext) -> Dict[str, Any]:
+    """Save selected parcels and run the full per-parcel pipeline on each."""
+    db = ctx.db
+    parcels = ctx.payload.get("parcels") or []
+
+    user = db.get(User, ctx.user_id)
+    user_api_key = None
+    if user and user.use_own_openrouter_key and user.openrouter_api_key:
+        user_api_key = user.openrouter_api_key
+
+    scoring_prompt = ctx.payload.get("scoring_prompt")
+    if not scoring_prompt:
+        default_prompt = db.query(ScoringPrompt).filter(
+            ScoringPrompt.user_id == ctx.user_id,
+            ScoringPrompt.is_default == True
+        ).first()
+        if default_prompt:
+            scoring_prompt = default_prompt.prompt
+
+    await ctx.publish({
+        "type": "started",
+        "message": f"Processing {len(parcels)} parcels",
+        "total": len(parcels),
+    })
+
+    property_ids = []
+    completed = 0
+    for idx, parcel in enumerate(parcels):
+        position = {"current": idx + 1, "total": len(parcels)}
+        try:
+            prop = _parcel_property(db, ctx.user_id, parcel)
+        except Exception as e:
+            db.rollback()
+            logger.warning("⚠️ Skipping parcel %s: %s", parcel.get("id"), e)
+            await ctx.publish({"type": "parcel_error", "message": f"Skipped parcel: {e}", **position})
+            continue
+
+        property_ids.append(str(prop.id))
+        async for event in stream_parcel_processing(
+            property_id=prop.id,
+            user_id=ctx.user_id,
+            scoring_prompt=scoring_prompt,
+            user_api_key=user_api_key,
+            db=db,
+        ):
+            await ctx.publish({**event, "property_id": str(prop.id), **position})
+            if event.get("type") == "complete":
+                completed += 1
+
+    result = {
+        "property_ids": property_ids,
+        "processed": completed,
+        "failed": len(parcels) - completed,
+    }
+    await ctx.publish({
+        "type": "complete",
+        "message": f"Processed {completed} of {len(parcels)} parcels",
+        **result,
+    })
+    return result
+
+
+HANDLERS: Dict[str, Callable[[JobContext], Awaitable[Dict[str, Any]]]] = {
+    "discovery": run_discovery_job,
+    "process_parcels": run_process_parcels_job,
+}
+
+
+# ============ Worker ============
+
+class JobWorker:
+    """Claims jobs from the queue and runs them as asyncio tasks."""
+
+    def __init__(self, concurrency: Optional[int] = None):
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._running: Dict[UUID, asyncio.Task] = {}
+        self._contexts: Dict[UUID, JobContext] = {}
+        self._stopping = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    # ============ Lifecycle ============
+
+    def start(self) -> None:
+        """Run the worker loop as a background task (in-process mode)."""
+        self._loop_task = asyncio.create_task(self.run())
+
+    def request_stop(self) -> None:
+        """Stop claiming; running jobs are drained when the loop exits (see _shutdown)."""
+        self._stopping.set()
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        self.request_stop()
+        if self._loop_task is not None:
+            await self._loop_task
+            self._loop_task = None
+
+    async def run(self) -> None:
+        logger.info("👷 Job worker %s started (concurrency %s)", self.worker_id, self.concurrency)
+        last_heartbeat = last_sweep = 0.0
+        try:
+            while not self._stopping.is_set():
+                now = time.monotonic()
+                if now - last_sweep >= settings.JOB_STALE_SECONDS / 2:
+                    self._db_call(job_queue.requeue_stale)
+                    last_sweep = now
+                if now - last_heartbeat >= settings.JOB_HEARTBEAT_SECONDS:
+                    self._heartbeat()
+                    last_heartbeat = now
+
+                while len(self._running) < self.concurrency and not self._stopping.is_set():
+                    job = self._db_call(job_queue.claim, self.worker_id)
+                    if job is None:
+                        break
+                    self._launch(job)
+
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), settings.JOB_POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self._shutdown()
+            logger.info("👷 Job worker %s stopped", self.worker_id)
+
+    async def _shutdown(self) -> None:
+        """Let running jobs finish within the grace period, then cancel the rest."""
+        deadline = time.monotonic() + settings.JOB_SHUTDOWN_GRACE_SECONDS
+        if self._running:
+            logger.info(
+                "⏳ Draining %s running jobs (up to %ss)", len(self._running), settings.JOB_SHUTDOWN_GRACE_SECONDS
+            )
+        while self._running and time.monotonic() < deadline:
+            # Keep heartbeating so other workers don't requeue these as stale
+            timeout = min(settings.JOB_HEARTBEAT_SECONDS, deadline - time.monotonic())
+            await asyncio.wait(list(self._running.values()), timeout=max(timeout, 0))
+            self._heartbeat()
+
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            logger.warning("⚠️ Cancelling %s jobs still running after the shutdown grace period", len(tasks))
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ============ Jobs ============
+
+    def _launch(self, job: BackgroundJob) -> None:
+        logger.info("▶️ Running %s job %s (attempt %s)", job.kind, job.id, job.attempts)
+        task = asyncio.create_task(self._execute(job.id, job))
+        self._running[job.id] = task
+
+    async def _execute(self, job_id: UUID, job: BackgroundJob) -> None:
+        db = SessionLocal()
+        ctx = JobContext(job, db)
+        self._contexts[job_id] = ctx
+        status, result, error = "failed", None, None
+        try:
+            handler = HANDLERS.get(ctx.kind)
+            if handler is None:
+                raise ValueError(f"Unknown job kind: {ctx.kind}")
+            result = await handler(ctx)
+            status = "completed"
+        except asyncio.CancelledError:
+            db.rollback()
+            if self._stopping.is_set() and not self._cancel_requested(job_id):
+                if ctx.last_event is None:
+                    status = "released"
+                else:
+                    # Work (and spend) already happened; running it again would repeat paid calls
+                    error = "Interrupted by worker shutdown"
+                    await ctx.publish({"type": "error", "message": f"Job failed: {error}"})
+            else:
+                status = "cancelled"
+                await ctx.publish({"type": "cancelled", "message": "Job cancelled"})
+        except JobFailedError as e:
+            db.rollback()
+            error = str(e)
+        except Exception as e:
+            db.rollback()
+            logger.error("❌ Job %s failed: %s", job_id, e, exc_info=True)
+            error = str(e)
+            await ctx.publish({"type": "error", "message": f"Job failed: {e}"})
+        finally:
+            db.close()
+            self._contexts.pop(job_id, None)
+            self._running.pop(job_id, None)
+            if status == "released":
+                self._db_call(job_queue.release, job_id)
+            else:
+                self._db_call(job_queue.finish, job_id, status, result, error, ctx.last_event)
+                await progress_bus.finish(ctx.channel)
+                logger.info("⏹️ Job %s %s", job_id, status)
+            self._wakeup.set()
+
+    def _heartbeat(self) -> None:
+        if not self._running:
+            return
+        progress = {}
+        for job_id in self._running:
+            ctx = self._contexts.get(job_id)
+            event = None
+            if ctx is not None and ctx.progress_dirty:
+                event, ctx.progress_dirty = ctx.last_event, False
+            progress[job_id] = event
+        for job_id in self._db_call(job_queue.heartbeat, progress) or []:
+            task = self._running.get(job_id)
+            if task is not None and not task.done():
+                logger.info("🛑 Cancelling job %s (requested)", job_id)
+                task.cancel()
+
+    def _cancel_requested(self, job_id: UUID) -> bool:
+        def check(db: Session) -> bool:
+            return bool(db.query(BackgroundJob.cancel_requested).filter(BackgroundJob.id == job_id).scalar())
+        return bool(self._db_call(check))
+
+    @staticmethod
+    def _db_call(fn, *args):
+        """Run a short queue operation in its own session; errors are logged, not raised."""
+        db = SessionLocal()
+        try:
+            return fn(db, *args)
+        except Exception as e:
+            db.rollback()
+            logger.error("❌ Job queue %s failed: %s", getattr(fn, "__name__", fn), e)
+            return None
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "concurrency": self.concurrency,
+            "running": [str(job_id) for job_id in self._running],
+        }
+
+
+# Singleton instance
+job_worker = JobWorker()
@@ -17,12 +17,14 @@ Sources (in priority order):
 import logging
 import re
 import httpx
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 
 from app.core.config import settings
+from app.core.http_client_manager import http_clients
+from app.core.places_cache import places_cache
 from app.core.property_classifier import (
     PropertyCategory, 
     classify_property, 
@@ -69,30 +71,15 @@ class LeadEnrichmentService:
     Finds Property Manager contacts using multiple sources.
     """
     
+    # Caller name for shared Places cache hit rates
+    PLACES_CACHE_CALLER = "lead_enrichment"
+    
     def __init__(self):
-        self._client: Optional[httpx.AsyncClient] = None
         self.google_api_key = settings.GOOGLE_PLACES_KEY
         
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                    "Sec-Fetch-Dest": "document",
-                    "Sec-Fetch-Mode": "navigate",
-                    "Sec-Fetch-Site": "none",
-                    "Sec-Fetch-User": "?1",
-                    "Cache-Control": "max-age=0",
-                }
-            )
-        return self._client
+        """Shared client for business websites (browser headers, managed by http_clients)."""
+        return http_clients.get("web")
     
     async def enrich_property(
         self,
@@ -151,7 +138,7 @@ class LeadEnrichmentService:
             struct_style=struct_style,
             business_name=business_name or property_name,
         )
-        logger.info(f"  [Enrichment] Property classified as: {category.value}")
+        logger.info("  [Enrichment] Property classified as: %s", category.value)
         
         # Get enrichment strategy for this category
         strategy = get_enrichment_strategy(category)
@@ -174,13 +161,13 @@ class LeadEnrichmentService:
             management_company = places_result.get("name")
             management_phone = places_result.get("phone")
             management_website = places_result.get("website")
-            logger.info(f"  [Enrichment] Google Places found: {management_company}")
+            logger.info("  [Enrichment] Google Places found: %s", management_company)
         
         # Step 3: Try website scraping if we have a website
         contact = None
         
         if management_website:
-            logger.info(f"  [Enrichment] Scraping website: {management_website}")
+            logger.info("  [Enrichment] Scraping website: %s", management_website)
             scraped_contacts = await self._scrape_website_contacts(management_website)
             sources_tried.append("website_scrape")
             
@@ -191,11 +178,11 @@ class LeadEnrichmentService:
                     contact.company_name = management_company
                     contact.company_website = management_website
                     contact.source = "website_scrape"
-                    logger.info(f"  [Enrichment] ✅ Found contact from website: {contact.name} ({contact.email})")
+                    logger.info("  [Enrichment] ✅ Found contact from website: %s (%s)", contact.name, contact.email)
         
         # Step 4: Try Apollo if we have a company name and no contact yet
         if not contact and management_company and apollo_enrichment_service.is_configured:
-            logger.info(f"  [Enrichment] Searching Apollo for contacts at: {management_company}")
+            logger.info("  [Enrichment] Searching Apollo for contacts at: %s", management_company)
             apollo_contact = await self._search_apollo_management_company(
                 company_name=management_company,
                 titles=strategy["apollo_titles"],
@@ -207,7 +194,7 @@ class LeadEnrichmentService:
                 contact.company_name = management_company
                 contact.company_website = management_website
                 contact.source = "apollo"
-                logger.info(f"  [Enrichment] ✅ Found contact from Apollo: {contact.name} ({contact.email})")
+                logger.info("  [Enrichment] ✅ Found contact from Apollo: %s (%s)", contact.name, contact.email)
         
         # Step 5: If still no contact but we have phone, that's still useful
         if not contact and management_phone:
@@ -218,15 +205,15 @@ class LeadEnrichmentService:
                 source="google_places",
                 confidence=0.5,
             )
-            logger.info(f"  [Enrichment] Using phone from Google Places: {management_phone}")
+            logger.info("  [Enrichment] Using phone from Google Places: %s", management_phone)
         
         # Build result
         success = contact is not None and (contact.email or contact.phone)
         
         if success:
-            logger.info(f"  [Enrichment] ✅ Enrichment successful")
+            logger.info("  [Enrichment] ✅ Enrichment successful")
         else:
-            logger.info(f"  [Enrichment] ⚠️ Could not find contact data")
+            logger.info("  [Enrichment] ⚠️ Could not find contact data")
         
         return EnrichmentResult(
             success=success,
@@ -255,7 +242,7 @@ class LeadEnrichmentService:
             logger.warning("  [Enrichment] Google Places API key not configured")
             return None
         
-        client = await self._get_client()
+        client = http_clients.get("google")
         
         # Build search queries based on what we know
         search_queries = []
@@ -311,20 +298,13 @@ class LeadEnrichmentService:
         
         for search_query in search_queries:
             try:
-                # Text search
-                url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-                params = {
-                    "query": search_query,
-                    "key": self.google_api_key,
-                }
-                
-                response = await client.get(url, params=params)
-                
-                if response.status_code != 200:
-                    continue
-                
-                data = response.json()
-                results = data.get("results", [])
+                # Text search (shared Places cache)
+                page = await places_cache.text_search(
+                    self.PLACES_CACHE_CALLER,
+                    lambda: self._places_text_search(client, search_query),
+                    query=search_query,
+                )
+                results = page.results
                 
                 if not results:
                     continue
@@ -338,21 +318,17 @@ class LeadEnrichmentService:
                         continue
                     
                     # Get place details (phone, website)
-                    details_url = "https://maps.googleapis.com/maps/api/place/details/json"
-                    details_params = {
-                        "place_id": place_id,
-                        "fields": "name,formatted_phone_number,website,formatted_address,geometry",
-                        "key": self.google_api_key,
-                    }
-                    
-                    details_response = await client.get(details_url, params=details_params)
+                    details_fields = "name,formatted_phone_number,website,formatted_address,geometry"
+                    result = await places_cache.details(
+                        self.PLACES_CACHE_CALLER,
+                        place_id,
+                        details_fields,
+                        lambda: self._places_details(client, place_id, details_fields),
+                    )
                     
-                    if details_response.status_code != 200:
+                    if result is None:
                         continue
                     
-                    details_data = details_response.json()
-                    result = details_data.get("result", {})
-                    
                     # Verify address match
                     result_address = result.get("formatted_address", "")
                     result_street_number = self._extract_street_number(result_address)
@@ -366,10 +342,10 @@ class LeadEnrichmentService:
                     )
                     
                     if not address_matches:
-                        logger.debug(f"  [Enrichment] Skipping {result.get('name')} - address mismatch: {result_address}")
+                        logger.debug("  [Enrichment] Skipping %s - address mismatch: %s", result.get('name'), result_address)
                         continue
                     
-                    logger.info(f"  [Enrichment] ✓ Address verified: {result.get('name')} at {result_address}")
+                    logger.info("  [Enrichment] ✓ Address verified: %s at %s", result.get('name'), result_address)
                     
                     # Found a matching result with contact info
                     if result.get("formatted_phone_number") or result.get("website"):
@@ -381,11 +357,41 @@ class LeadEnrichmentService:
                         }
                     
             except Exception as e:
-                logger.error(f"  [Enrichment] Google Places error: {e}")
+                logger.error("  [Enrichment] Google Places error: %s", e)
                 continue
         
         return None
     
+    async def _places_text_search(
+        self,
+        client: httpx.AsyncClient,
+        query: str,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Raw Places Text Search call - returns (results, next_page_token)."""
+        response = await client.get(
+            "https://maps.googleapis.com/maps/api/place/textsearch/json",
+            params={"query": query, "key": self.google_api_key},
+        )
+        if response.status_code != 200:
+            return [], None
+        data = response.json()
+        return data.get("results", []), data.get("next_page_token")
+    
+    async def _places_details(
+        self,
+        client: httpx.AsyncClient,
+        place_id: str,
+        fields: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Raw Place Details call - returns the 'result' dict."""
+        response = await client.get(
+            "https://maps.googleapis.com/maps/api/place/details/json",
+            params={"place_id": place_id, "fields": fields, "key": self.google_api_key},
+        )
+        if response.status_code != 200:
+            return None
+        return response.json().get("result", {})
+    
     def _extract_street_number(self, address: str) -> Optional[int]:
         """Extract the street number from an address."""
         if not address:
@@ -545,7 +551,7 @@ class LeadEnrichmentService:
                     contacts.append(contact)
                     
             except Exception as e:
-                logger.debug(f"  [Enrichment] Error scraping {page_path}: {e}")
+                logger.debug("  [Enrichment] Error scraping %s: %s", page_path, e)
                 continue
         
         # If we found phones but no emails, add phone-only contact
@@ -585,7 +591,7 @@ class LeadEnrichmentService:
             org_result = await apollo_enrichment_service._search_organization(company_name)
             
             if not org_result:
-                logger.debug(f"  [Enrichment] Apollo: Organization not found: {company_name}")
+                logger.debug("  [Enrichment] Apollo: Organization not found: %s", company_name)
                 return None
             
             org_id = org_result.get("id")
@@ -601,17 +607,17 @@ class LeadEnrichmentService:
                 "per_page": 10,
             }
             
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, headers=apollo_enrichment_service.headers)
             
             if response.status_code != 200:
-                logger.debug(f"  [Enrichment] Apollo search failed: {response.status_code}")
+                logger.debug("  [Enrichment] Apollo search failed: %s", response.status_code)
                 return None
             
             data = response.json()
             people = data.get("people", [])
             
             if not people:
-                logger.debug(f"  [Enrichment] Apollo: No people found at {company_name}")
+                logger.debug("  [Enrichment] Apollo: No people found at %s", company_name)
                 return None
             
             # Get best match (first result)
@@ -654,7 +660,7 @@ class LeadEnrichmentService:
                 )
                 
         except Exception as e:
-            logger.error(f"  [Enrichment] Apollo error: {e}")
+            logger.error("  [Enrichment] Apollo error: %s", e)
             return None
     
     def _select_best_contact(
@@ -703,11 +709,6 @@ class LeadEnrichmentService:
                 return contact
         
         return sorted_contacts[0] if sorted_contacts else None
-    
-    async def close(self):
-        """Close HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
 
 
 # Singleton instance
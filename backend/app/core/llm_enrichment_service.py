@@ -15,15 +15,22 @@ import re
 import json
 import time
 import httpx
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field, asdict
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, quote_plus
 
 from app.core.config import settings
+from app.core.http_client_manager import http_clients
+from app.core.openrouter_client_pool import openrouter_client_pool
+from app.core.places_cache import places_cache
+from app.core.telemetry import telemetry
 
 logger = logging.getLogger(__name__)
 
+# Place Details field mask used for both Places lookups below
+PLACES_DETAILS_FIELDS = "name,formatted_phone_number,website,formatted_address"
+
 
 # ============================================================
 # DATA STRUCTURES
@@ -350,8 +357,10 @@ VALIDATION RULES:
 class LLMEnrichmentService:
     """LLM-powered intelligent enrichment service."""
     
+    # Caller name for shared Places cache hit rates
+    PLACES_CACHE_CALLER = "llm_enrichment"
+    
     def __init__(self):
-        self._client: Optional[httpx.AsyncClient] = None
         self.model = "openai/gpt-4o-mini"
         self.api_key = settings.OPENROUTER_API_KEY
         
@@ -360,16 +369,8 @@ class LLMEnrichmentService:
         return bool(self.api_key)
     
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                }
-            )
-        return self._client
+        """Shared client for website scraping (browser headers, managed by http_clients)."""
+        return http_clients.get("web")
     
     async def enrich(
         self,
@@ -381,6 +382,18 @@ class LLMEnrichmentService:
         """
         Main enrichment flow with simple step logging.
         """
+        with telemetry.span("enrichment", address=address, property_type=property_type) as span:
+            result = await self._enrich(address, property_type, owner_name, lbcs_code)
+            span.set(success=result.success)
+            return result
+    
+    async def _enrich(
+        self,
+        address: str,
+        property_type: str,
+        owner_name: Optional[str],
+        lbcs_code: Optional[int],
+    ) -> LLMEnrichmentResult:
         if not self.is_configured:
             return LLMEnrichmentResult(
                 success=False,
@@ -395,7 +408,7 @@ class LLMEnrichmentService:
         
         try:
             # ============ Step 1: Plan Strategy ============
-            logger.info(f"  [LLM] Planning strategy for {address}")
+            logger.info("  [LLM] Planning strategy for %s", address)
             
             # Format property type for display
             property_type_display = property_type.replace("_", " ").title()
@@ -616,13 +629,13 @@ class LLMEnrichmentService:
                 )
                 
                 if verified_count > 0:
-                    logger.info(f"  [LLM] Found {verified_count} verified sources, continuing to gather more for validation...")
+                    logger.info("  [LLM] Found %s verified sources, continuing to gather more for validation...", verified_count)
             
             # ============ Step 2b: Fallback Strategies if no verified results ============
             verified_data = [d for d in collected_data if d.get("is_correct_property", False)]
             
             if not verified_data:
-                logger.info(f"  [LLM] No verified results, trying fallback strategies...")
+                logger.info("  [LLM] No verified results, trying fallback strategies...")
                 
                 # Fallback 1: Try owner-based search
                 if owner_name and owner_name != "Unknown":
@@ -807,7 +820,7 @@ class LLMEnrichmentService:
                         cross_validate_step.status = "partial"
                         
                 except Exception as e:
-                    logger.warning(f"  [LLM] Cross-validation error: {e}")
+                    logger.warning("  [LLM] Cross-validation error: %s", e)
                     cross_validate_step.status = "failed"
                     cross_validate_step.output = "Cross-validation skipped"
             
@@ -983,7 +996,7 @@ class LLMEnrichmentService:
             )
                 
         except Exception as e:
-            logger.error(f"  [LLM] Error: {e}")
+            logger.error("  [LLM] Error: %s", e)
             import traceback
             traceback.print_exc()
             steps.append(f"Error: {str(e)[:50]}")
@@ -1065,7 +1078,7 @@ class LLMEnrichmentService:
             client = await self._get_client()
             search_url = f"https://www.apartments.com/search/?query={quote_plus(query)}"
             
-            logger.info(f"  [LLM] Searching apartments.com: {query}")
+            logger.info("  [LLM] Searching apartments.com: %s", query)
             response = await client.get(search_url, follow_redirects=True)
             
             if response.status_code != 200:
@@ -1097,7 +1110,7 @@ class LLMEnrichmentService:
             return None
             
         except Exception as e:
-            logger.error(f"  [LLM] apartments.com error: {e}")
+            logger.error("  [LLM] apartments.com error: %s", e)
             return None
     
     async def _search_google_places(
@@ -1111,17 +1124,15 @@ class LLMEnrichmentService:
             return None
         
         try:
-            client = await self._get_client()
+            client = http_clients.get("google")
             
-            # Text search
-            url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-            params = {"query": query, "key": settings.GOOGLE_PLACES_KEY}
-            
-            response = await client.get(url, params=params)
-            if response.status_code != 200:
-                return None
-            
-            results = response.json().get("results", [])
+            # Text search (shared Places cache)
+            page = await places_cache.text_search(
+                self.PLACES_CACHE_CALLER,
+                lambda: self._places_text_search(client, query),
+                query=query,
+            )
+            results = page.results
             if not results:
                 return None
             
@@ -1130,16 +1141,13 @@ class LLMEnrichmentService:
             place_id = place.get("place_id")
             
             if place_id:
-                details_url = "https://maps.googleapis.com/maps/api/place/details/json"
-                details_params = {
-                    "place_id": place_id,
-                    "fields": "name,formatted_phone_number,website,formatted_address",
-                    "key": settings.GOOGLE_PLACES_KEY,
-                }
-                
-                details_response = await client.get(details_url, params=details_params)
-                if details_response.status_code == 200:
-                    result = details_response.json().get("result", {})
+                result = await places_cache.details(
+                    self.PLACES_CACHE_CALLER,
+                    place_id,
+                    PLACES_DETAILS_FIELDS,
+                    lambda: self._places_details(client, place_id),
+                )
+                if result is not None:
                     
                     name = result.get("name")
                     place_address = result.get("formatted_address", "")
@@ -1160,7 +1168,7 @@ class LLMEnrichmentService:
                     
                     # Return verification details even if failed (for UI display)
                     if not is_correct:
-                        logger.info(f"  [LLM] Google Places result '{name}' does not match '{address}' (confidence: {verification_confidence:.2f})")
+                        logger.info("  [LLM] Google Places result '%s' does not match '%s' (confidence: %.2f)", name, address, verification_confidence)
                         return {
                             "source": "google_places",
                             "property_name": name,
@@ -1171,7 +1179,7 @@ class LLMEnrichmentService:
                             "tokens_used": verify_tokens,
                         }
                     
-                    logger.info(f"  [LLM] Verified Google Places match: '{name}' = '{address}' (confidence: {verification_confidence:.2f})")
+                    logger.info("  [LLM] Verified Google Places match: '%s' = '%s' (confidence: %.2f)", name, address, verification_confidence)
                     
                     if phone or website:
                         data = {
@@ -1200,7 +1208,7 @@ class LLMEnrichmentService:
             return None
             
         except Exception as e:
-            logger.error(f"  [LLM] Google Places error: {e}")
+            logger.error("  [LLM] Google Places error: %s", e)
             return None
     
     async def _search_yelp(
@@ -1214,7 +1222,7 @@ class LLMEnrichmentService:
             client = await self._get_client()
             search_url = f"https://www.yelp.com/search?find_desc={quote_plus(query)}"
             
-            logger.info(f"  [LLM] Searching Yelp: {query}")
+            logger.info("  [LLM] Searching Yelp: %s", query)
             response = await client.get(search_url, follow_redirects=True)
             
             if response.status_code != 200:
@@ -1247,7 +1255,7 @@ class LLMEnrichmentService:
             return None
             
         except Exception as e:
-            logger.error(f"  [LLM] Yelp error: {e}")
+            logger.error("  [LLM] Yelp error: %s", e)
             return None
     
     async def _search_linkedin_company(
@@ -1261,20 +1269,18 @@ class LLMEnrichmentService:
             if not settings.GOOGLE_PLACES_KEY:
                 return None
             
-            client = await self._get_client()
+            client = http_clients.get("google")
             
             # Search for management company directly
             company_query = f"{query} property management company"
-            url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-            params = {"query": company_query, "key": settings.GOOGLE_PLACES_KEY}
-            
-            logger.info(f"  [LLM] Searching for management company: {company_query}")
+            logger.info("  [LLM] Searching for management company: %s", company_query)
             
-            response = await client.get(url, params=params)
-            if response.status_code != 200:
-                return None
-            
-            results = response.json().get("results", [])
+            page = await places_cache.text_search(
+                self.PLACES_CACHE_CALLER,
+                lambda: self._places_text_search(client, company_query),
+                query=company_query,
+            )
+            results = page.results
             if not results:
                 return None
             
@@ -1283,16 +1289,13 @@ class LLMEnrichmentService:
             place_id = place.get("place_id")
             
             if place_id:
-                details_url = "https://maps.googleapis.com/maps/api/place/details/json"
-                details_params = {
-                    "place_id": place_id,
-                    "fields": "name,formatted_phone_number,website,formatted_address",
-                    "key": settings.GOOGLE_PLACES_KEY,
-                }
-                
-                details_response = await client.get(details_url, params=details_params)
-                if details_response.status_code == 200:
-                    result = details_response.json().get("result", {})
+                result = await places_cache.details(
+                    self.PLACES_CACHE_CALLER,
+                    place_id,
+                    PLACES_DETAILS_FIELDS,
+                    lambda: self._places_details(client, place_id),
+                )
+                if result is not None:
                     
                     name = result.get("name")
                     phone = result.get("formatted_phone_number")
@@ -1338,7 +1341,7 @@ class LLMEnrichmentService:
                                             if self._is_decision_maker_title(c.get("title", ""))
                                         ]
                                         if dm_contacts:
-                                            logger.info(f"  [LLM] Found {len(dm_contacts)} decision-makers on {team_url}")
+                                            logger.info("  [LLM] Found %s decision-makers on %s", len(dm_contacts), team_url)
                                             data["contacts_found"].extend(dm_contacts)
                                             data["tokens_used"] += team_result.get("tokens_used", 0)
                                             break  # Found decision makers, stop looking
@@ -1359,7 +1362,7 @@ class LLMEnrichmentService:
             return None
             
         except Exception as e:
-            logger.error(f"  [LLM] LinkedIn company search error: {e}")
+            logger.error("  [LLM] LinkedIn company search error: %s", e)
             return None
     
     async def _visit_and_analyze(
@@ -1375,9 +1378,11 @@ class LLMEnrichmentService:
         
         try:
             client = await self._get_client()
-            logger.info(f"  [LLM] Visiting: {url}")
+            logger.info("  [LLM] Visiting: %s", url)
             
-            response = await client.get(url, follow_redirects=True)
+            with telemetry.span("enrichment.fetch", host=urlparse(url).netloc) as span:
+                response = await client.get(url, follow_redirects=True)
+                span.set(status=response.status_code).add(bytes=len(response.content))
             if response.status_code != 200:
                 return None
             
@@ -1454,39 +1459,56 @@ class LLMEnrichmentService:
             return result
             
         except Exception as e:
-            logger.error(f"  [LLM] Visit error: {e}")
+            logger.error("  [LLM] Visit error: %s", e)
             return None
     
     # ============================================================
     # HELPERS
     # ============================================================
     
+    async def _places_text_search(
+        self,
+        client: httpx.AsyncClient,
+        query: str,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Raw Places Text Search call - returns (results, next_page_token)."""
+        response = await client.get(
+            "https://maps.googleapis.com/maps/api/place/textsearch/json",
+            params={"query": query, "key": settings.GOOGLE_PLACES_KEY},
+        )
+        if response.status_code != 200:
+            return [], None
+        data = response.json()
+        return data.get("results", []), data.get("next_page_token")
+    
+    async def _places_details(self, client: httpx.AsyncClient, place_id: str) -> Optional[Dict[str, Any]]:
+        """Raw Place Details call - returns the 'result' dict."""
+        response = await client.get(
+            "https://maps.googleapis.com/maps/api/place/details/json",
+            params={"place_id": place_id, "fields": PLACES_DETAILS_FIELDS, "key": settings.GOOGLE_PLACES_KEY},
+        )
+        if response.status_code != 200:
+            return None
+        return response.json().get("result", {})
+    
     async def _call_llm(self, prompt: str) -> tuple[Dict[str, Any], int]:
         """Call LLM and return parsed JSON + token count."""
         try:
-            client = await self._get_client()
-            
-            response = await client.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.1,
-                    "max_tokens": 1000,
-                }
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"  [LLM] API error: {response.status_code}")
+            client = openrouter_client_pool.get(self.api_key)
+            if not client:
                 return {}, 0
             
-            data = response.json()
-            content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-            tokens = data.get("usage", {}).get("total_tokens", 0)
+            with telemetry.span("enrichment.llm", model=self.model) as span:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.1,
+                    max_tokens=1000,
+                )
+                tokens = response.usage.total_tokens if response.usage else 0
+                span.add(tokens=tokens, cost_usd=getattr(response.usage, "cost", 0) or 0.0)
+            
+            content = (response.choices[0].message.content or "") if response.choices else ""
             
             # Parse JSON
             content = content.strip()
@@ -1497,11 +1519,11 @@ class LLMEnrichmentService:
             try:
                 return json.loads(content), tokens
             except json.JSONDecodeError:
-                logger.error(f"  [LLM] JSON parse failed")
+                logger.error("  [LLM] JSON parse failed")
                 return {}, tokens
                 
         except Exception as e:
-            logger.error(f"  [LLM] Error: {e}")
+            logger.error("  [LLM] Error: %s", e)
             return {}, 0
     
     def _simplify_html(self, html: str) -> str:
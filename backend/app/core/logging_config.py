@@ -0,0 +1,196 @@
+"""
+Logging Configuration
+
+Process-wide logging setup, applied once from app.main:
+
+- JSON lines (LOG_FORMAT=json) or plain text, with the discovery job /
+  trace id attached from telemetry when a record is emitted inside a job
+- Root level from LOG_LEVEL, per-module overrides from LOG_LEVELS
+- SamplingFilter: repetitive INFO/DEBUG records from one call site
+  (per-parcel lines in hot loops) pass LOG_SAMPLE_BURST times per window,
+  then 1 in LOG_SAMPLE_RATE; the next record that passes carries the
+  suppressed count. WARNING and above are never sampled
+- QueueHandler -> QueueListener thread: JSON encoding and stream writes
+  happen off the event loop; a full queue drops records instead of
+  blocking the caller
+
+Log calls use lazy %-style arguments (logger.info("Found %s parcels", n)),
+so records dropped by level or sampling are never formatted.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Tuple
+
+from app.core.config import settings
+from app.core.telemetry import telemetry
+
+MAX_SAMPLED_CALL_SITES = 5000
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "job_id", "trace_id", "suppressed"}
+
+
+class SamplingFilter(logging.Filter):
+    """Rate-limits repetitive INFO/DEBUG records per call site."""
+
+    def __init__(self, burst: int, window_seconds: float, sample_rate: int):
+        super().__init__()
+        self.burst = burst
+        self.window_seconds = window_seconds
+        self.sample_rate = sample_rate
+        # (pathname, lineno) -> [window start, records seen in window, suppressed since last pass]
+        self._sites: Dict[Tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+        self.suppressed_total = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.burst <= 0:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None or now - site[0] >= self.window_seconds:
+                if site is None and len(self._sites) >= MAX_SAMPLED_CALL_SITES:
+                    self._sites.clear()
+                suppressed = site[2] if site else 0
+                site = self._sites[key] = [now, 0, suppressed]
+            site[1] += 1
+            seen = site[1]
+            if seen > self.burst and (not self.sample_rate or (seen - self.burst) % self.sample_rate):
+                site[2] += 1
+                self.suppressed_total += 1
+                return False
+            if site[2]:
+                record.suppressed = site[2]
+                site[2] = 0
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for name in ("job_id", "trace_id", "suppressed"):
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        for name, value in vars(record).items():
+            if name not in _RECORD_ATTRIBUTES and not name.startswith("_"):
+                entry[name] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Plain text for local development."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        suppressed = getattr(record, "suppressed", None)
+        return f"{line} (+{suppressed} similar suppressed)" if suppressed else line
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records for the listener thread without formatting them.
+
+    Only the %-interpolation happens on the caller's thread (so mutable
+    arguments are captured as they were), plus the telemetry job context.
+    A full queue drops the record rather than blocking the event loop.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        span = telemetry.current_span()
+        if span is not None:
+            record.trace_id = span.trace_id
+            job_id = span.attributes.get("job_id")
+            if job_id:
+                record.job_id = job_id
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handler: Optional[NonBlockingQueueHandler] = None
+_sampler: Optional[SamplingFilter] = None
+
+
+def setup_logging() -> None:
+    """Install the queue handler on the root logger (idempotent)."""
+    global _listener, _handler, _sampler
+    if _listener is not None:
+        return
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter() if settings.LOG_FORMAT.lower() == "json" else TextFormatter())
+
+    _sampler = SamplingFilter(settings.LOG_SAMPLE_BURST, settings.LOG_SAMPLE_WINDOW_SECONDS, settings.LOG_SAMPLE_RATE)
+    _handler = NonBlockingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_MAX_RECORDS))
+    _handler.addFilter(_sampler)
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(_handler)
+    root.setLevel(settings.LOG_LEVEL.upper())
+    for name, level in settings.LOG_LEVELS.items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    _listener = logging.handlers.QueueListener(_handler.queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread (app shutdown)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        if _handler is not None:
+            logging.getLogger().removeHandler(_handler)
+
+
+def get_stats() -> Dict[str, Any]:
+    return {
+        "queued": _handler.queue.qsize() if _handler else 0,
+        "dropped": _handler.dropped if _handler else 0,
+        "suppressed": _sampler.suppressed_total if _sampler else 0,
+    }
@@ -0,0 +1,124 @@
+"""
+OpenRouter Client Pool
+
+One AsyncOpenAI client per (base_url, api key hash), all sharing the
+"openrouter" HTTP/2 client from http_clients. Users who bring their own OpenRouter
+key get a reused client instead of a fresh connection pool + TLS handshake
+on every call, and the socket count stays bounded.
+
+- Bounded: at most OPENROUTER_CLIENT_POOL_MAX_SIZE keyed clients (LRU)
+- Idle eviction: clients unused for OPENROUTER_CLIENT_IDLE_SECONDS are dropped
+- Shutdown: close() forgets keyed clients; http_clients closes the transport
+
+Keyed clients are thin wrappers over the shared transport, so eviction just
+forgets them - never call close() on a pooled client.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.core.config import settings
+from app.core.http_client_manager import http_clients, HTTP2_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+
+def _key_hash(api_key: str) -> str:
+    """Pool key component - never keep raw keys as dict keys."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class OpenRouterClientPool:
+    """Bounded, keyed pool of AsyncOpenAI clients over the shared HTTP/2 transport."""
+    
+    def __init__(self, max_size: Optional[int] = None, idle_seconds: Optional[int] = None):
+        self.max_size = max_size if max_size is not None else settings.OPENROUTER_CLIENT_POOL_MAX_SIZE
+        self.idle_seconds = idle_seconds if idle_seconds is not None else settings.OPENROUTER_CLIENT_IDLE_SECONDS
+        
+        # (base_url, key hash) -> (client, last_used monotonic time), LRU order
+        self._clients: "OrderedDict[Tuple[str, str], Tuple[AsyncOpenAI, float]]" = OrderedDict()
+        
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    def get(self, api_key: Optional[str], base_url: str = OPENROUTER_BASE_URL) -> Optional[AsyncOpenAI]:
+        """
+        Get the pooled client for an API key.
+        
+        Args:
+            api_key: OpenRouter key (user's own or system key)
+            base_url: API base URL
+            
+        Returns:
+            AsyncOpenAI client, or None if no key was given
+        """
+        if not api_key:
+            return None
+        
+        now = time.monotonic()
+        self._evict_idle(now)
+        
+        key = (base_url, _key_hash(api_key))
+        entry = self._clients.get(key)
+        if entry:
+            self._hits += 1
+            self._clients[key] = (entry[0], now)
+            self._clients.move_to_end(key)
+            return entry[0]
+        
+        self._misses += 1
+        client = AsyncOpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            http_client=self._get_transport(base_url),
+            max_retries=0,  # Retries/backoff happen once, in the shared transport
+        )
+        self._clients[key] = (client, now)
+        
+        while len(self._clients) > self.max_size:
+            self._clients.popitem(last=False)
+            self._evictions += 1
+        
+        return client
+    
+    def _get_transport(self, base_url: str) -> httpx.AsyncClient:
+        """Shared OpenRouter connection pool from the app-wide HTTP client manager."""
+        return http_clients.get("openrouter")
+    
+    def _evict_idle(self, now: float) -> None:
+        if not self.idle_seconds:
+            return
+        while self._clients:
+            key, (_, last_used) = next(iter(self._clients.items()))
+            if now - last_used < self.idle_seconds:
+                break
+            self._clients.popitem(last=False)
+            self._evictions += 1
+    
+    async def close(self) -> None:
+        """Forget all clients (app shutdown - the transport is closed by http_clients)."""
+        self._clients.clear()
+        logger.info("OpenRouter client pool closed")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "clients": len(self._clients),
+            "max_size": self.max_size,
+            "http2": HTTP2_AVAILABLE,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+
+# Singleton instance
+openrouter_client_pool = OpenRouterClientPool()
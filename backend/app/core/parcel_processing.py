@@ -0,0 +1,393 @@
+"""
+Parcel Processing Pipeline
+
+Full processing for one saved property, reporting progress as it goes:
+Regrid refresh (incl. LBCS) → classification → satellite imagery → VLM lead
+scoring → LLM contact enrichment.
+
+Used by the parcel process stream endpoint and by the job worker for
+/discover/process batches; both publish the yielded events to the progress bus.
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Optional, AsyncGenerator
+from uuid import UUID
+
+from geoalchemy2.shape import to_shape, from_shape
+from sqlalchemy.orm import Session
+
+from app.models.property import Property
+from app.core.property_classifier import classify_property
+from app.core.property_imagery_pipeline import property_imagery_pipeline
+from app.core.regrid_service import regrid_service
+from app.core.usage_tracking_service import usage_tracking_service
+from app.core.vlm_analysis_service import vlm_analysis_service
+from app.core.vlm_result_cache_service import vlm_result_cache_service
+from app.core.vlm_image_preprocessor import vlm_image_preprocessor
+from app.core.llm_enrichment_service import llm_enrichment_service
+
+logger = logging.getLogger(__name__)
+
+
+async def stream_parcel_processing(
+    property_id: UUID,
+    user_id: UUID,
+    scoring_prompt: Optional[str],
+    user_api_key: Optional[str],
+    db: Session,
+    bypass_cache: bool = False,
+) -> AsyncGenerator[dict, None]:
+    """
+    Stream parcel processing: Regrid → VLM → LLM Enrichment
+    Yields progress event dicts ("started", "regrid", ..., "complete" / "error").
+    """
+    start_time = datetime.utcnow()
+    total_cost = 0.0
+    total_tokens = 0
+    
+    # Get property
+    prop = db.query(Property).filter(Property.id == property_id).first()
+    if not prop:
+        yield {"type": "error", "message": "Property not found"}
+        return
+    
+    short_address = (prop.address or "Unknown")[:40]
+    
+    # ============================================================
+    # STEP 1: REGRID DATA - Fetch/update all fields including LBCS
+    # ============================================================
+    yield {
+        "type": "started",
+        "message": f"Processing: {short_address}",
+        "details": "Fetching property records"
+    }
+    
+    # Check if we need to fetch Regrid data
+    if not prop.regrid_id or not prop.lbcs_structure:
+        yield {
+            "type": "regrid",
+            "message": "Querying Regrid for parcel data",
+        }
+        
+        try:
+            centroid = to_shape(prop.centroid)
+            parcel = await regrid_service.get_parcel_by_coordinates(centroid.y, centroid.x)
+            
+            if parcel:
+                # Store ALL Regrid fields (same as discovery flow)
+                prop.regrid_id = parcel.parcel_id
+                prop.regrid_apn = parcel.apn
+                prop.regrid_owner = parcel.owner
+                prop.regrid_owner2 = parcel.owner2
+                prop.regrid_owner_type = parcel.owner_type
+                prop.regrid_owner_address = parcel.mail_address
+                prop.regrid_owner_city = parcel.mail_city
+                prop.regrid_owner_state = parcel.mail_state
+                prop.regrid_land_use = parcel.land_use
+                prop.regrid_zoning = parcel.zoning
+                prop.regrid_zoning_desc = parcel.zoning_description
+                prop.regrid_year_built = str(parcel.year_built) if parcel.year_built else None
+                prop.regrid_area_acres = parcel.area_acres
+                prop.regrid_num_units = parcel.num_units
+                prop.regrid_num_stories = parcel.num_stories
+                prop.regrid_struct_style = parcel.struct_style
+                
+                # LBCS codes (critical for classification)
+                prop.lbcs_structure = parcel.lbcs_structure
+                prop.lbcs_structure_desc = parcel.lbcs_structure_desc
+                prop.lbcs_activity = parcel.lbcs_activity
+                prop.lbcs_function = parcel.lbcs_function
+                prop.lbcs_ownership = parcel.lbcs_ownership
+                prop.lbcs_site = parcel.lbcs_site
+                
+                # Store polygon if available
+                if parcel.polygon:
+                    try:
+                        prop.polygon = from_shape(parcel.polygon, srid=4326)
+                    except Exception:
+                        pass
+                
+                yield {
+                    "type": "regrid_complete",
+                    "message": f"Found: {parcel.owner or 'Unknown owner'}",
+                    "details": f"LBCS: {parcel.lbcs_structure or 'N/A'}"
+                }
+            else:
+                yield {
+                    "type": "regrid_warning",
+                    "message": "No Regrid parcel found at location",
+                }
+                
+        except Exception as e:
+            logger.error("[ProcessParcel] Regrid error: %s", e)
+            yield {
+                "type": "regrid_error",
+                "message": f"Regrid lookup failed: {str(e)[:50]}",
+            }
+    else:
+        yield {
+            "type": "regrid_complete",
+            "message": f"Using existing: {prop.regrid_owner or 'Unknown owner'}",
+            "details": f"LBCS: {prop.lbcs_structure or 'N/A'}"
+        }
+    
+    # ============================================================
+    # STEP 2: CLASSIFY PROPERTY - Using LBCS codes
+    # ============================================================
+    yield {
+        "type": "classifying",
+        "message": "Classifying property type",
+    }
+    
+    classification = classify_property(
+        usecode=prop.regrid_land_use or "",
+        usedesc=prop.regrid_land_use or "",
+        zoning=prop.regrid_zoning or "",
+        lbcs_structure=prop.lbcs_structure,
+        lbcs_activity=prop.lbcs_activity,
+    )
+    prop.property_category = classification.value
+    
+    category_display = classification.value.replace("_", " ").title()
+    yield {
+        "type": "classified",
+        "message": f"Property type: {category_display}",
+        "category": classification.value
+    }
+    
+    # ============================================================
+    # STEP 3: SATELLITE IMAGERY
+    # ============================================================
+    if not prop.satellite_image_base64:
+        yield {
+            "type": "imagery",
+            "message": "Capturing satellite view",
+        }
+        
+        try:
+            # Use polygon if available, otherwise centroid
+            if prop.polygon:
+                polygon = to_shape(prop.polygon)
+                imagery_result = await property_imagery_pipeline.get_property_image(
+                    polygon,
+                    address=prop.address
+                )
+            else:
+                centroid = to_shape(prop.centroid)
+                imagery_result = await property_imagery_pipeline.get_property_image(
+                    lat=centroid.y,
+                    lng=centroid.x,
+                    address=prop.address
+                )
+            
+            if imagery_result and imagery_result.success:
+                prop.satellite_image_base64 = imagery_result.image_base64
+                metadata = imagery_result.metadata or {}
+                prop.satellite_zoom = metadata.get("zoom_level")
+                if metadata.get("area_m2"):
+                    prop.area_m2 = metadata["area_m2"]
+                    prop.area_sqft = metadata["area_m2"] * 10.764
+                prop.status = "imagery_captured"
+                
+                yield {
+                    "type": "imagery_complete",
+                    "message": "Satellite imagery captured",
+                    "zoom": metadata.get("zoom_level")
+                }
+            else:
+                yield {
+                    "type": "imagery_error",
+                    "message": "Failed to capture imagery"
+                }
+                
+        except Exception as e:
+            logger.error("[ProcessParcel] Imagery error: %s", e)
+            yield {
+                "type": "imagery_error",
+                "message": f"Imagery failed: {str(e)[:50]}"
+            }
+    else:
+        yield {
+            "type": "imagery_complete",
+            "message": "Using existing satellite imagery",
+        }
+    
+    # ============================================================
+    # STEP 4: VLM ANALYSIS
+    # ============================================================
+    if prop.satellite_image_base64:
+        yield {
+            "type": "analyzing",
+            "message": "AI analyzing property",
+        }
+        
+        try:
+            property_context = {
+                "address": prop.address,
+                "area_sqft": (float(prop.regrid_area_acres) * 43560) if prop.regrid_area_acres else None,
+                "property_type": classification.value,
+                "owner": prop.regrid_owner,
+            }
+            
+            # Stored image has no georeference - policy resize only, no crop
+            vlm_image = vlm_image_preprocessor.prepare_base64(
+                prop.satellite_image_base64,
+                area_m2=float(prop.area_m2) if prop.area_m2 else None,
+            )
+            
+            vlm_result = await vlm_result_cache_service.analyze_property(
+                image_base64=vlm_image.image_base64,
+                property_context=property_context,
+                scoring_prompt=scoring_prompt,
+                user_api_key=user_api_key,
+                image_detail=vlm_image.detail,
+                bypass_cache=bypass_cache,
+            )
+            
+            if vlm_result and vlm_result.success:
+                prop.lead_score = vlm_result.lead_score
+                prop.lead_confidence = vlm_result.confidence
+                prop.analysis_notes = vlm_result.reasoning
+                prop.lead_quality = (
+                    'high' if vlm_result.lead_score >= 70
+                    else 'medium' if vlm_result.lead_score >= 40
+                    else 'low'
+                )
+                prop.analyzed_at = datetime.utcnow()
+                prop.status = "analyzed"
+                
+                if vlm_result.usage:
+                    total_cost += vlm_result.usage.cost or 0
+                    total_tokens += vlm_result.usage.total_tokens or 0
+                
+                # Store observations if available
+                if vlm_result.observations:
+                    prop.paved_percentage = vlm_result.observations.paved_area_pct
+                    prop.building_percentage = vlm_result.observations.building_pct
+                    prop.landscaping_percentage = vlm_result.observations.landscaping_pct
+                
+                score = vlm_result.lead_score or 0
+                score_label = "High" if score >= 70 else "Medium" if score >= 40 else "Low"
+                
+                yield {
+                    "type": "scoring",
+                    "message": f"Lead score: {score}/100 ({score_label})",
+                    "score": score,
+                    "reasoning": vlm_result.reasoning[:100] if vlm_result.reasoning else None,
+                    "cached": vlm_result.cached,
+                }
+            else:
+                yield {
+                    "type": "analyzing_error",
+                    "message": f"VLM analysis failed: {vlm_result.error_message if vlm_result else 'Unknown error'}"
+                }
+                
+        except Exception as e:
+            logger.error("[ProcessParcel] VLM error: %s", e)
+            yield {
+                "type": "analyzing_error",
+                "message": f"Analysis failed: {str(e)[:50]}"
+            }
+    
+    # ============================================================
+    # STEP 5: LLM ENRICHMENT - Find decision-maker contact
+    # ============================================================
+    if prop.lead_score is not None:
+        yield {
+            "type": "enriching",
+            "message": "Finding property manager",
+            "details": f"Strategy based on {category_display}"
+        }
+        
+        try:
+            enrichment_result = await llm_enrichment_service.enrich(
+                address=prop.address or "",
+                property_type=classification.value,
+                owner_name=prop.regrid_owner,
+                lbcs_code=int(prop.lbcs_structure) if prop.lbcs_structure else None,
+            )
+            
+            # Always store enrichment steps
+            if enrichment_result.detailed_steps:
+                prop.enrichment_steps = json.dumps([
+                    step.to_dict() for step in enrichment_result.detailed_steps
+                ])
+            
+            if enrichment_result.success and enrichment_result.contact:
+                contact = enrichment_result.contact
+                prop.contact_name = contact.name
+                prop.contact_first_name = contact.first_name
+                prop.contact_last_name = contact.last_name
+                prop.contact_email = contact.email
+                prop.contact_phone = contact.phone
+                prop.contact_title = contact.title
+                prop.contact_company = enrichment_result.management_company
+                prop.contact_company_website = enrichment_result.management_website
+                prop.enrichment_source = "llm_enrichment"
+                prop.enrichment_status = "success"
+                prop.enrichment_confidence = enrichment_result.confidence
+                prop.enriched_at = datetime.utcnow()
+                
+                total_tokens += enrichment_result.tokens_used
+                
+                phone_display = contact.phone[:15] + "..." if contact.phone and len(contact.phone) > 15 else contact.phone
+                contact_msg = f"Contact found: {phone_display or contact.email or enrichment_result.management_company}"
+                
+                yield {
+                    "type": "contact_found",
+                    "message": contact_msg,
+                    "phone": contact.phone,
+                    "email": contact.email,
+                    "company": enrichment_result.management_company,
+                    "confidence": enrichment_result.confidence
+                }
+            else:
+                prop.enrichment_status = "not_found"
+                total_tokens += enrichment_result.tokens_used
+                
+                yield {
+                    "type": "enrichment_complete",
+                    "message": "No contact info found",
+                    "steps_taken": len(enrichment_result.detailed_steps) if enrichment_result.detailed_steps else 0
+                }
+                
+        except Exception as e:
+            logger.error("[ProcessParcel] Enrichment error: %s", e)
+            prop.enrichment_status = "error"
+            yield {
+                "type": "enrichment_error",
+                "message": f"Enrichment failed: {str(e)[:50]}"
+            }
+    
+    # ============================================================
+    # COMPLETE
+    # ============================================================
+    db.commit()
+    db.refresh(prop)
+    
+    duration = (datetime.utcnow() - start_time).total_seconds()
+    
+    # Log usage
+    if total_tokens > 0:
+        usage_tracking_service.log_openrouter_call(
+            db=db,
+            user_id=user_id,
+            property_id=prop.id,
+            model=vlm_analysis_service.DEFAULT_MODEL,
+            tokens_used=total_tokens,
+            actual_cost=total_cost,
+            metadata={"operation": "process_parcel_stream"},
+        )
+    
+    yield {
+        "type": "complete",
+        "message": "Processing complete",
+        "stats": {
+            "lead_score": float(prop.lead_score) if prop.lead_score else None,
+            "has_contact": bool(prop.contact_email or prop.contact_phone),
+            "duration": f"{duration:.1f}s",
+            "cost": f"${total_cost:.4f}" if total_cost > 0 else None
+        }
+    }
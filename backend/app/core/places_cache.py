@@ -0,0 +1,224 @@
+"""
+Google Places Cache
+
+Shared in-process cache for Google Places Text Search pages and Place Details,
+used by business-first discovery and the enrichment services so the same
+searches and place_ids are not paid for twice within a short window.
+
+- Text search pages: keyed by (normalized query, center rounded to ~100 m,
+  radius, page index); entries keep the page's next_page_token and when it
+  was issued so callers can tell if it is still usable
+- Place details: keyed by place_id; each entry remembers which fields were
+  requested, so a lookup is only a hit if the cached field mask covers it
+- TTLs are short on purpose: Google's terms allow only temporary caching of
+  Places content (place_id itself may be stored indefinitely)
+- Hit/miss counters are kept per caller ("business_discovery", "lead_enrichment", ...)
+"""
+
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Awaitable, Callable, FrozenSet
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# ~110 m at the equator - close enough that the same search returns the same page
+CENTER_ROUND_DECIMALS = 3
+
+
+@dataclass
+class TextSearchPage:
+    """One cached page of Text Search results."""
+    results: List[Dict[str, Any]]
+    next_page_token: Optional[str]
+    fetched_at: float  # time.monotonic() when fetched (token age)
+    
+    def token_age_seconds(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+def _normalize_fields(fields: Iterable[str]) -> FrozenSet[str]:
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return frozenset(f.strip() for f in fields if f.strip())
+
+
+class PlacesCache:
+    """TTL + LRU cache for Places Text Search pages and Place Details."""
+    
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        max_entries: Optional[int] = None,
+        text_search_ttl_seconds: Optional[int] = None,
+        details_ttl_seconds: Optional[int] = None,
+    ):
+        self.enabled = enabled if enabled is not None else settings.PLACES_CACHE_ENABLED
+        self.max_entries = max_entries or settings.PLACES_CACHE_MAX_ENTRIES
+        self.text_search_ttl = text_search_ttl_seconds or settings.PLACES_TEXT_SEARCH_TTL_SECONDS
+        self.details_ttl = details_ttl_seconds or settings.PLACES_DETAILS_TTL_SECONDS
+        
+        # key -> (expires_at, value)
+        self._text_search: "OrderedDict[Tuple, Tuple[float, TextSearchPage]]" = OrderedDict()
+        self._details: "OrderedDict[str, Tuple[float, FrozenSet[str], Dict[str, Any]]]" = OrderedDict()
+        
+        # caller -> counters
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {
+            "text_search_hits": 0,
+            "text_search_misses": 0,
+            "details_hits": 0,
+            "details_misses": 0,
+        })
+    
+    # ============ Text Search ============
+    
+    @staticmethod
+    def text_search_key(
+        query: str,
+        center_lat: Optional[float] = None,
+        center_lng: Optional[float] = None,
+        radius_meters: Optional[int] = None,
+        page: int = 0,
+    ) -> Tuple:
+        return (
+            " ".join(query.lower().split()),
+            round(center_lat, CENTER_ROUND_DECIMALS) if center_lat is not None else None,
+            round(center_lng, CENTER_ROUND_DECIMALS) if center_lng is not None else None,
+            int(radius_meters) if radius_meters is not None else None,
+            page,
+        )
+    
+    def get_text_search(self, caller: str, key: Tuple) -> Optional[TextSearchPage]:
+        """Cached text search page, or None (counts a hit or miss for caller)."""
+        if not self.enabled:
+            return None
+        entry = self._get(self._text_search, key)
+        self._stats[caller]["text_search_hits" if entry else "text_search_misses"] += 1
+        return entry[1] if entry else None
+    
+    def put_text_search(self, key: Tuple, results: List[Dict[str, Any]], next_page_token: Optional[str]) -> TextSearchPage:
+        page = TextSearchPage(results=results, next_page_token=next_page_token, fetched_at=time.monotonic())
+        if self.enabled:
+            self._put(self._text_search, key, (time.monotonic() + self.text_search_ttl, page))
+        return page
+    
+    async def text_search(
+        self,
+        caller: str,
+        fetch: Callable[[], Awaitable[Tuple[List[Dict[str, Any]], Optional[str]]]],
+        query: str,
+        center_lat: Optional[float] = None,
+        center_lng: Optional[float] = None,
+        radius_meters: Optional[int] = None,
+        page: int = 0,
+    ) -> TextSearchPage:
+        """
+        Cache-through text search page.
+        
+        Args:
+            caller: Name used for per-caller hit rates
+            fetch: Coroutine factory returning (results, next_page_token) from the API
+            query/center/radius/page: Cache key components
+        """
+        key = self.text_search_key(query, center_lat, center_lng, radius_meters, page)
+        cached = self.get_text_search(caller, key)
+        if cached:
+            return cached
+        results, next_page_token = await fetch()
+        if not results:
+            # Don't cache empty/failed pages
+            return TextSearchPage(results=[], next_page_token=None, fetched_at=time.monotonic())
+        return self.put_text_search(key, results, next_page_token)
+    
+    # ============ Place Details ============
+    
+    def get_details(self, caller: str, place_id: str, fields: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Cached details if the cached field mask covers the requested fields."""
+        if not self.enabled:
+            return None
+        requested = _normalize_fields(fields)
+        entry = self._get(self._details, place_id)
+        hit = entry is not None and requested <= entry[1]
+        self._stats[caller]["details_hits" if hit else "details_misses"] += 1
+        return entry[2] if hit else None
+    
+    def put_details(self, place_id: str, fields: Iterable[str], result: Dict[str, Any]) -> None:
+        """Store details; merges with a live entry so the field mask only grows."""
+        if not self.enabled or not result:
+            return
+        requested = _normalize_fields(fields)
+        now = time.monotonic()
+        expires_at = now + self.details_ttl
+        
+        existing = self._get(self._details, place_id)
+        if existing:
+            # Keep the older expiry so merged data is never held past its TTL
+            expires_at = min(expires_at, existing[0])
+            requested = requested | existing[1]
+            result = {**existing[2], **result}
+        
+        self._put(self._details, place_id, (expires_at, requested, result))
+    
+    async def details(
+        self,
+        caller: str,
+        place_id: str,
+        fields: Iterable[str],
+        fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Cache-through Place Details lookup (fetch returns the API 'result' dict)."""
+        cached = self.get_details(caller, place_id, fields)
+        if cached is not None:
+            return cached
+        result = await fetch()
+        if result:
+            self.put_details(place_id, fields, result)
+        return result
+    
+    # ============ Stats ============
+    
+    def get_stats(self) -> Dict[str, Any]:
+        by_caller = {}
+        for caller, counts in self._stats.items():
+            ts_total = counts["text_search_hits"] + counts["text_search_misses"]
+            d_total = counts["details_hits"] + counts["details_misses"]
+            by_caller[caller] = {
+                **counts,
+                "text_search_hit_rate_pct": round(100.0 * counts["text_search_hits"] / ts_total, 1) if ts_total else 0.0,
+                "details_hit_rate_pct": round(100.0 * counts["details_hits"] / d_total, 1) if d_total else 0.0,
+            }
+        return {
+            "enabled": self.enabled,
+            "text_search_entries": len(self._text_search),
+            "details_entries": len(self._details),
+            "max_entries": self.max_entries,
+            "text_search_ttl_seconds": self.text_search_ttl,
+            "details_ttl_seconds": self.details_ttl,
+            "by_caller": by_caller,
+        }
+    
+    # ============ Internals ============
+    
+    @staticmethod
+    def _get(store: OrderedDict, key) -> Optional[Tuple]:
+        entry = store.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del store[key]
+            return None
+        store.move_to_end(key)
+        return entry
+    
+    def _put(self, store: OrderedDict, key, entry: Tuple) -> None:
+        store[key] = entry
+        store.move_to_end(key)
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+
+
+# Singleton instance
+places_cache = PlacesCache()
@@ -20,9 +20,9 @@ import io
 import base64
 import logging
 import httpx
-import math
 
 from app.core.config import settings
+from app.core.http_client_manager import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -50,13 +50,10 @@ class PolygonImageryService:
         """Initialize the service."""
         # Transformer for converting lat/lng to Web Mercator
         self.transformer = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
-        self._http_client = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=30.0)
-        return self._http_client
+        """Shared Google client (managed by http_clients)."""
+        return http_clients.get("google")
     
     def get_polygon_image(
         self,
@@ -126,15 +123,9 @@ class PolygonImageryService:
                 
                 # Draw boundary
                 if draw_boundary:
-                    # Calculate extent for boundary drawing
-                    minx, miny, maxx, maxy = polygon.bounds
-                    pad_x = (maxx - minx) * (padding_percent / 100)
-                    pad_y = (maxy - miny) * (padding_percent / 100)
-                    
-                    # Convert bounds to Mercator for extent
-                    left, bottom = self.transformer.transform(minx - pad_x, miny - pad_y)
-                    right, top = self.transformer.transform(maxx + pad_x, maxy + pad_y)
-                    extent = (left, right, bottom, top)
+                    # The image covers a fixed zoom/size window around the center, not the polygon bounds
+                    bounds = metadata["bounds_mercator"]
+                    extent = (bounds["left"], bounds["right"], bounds["bottom"], bounds["top"])
                     
                     img = self._draw_polygon_boundary(
                         img, polygon, extent, boundary_color, boundary_width
@@ -144,7 +135,7 @@ class PolygonImageryService:
                 return img, metadata
                 
             except Exception as e:
-                logger.warning(f"Google Static Maps failed: {e}, falling back to ESRI")
+                logger.warning("Google Static Maps failed: %s, falling back to ESRI", e)
                 source = "esri"
         
         # Fall back to contextily-based sources
@@ -189,6 +180,7 @@ class PolygonImageryService:
         
         # Request maximum size for best quality
         size = self.GOOGLE_MAX_SIZE
+        scale = 2  # 2x resolution (1280x1280 actual)
         
         # Build request URL
         params = {
@@ -197,10 +189,10 @@ class PolygonImageryService:
             "size": f"{size}x{size}",
             "maptype": "satellite",
             "key": settings.GOOGLE_MAPS_KEY,
-            "scale": 2,  # 2x resolution (1280x1280 actual)
+            "scale": scale,
         }
         
-        logger.info(f"Fetching Google Static Maps: center={center_lat:.6f},{center_lng:.6f}, zoom={actual_zoom}")
+        logger.info("Fetching Google Static Maps: center=%.6f,%.6f, zoom=%s", center_lat, center_lng, actual_zoom)
         
         client = await self._get_client()
         response = await client.get(self.GOOGLE_STATIC_MAPS_URL, params=params)
@@ -219,11 +211,12 @@ class PolygonImageryService:
         if img.mode != 'RGB':
             img = img.convert('RGB')
         
-        logger.info(f"Google Static Maps: {img.size[0]}x{img.size[1]} pixels")
+        logger.info("Google Static Maps: %sx%s pixels", img.size[0], img.size[1])
         
-        # Calculate extent in Web Mercator for boundary drawing
-        # This is approximate since Google doesn't return exact bounds
-        meters_per_pixel = 156543.03392 * math.cos(math.radians(center_lat)) / (2 ** actual_zoom)
+        # Calculate extent in Web Mercator for boundary drawing and VLM cropping.
+        # Projected (not ground) meters per pixel, so no cos(lat) term; with
+        # scale=2 each returned pixel covers half a zoom-level pixel.
+        meters_per_pixel = 156543.03392 / (2 ** actual_zoom) / scale
         half_width_m = (img.size[0] / 2) * meters_per_pixel
         half_height_m = (img.size[1] / 2) * meters_per_pixel
         
@@ -292,7 +285,7 @@ class PolygonImageryService:
         # Select tile source
         tile_source = self._get_tile_source(source)
         
-        logger.info(f"Fetching imagery ({source}) for polygon at zoom {zoom}")
+        logger.info("Fetching imagery (%s) for polygon at zoom %s", source, zoom)
         
         # Fetch tiles
         try:
@@ -304,7 +297,7 @@ class PolygonImageryService:
                 ll=True
             )
         except Exception as e:
-            logger.warning(f"Failed with {source}, trying fallback: {e}")
+            logger.warning("Failed with %s, trying fallback: %s", source, e)
             fallback_source = self.BING_TILES if source == "esri" else self.ESRI_TILES
             img_array, extent = ctx.bounds2img(
                 padded_bounds[0], padded_bounds[1],
@@ -321,7 +314,7 @@ class PolygonImageryService:
         if img.mode == 'RGBA':
             img = img.convert('RGB')
         
-        logger.info(f"Image size: {img.size[0]}x{img.size[1]} pixels")
+        logger.info("Image size: %sx%s pixels", img.size[0], img.size[1])
         
         # Draw boundary
         if draw_boundary:
@@ -0,0 +1,327 @@
+"""
+Progress Event Bus
+
+Fan-out of job progress events (discovery jobs, parcel processing) to SSE
+subscribers, decoupled from the request that started the job:
+
+- Jobs run as background tasks and publish events to a channel
+  ("discovery:<job_id>", "parcel:<property_id>"); each event gets a
+  monotonic id, sent as the SSE `id:` field
+- Subscribers replay everything after their Last-Event-ID, then follow new
+  events; a comment heartbeat keeps idle connections (and proxies) open
+- Subscribers pull from the channel's bounded log at their own pace, so a
+  slow client never blocks the job; one that falls further behind than
+  PROGRESS_BUS_MAX_EVENTS resumes at the oldest retained event
+- Backends: in-process (default, single worker) or Redis Streams
+  (PROGRESS_BUS_BACKEND=redis) so any worker can serve a job's stream
+- Finished channels are kept PROGRESS_BUS_RETENTION_SECONDS for reconnects
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Deque
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+# Internal start/end-of-stream markers; never forwarded to clients
+START_PAYLOAD = json.dumps({"type": "_start"})
+END_PAYLOAD = json.dumps({"type": "_end"})
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+class ProgressBackend(ABC):
+    """Storage for channel event logs. Event ids are strings that sort in publish order."""
+
+    # Whether channels are visible to every process (not just the publishing one)
+    shared = False
+
+    @abstractmethod
+    async def append(self, channel: str, payload: str) -> str:
+        """Append a payload to the channel (creating it); returns the event id."""
+
+    @abstractmethod
+    async def read(self, channel: str, after: Optional[str], timeout: float) -> List[Tuple[str, str]]:
+        """Events after `after` (all retained if None); waits up to timeout when there are none."""
+
+    @abstractmethod
+    async def exists(self, channel: str) -> bool:
+        """Whether the channel has a (non-expired) log."""
+
+    @abstractmethod
+    async def expire(self, channel: str, seconds: float) -> None:
+        """Drop the channel after `seconds` unless it is appended to again."""
+
+    @abstractmethod
+    async def delete(self, channel: str) -> None:
+        """Drop the channel now."""
+
+    def parse_event_id(self, value: Optional[str]) -> Optional[str]:
+        """Validated Last-Event-ID, or None to replay from the start."""
+        return value or None
+
+    async def close(self) -> None:
+        pass
+
+
+@dataclass
+class _Channel:
+    events: Deque[Tuple[int, str]]
+    expires_at: Optional[float] = None
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class InMemoryProgressBackend(ProgressBackend):
+    """Per-process channels: a bounded deque plus a wakeup event per channel."""
+
+    def __init__(self, max_events: int):
+        self.max_events = max_events
+        self._channels: Dict[str, _Channel] = {}
+        # One counter for all channels, so ids keep increasing when a channel is reset
+        self._ids = itertools.count(1)
+
+    def _channel(self, channel: str, create: bool = False) -> Optional[_Channel]:
+        ch = self._channels.get(channel)
+        if ch is not None and ch.expires_at is not None and ch.expires_at <= time.monotonic():
+            del self._channels[channel]
+            ch = None
+        if ch is None and create:
+            self._prune()
+            ch = self._channels[channel] = _Channel(events=deque(maxlen=self.max_events))
+        return ch
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for name in [n for n, ch in self._channels.items() if ch.expires_at is not None and ch.expires_at <= now]:
+            del self._channels[name]
+
+    async def append(self, channel: str, payload: str) -> str:
+        ch = self._channel(channel, create=True)
+        event_id = next(self._ids)
+        ch.events.append((event_id, payload))
+        ch.expires_at = None
+        # Wake current readers; later readers wait on the fresh event
+        ch.wakeup.set()
+        ch.wakeup = asyncio.Event()
+        return str(event_id)
+
+    async def read(self, channel: str, after: Optional[str], timeout: float) -> List[Tuple[str, str]]:
+        after_id = int(after) if after else 0
+        ch = self._channel(channel)
+        if ch is None:
+            return []
+        if not ch.events or ch.events[-1][0] <= after_id:
+            wakeup = ch.wakeup
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        return [(str(i), payload) for i, payload in ch.events if i > after_id]
+
+    async def exists(self, channel: str) -> bool:
+        return self._channel(channel) is not None
+
+    async def expire(self, channel: str, seconds: float) -> None:
+        ch = self._channel(channel)
+        if ch is not None:
+            ch.expires_at = time.monotonic() + seconds
+
+    async def delete(self, channel: str) -> None:
+        ch = self._channels.pop(channel, None)
+        if ch is not None:
+            ch.wakeup.set()
+
+    def parse_event_id(self, value: Optional[str]) -> Optional[str]:
+        return value if value and value.isdigit() else None
+
+
+class RedisProgressBackend(ProgressBackend):
+    """Redis Streams: one capped stream per channel, XREAD BLOCK for followers."""
+
+    STREAM_ID_RE = re.compile(r"^\d+-\d+$")
+    shared = True
+
+    def __init__(self, url: str, max_events: int):
+        self.max_events = max_events
+        self.redis = aioredis.from_url(url, decode_responses=True)
+
+    @staticmethod
+    def _key(channel: str) -> str:
+        return f"progress:{channel}"
+
+    async def append(self, channel: str, payload: str) -> str:
+        key = self._key(channel)
+        event_id = await self.redis.xadd(key, {"e": payload}, maxlen=self.max_events, approximate=True)
+        await self.redis.persist(key)
+        return event_id
+
+    async def read(self, channel: str, after: Optional[str], timeout: float) -> List[Tuple[str, str]]:
+        response = await self.redis.xread(
+            {self._key(channel): after or "0-0"},
+            count=self.max_events,
+            block=max(1, int(timeout * 1000)),
+        )
+        return [(event_id, fields["e"]) for _, entries in response or [] for event_id, fields in entries]
+
+    async def exists(self, channel: str) -> bool:
+        return bool(await self.redis.exists(self._key(channel)))
+
+    async def expire(self, channel: str, seconds: float) -> None:
+        await self.redis.expire(self._key(channel), max(1, int(seconds)))
+
+    async def delete(self, channel: str) -> None:
+        await self.redis.delete(self._key(channel))
+
+    def parse_event_id(self, value: Optional[str]) -> Optional[str]:
+        return value if value and self.STREAM_ID_RE.match(value) else None
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+class ProgressBus:
+    """Publish job progress and serve it as resumable SSE streams."""
+
+    def __init__(self):
+        self.heartbeat_seconds = settings.PROGRESS_HEARTBEAT_SECONDS
+        self.retention_seconds = settings.PROGRESS_BUS_RETENTION_SECONDS
+        self.backend = self._build_backend()
+        # channel -> background task running the job (this worker only)
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.published = 0
+        self.subscribers = 0
+
+    @staticmethod
+    def _build_backend() -> ProgressBackend:
+        if settings.PROGRESS_BUS_BACKEND == "redis":
+            if REDIS_AVAILABLE and settings.REDIS_URL:
+                return RedisProgressBackend(settings.REDIS_URL, settings.PROGRESS_BUS_MAX_EVENTS)
+            logger.warning("⚠️ PROGRESS_BUS_BACKEND=redis but redis is not installed or REDIS_URL is unset; using in-process bus")
+        return InMemoryProgressBackend(settings.PROGRESS_BUS_MAX_EVENTS)
+
+    # ============ Publishing ============
+
+    async def publish(self, channel: str, event: Dict[str, Any]) -> str:
+        """Append an event; returns its id."""
+        self.published += 1
+        return await self.backend.append(channel, json.dumps(event, default=str))
+
+    async def finish(self, channel: str) -> None:
+        """Mark the end of a channel's events; subscribers disconnect after draining."""
+        await self.backend.append(channel, END_PAYLOAD)
+        await self.backend.expire(channel, self.retention_seconds)
+
+    def is_running(self, channel: str) -> bool:
+        task = self._tasks.get(channel)
+        return task is not None and not task.done()
+
+    async def start(self, channel: str, events: AsyncIterator[Dict[str, Any]]) -> asyncio.Task:
+        """
+        Run a job's event generator as a background task, publishing each event.
+
+        Any previous log on the channel is discarded (a run still in progress
+        is cancelled). The job keeps running if the client that started it
+        disconnects.
+        """
+        previous = self._tasks.get(channel)
+        if previous is not None and not previous.done():
+            previous.cancel()
+        await self.backend.delete(channel)
+        # Creates the channel before the task runs, so an immediate subscriber doesn't see "no such job"
+        await self.backend.append(channel, START_PAYLOAD)
+        task = asyncio.create_task(self._run(channel, events))
+        self._tasks[channel] = task
+        task.add_done_callback(lambda t, c=channel: self._tasks.pop(c, None) if self._tasks.get(c) is t else None)
+        return task
+
+    async def _run(self, channel: str, events: AsyncIterator[Dict[str, Any]]) -> None:
+        try:
+            async for event in events:
+                await self.publish(channel, event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("❌ Progress job %s failed: %s", channel, e, exc_info=True)
+            await self.publish(channel, {"type": "error", "message": str(e)})
+        finally:
+            # A cancelled run that was replaced must not end its successor's stream
+            if self._tasks.get(channel) is asyncio.current_task():
+                await self.finish(channel)
+
+    # ============ Subscribing ============
+
+    @property
+    def shared(self) -> bool:
+        """Whether events published by other processes (job workers) reach this one."""
+        return self.backend.shared
+
+    async def exists(self, channel: str) -> bool:
+        return await self.backend.exists(channel)
+
+    async def stream(self, channel: str, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+        """SSE frames for a channel: replay after last_event_id, follow, heartbeat, end."""
+        after = self.backend.parse_event_id(last_event_id)
+        self.subscribers += 1
+        try:
+            while True:
+                events = await self.backend.read(channel, after, self.heartbeat_seconds)
+                if not events:
+                    if not await self.backend.exists(channel):
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+                frames = []
+                for event_id, payload in events:
+                    after = event_id
+                    if payload == END_PAYLOAD:
+                        if frames:
+                            yield "".join(frames)
+                        return
+                    if payload == START_PAYLOAD:
+                        continue
+                    frames.append(f"id: {event_id}\ndata: {payload}\n\n")
+                if frames:
+                    yield "".join(frames)
+        finally:
+            self.subscribers -= 1
+
+    # ============ Stats / lifecycle ============
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "running_jobs": sum(1 for t in self._tasks.values() if not t.done()),
+            "subscribers": self.subscribers,
+            "events_published": self.published,
+            "heartbeat_seconds": self.heartbeat_seconds,
+            "retention_seconds": self.retention_seconds,
+        }
+
+    async def close(self) -> None:
+        for task in list(self._tasks.values()):
+            task.cancel()
+        await self.backend.close()
+
+
+# Singleton instance
+progress_bus = ProgressBus()
@@ -6,12 +6,15 @@ Uses spatial analysis to determine connectivity to the business building.
 """
 import logging
 import math
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, TYPE_CHECKING
 from dataclasses import dataclass
+import numpy as np
+import shapely
 from shapely.geometry import Polygon, Point
 from shapely.ops import unary_union
 
-from app.core.asphalt_segmentation_service import DetectedPolygon
+if TYPE_CHECKING:
+    from app.core.asphalt_segmentation_service import DetectedPolygon
 
 logger = logging.getLogger(__name__)
 
@@ -46,13 +49,16 @@ class PropertyAssociationService:
     MAX_CONNECTION_DISTANCE_M = 25.0  # Max gap between connected surfaces (was 5m)
     MIN_AREA_M2 = 10.0  # Minimum area to consider (filter noise) - reduced
     ROAD_WIDTH_THRESHOLD_M = 12.0  # Typical road width for filtering
+    BOUNDARY_BUFFER_DEG = 0.00002  # ~2m edge tolerance around the property boundary
+    MIN_BOUNDARY_OVERLAP_PCT = 30.0  # Share of a surface that must fall inside the boundary
+    M_PER_DEG = 111000
     
     def associate_with_business(
         self,
-        buildings: List[DetectedPolygon],
-        paved_surfaces: List[DetectedPolygon],
+        buildings: List["DetectedPolygon"],
+        paved_surfaces: List["DetectedPolygon"],
         business_location: Tuple[float, float]  # (lat, lng)
-    ) -> Tuple[Optional[DetectedPolygon], List[AssociatedAsphaltArea]]:
+    ) -> Tuple[Optional["DetectedPolygon"], List[AssociatedAsphaltArea]]:
         """
         Find which paved surfaces belong to the business.
         
@@ -64,20 +70,20 @@ class PropertyAssociationService:
         Returns:
             Tuple of (business_building, list of AssociatedAsphaltArea)
         """
-        logger.info(f"🔗 Associating {len(paved_surfaces)} surfaces with business at {business_location}")
+        logger.info("🔗 Associating %s surfaces with business at %s", len(paved_surfaces), business_location)
         
         # Filter small surfaces (likely noise)
         valid_surfaces = [
             p for p in paved_surfaces 
             if p.area_m2 and p.area_m2 >= self.MIN_AREA_M2
         ]
-        logger.info(f"   Filtered to {len(valid_surfaces)} surfaces >= {self.MIN_AREA_M2}m²")
+        logger.info("   Filtered to %s surfaces >= %sm²", len(valid_surfaces), self.MIN_AREA_M2)
         
         # Step 1: Find business building
         business_building = self._find_closest_building(buildings, business_location)
         
         if business_building:
-            logger.info(f"   🏢 Found business building: {business_building.area_m2:.0f}m²")
+            logger.info("   🏢 Found business building: %.0fm²", business_building.area_m2)
         else:
             logger.warning("   ⚠️ No building found near business location")
             # Fallback: associate surfaces near the location
@@ -104,9 +110,9 @@ class PropertyAssociationService:
                 )
                 associated.append(area)
                 pending.remove(surface)
-                logger.debug(f"   ✅ Associated (near building): {area.area_m2:.0f}m², dist={distance_m:.1f}m")
+                logger.debug("   ✅ Associated (near building): %.0fm², dist=%.1fm", area.area_m2, distance_m)
         
-        logger.info(f"   Initial association: {len(associated)} surfaces")
+        logger.info("   Initial association: %s surfaces", len(associated))
         
         # Step 3: Recursive association - surfaces connected to associated surfaces
         iterations = 0
@@ -140,13 +146,13 @@ class PropertyAssociationService:
                         associated.append(area)
                         pending.remove(surface)
                         added_this_round += 1
-                        logger.debug(f"   ✅ Associated (connected): {area.area_m2:.0f}m²")
+                        logger.debug("   ✅ Associated (connected): %.0fm²", area.area_m2)
                         break
             
             if added_this_round == 0:
                 break
         
-        logger.info(f"   After {iterations} iterations: {len(associated)} associated surfaces")
+        logger.info("   After %s iterations: %s associated surfaces", iterations, len(associated))
         
         # Step 4: Mark remaining as not associated (public roads, neighbors)
         for surface in pending:
@@ -164,22 +170,22 @@ class PropertyAssociationService:
                 area_type="public_road" if self._looks_like_road(surface) else "unknown"
             )
             associated.append(area)
-            logger.debug(f"   ❌ Not associated: {area.area_m2:.0f}m², dist={dist_to_building:.1f}m")
+            logger.debug("   ❌ Not associated: %.0fm², dist=%.1fm", area.area_m2, dist_to_building)
         
         # Log summary
         associated_count = sum(1 for a in associated if a.is_associated)
         excluded_count = len(associated) - associated_count
         total_area = sum(a.area_m2 for a in associated if a.is_associated)
         
-        logger.info(f"   ✅ Final: {associated_count} associated ({total_area:.0f}m²), {excluded_count} excluded")
+        logger.info("   ✅ Final: %s associated (%.0fm²), %s excluded", associated_count, total_area, excluded_count)
         
         return business_building, associated
     
     def _find_closest_building(
         self,
-        buildings: List[DetectedPolygon],
+        buildings: List["DetectedPolygon"],
         location: Tuple[float, float]
-    ) -> Optional[DetectedPolygon]:
+    ) -> Optional["DetectedPolygon"]:
         """Find the building closest to the business location."""
         if not buildings:
             return None
@@ -187,16 +193,13 @@ class PropertyAssociationService:
         lat, lng = location
         point = Point(lng, lat)  # Shapely uses (lng, lat)
         
-        closest = None
-        min_distance = float('inf')
-        
-        for building in buildings:
-            distance = building.polygon.distance(point)
-            if distance < min_distance:
-                min_distance = distance
-                closest = building
+        # all_matches returns every building tied for nearest; keep the first, like a linear scan
+        tree = shapely.STRtree([building.polygon for building in buildings])
+        nearest = tree.query_nearest(point, all_matches=True)
+        if len(nearest) == 0:
+            return None
         
-        return closest
+        return buildings[int(nearest.min())]
     
     def _distance_between_m(self, poly1: Polygon, poly2: Polygon) -> float:
         """Calculate distance between two polygons in meters."""
@@ -219,8 +222,8 @@ class PropertyAssociationService:
     
     def _classify_area_type(
         self,
-        surface: DetectedPolygon,
-        building: DetectedPolygon
+        surface: "DetectedPolygon",
+        building: "DetectedPolygon"
     ) -> str:
         """
         Classify the type of paved area based on geometry and position.
@@ -256,7 +259,7 @@ class PropertyAssociationService:
         
         return "unknown"
     
-    def _looks_like_road(self, surface: DetectedPolygon) -> bool:
+    def _looks_like_road(self, surface: "DetectedPolygon") -> bool:
         """Check if a surface looks like a public road (long and narrow)."""
         bounds = surface.polygon.bounds
         width = bounds[2] - bounds[0]
@@ -277,7 +280,7 @@ class PropertyAssociationService:
     
     def _fallback_association(
         self,
-        surfaces: List[DetectedPolygon],
+        surfaces: List["DetectedPolygon"],
         location: Tuple[float, float]
     ) -> List[AssociatedAsphaltArea]:
         """
@@ -314,11 +317,11 @@ class PropertyAssociationService:
     
     def associate_with_property_boundary(
         self,
-        buildings: List[DetectedPolygon],
-        paved_surfaces: List[DetectedPolygon],
+        buildings: List["DetectedPolygon"],
+        paved_surfaces: List["DetectedPolygon"],
         property_boundary: Polygon,
         business_location: Tuple[float, float]
-    ) -> Tuple[Optional[DetectedPolygon], List[AssociatedAsphaltArea]]:
+    ) -> Tuple[Optional["DetectedPolygon"], List[AssociatedAsphaltArea]]:
         """
         Associate paved surfaces using the legal property boundary from Regrid.
         
@@ -336,60 +339,57 @@ class PropertyAssociationService:
         Returns:
             Tuple of (business_building, list of AssociatedAsphaltArea)
         """
-        logger.info(f"🔗 Associating surfaces with property boundary (Regrid)")
-        logger.info(f"   Property boundary area: ~{self._polygon_area_m2(property_boundary):.0f} m²")
+        logger.info("🔗 Associating surfaces with property boundary (Regrid)")
+        logger.info("   Property boundary area: ~%.0f m²", self._polygon_area_m2(property_boundary))
         
         # Filter small surfaces (likely noise)
         valid_surfaces = [
             p for p in paved_surfaces 
             if p.area_m2 and p.area_m2 >= self.MIN_AREA_M2
         ]
-        logger.info(f"   Filtered to {len(valid_surfaces)} surfaces >= {self.MIN_AREA_M2}m²")
+        logger.info("   Filtered to %s surfaces >= %sm²", len(valid_surfaces), self.MIN_AREA_M2)
         
         # Find business building (for classification purposes)
         business_building = self._find_closest_building(buildings, business_location)
         if business_building:
-            logger.info(f"   🏢 Found business building: {business_building.area_m2:.0f}m²")
+            logger.info("   🏢 Found business building: %.0fm²", business_building.area_m2)
         
-        # Buffer the property boundary slightly (2m) to catch surfaces on the edge
-        boundary_buffered = property_boundary.buffer(0.00002)  # ~2m in degrees
+        if not valid_surfaces:
+            return business_building, []
+        
+        # All geometry work runs as shapely array ops over the whole surface set
+        geoms = np.array([surface.polygon for surface in valid_surfaces], dtype=object)
+        centroids = shapely.centroid(geoms)
+        areas_m2 = np.array([surface.area_m2 or 0 for surface in valid_surfaces], dtype=np.float64)
+        
+        is_within, intersection_pct = self._boundary_overlap(geoms, centroids, property_boundary)
+        is_associated = is_within | (intersection_pct > self.MIN_BOUNDARY_OVERLAP_PCT)
+        
+        # Distance and area type need the business building
+        dist_to_building = [None] * len(valid_surfaces)
+        area_types = ["unknown"] * len(valid_surfaces)
+        if business_building:
+            dist_to_building = self._distances_between_m(geoms, centroids, business_building.polygon).tolist()
+            area_types = self._classify_area_types(geoms, areas_m2).tolist()
+        
+        # Plain lists - per-element numpy scalar access is slow in the loop below
+        is_within = is_within.tolist()
+        is_associated = is_associated.tolist()
+        intersection_pct = intersection_pct.tolist()
+        log_debug = logger.isEnabledFor(logging.DEBUG)
         
         associated: List[AssociatedAsphaltArea] = []
         
-        for surface in valid_surfaces:
-            # Check if surface intersects with property boundary
-            is_within = property_boundary.contains(surface.polygon.centroid)
-            is_intersecting = boundary_buffered.intersects(surface.polygon)
-            
-            # Calculate intersection percentage
-            if is_intersecting:
-                try:
-                    intersection = surface.polygon.intersection(boundary_buffered)
-                    intersection_pct = (intersection.area / surface.polygon.area * 100) if surface.polygon.area > 0 else 0
-                except:
-                    intersection_pct = 0
-            else:
-                intersection_pct = 0
-            
-            # Associate if mostly within property boundary (>30% overlap)
-            is_associated = is_within or intersection_pct > 30
-            
-            # Calculate distance to building if we have one
-            dist_to_building = None
-            area_type = "unknown"
-            if business_building:
-                dist_to_building = self._distance_between_m(surface.polygon, business_building.polygon)
-                area_type = self._classify_area_type(surface, business_building)
-            
+        for i, surface in enumerate(valid_surfaces):
             # Determine reason
-            if is_associated:
-                if is_within:
+            if is_associated[i]:
+                if is_within[i]:
                     reason = "within_property_boundary"
                 else:
-                    reason = f"intersects_boundary_{intersection_pct:.0f}pct"
+                    reason = f"intersects_boundary_{intersection_pct[i]:.0f}pct"
             else:
-                if intersection_pct > 0:
-                    reason = f"minimal_intersection_{intersection_pct:.0f}pct"
+                if intersection_pct[i] > 0:
+                    reason = f"minimal_intersection_{intersection_pct[i]:.0f}pct"
                 else:
                     reason = "outside_property_boundary"
             
@@ -399,27 +399,108 @@ class PropertyAssociationService:
                 class_name=surface.class_name,
                 confidence=surface.confidence,
                 area_m2=surface.area_m2 or 0,
-                is_associated=is_associated,
+                is_associated=is_associated[i],
                 association_reason=reason,
-                distance_to_building_m=dist_to_building,
-                area_type=area_type
+                distance_to_building_m=dist_to_building[i],
+                area_type=area_types[i]
             )
             associated.append(area)
             
-            if is_associated:
-                logger.debug(f"   ✅ Associated: {area.area_m2:.0f}m² - {reason}")
+            if not log_debug:
+                continue
+            if area.is_associated:
+                logger.debug("   ✅ Associated: %.0fm² - %s", area.area_m2, reason)
             else:
-                logger.debug(f"   ❌ Excluded: {area.area_m2:.0f}m² - {reason}")
+                logger.debug("   ❌ Excluded: %.0fm² - %s", area.area_m2, reason)
         
         # Log summary
         associated_count = sum(1 for a in associated if a.is_associated)
         excluded_count = len(associated) - associated_count
         total_area = sum(a.area_m2 for a in associated if a.is_associated)
         
-        logger.info(f"   ✅ Final: {associated_count} associated ({total_area:.0f}m²), {excluded_count} excluded")
+        logger.info("   ✅ Final: %s associated (%.0fm²), %s excluded", associated_count, total_area, excluded_count)
         
         return business_building, associated
     
+    def _boundary_overlap(
+        self,
+        geoms: np.ndarray,
+        centroids: np.ndarray,
+        property_boundary: Polygon
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized boundary test for an array of surface polygons.
+        
+        Returns (centroid_within_boundary, percent_of_surface_inside_buffered_boundary).
+        The percentage only decides surfaces whose centroid is outside the
+        boundary, so only those that also straddle the buffered edge pay
+        for an intersection; the rest get 100 (covered) or 0.
+        """
+        # Buffer the property boundary slightly (2m) to catch surfaces on the edge
+        boundary = property_boundary
+        boundary_buffered = boundary.buffer(self.BOUNDARY_BUFFER_DEG)
+        shapely.prepare(boundary)
+        shapely.prepare(boundary_buffered)
+        
+        is_within = shapely.contains(boundary, centroids)
+        is_intersecting = shapely.intersects(boundary_buffered, geoms)
+        is_covered = shapely.covers(boundary_buffered, geoms)
+        
+        surface_areas = shapely.area(geoms)
+        intersection_pct = np.zeros(len(geoms), dtype=np.float64)
+        intersection_pct[(is_covered | is_within) & (surface_areas > 0)] = 100.0
+        
+        partial = np.flatnonzero(is_intersecting & ~is_covered & ~is_within)
+        if len(partial):
+            intersection_pct[partial] = self._intersection_pct(geoms[partial], boundary_buffered)
+        
+        return is_within, intersection_pct
+    
+    def _intersection_pct(self, geoms: np.ndarray, boundary: Polygon) -> np.ndarray:
+        """Percent of each surface's area inside boundary (0 for geometries GEOS rejects)."""
+        surface_areas = shapely.area(geoms)
+        try:
+            overlap = shapely.area(shapely.intersection(geoms, boundary))
+        except shapely.errors.GEOSException:
+            # One invalid polygon fails the whole array op - retry one by one
+            overlap = np.zeros(len(geoms), dtype=np.float64)
+            for i, geom in enumerate(geoms):
+                try:
+                    overlap[i] = geom.intersection(boundary).area
+                except shapely.errors.GEOSException:
+                    surface_areas[i] = 0
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(surface_areas > 0, overlap / surface_areas * 100, 0.0)
+    
+    def _distances_between_m(self, geoms: np.ndarray, centroids: np.ndarray, building: Polygon) -> np.ndarray:
+        """Vectorized _distance_between_m from every surface to one building."""
+        distance_deg = shapely.distance(geoms, building)
+        avg_lat = (shapely.get_y(centroids) + building.centroid.y) / 2
+        m_per_deg = self.M_PER_DEG * np.cos(np.radians(avg_lat))
+        return np.where(distance_deg > 0, distance_deg * m_per_deg, 0.0)
+    
+    def _classify_area_types(self, geoms: np.ndarray, areas_m2: np.ndarray) -> np.ndarray:
+        """Vectorized _classify_area_type (same thresholds and precedence)."""
+        bounds = shapely.bounds(geoms)
+        width = bounds[:, 2] - bounds[:, 0]
+        height = bounds[:, 3] - bounds[:, 1]
+        width_adjusted = width * np.cos(np.radians((bounds[:, 1] + bounds[:, 3]) / 2))
+        
+        has_extent = (width_adjusted > 0) & (height > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            aspect_ratio = np.maximum(width_adjusted, height) / np.minimum(width_adjusted, height)
+        
+        return np.select(
+            [
+                areas_m2 > 500,
+                has_extent & (aspect_ratio > 3) & (areas_m2 < 200),
+                (areas_m2 > 100) & (areas_m2 < 500),
+            ],
+            ["parking", "driveway", "loading_dock"],
+            default="unknown",
+        )
+    
     def _polygon_area_m2(self, polygon: Polygon) -> float:
         """Calculate area of polygon in square meters."""
         from pyproj import Geod
@@ -9,13 +9,20 @@ Classification priority:
 2. LBCS Activity/Function codes (backup standardized codes)
 3. Text matching on usedesc/usecode (fallback for non-premium data)
 4. Business name hints (last resort)
+
+Rules are compiled once at import: LBCS ranges into sorted interval arrays
+(bisect) and dense NumPy lookup tables, text rules into one alternation
+regex per category. classify_many() classifies whole column sets.
 """
 
 from enum import Enum
-from typing import Optional
+from typing import Optional, List, Sequence
+import bisect
 import re
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -182,6 +189,95 @@ COMMERCIAL_CATCHALL_PATTERNS = [
 ]
 
 
+# Zoning code fragments checked (substring) between the text rules and the catch-all
+ZONING_RULES = [
+    (PropertyCategory.MULTI_FAMILY, ("MF", "R-3", "R-4", "R-5", "RM", "RMF")),
+    (PropertyCategory.RETAIL, ("C-", "CR", "CC", "CG", "CN")),
+    (PropertyCategory.OFFICE, ("O-", "PO", "BP")),
+    (PropertyCategory.INDUSTRIAL, ("I-", "M-", "LI", "HI", "IR")),
+]
+
+BUSINESS_NAME_HINTS = {
+    PropertyCategory.MULTI_FAMILY: [r"apartment", r"apt", r"residence", r"living", r"lofts", r"flats"],
+    PropertyCategory.RETAIL: [r"shopping", r"center", r"plaza", r"mall", r"market"],
+    PropertyCategory.OFFICE: [r"office", r"tower", r"building", r"corporate"],
+    PropertyCategory.INSTITUTIONAL: [r"church", r"school", r"hospital", r"clinic", r"temple", r"mosque"],
+}
+
+
+# =============================================================================
+# COMPILED TABLES
+# =============================================================================
+
+# LBCS codes are 4-digit; anything outside this range never matches a rule
+LBCS_CODE_SPACE = 10000
+
+# Index into _CATEGORIES in the lookup tables; -1 = no rule
+NO_MATCH = -1
+_CATEGORIES = list(PropertyCategory)
+_CATEGORY_INDEX = {category: i for i, category in enumerate(_CATEGORIES)}
+
+
+class _IntervalTable:
+    """
+    LBCS ranges compiled to a dense code -> category table (NumPy, column
+    lookups) and sorted interval starts (bisect, scalar lookups).
+    
+    Ranges may overlap (Function 2320-2329 sits inside Office 2200-2499);
+    like the rule dicts, the category listed first wins.
+    """
+    
+    def __init__(self, ranges_by_category: dict):
+        self.lut = np.full(LBCS_CODE_SPACE, NO_MATCH, dtype=np.int8)
+        # Paint lowest priority first so earlier categories overwrite
+        for category, ranges in reversed(list(ranges_by_category.items())):
+            for low, high in ranges:
+                self.lut[max(low, 0):min(high, LBCS_CODE_SPACE - 1) + 1] = _CATEGORY_INDEX[category]
+        
+        # Runs of equal values in the table become disjoint intervals
+        boundaries = np.flatnonzero(np.diff(self.lut)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [LBCS_CODE_SPACE])) - 1
+        self._intervals = [
+            (int(low), int(high), _CATEGORIES[self.lut[low]])
+            for low, high in zip(starts, ends)
+            if self.lut[low] != NO_MATCH
+        ]
+        self._starts = [low for low, _, _ in self._intervals]
+    
+    def lookup(self, code: Optional[int]) -> Optional[PropertyCategory]:
+        if code is None:
+            return None
+        i = bisect.bisect_right(self._starts, code) - 1
+        if i >= 0:
+            low, high, category = self._intervals[i]
+            if code <= high:
+                return category
+        return None
+    
+    def lookup_many(self, codes: np.ndarray) -> np.ndarray:
+        """Category indexes for an int64 code column (negative = missing)."""
+        valid = (codes >= 0) & (codes < LBCS_CODE_SPACE)
+        result = np.full(codes.shape, NO_MATCH, dtype=np.int8)
+        result[valid] = self.lut[codes[valid]]
+        return result
+
+
+def _alternation(patterns: List[str]) -> re.Pattern:
+    """One regex per rule tier; group order keeps each pattern's own anchors."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+_STRUCTURE_TABLE = _IntervalTable(LBCS_STRUCTURE_RANGES)
+_ACTIVITY_TABLE = _IntervalTable(LBCS_ACTIVITY_RANGES)
+_FUNCTION_TABLE = _IntervalTable(LBCS_FUNCTION_RANGES)
+
+# Category order is the priority order - first tier with any match wins
+_TEXT_TIERS = [(category, _alternation(patterns)) for category, patterns in TEXT_CLASSIFICATION_RULES.items()]
+_COMMERCIAL_CATCHALL = _alternation(COMMERCIAL_CATCHALL_PATTERNS)
+_BUSINESS_NAME_TIERS = [(category, _alternation(patterns)) for category, patterns in BUSINESS_NAME_HINTS.items()]
+
+
 # =============================================================================
 # CLASSIFICATION FUNCTIONS
 # =============================================================================
@@ -191,44 +287,17 @@ def classify_by_lbcs_structure(lbcs_structure: Optional[int]) -> Optional[Proper
     Classify property by LBCS Structure code.
     This is the most reliable classification method.
     """
-    if lbcs_structure is None:
-        return None
-    
-    for category, ranges in LBCS_STRUCTURE_RANGES.items():
-        for low, high in ranges:
-            if low <= lbcs_structure <= high:
-                logger.debug(f"LBCS Structure {lbcs_structure} -> {category.value}")
-                return category
-    
-    return None
+    return _STRUCTURE_TABLE.lookup(lbcs_structure)
 
 
 def classify_by_lbcs_activity(lbcs_activity: Optional[int]) -> Optional[PropertyCategory]:
     """Classify property by LBCS Activity code."""
-    if lbcs_activity is None:
-        return None
-    
-    for category, ranges in LBCS_ACTIVITY_RANGES.items():
-        for low, high in ranges:
-            if low <= lbcs_activity <= high:
-                logger.debug(f"LBCS Activity {lbcs_activity} -> {category.value}")
-                return category
-    
-    return None
+    return _ACTIVITY_TABLE.lookup(lbcs_activity)
 
 
 def classify_by_lbcs_function(lbcs_function: Optional[int]) -> Optional[PropertyCategory]:
     """Classify property by LBCS Function code."""
-    if lbcs_function is None:
-        return None
-    
-    for category, ranges in LBCS_FUNCTION_RANGES.items():
-        for low, high in ranges:
-            if low <= lbcs_function <= high:
-                logger.debug(f"LBCS Function {lbcs_function} -> {category.value}")
-                return category
-    
-    return None
+    return _FUNCTION_TABLE.lookup(lbcs_function)
 
 
 def classify_by_text(
@@ -243,49 +312,31 @@ def classify_by_text(
     Fallback method when LBCS codes are not available.
     """
     # Combine all text fields
-    text_fields = [
+    combined_text = " ".join((
         usecode or "",
         usedesc or "",
         zoning_description or "",
         struct_style or "",
-    ]
-    combined_text = " ".join(text_fields).upper()
+    )).upper()
     
     if not combined_text.strip():
         return None
     
     # Check each category's rules
-    for category, patterns in TEXT_CLASSIFICATION_RULES.items():
-        for pattern in patterns:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                logger.debug(f"Text match '{pattern}' -> {category.value}")
-                return category
+    for category, pattern in _TEXT_TIERS:
+        if pattern.search(combined_text):
+            return category
     
     # Check zoning codes
     if zoning:
         zoning_upper = zoning.upper()
-        
-        # Multi-family zoning codes
-        if any(z in zoning_upper for z in ["MF", "R-3", "R-4", "R-5", "RM", "RMF"]):
-            return PropertyCategory.MULTI_FAMILY
-        
-        # Commercial zoning
-        if any(z in zoning_upper for z in ["C-", "CR", "CC", "CG", "CN"]):
-            return PropertyCategory.RETAIL
-        
-        # Office zoning
-        if any(z in zoning_upper for z in ["O-", "PO", "BP"]):
-            return PropertyCategory.OFFICE
-        
-        # Industrial zoning
-        if any(z in zoning_upper for z in ["I-", "M-", "LI", "HI", "IR"]):
-            return PropertyCategory.INDUSTRIAL
+        for category, fragments in ZONING_RULES:
+            if any(z in zoning_upper for z in fragments):
+                return category
     
     # Commercial catch-all
-    for pattern in COMMERCIAL_CATCHALL_PATTERNS:
-        if re.search(pattern, combined_text, re.IGNORECASE):
-            logger.debug(f"Commercial catch-all '{pattern}' -> RETAIL")
-            return PropertyCategory.RETAIL
+    if _COMMERCIAL_CATCHALL.search(combined_text):
+        return PropertyCategory.RETAIL
     
     return None
 
@@ -295,20 +346,9 @@ def classify_by_business_name(business_name: Optional[str]) -> Optional[Property
     if not business_name:
         return None
     
-    business_upper = business_name.upper()
-    
-    business_hints = {
-        PropertyCategory.MULTI_FAMILY: [r"apartment", r"apt", r"residence", r"living", r"lofts", r"flats"],
-        PropertyCategory.RETAIL: [r"shopping", r"center", r"plaza", r"mall", r"market"],
-        PropertyCategory.OFFICE: [r"office", r"tower", r"building", r"corporate"],
-        PropertyCategory.INSTITUTIONAL: [r"church", r"school", r"hospital", r"clinic", r"temple", r"mosque"],
-    }
-    
-    for category, patterns in business_hints.items():
-        for pattern in patterns:
-            if re.search(pattern, business_upper, re.IGNORECASE):
-                logger.debug(f"Business name match '{pattern}' -> {category.value}")
-                return category
+    for category, pattern in _BUSINESS_NAME_TIERS:
+        if pattern.search(business_name):
+            return category
     
     return None
 
@@ -343,37 +383,125 @@ def classify_property(
     # Priority 1: LBCS Structure (most reliable)
     result = classify_by_lbcs_structure(lbcs_structure)
     if result:
-        logger.info(f"   🏷️  Classified by LBCS Structure ({lbcs_structure}): {result.value}")
+        logger.debug("   🏷️  Classified by LBCS Structure (%s): %s", lbcs_structure, result.value)
         return result
     
     # Priority 2: LBCS Activity
     result = classify_by_lbcs_activity(lbcs_activity)
     if result:
-        logger.info(f"   🏷️  Classified by LBCS Activity ({lbcs_activity}): {result.value}")
+        logger.debug("   🏷️  Classified by LBCS Activity (%s): %s", lbcs_activity, result.value)
         return result
     
     # Priority 3: LBCS Function
     result = classify_by_lbcs_function(lbcs_function)
     if result:
-        logger.info(f"   🏷️  Classified by LBCS Function ({lbcs_function}): {result.value}")
+        logger.debug("   🏷️  Classified by LBCS Function (%s): %s", lbcs_function, result.value)
         return result
     
     # Priority 4: Text matching
     result = classify_by_text(usecode, usedesc, zoning, zoning_description, struct_style)
     if result:
-        logger.info(f"   🏷️  Classified by text ({usedesc or usecode}): {result.value}")
+        logger.debug("   🏷️  Classified by text (%s): %s", usedesc or usecode, result.value)
         return result
     
     # Priority 5: Business name hints
     result = classify_by_business_name(business_name)
     if result:
-        logger.info(f"   🏷️  Classified by business name ({business_name}): {result.value}")
+        logger.debug("   🏷️  Classified by business name (%s): %s", business_name, result.value)
         return result
     
-    logger.info(f"   🏷️  Could not classify property")
+    logger.debug("   🏷️  Could not classify property")
     return PropertyCategory.UNKNOWN
 
 
+def _code_column(values: Optional[Sequence], n: int) -> np.ndarray:
+    """LBCS column (list with None / numeric array with NaN) as int64, -1 = missing."""
+    if values is None:
+        return np.full(n, -1, dtype=np.int64)
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        return values.astype(np.int64, copy=False)
+    if isinstance(values, np.ndarray) and values.dtype.kind == "f":
+        return np.where(np.isnan(values), -1, values).astype(np.int64)
+    return np.fromiter(
+        (-1 if v is None or v == "" else int(v) for v in values),
+        dtype=np.int64,
+        count=n,
+    )
+
+
+def classify_many(
+    lbcs_structure: Optional[Sequence] = None,
+    lbcs_activity: Optional[Sequence] = None,
+    lbcs_function: Optional[Sequence] = None,
+    usecode: Optional[Sequence[Optional[str]]] = None,
+    usedesc: Optional[Sequence[Optional[str]]] = None,
+    zoning: Optional[Sequence[Optional[str]]] = None,
+    zoning_description: Optional[Sequence[Optional[str]]] = None,
+    struct_style: Optional[Sequence[Optional[str]]] = None,
+    business_name: Optional[Sequence[Optional[str]]] = None,
+) -> List[PropertyCategory]:
+    """
+    Classify a whole column set at once (a Regrid page or MVT tile).
+    
+    Same priority and results as classify_property row by row. LBCS columns
+    go through NumPy lookup tables; only rows no code resolves fall through
+    to the text rules, memoized per distinct field combination (pages
+    repeat the same usedesc/zoning values heavily).
+    
+    Args:
+        Each argument is a column (list or array) with one value per parcel;
+        None for a column that is not available. LBCS columns may be int
+        arrays, float arrays with NaN, or lists with None.
+    
+    Returns:
+        List of PropertyCategory, one per row
+    """
+    columns = [lbcs_structure, lbcs_activity, lbcs_function, usecode, usedesc,
+               zoning, zoning_description, struct_style, business_name]
+    lengths = {len(c) for c in columns if c is not None}
+    if not lengths:
+        return []
+    if len(lengths) > 1:
+        raise ValueError(f"classify_many columns differ in length: {sorted(lengths)}")
+    n = lengths.pop()
+    
+    result = _STRUCTURE_TABLE.lookup_many(_code_column(lbcs_structure, n))
+    for table, column in ((_ACTIVITY_TABLE, lbcs_activity), (_FUNCTION_TABLE, lbcs_function)):
+        if column is None:
+            continue
+        missing = result == NO_MATCH
+        if not missing.any():
+            break
+        codes = _code_column(column, n)
+        result[missing] = table.lookup_many(codes[missing])
+    
+    categories = [_CATEGORIES[i] if i != NO_MATCH else None for i in result.tolist()]
+    
+    unresolved = [i for i, category in enumerate(categories) if category is None]
+    if unresolved:
+        def field(column: Optional[Sequence], i: int) -> Optional[str]:
+            return column[i] if column is not None else None
+        
+        memo: dict = {}
+        for i in unresolved:
+            key = (
+                field(usecode, i), field(usedesc, i), field(zoning, i),
+                field(zoning_description, i), field(struct_style, i), field(business_name, i),
+            )
+            category = memo.get(key)
+            if category is None:
+                category = (
+                    classify_by_text(*key[:5])
+                    or classify_by_business_name(key[5])
+                    or PropertyCategory.UNKNOWN
+                )
+                memo[key] = category
+            categories[i] = category
+    
+    logger.debug("   🏷️  Classified %s parcels (%s by LBCS code)", n, n - len(unresolved))
+    return categories
+
+
 # =============================================================================
 # ENRICHMENT STRATEGY
 # =============================================================================
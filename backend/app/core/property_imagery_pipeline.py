@@ -12,6 +12,8 @@ No SAM, no Modal, no complex segmentation - just clean imagery.
 
 import logging
 import os
+import io
+import base64
 from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 from shapely.geometry import Polygon, MultiPolygon, Point
@@ -19,7 +21,9 @@ from PIL import Image
 
 from app.core.regrid_service import regrid_service, PropertyParcel
 from app.core.polygon_imagery_service import get_polygon_imagery_service
+from app.core.vlm_image_preprocessor import vlm_image_preprocessor, PreparedVLMImage
 from app.core.config import settings
+from app.core.telemetry import telemetry
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +40,7 @@ class PropertyImageryResult:
         parcel: Optional[PropertyParcel] = None,
         metadata: Optional[Dict[str, Any]] = None,
         error_message: Optional[str] = None,
+        vlm_image: Optional[PreparedVLMImage] = None,
     ):
         self.success = success
         self.image = image
@@ -44,6 +49,21 @@ class PropertyImageryResult:
         self.parcel = parcel
         self.metadata = metadata or {}
         self.error_message = error_message
+        self.vlm_image = vlm_image
+    
+    @property
+    def vlm_image_base64(self) -> Optional[str]:
+        """Cropped/downscaled image for VLM analysis (falls back to full image)."""
+        if self.vlm_image:
+            return self.vlm_image.image_base64
+        return self.image_base64
+    
+    @property
+    def vlm_image_detail(self) -> str:
+        """Detail level to request from the VLM for vlm_image_base64."""
+        if self.vlm_image:
+            return self.vlm_image.detail
+        return "high"
     
     @property
     def area_sqm(self) -> float:
@@ -110,76 +130,83 @@ class PropertyImageryPipeline:
         Returns:
             PropertyImageryResult with image and metadata
         """
+        with telemetry.span("imagery", address=address) as span:
+            result = await self._get_property_image(lat, lng, address, zoom, draw_boundary, save_debug)
+            span.set(success=result.success, parcel_id=result.parcel.parcel_id if result.parcel else None)
+            return result
+    
+    async def _get_property_image(
+        self,
+        lat: float,
+        lng: float,
+        address: Optional[str],
+        zoom: Optional[int],
+        draw_boundary: bool,
+        save_debug: Optional[bool],
+    ) -> PropertyImageryResult:
         zoom = zoom or self.DEFAULT_ZOOM
         save_debug = save_debug if save_debug is not None else self.SAVE_DEBUG_IMAGES
         
-        logger.info(f"\n{'='*60}")
-        logger.info(f"PROPERTY IMAGERY PIPELINE")
-        logger.info(f"Location: {lat}, {lng}")
-        if address:
-            logger.info(f"Address: {address}")
-        logger.info(f"{'='*60}")
+        # Per-parcel detail is DEBUG; one INFO line when the image is ready
+        logger.debug("Imagery pipeline: (%s, %s) %s", lat, lng, address or "")
         
         # ============ Step 1: Get Property Polygon from Regrid ============
-        logger.info(f"\n[1] Fetching property boundary from Regrid...")
         
         polygon = None
         parcel = None
         
         try:
-            parcel = await regrid_service.get_validated_parcel(lat, lng, address)
+            with telemetry.span("imagery.parcel"):
+                parcel = await regrid_service.get_validated_parcel(lat, lng, address)
             
             if parcel and parcel.polygon:
                 polygon = parcel.polygon
-                logger.info(f"    Parcel ID: {parcel.parcel_id}")
-                logger.info(f"    Address: {parcel.address}")
-                logger.info(f"    Area: {parcel.area_m2:.0f} m² ({parcel.area_acres or 0:.2f} acres)")
-                logger.info(f"    Land Use: {parcel.land_use}")
+                logger.debug(
+                    "    Parcel %s: %s, %.0f m² (%.2f acres), land use %s",
+                    parcel.parcel_id, parcel.address, parcel.area_m2, parcel.area_acres or 0, parcel.land_use
+                )
             else:
-                logger.warning(f"    No parcel found - using estimated boundary")
+                logger.warning("    No parcel found - using estimated boundary")
         except Exception as e:
-            logger.warning(f"    Regrid error: {e} - using estimated boundary")
+            logger.warning("    Regrid error: %s - using estimated boundary", e)
         
         # If no Regrid polygon, create an estimated one
         if polygon is None:
             polygon = self._create_estimated_polygon(lat, lng)
-            logger.info(f"    Created estimated polygon (~100m x 100m)")
+            logger.debug("    Created estimated polygon (~100m x 100m)")
         
         # ============ Step 2: Fetch Satellite Imagery ============
         # Use Google Static Maps API if key available (best quality), otherwise ESRI (free)
         source = "google" if settings.GOOGLE_MAPS_KEY else "esri"
-        logger.info(f"\n[2] Fetching satellite imagery (source: {source})...")
         
         try:
             # Use async method for Google (API call), sync for ESRI (tile stitching)
-            if source == "google":
-                img, metadata = await self.imagery_service.get_polygon_image_async(
-                    polygon=polygon,
-                    zoom=zoom,
-                    draw_boundary=draw_boundary,
-                    boundary_color=self.DEFAULT_BOUNDARY_COLOR,
-                    boundary_width=self.DEFAULT_BOUNDARY_WIDTH,
-                    padding_percent=self.DEFAULT_PADDING_PERCENT,
-                    source="google",
-                )
-                logger.info(f"    Source: Google Static Maps API (legitimate, ~$0.002/request)")
-            else:
-                img, metadata = self.imagery_service.get_polygon_image(
-                    polygon=polygon,
-                    zoom=zoom,
-                    draw_boundary=draw_boundary,
-                    boundary_color=self.DEFAULT_BOUNDARY_COLOR,
-                    boundary_width=self.DEFAULT_BOUNDARY_WIDTH,
-                    padding_percent=self.DEFAULT_PADDING_PERCENT,
-                    source="esri",
-                )
-                logger.info(f"    Source: ESRI WorldImagery (free)")
+            with telemetry.span("imagery.fetch", source=source, zoom=zoom):
+                if source == "google":
+                    img, metadata = await self.imagery_service.get_polygon_image_async(
+                        polygon=polygon,
+                        zoom=zoom,
+                        draw_boundary=draw_boundary,
+                        boundary_color=self.DEFAULT_BOUNDARY_COLOR,
+                        boundary_width=self.DEFAULT_BOUNDARY_WIDTH,
+                        padding_percent=self.DEFAULT_PADDING_PERCENT,
+                        source="google",
+                    )
+                else:
+                    img, metadata = self.imagery_service.get_polygon_image(
+                        polygon=polygon,
+                        zoom=zoom,
+                        draw_boundary=draw_boundary,
+                        boundary_color=self.DEFAULT_BOUNDARY_COLOR,
+                        boundary_width=self.DEFAULT_BOUNDARY_WIDTH,
+                        padding_percent=self.DEFAULT_PADDING_PERCENT,
+                        source="esri",
+                    )
             
-            logger.info(f"    Image size: {img.size[0]}x{img.size[1]} pixels")
-            logger.info(f"    Property area: {metadata.get('polygon_area_sqm', 0):.0f} m²")
+            logger.debug("    Image: %sx%s pixels, property area %.0f m²", img.size[0], img.size[1], metadata.get('polygon_area_sqm', 0))
             
         except Exception as e:
-            logger.error(f"    Imagery fetch failed: {e}")
+            logger.error("    Imagery fetch failed: %s", e)
             return PropertyImageryResult(
                 success=False,
                 error_message=f"Failed to fetch satellite imagery: {e}"
@@ -189,30 +216,38 @@ class PropertyImageryPipeline:
         if save_debug:
             self._save_debug_image(img, lat, lng, parcel)
         
-        # ============ Step 4: Get Base64 for API usage ============
-        if source == "google":
-            base64_str, _ = await self.imagery_service.get_polygon_image_base64_async(
-                polygon=polygon,
-                zoom=zoom,
-                draw_boundary=draw_boundary,
-                boundary_color=self.DEFAULT_BOUNDARY_COLOR,
-                boundary_width=self.DEFAULT_BOUNDARY_WIDTH,
-                padding_percent=self.DEFAULT_PADDING_PERCENT,
-                source="google",
-            )
-        else:
-            base64_str, _ = self.imagery_service.get_polygon_image_base64(
-                polygon=polygon,
-                zoom=zoom,
-                draw_boundary=draw_boundary,
-                boundary_color=self.DEFAULT_BOUNDARY_COLOR,
-                boundary_width=self.DEFAULT_BOUNDARY_WIDTH,
-                padding_percent=self.DEFAULT_PADDING_PERCENT,
-                source="esri",
+        # ============ Step 4: Encode for display + prepare VLM image ============
+        # Encode the image we already have (re-fetching would pay for a second
+        # Static Maps request and could return a different mosaic)
+        with telemetry.span("imagery.encode") as encode_span:
+            buffer = io.BytesIO()
+            img.save(buffer, format='JPEG', quality=95)
+            base64_str = base64.b64encode(buffer.getvalue()).decode('utf-8')
+            metadata["format"] = "jpeg"
+            metadata["base64_length"] = len(base64_str)
+            encode_span.add(bytes=buffer.tell())
+        
+        vlm_image = None
+        try:
+            with telemetry.span("imagery.vlm_prepare"):
+                vlm_image = vlm_image_preprocessor.prepare(
+                    img,
+                    polygon=polygon,
+                    bounds_mercator=metadata.get("bounds_mercator"),
+                    area_m2=parcel.area_m2 if parcel and parcel.area_m2 else metadata.get("polygon_area_sqm"),
+                )
+            metadata["vlm_image"] = vlm_image.to_dict()
+            logger.debug(
+                "    VLM image: %sx%s -> %sx%s (detail=%s, q=%s), ~%s -> %s tokens (%.0f%% saved)",
+                vlm_image.original_width, vlm_image.original_height, vlm_image.width, vlm_image.height, vlm_image.detail, vlm_image.jpeg_quality, vlm_image.baseline_tokens, vlm_image.estimated_tokens, vlm_image.savings_pct
             )
+        except Exception as e:
+            logger.warning("    VLM image preprocessing failed: %s - using full image", e)
         
-        logger.info(f"\n[COMPLETE] Property imagery ready")
-        logger.info(f"{'='*60}\n")
+        logger.info(
+            "🛰️ Imagery ready for (%.5f, %.5f): %s %sx%s, %s boundary",
+            lat, lng, source, img.size[0], img.size[1], "Regrid" if parcel else "estimated"
+        )
         
         return PropertyImageryResult(
             success=True,
@@ -221,6 +256,7 @@ class PropertyImageryPipeline:
             polygon=polygon,
             parcel=parcel,
             metadata=metadata,
+            vlm_image=vlm_image,
         )
     
     def _create_estimated_polygon(self, lat: float, lng: float, size_m: float = 100) -> Polygon:
@@ -259,7 +295,7 @@ class PropertyImageryPipeline:
         filepath = os.path.join(self.DEBUG_IMAGE_DIR, filename)
         img.save(filepath, quality=95)
         
-        logger.info(f"\n[DEBUG] Image saved: {filepath}")
+        logger.debug("Debug image saved: %s", filepath)
         
         return filepath
 
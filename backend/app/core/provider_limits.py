@@ -0,0 +1,321 @@
+"""
+Provider Limits
+
+Pacing and failure handling for outbound provider traffic, installed as
+an httpx transport on every client from http_clients, so each service
+gets it without changes at the call site:
+
+- Token bucket per provider sized to the API's quota (a 429 pauses the
+  whole bucket for Retry-After, not just the request that saw it)
+- Concurrency cap per host
+- Jittered exponential retry on 429 / 5xx / timeouts, honouring Retry-After
+  (non-idempotent requests are only retried on 429 and connect failures
+  unless the provider policy allows it)
+- Circuit breaker per provider: after repeated 5xx/transport failures,
+  requests fail fast with CircuitOpenError until a trial request succeeds
+
+Counters and breaker state are exposed via get_stats() for /usage/providers.
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+MAX_TRACKED_HOSTS = 256
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request while a provider's circuit is open."""
+
+
+@dataclass
+class ProviderPolicy:
+    """Quota and retry settings for one outbound provider."""
+    rate_per_second: Optional[float] = None  # None = no bucket
+    burst: int = 10
+    max_concurrency_per_host: int = 10
+    max_retries: int = 3
+    backoff_base: float = 0.5  # Seconds; doubled per attempt, full jitter
+    backoff_max: float = 20.0
+    max_retry_after: float = 60.0  # Longer Retry-After values are returned to the caller instead
+    retry_unsafe_methods: bool = False  # Retry POSTs on 5xx / timeouts too
+    breaker_threshold: int = 5  # Consecutive failures that open the circuit (0 = no breaker)
+    breaker_reset_seconds: float = 30.0
+
+
+@dataclass
+class ProviderCounters:
+    requests: int = 0
+    retries: int = 0
+    rate_limited: int = 0  # 429 responses
+    server_errors: int = 0  # 5xx responses
+    transport_errors: int = 0  # Timeouts, connection failures
+    rejected: int = 0  # Failed fast while the circuit was open
+    throttle_wait_s: float = 0.0  # Time spent waiting for bucket tokens
+
+
+class TokenBucket:
+    """Async token bucket; pause() blocks all callers (used for provider-wide 429s)."""
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self) -> float:
+        """Take one token, sleeping until available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                delay = self._paused_until - now
+            else:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    @property
+    def available(self) -> float:
+        now = time.monotonic()
+        return round(min(self.burst, self._tokens + (now - self._updated) * self.rate), 2)
+
+
+class CircuitBreaker:
+    """Closed → open after N consecutive failures → half-open (one trial) after a cool-down."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold: int, reset_seconds: float):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+
+    def allow(self) -> bool:
+        if not self.threshold or self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        now = time.monotonic()
+        # A trial that never reported back (cancelled) is replaced after a cool-down
+        if self._trial_in_flight and now - self._trial_started < self.reset_seconds:
+            return False
+        self._trial_in_flight = True
+        self._trial_started = now
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.state = self.CLOSED
+        self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Returns True if this failure opened the circuit."""
+        if not self.threshold:
+            return False
+        self.failures += 1
+        if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.threshold):
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+            self.opened += 1
+            return True
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = {"state": self.state, "consecutive_failures": self.failures, "times_opened": self.opened}
+        if self.state == self.OPEN:
+            stats["retry_in_s"] = round(max(0.0, self.reset_seconds - (time.monotonic() - self._opened_at)), 1)
+        return stats
+
+
+class ProviderGuard:
+    """Bucket, per-host semaphores, breaker and counters for one provider (outlives its clients)."""
+
+    def __init__(self, name: str, policy: ProviderPolicy):
+        self.name = name
+        self.policy = policy
+        self.bucket = TokenBucket(policy.rate_per_second, policy.burst) if policy.rate_per_second else None
+        self.breaker = CircuitBreaker(policy.breaker_threshold, policy.breaker_reset_seconds)
+        self.counters = ProviderCounters()
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def host_slot(self, host: str) -> asyncio.Semaphore:
+        slot = self._host_slots.get(host)
+        if slot is None:
+            if len(self._host_slots) >= MAX_TRACKED_HOSTS:
+                # Scraping touches many one-off hosts - forget the idle ones
+                self._host_slots = {
+                    h: s for h, s in self._host_slots.items()
+                    if s._value < self.policy.max_concurrency_per_host
+                }
+            slot = asyncio.Semaphore(self.policy.max_concurrency_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.policy.backoff_max, self.policy.backoff_base * (2 ** attempt)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        counters = asdict(self.counters)
+        counters["throttle_wait_s"] = round(counters["throttle_wait_s"], 2)
+        in_flight = {
+            host: self.policy.max_concurrency_per_host - slot._value
+            for host, slot in self._host_slots.items()
+            if slot._value < self.policy.max_concurrency_per_host
+        }
+        return {
+            **counters,
+            "rate_per_second": self.policy.rate_per_second,
+            "tokens_available": self.bucket.available if self.bucket else None,
+            "max_concurrency_per_host": self.policy.max_concurrency_per_host,
+            "in_flight": in_flight,
+            "circuit": self.breaker.get_stats(),
+        }
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that frees its host slot when the response is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+        self._done()
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._done()
+
+    def _done(self) -> None:
+        if self._release:
+            self._release()
+            self._release = None
+
+
+class GuardedTransport(httpx.AsyncBaseTransport):
+    """httpx transport applying a ProviderGuard around an inner transport."""
+
+    def __init__(self, guard: ProviderGuard, inner: httpx.AsyncBaseTransport):
+        self.guard = guard
+        self._inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        guard = self.guard
+        policy = guard.policy
+        counters = guard.counters
+
+        if not guard.breaker.allow():
+            counters.rejected += 1
+            raise CircuitOpenError(f"{guard.name} circuit open - failing fast", request=request)
+
+        unsafe_ok = policy.retry_unsafe_methods or request.method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            if guard.bucket:
+                counters.throttle_wait_s += await guard.bucket.acquire()
+
+            slot = guard.host_slot(request.url.host)
+            await slot.acquire()
+            counters.requests += 1
+            try:
+                response = await self._inner.handle_async_request(request)
+            except BaseException as e:
+                slot.release()
+                if not isinstance(e, httpx.TransportError):
+                    raise
+                counters.transport_errors += 1
+                self._failure()
+                # Connect failures never reached the server - safe to resend any method
+                retryable = unsafe_ok or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if not retryable or attempt >= policy.max_retries:
+                    raise
+                delay = guard.backoff(attempt)
+                logger.warning("↻ %s: %s on %s, retry %s in %.1fs", guard.name, type(e).__name__, request.url.host, attempt + 1, delay)
+            else:
+                response.stream = _ReleasingStream(response.stream, slot.release)
+                status = response.status_code
+                if status not in RETRY_STATUSES:
+                    guard.breaker.record_success()
+                    return response
+
+                if status == 429:
+                    # Throttled, not down - counts as the provider being reachable
+                    counters.rate_limited += 1
+                    guard.breaker.record_success()
+                    retryable = True
+                else:
+                    counters.server_errors += 1
+                    self._failure()
+                    retryable = unsafe_ok
+                retry_after = _retry_after_seconds(response)
+                delay = retry_after if retry_after is not None else guard.backoff(attempt)
+                if not retryable or attempt >= policy.max_retries or delay > policy.max_retry_after:
+                    return response
+                if status == 429 and guard.bucket:
+                    guard.bucket.pause(delay)
+                await response.aclose()
+                logger.warning("↻ %s: HTTP %s from %s, retry %s in %.1fs", guard.name, status, request.url.host, attempt + 1, delay)
+
+            attempt += 1
+            counters.retries += 1
+            await asyncio.sleep(delay)
+
+    def _failure(self) -> None:
+        if self.guard.breaker.record_failure():
+            logger.error(
+                "⛔ %s: circuit opened after %s failures (retry in %.0fs)",
+                self.guard.name, self.guard.breaker.failures, self.guard.policy.breaker_reset_seconds
+            )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
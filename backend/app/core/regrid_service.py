@@ -17,31 +17,44 @@ import logging
 import math
 import httpx
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pyproj import Geod
 from shapely.geometry import shape, Polygon, MultiPolygon, Point
 from shapely.ops import unary_union
 
 from app.core.config import settings
+from app.core.http_client_manager import http_clients
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Shared ellipsoid for parcel areas (Geod construction is not free)
+_GEOD = Geod(ellps="WGS84")
+
+_POLYGON_TYPES = ("Polygon", "MultiPolygon")
+
+
+@dataclass(slots=True)
 class PropertyParcel:
-    """Property parcel data from Regrid."""
+    """
+    Property parcel data from Regrid.
+    
+    Attributes are read straight from the feature properties. The boundary
+    is kept as the raw GeoJSON geometry and only turned into a shapely
+    polygon (plus centroid / geodesic area) the first time one of those is
+    read, so parcels that are dropped by id never pay for geometry.
+    """
     parcel_id: str
     apn: Optional[str]  # Assessor Parcel Number
     address: Optional[str]
     owner: Optional[str]
-    polygon: Polygon  # Property boundary
-    centroid: Point
-    area_m2: float
     area_acres: Optional[float]
     land_use: Optional[str]  # usedesc or usecode
     zoning: Optional[str]
     zoning_description: Optional[str]
     year_built: Optional[int]
-    raw_data: Dict[str, Any]
+    geometry: Optional[Dict[str, Any]] = field(default=None, repr=False)  # GeoJSON, released once parsed
+    raw_data: Optional[Dict[str, Any]] = field(default=None, repr=False)  # Only kept when requested
     
     # Additional property details (Standard tier)
     num_units: Optional[int] = None  # Number of living units
@@ -68,6 +81,39 @@ class PropertyParcel:
     mail_city: Optional[str] = None
     mail_state: Optional[str] = None
     
+    # Lazily computed from geometry
+    _polygon: Optional[Polygon] = field(default=None, init=False, repr=False, compare=False)
+    _centroid: Optional[Point] = field(default=None, init=False, repr=False, compare=False)
+    _area_m2: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _parsed: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    @property
+    def polygon(self) -> Optional[Polygon]:
+        """Property boundary (largest ring of a MultiPolygon, repaired if invalid)."""
+        if not self._parsed:
+            self._polygon = _polygon_from_geojson(self.geometry)
+            self.geometry = None
+            self._parsed = True
+        return self._polygon
+    
+    @property
+    def centroid(self) -> Optional[Point]:
+        if self._centroid is None and self.polygon is not None:
+            self._centroid = self.polygon.centroid
+        return self._centroid
+    
+    @property
+    def area_m2(self) -> float:
+        """Geodesic area of the boundary in square meters."""
+        if self._area_m2 is None:
+            polygon = self.polygon
+            if polygon is None:
+                return 0.0
+            lngs, lats = polygon.exterior.coords.xy
+            area, _ = _GEOD.polygon_area_perimeter(lngs, lats)
+            self._area_m2 = abs(area)
+        return self._area_m2
+    
     @property
     def has_valid_geometry(self) -> bool:
         """Check if the parcel has a valid polygon."""
@@ -81,6 +127,31 @@ class PropertyParcel:
         return self.polygon.contains(point) or self.polygon.boundary.distance(point) < 0.0001
 
 
+def _polygon_from_geojson(geometry: Optional[Dict[str, Any]]) -> Optional[Polygon]:
+    """GeoJSON Polygon/MultiPolygon -> single valid shapely Polygon, or None."""
+    if not geometry:
+        return None
+    try:
+        geom = shape(geometry)
+        
+        if isinstance(geom, MultiPolygon):
+            geom = max(geom.geoms, key=lambda g: g.area)
+        
+        if not isinstance(geom, Polygon):
+            return None
+        
+        if not geom.is_valid:
+            geom = geom.buffer(0)
+        
+        if geom.is_empty or not isinstance(geom, Polygon):
+            return None
+        
+        return geom
+    except Exception as e:
+        logger.debug("Failed to parse geometry: %s", e)
+        return None
+
+
 class RegridService:
     """
     Service to fetch property parcel data from Regrid API.
@@ -98,7 +169,6 @@ class RegridService:
     def __init__(self):
         self.api_key = settings.REGRID_API_KEY
         self.base_url = settings.REGRID_API_URL
-        self._client: Optional[httpx.AsyncClient] = None
     
     @property
     def is_configured(self) -> bool:
@@ -106,10 +176,8 @@ class RegridService:
         return bool(self.api_key)
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+        """Shared Regrid client (managed by http_clients)."""
+        return http_clients.get("regrid")
     
     # ============================================================
     # MAIN ENTRY POINT - Use this method
@@ -142,7 +210,7 @@ class RegridService:
             logger.warning("   ⚠️ Regrid API not configured (REGRID_API_KEY not set)")
             return None
         
-        logger.info(f"   🗺️  Regrid: Finding parcel for ({lat:.6f}, {lng:.6f})")
+        logger.info("   🗺️  Regrid: Finding parcel for (%.6f, %.6f)", lat, lng)
         
         # ============ STEP 1: Point Lookup (PRIMARY) ============
         parcel = await self._point_lookup(lat, lng)
@@ -150,23 +218,23 @@ class RegridService:
         if parcel:
             # Validate: Does parcel contain the business point?
             if parcel.contains_point(lat, lng):
-                logger.info(f"   ✅ Point lookup SUCCESS - parcel contains business location")
+                logger.info("   ✅ Point lookup SUCCESS - parcel contains business location")
                 self._log_parcel_info(parcel)
                 return parcel
             else:
                 # This shouldn't happen with point lookup, but let's be safe
-                logger.warning(f"   ⚠️ Point lookup returned parcel that doesn't contain point - rejecting")
+                logger.warning("   ⚠️ Point lookup returned parcel that doesn't contain point - rejecting")
                 parcel = None
         
         # ============ STEP 2: Address Search (FALLBACK) ============
         if not parcel and address:
-            logger.info(f"   🔄 Point lookup failed, trying address search...")
+            logger.info("   🔄 Point lookup failed, trying address search...")
             parcel = await self._address_lookup(address)
             
             if parcel:
                 # Check if parcel contains the business point (ideal case)
                 if parcel.contains_point(lat, lng):
-                    logger.info(f"   ✅ Address lookup SUCCESS - parcel contains business location")
+                    logger.info("   ✅ Address lookup SUCCESS - parcel contains business location")
                     self._log_parcel_info(parcel)
                     return parcel
                 else:
@@ -177,20 +245,20 @@ class RegridService:
                     MAX_DISTANCE_M = 150  # Accept parcels within 150m
                     
                     if dist <= MAX_DISTANCE_M:
-                        logger.info(f"   ✅ Address lookup SUCCESS - parcel is {dist:.0f}m from business (within {MAX_DISTANCE_M}m tolerance)")
-                        logger.info(f"      Note: Google coordinates may point to entrance/sign, not property center")
+                        logger.info("   ✅ Address lookup SUCCESS - parcel is %.0fm from business (within %sm tolerance)", dist, MAX_DISTANCE_M)
+                        logger.info("      Note: Google coordinates may point to entrance/sign, not property center")
                         self._log_parcel_info(parcel)
                         return parcel
                     else:
-                        logger.warning(f"   ❌ Address lookup returned WRONG parcel!")
-                        logger.warning(f"      Parcel centroid is {dist:.0f}m from business (>{MAX_DISTANCE_M}m)")
-                        logger.warning(f"      Parcel too far from business point - REJECTED")
+                        logger.warning("   ❌ Address lookup returned WRONG parcel!")
+                        logger.warning("      Parcel centroid is %.0fm from business (>%sm)", dist, MAX_DISTANCE_M)
+                        logger.warning("      Parcel too far from business point - REJECTED")
                         parcel = None
         
         # ============ STEP 3: No Valid Parcel Found ============
         if not parcel:
-            logger.warning(f"   ⚠️ No valid Regrid parcel found for this location")
-            logger.warning(f"      Will use estimated boundary instead")
+            logger.warning("   ⚠️ No valid Regrid parcel found for this location")
+            logger.warning("      Will use estimated boundary instead")
         
         return parcel
     
@@ -220,11 +288,11 @@ class RegridService:
                 return None
             
             if response.status_code == 404:
-                logger.info(f"   📍 No parcel at coordinates (coverage gap)")
+                logger.info("   📍 No parcel at coordinates (coverage gap)")
                 return None
             
             if response.status_code != 200:
-                logger.warning(f"   ⚠️ Point lookup failed: {response.status_code}")
+                logger.warning("   ⚠️ Point lookup failed: %s", response.status_code)
                 return None
             
             data = response.json()
@@ -237,7 +305,7 @@ class RegridService:
             return None
             
         except Exception as e:
-            logger.error(f"   ❌ Point lookup error: {e}")
+            logger.error("   ❌ Point lookup error: %s", e)
             return None
     
     async def _address_lookup(self, address: str) -> Optional[PropertyParcel]:
@@ -279,7 +347,7 @@ class RegridService:
             if not parcel_path:
                 return None
             
-            logger.info(f"      Typeahead found: {parcel_path}")
+            logger.info("      Typeahead found: %s", parcel_path)
             
             # Step 2: Fetch parcel details (try v1, then v2)
             parcel = await self._fetch_parcel_by_path(parcel_path)
@@ -287,7 +355,7 @@ class RegridService:
             return parcel
             
         except Exception as e:
-            logger.error(f"   ❌ Address lookup error: {e}")
+            logger.error("   ❌ Address lookup error: %s", e)
             return None
     
     async def _fetch_parcel_by_path(self, parcel_path: str) -> Optional[PropertyParcel]:
@@ -326,9 +394,9 @@ class RegridService:
     
     def _log_parcel_info(self, parcel: PropertyParcel):
         """Log parcel information."""
-        logger.info(f"      📋 Parcel: {parcel.address or parcel.parcel_id}")
-        logger.info(f"      👤 Owner: {parcel.owner or 'Unknown'}")
-        logger.info(f"      📐 Area: {parcel.area_m2:,.0f} m² ({parcel.area_acres or 0:.2f} acres)")
+        logger.info("      📋 Parcel: %s", parcel.address or parcel.parcel_id)
+        logger.info("      👤 Owner: %s", parcel.owner or 'Unknown')
+        logger.info("      📐 Area: %.0f m² (%.2f acres)", parcel.area_m2, parcel.area_acres or 0)
     
     # ============================================================
     # LEGACY METHODS (for backwards compatibility)
@@ -369,8 +437,22 @@ class RegridService:
     # UTILITY METHODS
     # ============================================================
     
-    def _parse_response(self, data: Dict[str, Any]) -> List[PropertyParcel]:
-        """Parse Regrid API response into PropertyParcel objects."""
+    def _parse_response(
+        self,
+        data: Dict[str, Any],
+        keep_raw: bool = False,
+        validate_geometry: bool = True,
+    ) -> List[PropertyParcel]:
+        """
+        Parse Regrid API response into PropertyParcel objects.
+        
+        Args:
+            data: FeatureCollection (or single feature) from Regrid
+            keep_raw: Keep each feature dict on PropertyParcel.raw_data
+            validate_geometry: Drop parcels without a valid polygon here. Callers
+                that filter by id first pass False and check has_valid_geometry
+                on the parcels they keep.
+        """
         parcels: List[PropertyParcel] = []
         
         features = data.get("features", [])
@@ -381,39 +463,20 @@ class RegridService:
         
         for feature in features:
             try:
-                parcel = self._parse_feature(feature)
-                if parcel and parcel.has_valid_geometry:
+                parcel = self._parse_feature(feature, keep_raw=keep_raw)
+                if parcel and (not validate_geometry or parcel.has_valid_geometry):
                     parcels.append(parcel)
             except Exception as e:
-                logger.debug(f"Failed to parse parcel feature: {e}")
+                logger.debug("Failed to parse parcel feature: %s", e)
         
         return parcels
     
-    def _parse_feature(self, feature: Dict[str, Any]) -> Optional[PropertyParcel]:
-        """Parse a single GeoJSON feature into PropertyParcel."""
+    def _parse_feature(self, feature: Dict[str, Any], keep_raw: bool = False) -> Optional[PropertyParcel]:
+        """Parse a single GeoJSON feature into PropertyParcel (geometry is parsed lazily)."""
         geometry = feature.get("geometry")
         properties = feature.get("properties", {})
         
-        if not geometry:
-            return None
-        
-        try:
-            geom = shape(geometry)
-            
-            if isinstance(geom, MultiPolygon):
-                geom = max(geom.geoms, key=lambda g: g.area)
-            
-            if not isinstance(geom, Polygon):
-                return None
-            
-            if not geom.is_valid:
-                geom = geom.buffer(0)
-            
-            if geom.is_empty:
-                return None
-                
-        except Exception as e:
-            logger.debug(f"Failed to parse geometry: {e}")
+        if not geometry or geometry.get("type") not in _POLYGON_TYPES or not geometry.get("coordinates"):
             return None
         
         # V2 API stores fields in 'fields' subobject
@@ -427,16 +490,6 @@ class RegridService:
             str(feature.get("id", "unknown"))
         )
         
-        # Calculate area
-        from pyproj import Geod
-        geod = Geod(ellps="WGS84")
-        coords = list(geom.exterior.coords)
-        area_m2, _ = geod.polygon_area_perimeter(
-            [c[0] for c in coords],
-            [c[1] for c in coords]
-        )
-        area_m2 = abs(area_m2)
-        
         area_acres = all_props.get("ll_gisacre") or all_props.get("gisacre")
         if area_acres:
             try:
@@ -489,15 +542,13 @@ class RegridService:
             apn=all_props.get("parcelnumb") or all_props.get("apn"),
             address=address,
             owner=owner,
-            polygon=geom,
-            centroid=geom.centroid,
-            area_m2=area_m2,
             area_acres=area_acres,
             land_use=all_props.get("usedesc") or all_props.get("usecode") or all_props.get("landuse"),
             zoning=all_props.get("zoning") or all_props.get("zoning_code"),
             zoning_description=all_props.get("zoning_description"),
             year_built=safe_int(all_props.get("yearbuilt")),
-            raw_data=feature,
+            geometry=geometry,
+            raw_data=feature if keep_raw else None,
             # Additional property details
             num_units=safe_int(all_props.get("numunits")),
             num_stories=safe_float(all_props.get("numstories")),
@@ -574,11 +625,11 @@ class RegridService:
         # Clean up owner name for search
         clean_name = self._clean_owner_name_for_search(owner_name)
         
-        logger.info(f"   🔍 Regrid: Searching parcels owned by '{clean_name}'")
+        logger.info("   🔍 Regrid: Searching parcels owned by '%s'", clean_name)
         if county_fips:
-            logger.info(f"      County FIPS: {county_fips}")
+            logger.info("      County FIPS: %s", county_fips)
         elif state_code:
-            logger.info(f"      State: {state_code}")
+            logger.info("      State: %s", state_code)
         
         try:
             client = await self._get_client()
@@ -606,19 +657,19 @@ class RegridService:
                 return []
             
             if response.status_code != 200:
-                logger.warning(f"   ⚠️ Regrid owner search failed: {response.status_code}")
+                logger.warning("   ⚠️ Regrid owner search failed: %s", response.status_code)
                 return []
             
             data = response.json()
             parcels_data = data.get("parcels", {})
             parcels = self._parse_response(parcels_data)
             
-            logger.info(f"   ✅ Found {len(parcels)} parcels owned by '{clean_name}'")
+            logger.info("   ✅ Found %s parcels owned by '%s'", len(parcels), clean_name)
             
             return parcels[:max_results]
             
         except Exception as e:
-            logger.error(f"   ❌ Regrid owner search error: {e}")
+            logger.error("   ❌ Regrid owner search error: %s", e)
             return []
     
     def _clean_owner_name_for_search(self, name: str) -> str:
@@ -709,6 +760,7 @@ class RegridService:
         min_acres: Optional[float] = None,
         max_acres: Optional[float] = None,
         offset: int = 0,
+        validate_geometry: bool = True,
     ) -> List[PropertyParcel]:
         """
         Search for parcels by LBCS code ranges.
@@ -734,6 +786,8 @@ class RegridService:
             min_acres: Optional minimum parcel size in acres
             max_acres: Optional maximum parcel size in acres
             offset: Pagination offset (skip first N results)
+            validate_geometry: False skips polygon parsing here; the caller must
+                check has_valid_geometry on the parcels it keeps
             
         Returns:
             List of PropertyParcel objects
@@ -746,12 +800,12 @@ class RegridService:
             logger.warning("   ⚠️ No LBCS ranges provided")
             return []
         
-        logger.info(f"   🔍 Regrid: Searching parcels by LBCS codes ({lbcs_field})")
-        logger.info(f"      LBCS ranges: {lbcs_ranges}")
+        logger.info("   🔍 Regrid: Searching parcels by LBCS codes (%s)", lbcs_field)
+        logger.info("      LBCS ranges: %s", lbcs_ranges)
         if min_acres or max_acres:
-            logger.info(f"      Size filter: {min_acres or 0} - {max_acres or '∞'} acres")
+            logger.info("      Size filter: %s - %s acres", min_acres or 0, max_acres or '∞')
         if offset > 0:
-            logger.info(f"      Offset: {offset}")
+            logger.info("      Offset: %s", offset)
         
         all_parcels = []
         seen_ids = set()
@@ -793,7 +847,7 @@ class RegridService:
                 if max_acres is not None:
                     params["fields[ll_gisacre][lte]"] = max_acres
                 
-                logger.info(f"      Querying {lbcs_field} {lbcs_min}-{lbcs_max}...")
+                logger.info("      Querying %s %s-%s...", lbcs_field, lbcs_min, lbcs_max)
                 
                 response = await client.get(url, params=params)
                 
@@ -802,12 +856,12 @@ class RegridService:
                     return all_parcels
                 
                 if response.status_code != 200:
-                    logger.warning(f"   ⚠️ Regrid LBCS search failed: {response.status_code} - {response.text[:200]}")
+                    logger.warning("   ⚠️ Regrid LBCS search failed: %s - %s", response.status_code, response.text[:200])
                     continue
                 
                 data = response.json()
                 parcels_data = data.get("parcels", {})
-                parcels = self._parse_response(parcels_data)
+                parcels = self._parse_response(parcels_data, validate_geometry=validate_geometry)
                 
                 # Deduplicate
                 added = 0
@@ -817,13 +871,13 @@ class RegridService:
                         all_parcels.append(parcel)
                         added += 1
                 
-                logger.info(f"      Found {len(parcels)} parcels, added {added} new (total: {len(all_parcels)})")
+                logger.info("      Found %s parcels, added %s new (total: %s)", len(parcels), added, len(all_parcels))
             
-            logger.info(f"   ✅ Total unique parcels found: {len(all_parcels)}")
+            logger.info("   ✅ Total unique parcels found: %s", len(all_parcels))
             return all_parcels[:max_results]
             
         except Exception as e:
-            logger.error(f"   ❌ Regrid LBCS search error: {e}")
+            logger.error("   ❌ Regrid LBCS search error: %s", e)
             return all_parcels
     
     async def search_parcels_by_usedesc(
@@ -833,6 +887,7 @@ class RegridService:
         state_code: Optional[str] = None,
         zip_code: Optional[str] = None,
         max_results: int = 50,
+        validate_geometry: bool = True,
     ) -> List[PropertyParcel]:
         """
         Search for parcels by usedesc text patterns (fallback if LBCS not available).
@@ -848,6 +903,7 @@ class RegridService:
             state_code: Optional state code
             zip_code: Optional ZIP code
             max_results: Maximum results
+            validate_geometry: See search_parcels_by_lbcs
             
         Returns:
             List of PropertyParcel objects
@@ -856,8 +912,8 @@ class RegridService:
             logger.warning("   ⚠️ Regrid API not configured")
             return []
         
-        logger.info(f"   🔍 Regrid: Searching parcels by usedesc patterns")
-        logger.info(f"      Patterns: {patterns}")
+        logger.info("   🔍 Regrid: Searching parcels by usedesc patterns")
+        logger.info("      Patterns: %s", patterns)
         
         all_parcels = []
         seen_ids = set()
@@ -898,7 +954,7 @@ class RegridService:
                 elif state_code:
                     params["fields[state2][eq]"] = state_code.upper()
                 
-                logger.info(f"      Trying usecode = '{usecode}'...")
+                logger.info("      Trying usecode = '%s'...", usecode)
                 
                 response = await client.get(url, params=params)
                 
@@ -907,7 +963,7 @@ class RegridService:
                 
                 data = response.json()
                 parcels_data = data.get("parcels", {})
-                parcels = self._parse_response(parcels_data)
+                parcels = self._parse_response(parcels_data, validate_geometry=validate_geometry)
                 
                 # Filter by usedesc patterns locally
                 for parcel in parcels:
@@ -921,14 +977,14 @@ class RegridService:
                     if matches or usedesc:  # Include if matches or has any description
                         seen_ids.add(parcel.parcel_id)
                         all_parcels.append(parcel)
-                        logger.info(f"         Found: {parcel.address} ({parcel.land_use})")
+                        logger.debug("         Found: %s (%s)", parcel.address, parcel.land_use)
                 
                 if parcels:
-                    logger.info(f"      Found {len(parcels)} parcels with usecode '{usecode}'")
+                    logger.info("      Found %s parcels with usecode '%s'", len(parcels), usecode)
             
             # If still no results, try getting any commercial parcels in the area
             if not all_parcels:
-                logger.info(f"      Trying broader commercial property search...")
+                logger.info("      Trying broader commercial property search...")
                 
                 # Try lbcs_activity codes for commercial (2xxx range)
                 url = "https://app.regrid.com/api/v2/parcels/query"
@@ -951,28 +1007,23 @@ class RegridService:
                 if response.status_code == 200:
                     data = response.json()
                     parcels_data = data.get("parcels", {})
-                    parcels = self._parse_response(parcels_data)
+                    parcels = self._parse_response(parcels_data, validate_geometry=validate_geometry)
                     
                     for parcel in parcels:
                         if parcel.parcel_id not in seen_ids:
                             seen_ids.add(parcel.parcel_id)
                             all_parcels.append(parcel)
                     
-                    logger.info(f"      Found {len(parcels)} commercial parcels (LBCS activity 2000-2999)")
+                    logger.info("      Found %s commercial parcels (LBCS activity 2000-2999)", len(parcels))
             
-            logger.info(f"   ✅ Total unique parcels found: {len(all_parcels)}")
+            logger.info("   ✅ Total unique parcels found: %s", len(all_parcels))
             return all_parcels[:max_results]
             
         except Exception as e:
-            logger.error(f"   ❌ Regrid usedesc search error: {e}")
+            logger.error("   ❌ Regrid usedesc search error: %s", e)
             import traceback
             traceback.print_exc()
             return all_parcels
-    
-    async def close(self):
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
 
 
 # Singleton instance
@@ -2,6 +2,8 @@
 NLP Search Parser Service
 
 Uses LLM via OpenRouter to parse natural language queries into structured SearchQuery objects.
+Common shapes (category / brand + ZIP / state / county / size) are resolved locally by
+RuleBasedQueryParser first; parsed queries are kept in an in-process LRU.
 
 Examples:
 - "parking lots in miami" → category=parking, city=Miami
@@ -12,12 +14,16 @@ Examples:
 
 import logging
 import json
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 from dataclasses import asdict
 
 from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.core.openrouter_client_pool import openrouter_client_pool
+from app.core.county_service import county_service
+from app.core.search_query_rules import rule_based_query_parser, COMMON_BRANDS
 from app.core.search_service import (
     SearchQuery, SearchFilters, SearchType, PROPERTY_CATEGORIES
 )
@@ -85,16 +91,22 @@ class NLPSearchService:
     DEFAULT_MODEL = "openai/gpt-4o-mini"  # Fast and cheap for parsing
     
     def __init__(self):
-        self.client: Optional[AsyncOpenAI] = None
+        # normalized query -> parsed dict (LLM-shaped), LRU order
+        self._parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_hits = 0
+        self._rule_parses = 0
+        self._llm_parses = 0
+        
         if settings.OPENROUTER_API_KEY:
-            self.client = AsyncOpenAI(
-                base_url=self.OPENROUTER_BASE_URL,
-                api_key=settings.OPENROUTER_API_KEY,
-            )
             logger.info("NLP Search Service initialized with OpenRouter")
         else:
             logger.warning("OPENROUTER_API_KEY not set - NLP search will not work")
     
+    @property
+    def client(self) -> Optional[AsyncOpenAI]:
+        """Pooled client for the system key (shared with VLM/LLM enrichment traffic)."""
+        return openrouter_client_pool.get(settings.OPENROUTER_API_KEY, self.OPENROUTER_BASE_URL)
+    
     async def parse_query(
         self,
         natural_query: str,
@@ -110,9 +122,34 @@ class NLPSearchService:
         Returns:
             Structured SearchQuery object
         """
-        logger.info(f"🧠 NLP: Parsing query '{natural_query}'")
+        logger.info("🧠 NLP: Parsing query '%s'", natural_query)
+        
+        cache_key = " ".join(natural_query.lower().split())
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            self._parse_cache.move_to_end(cache_key)
+            self._cache_hits += 1
+            logger.info("   Parse cache hit: %s", cached)
+            return self._build_search_query(cached, natural_query, current_viewport)
+        
+        rules = rule_based_query_parser.parse(natural_query)
+        if rules.confident and rules.county_name:
+            county = await county_service.find_county(rules.county_name, rules.parsed["state_code"])
+            if county:
+                rules.parsed["county_fips"] = county.fips
+            else:
+                rules.confident = False
+        
+        if rules.confident:
+            self._rule_parses += 1
+            logger.info("   Parsed (rules): %s", rules.parsed)
+            self._remember(cache_key, rules.parsed)
+            return self._build_search_query(rules.parsed, natural_query, current_viewport)
         
         if not self.client:
+            if rules.parsed.get("search_type"):
+                logger.warning("NLP client not available, using partial rule parse (unmatched: %s)", rules.unmatched)
+                return self._build_search_query(rules.parsed, natural_query, current_viewport)
             logger.warning("NLP client not available, returning default query")
             return SearchQuery(
                 search_type=SearchType.CATEGORY,
@@ -153,13 +190,15 @@ class NLPSearchService:
                 response_text = "\n".join(json_lines)
             
             parsed = json.loads(response_text)
-            logger.info(f"   Parsed: {parsed}")
+            logger.info("   Parsed: %s", parsed)
+            self._llm_parses += 1
+            self._remember(cache_key, parsed)
             
             # Convert to SearchQuery
             return self._build_search_query(parsed, natural_query, current_viewport)
             
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse NLP response as JSON: {e}")
+            logger.error("Failed to parse NLP response as JSON: %s", e)
             # Return a fallback query that requires user action
             return SearchQuery(
                 search_type=SearchType.CATEGORY,
@@ -167,7 +206,7 @@ class NLPSearchService:
                 filters=SearchFilters(),
             )
         except Exception as e:
-            logger.error(f"NLP parsing error: {e}")
+            logger.error("NLP parsing error: %s", e)
             import traceback
             traceback.print_exc()
             return SearchQuery(
@@ -206,6 +245,7 @@ class NLPSearchService:
             search_type=search_type,
             raw_query=raw_query,
             zip_code=parsed.get("zip_code"),
+            county_fips=parsed.get("county_fips"),
             state_code=parsed.get("state_code"),
             brand_name=parsed.get("brand_name"),
             filters=filters,
@@ -215,7 +255,7 @@ class NLPSearchService:
         if viewport and parsed.get("requires_draw", False) is False:
             # If we have a city but no ZIP, we might want to geocode it
             # For now, use viewport as fallback
-            if not query.zip_code and not query.state_code:
+            if not query.zip_code and not query.county_fips and not query.state_code:
                 query.viewport = viewport
         
         return query
@@ -244,9 +284,8 @@ class NLPSearchService:
                 suggestions.append(f"{cat_info['label']} in current view")
                 suggestions.append(f"{cat_info['label']} in ZIP...")
         
-        # Brand suggestions
-        common_brands = ["McDonald's", "Starbucks", "Walmart", "Target", "CVS", "Walgreens", "Shell", "7-Eleven"]
-        for brand in common_brands:
+        # Brand suggestions (same lexicon the rule parser resolves locally)
+        for brand in COMMON_BRANDS:
             if partial_lower in brand.lower():
                 suggestions.append(f"{brand} nearby")
         
@@ -256,6 +295,24 @@ class NLPSearchService:
             suggestions.append("Industrial over 5 acres")
         
         return suggestions[:5]  # Limit to 5 suggestions
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """How queries were resolved since startup."""
+        parses = self._cache_hits + self._rule_parses + self._llm_parses
+        return {
+            "cache_entries": len(self._parse_cache),
+            "max_entries": settings.NLP_PARSE_CACHE_MAX_ENTRIES,
+            "cache_hits": self._cache_hits,
+            "rule_parses": self._rule_parses,
+            "llm_parses": self._llm_parses,
+            "llm_avoided_pct": round(100.0 * (self._cache_hits + self._rule_parses) / parses, 1) if parses else 0.0,
+        }
+    
+    def _remember(self, cache_key: str, parsed: Dict[str, Any]) -> None:
+        self._parse_cache[cache_key] = parsed
+        self._parse_cache.move_to_end(cache_key)
+        while len(self._parse_cache) > settings.NLP_PARSE_CACHE_MAX_ENTRIES:
+            self._parse_cache.popitem(last=False)
 
 
 # Singleton instance
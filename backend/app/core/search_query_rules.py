@@ -0,0 +1,229 @@
+"""
+Rule-Based Search Query Parser
+
+Deterministic fast path in front of the LLM parser in NLPSearchService.
+Resolves the common query shapes with lexicons only:
+
+- "apartments in 78701"            → category=multifamily, zip=78701
+- "walmart in TX"                  → brand=Walmart, state=TX
+- "gas stations over 1 acre in Dallas County, TX"
+                                   → category=gas_station, min_acres=1, county=Dallas/TX
+- "large industrial"               → category=industrial, min_acres=2, requires_draw
+
+A parse is only returned as confident when every token was recognized
+(category / brand / location / size / filler words). Anything else -
+cities, neighbourhoods, "near downtown", misspellings - goes to the LLM.
+
+Output is the same dict shape the LLM returns, so
+NLPSearchService._build_search_query handles both.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple
+
+from app.core.county_service import STATE_NAMES
+from app.core.search_service import PROPERTY_CATEGORIES
+
+SQFT_PER_ACRE = 43560.0
+
+# "large" per the LLM prompt rules
+LARGE_MIN_ACRES = 2.0
+
+# Franchise names recognized without the LLM (display name as sent to Places Text Search)
+COMMON_BRANDS = [
+    "McDonald's", "Starbucks", "Walmart", "Target", "CVS", "Walgreens", "Shell", "7-Eleven",
+    "Costco", "Home Depot", "Lowe's", "Kroger", "Publix", "Aldi", "Whole Foods", "Trader Joe's",
+    "Dollar General", "Dollar Tree", "Family Dollar", "AutoZone", "O'Reilly Auto Parts",
+    "Chick-fil-A", "Taco Bell", "Wendy's", "Burger King", "Subway", "Dunkin'", "Chipotle",
+    "Sonic", "Popeyes", "KFC", "Domino's", "Pizza Hut", "Arby's", "Jack in the Box",
+    "Chevron", "Exxon", "Mobil", "BP", "Circle K", "Wawa", "Sheetz", "QuikTrip", "Speedway",
+    "Marathon", "Valero", "Buc-ee's", "Love's", "Pilot", "Planet Fitness", "Best Buy",
+    "Kohl's", "Ross", "TJ Maxx", "PetSmart", "Tractor Supply",
+]
+
+# Words that carry no search meaning in these query shapes
+FILLER_WORDS = {
+    "in", "near", "at", "around", "within", "inside", "the", "a", "an", "all", "any", "every",
+    "find", "show", "me", "list", "search", "for", "of", "with", "and", "on",
+    "lot", "lots", "property", "properties", "parcel", "parcels", "site", "sites",
+    "location", "locations", "building", "buildings", "space", "spaces", "places", "place",
+    "zip", "zipcode", "code", "state", "area",
+}
+
+# Two-letter abbreviations that are also common words (or "LA" = Los Angeles);
+# only recognized as states when spelled out in full
+AMBIGUOUS_STATE_CODES = {"IN", "OR", "ME", "HI", "OK", "OH", "LA", "DE", "AL", "ID", "PA", "CO", "MA"}
+
+_ZIP_RE = re.compile(r"\b(\d{5})(?:-\d{4})?\b")
+_NUMBER = r"(\d+(?:\.\d+)?)"
+_UNIT = r"(acres?|ac|sq\.?\s*ft|sqft|square\s+feet|sf)"
+_BETWEEN_RE = re.compile(rf"\bbetween\s+{_NUMBER}\s*(?:{_UNIT}\s*)?(?:and|-|to)\s*{_NUMBER}\s*{_UNIT}")
+_MIN_RE = re.compile(rf"\b(?:over|above|more\s+than|greater\s+than|at\s+least|min(?:imum)?|bigger\s+than|larger\s+than)\s+{_NUMBER}\s*{_UNIT}")
+_MAX_RE = re.compile(rf"\b(?:under|below|less\s+than|at\s+most|max(?:imum)?|smaller\s+than|up\s+to)\s+{_NUMBER}\s*{_UNIT}")
+_PLUS_RE = re.compile(rf"\b{_NUMBER}\s*\+\s*{_UNIT}")
+_LARGE_RE = re.compile(r"\b(?:large|big)\b")
+_COUNTY_RE = re.compile(r"\b([a-z][a-z .'\-]*?)\s+(county|parish|borough)\b")
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9'\-\.&]*")
+
+
+def _key(text: str) -> str:
+    """Match key: lowercase, apostrophes/hyphens/dots dropped, single spaces."""
+    text = re.sub(r"['’\.]", "", text.lower())
+    text = re.sub(r"[\-&]", " ", text)
+    return " ".join(text.split())
+
+
+def _to_acres(value: str, unit: str) -> float:
+    number = float(value)
+    return number if unit.startswith("ac") else round(number / SQFT_PER_ACRE, 3)
+
+
+def _phrase_table() -> Dict[Tuple[str, ...], Tuple[str, str]]:
+    """token tuple -> ("category", id) / ("brand", name) / ("state", code)."""
+    table: Dict[Tuple[str, ...], Tuple[str, str]] = {}
+    for cat_id, cat in PROPERTY_CATEGORIES.items():
+        for phrase in [cat_id.replace("_", " "), cat["label"], *cat["keywords"]]:
+            table[tuple(_key(phrase).split())] = ("category", cat_id)
+    for brand in COMMON_BRANDS:
+        table[tuple(_key(brand).split())] = ("brand", brand)
+    for code, name in STATE_NAMES.items():
+        table[tuple(_key(name).split())] = ("state", code)
+    return table
+
+
+@dataclass
+class RuleParse:
+    """Outcome of the rule parser: LLM-shaped fields plus whether they can be trusted."""
+    parsed: Dict[str, Any] = field(default_factory=dict)
+    confident: bool = False
+    county_name: Optional[str] = None  # Resolved to a FIPS code by the caller
+    unmatched: List[str] = field(default_factory=list)
+
+
+class RuleBasedQueryParser:
+    """Lexicon parser for category / brand / ZIP / state / county / size queries."""
+
+    def __init__(self):
+        self._phrases = _phrase_table()
+        self._max_phrase_len = max(len(p) for p in self._phrases)
+
+    def parse(self, natural_query: str) -> RuleParse:
+        text = " " + natural_query.strip().lower() + " "
+        result = RuleParse()
+        parsed = result.parsed
+
+        # Size filters (consumed from the text so their words are not left over)
+        def consume(pattern: re.Pattern, handler) -> None:
+            nonlocal text
+            match = pattern.search(text)
+            if match:
+                handler(match)
+                text = text[:match.start()] + " " + text[match.end():]
+
+        consume(_BETWEEN_RE, lambda m: parsed.update(
+            min_acres=_to_acres(m.group(1), m.group(2) or m.group(4)),
+            max_acres=_to_acres(m.group(3), m.group(4)),
+        ))
+        consume(_MIN_RE, lambda m: parsed.update(min_acres=_to_acres(m.group(1), m.group(2))))
+        consume(_PLUS_RE, lambda m: parsed.update(min_acres=_to_acres(m.group(1), m.group(2))))
+        consume(_MAX_RE, lambda m: parsed.update(max_acres=_to_acres(m.group(1), m.group(2))))
+        if "min_acres" not in parsed:
+            consume(_LARGE_RE, lambda m: parsed.update(min_acres=LARGE_MIN_ACRES))
+
+        zips = _ZIP_RE.findall(text)
+        if len(zips) > 1:
+            result.unmatched.append("multiple ZIP codes")
+        consume(_ZIP_RE, lambda m: parsed.update(zip_code=m.group(1)))
+
+        county = _COUNTY_RE.search(text)
+        if county:
+            # The lazy prefix can start at the first word of the query - only the words
+            # after the last filler are the name ("parking lots in dallas county" → "dallas")
+            rest, result.county_name = self._split_county_prefix(county.group(1))
+            text = text[:county.start(1)] + rest + " " + text[county.end():]
+
+        # Uppercase two-letter state codes ("walmart in TX") - checked on the original casing
+        for code in re.findall(r"\b([A-Z]{2})\b", natural_query):
+            if code in STATE_NAMES and code not in AMBIGUOUS_STATE_CODES:
+                self._set(result, "state_code", code)
+                text = re.sub(rf"\b{code.lower()}\b", " ", text, count=1)
+
+        tokens = [_key(t) for t in _TOKEN_RE.findall(text.replace(",", " "))]
+        tokens = [t for t in " ".join(tokens).split()]
+        i = 0
+        while i < len(tokens):
+            hit = self._match(tokens, i)
+            if hit:
+                length, (kind, value) = hit
+                self._set(result, {"category": "category_id", "brand": "brand_name", "state": "state_code"}[kind], value)
+                i += length
+                continue
+            token = tokens[i]
+            if token in FILLER_WORDS:
+                pass
+            elif len(token) == 2 and token.upper() in STATE_NAMES and token.upper() not in AMBIGUOUS_STATE_CODES:
+                # Lowercase codes only at the end of the query ("walmart in tx")
+                if i == len(tokens) - 1:
+                    self._set(result, "state_code", token.upper())
+                else:
+                    result.unmatched.append(token)
+            else:
+                result.unmatched.append(token)
+            i += 1
+
+        if parsed.get("brand_name"):
+            parsed["search_type"] = "brand"
+        elif parsed.get("category_id"):
+            parsed["search_type"] = "category"
+        parsed["requires_draw"] = not (parsed.get("zip_code") or parsed.get("state_code") or result.county_name)
+
+        result.confident = (
+            not result.unmatched
+            and bool(parsed.get("search_type"))
+            and not (parsed.get("brand_name") and parsed.get("category_id"))
+            and not (result.county_name and (parsed.get("brand_name") or not parsed.get("state_code")))
+        )
+        return result
+
+    def _match(self, tokens: List[str], start: int) -> Optional[Tuple[int, Tuple[str, str]]]:
+        """Longest lexicon phrase at tokens[start:], allowing a plural last word."""
+        for length in range(min(self._max_phrase_len, len(tokens) - start), 0, -1):
+            words = tokens[start:start + length]
+            for candidate in (tuple(words), tuple(words[:-1]) + (self._singular(words[-1]),)):
+                hit = self._phrases.get(candidate)
+                if hit:
+                    return length, hit
+        return None
+
+    @staticmethod
+    def _singular(word: str) -> str:
+        if word.endswith("ies") and len(word) > 4:
+            return word[:-3] + "y"
+        if word.endswith(("ses", "xes", "ches", "shes")):
+            return word[:-2]
+        if word.endswith("s") and not word.endswith("ss"):
+            return word[:-1]
+        return word
+
+    @staticmethod
+    def _split_county_prefix(prefix: str) -> Tuple[str, str]:
+        """Split "parking lots in dallas" into ("parking lots in", "dallas")."""
+        words = prefix.split()
+        cut = 0
+        for j in range(len(words) - 1, -1, -1):
+            if words[j] in FILLER_WORDS:
+                cut = j + 1
+                break
+        return " ".join(words[:cut]), " ".join(words[cut:])
+
+    @staticmethod
+    def _set(result: RuleParse, key: str, value: Any) -> None:
+        existing = result.parsed.get(key)
+        if existing is not None and existing != value:
+            result.unmatched.append(f"conflicting {key}")
+        result.parsed[key] = value
+
+
+# Singleton instance
+rule_based_query_parser = RuleBasedQueryParser()
@@ -25,7 +25,8 @@ import json
 from shapely.geometry import shape, mapping, Polygon, MultiPolygon, Point, box
 from shapely.ops import unary_union
 
-from app.core.regrid_service import RegridService, PropertyParcel
+from app.core.regrid_service import regrid_service, PropertyParcel
+from app.core.http_client_manager import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -188,7 +189,7 @@ class SearchService:
     """
     
     def __init__(self):
-        self.regrid = RegridService()
+        self.regrid = regrid_service
     
     async def search(
         self,
@@ -205,7 +206,7 @@ class SearchService:
         Returns:
             SearchResult with parcels or count
         """
-        logger.info(f"🔍 Search: type={query.search_type}, preview={preview_only}")
+        logger.info("🔍 Search: type=%s, preview=%s", query.search_type, preview_only)
         
         try:
             if query.search_type == SearchType.PIN:
@@ -238,7 +239,7 @@ class SearchService:
                     error=f"Unknown search type: {query.search_type}",
                 )
         except Exception as e:
-            logger.error(f"Search error: {e}")
+            logger.error("Search error: %s", e)
             import traceback
             traceback.print_exc()
             return SearchResult(
@@ -310,7 +311,7 @@ class SearchService:
         
         # Get LBCS codes from category or filters
         lbcs_ranges = self._get_lbcs_ranges(query.filters)
-        print(f"Polygon search - category_id: {query.filters.category_id}, lbcs_ranges: {lbcs_ranges}, min_acres: {query.filters.min_acres}")
+        logger.debug("Polygon search - category_id: %s, lbcs_ranges: %s, min_acres: %s", query.filters.category_id, lbcs_ranges, query.filters.min_acres)
         
         # Require category filter to avoid returning too many parcels
         if not lbcs_ranges and not query.filters.min_acres:
@@ -443,6 +444,26 @@ class SearchService:
                 max_acres=query.filters.max_acres,
                 offset=query.offset,
             )
+        elif query.county_fips:
+            from app.core.county_service import county_service
+            county_polygon = await county_service.get_county_boundary(query.county_fips)
+            if not county_polygon:
+                return SearchResult(
+                    success=False,
+                    search_type=SearchType.CATEGORY,
+                    query=query,
+                    total_count=0,
+                    parcels=[],
+                    error=f"County boundary not found: {query.county_fips}",
+                )
+            parcels = await self._query_regrid_spatial(
+                polygon_geojson=county_polygon,
+                lbcs_ranges=lbcs_ranges,
+                min_acres=query.filters.min_acres,
+                max_acres=query.filters.max_acres,
+                limit=query.limit,
+                offset=query.offset,
+            )
         elif query.viewport:
             # Convert viewport to polygon and search
             viewport_polygon = self._viewport_to_polygon(query.viewport)
@@ -461,7 +482,7 @@ class SearchService:
                 query=query,
                 total_count=0,
                 parcels=[],
-                error="Geographic scope required (polygon, ZIP, or viewport)",
+                error="Geographic scope required (polygon, ZIP, county, or viewport)",
             )
         
         result_parcels = [self._parcel_to_result(p) for p in parcels]
@@ -491,9 +512,8 @@ class SearchService:
                 error="Brand name required",
             )
         
-        # Import Google Places service
-        from app.core.brand_search_service import BrandSearchService
-        brand_service = BrandSearchService()
+        # Import Google Places service (singleton - shares the Text Search rate limiter)
+        from app.core.brand_search_service import brand_search_service as brand_service
         
         # Determine geographic scope
         if query.viewport:
@@ -588,38 +608,38 @@ class SearchService:
                 if max_acres is not None:
                     params["fields[ll_gisacre][lte]"] = max_acres
                 
-                print(f"Querying LBCS {lbcs_min}-{lbcs_max} via /parcels/query with bbox + LBCS filter...")
+                logger.debug("Querying LBCS %s-%s via /parcels/query with bbox + LBCS filter...", lbcs_min, lbcs_max)
                 
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    try:
-                        response = await client.get(url, params=params)
-                        print(f"Response status: {response.status_code}")
+                client = http_clients.get("regrid")
+                try:
+                    response = await client.get(url, params=params)
+                    logger.debug("Response status: %s", response.status_code)
                         
-                        if response.status_code != 200:
-                            print(f"Regrid error: {response.text[:300]}")
-                            continue
+                    if response.status_code != 200:
+                        logger.warning("Regrid error: %s", response.text[:300])
+                        continue
                         
-                        data = response.json()
+                    data = response.json()
                         
-                        # /parcels/query returns: {"parcels": {"type": "FeatureCollection", ...}}
-                        parcels_data = data.get("parcels", data)  # Handle both formats
-                        if isinstance(parcels_data, dict):
-                            features = parcels_data.get("features", [])
-                        else:
-                            features = []
+                    # /parcels/query returns: {"parcels": {"type": "FeatureCollection", ...}}
+                    parcels_data = data.get("parcels", data)  # Handle both formats
+                    if isinstance(parcels_data, dict):
+                        features = parcels_data.get("features", [])
+                    else:
+                        features = []
                         
-                        print(f"Found {len(features)} parcels in bbox for LBCS {lbcs_min}-{lbcs_max}")
+                    logger.debug("Found %s parcels in bbox for LBCS %s-%s", len(features), lbcs_min, lbcs_max)
                         
-                        # Parse using RegridService
-                        parcels = self.regrid._parse_response(parcels_data)
-                        all_parcels.extend(parcels)
+                    # Parse using RegridService
+                    parcels = self.regrid._parse_response(parcels_data)
+                    all_parcels.extend(parcels)
                             
-                    except httpx.TimeoutException:
-                        print(f"⚠️ Regrid request timed out")
-                        continue
-                    except httpx.RequestError as e:
-                        print(f"⚠️ Regrid request error: {e}")
-                        continue
+                except httpx.TimeoutException:
+                    logger.warning("⚠️ Regrid request timed out")
+                    continue
+                except httpx.RequestError as e:
+                    logger.warning("⚠️ Regrid request error: %s", e)
+                    continue
             
             # Deduplicate by parcel_id
             seen_ids = set()
@@ -629,7 +649,7 @@ class SearchService:
                     seen_ids.add(p.parcel_id)
                     unique_parcels.append(p)
             
-            print(f"Server-side LBCS filter returned {len(unique_parcels)} unique parcels")
+            logger.info("Server-side LBCS filter returned %s unique parcels", len(unique_parcels))
             
             # Post-filter: ensure parcels are actually inside the polygon (not just bbox)
             if unique_parcels:
@@ -643,7 +663,7 @@ class SearchService:
                         elif polygon_shape.intersects(parcel.polygon):
                             filtered.append(parcel)
                 
-                print(f"✓ After polygon filter: {len(filtered)} parcels (from {len(unique_parcels)} in bbox)")
+                logger.debug("✓ After polygon filter: %s parcels (from %s in bbox)", len(filtered), len(unique_parcels))
                 return filtered
             
             # FALLBACK: If LBCS returned 0, try keyword search on usedesc field
@@ -652,7 +672,7 @@ class SearchService:
             for cat_id, cat_info in PROPERTY_CATEGORIES.items():
                 if cat_info.get("lbcs_codes") == lbcs_ranges:
                     keywords = cat_info.get("keywords", [])
-                    print(f"LBCS returned 0, trying keyword fallback with: {keywords[:3]}...")
+                    logger.debug("LBCS returned 0, trying keyword fallback with: %s...", keywords[:3])
                     break
             
             if keywords:
@@ -664,13 +684,13 @@ class SearchService:
                     limit=limit,
                 )
                 if keyword_parcels:
-                    print(f"✓ Keyword fallback found {len(keyword_parcels)} parcels")
+                    logger.info("✓ Keyword fallback found %s parcels", len(keyword_parcels))
                     return keyword_parcels
             
             return unique_parcels
             
         except Exception as e:
-            print(f"Regrid query error: {e}")
+            logger.warning("Regrid query error: %s", e)
             import traceback
             traceback.print_exc()
             return []
@@ -689,7 +709,6 @@ class SearchService:
         Uses /parcels/query with usedesc[ilike] for pattern matching.
         This catches parcels that don't have LBCS codes but have descriptive text.
         """
-        import httpx
         from app.core.config import settings
         from shapely.geometry import shape
         
@@ -723,38 +742,38 @@ class SearchService:
                 if max_acres is not None:
                     params["fields[ll_gisacre][lte]"] = max_acres
                 
-                print(f"  Trying keyword '{keyword}'...")
+                logger.debug("  Trying keyword '%s'...", keyword)
                 
-                async with httpx.AsyncClient(timeout=20.0) as client:
-                    try:
-                        response = await client.get(url, params=params)
+                client = http_clients.get("regrid")
+                try:
+                    response = await client.get(url, params=params, timeout=20.0)
                         
-                        if response.status_code != 200:
-                            continue
+                    if response.status_code != 200:
+                        continue
                         
-                        data = response.json()
-                        parcels_data = data.get("parcels", data)
+                    data = response.json()
+                    parcels_data = data.get("parcels", data)
                         
-                        if isinstance(parcels_data, dict):
-                            features = parcels_data.get("features", [])
-                            if features:
-                                print(f"    Found {len(features)} for '{keyword}'")
-                                parcels = self.regrid._parse_response(parcels_data)
+                    if isinstance(parcels_data, dict):
+                        features = parcels_data.get("features", [])
+                        if features:
+                            logger.debug("    Found %s for '%s'", len(features), keyword)
+                            parcels = self.regrid._parse_response(parcels_data)
                                 
-                                # Add unique parcels that are in polygon
-                                for p in parcels:
-                                    if p.parcel_id not in seen_ids and p.has_valid_geometry:
-                                        if polygon_shape.contains(p.centroid) or polygon_shape.intersects(p.polygon):
-                                            seen_ids.add(p.parcel_id)
-                                            all_parcels.append(p)
+                            # Add unique parcels that are in polygon
+                            for p in parcels:
+                                if p.parcel_id not in seen_ids and p.has_valid_geometry:
+                                    if polygon_shape.contains(p.centroid) or polygon_shape.intersects(p.polygon):
+                                        seen_ids.add(p.parcel_id)
+                                        all_parcels.append(p)
                                             
-                    except Exception:
-                        continue
+                except Exception:
+                    continue
             
             return all_parcels[:limit]
             
         except Exception as e:
-            print(f"Keyword search error: {e}")
+            logger.warning("Keyword search error: %s", e)
             return []
 
     async def _query_regrid_spatial(
@@ -797,11 +816,11 @@ class SearchService:
             height_miles = (maxy - miny) * 69
             approx_area_sqmi = width_miles * height_miles
             
-            print(f"Polygon bounds: ({miny:.4f}, {minx:.4f}) to ({maxy:.4f}, {maxx:.4f})")
-            print(f"Approximate area: {approx_area_sqmi:.1f} sq miles")
+            logger.debug("Polygon bounds: (%.4f, %.4f) to (%.4f, %.4f)", miny, minx, maxy, maxx)
+            logger.debug("Approximate area: %.1f sq miles", approx_area_sqmi)
             
             if approx_area_sqmi > MAX_AREA_SQ_MILES:
-                print(f"⚠️ Area too large ({approx_area_sqmi:.1f} sq mi > {MAX_AREA_SQ_MILES} sq mi limit).")
+                logger.warning("⚠️ Area too large (%.1f sq mi > %s sq mi limit).", approx_area_sqmi, MAX_AREA_SQ_MILES)
                 return []
             
             # STRATEGY:
@@ -814,7 +833,7 @@ class SearchService:
             use_query_endpoint = lbcs_ranges and approx_area_sqmi <= QUERY_AREA_LIMIT
             
             if use_query_endpoint:
-                print(f"✓ Using /parcels/query (server-side LBCS filter, area {approx_area_sqmi:.1f} ≤ {QUERY_AREA_LIMIT} sq mi)")
+                logger.info("✓ Using /parcels/query (server-side LBCS filter, area %.1f ≤ %s sq mi)", approx_area_sqmi, QUERY_AREA_LIMIT)
                 parcels = await self._query_regrid_with_lbcs(
                     polygon_geojson=polygon_geojson,
                     lbcs_ranges=lbcs_ranges,
@@ -826,7 +845,7 @@ class SearchService:
                 return parcels
             
             # Fall back to /parcels/area (no server-side LBCS filtering)
-            print(f"→ Using /parcels/area (local filtering, area {approx_area_sqmi:.1f} sq mi)")
+            logger.info("→ Using /parcels/area (local filtering, area %.1f sq mi)", approx_area_sqmi)
             url = "https://app.regrid.com/api/v2/parcels/area"
             
             # Build request body
@@ -852,114 +871,114 @@ class SearchService:
             # Log request
             safe_body = {k: v for k, v in body.items() if k != 'token'}
             safe_body['geojson'] = f"<Polygon with {len(polygon_geojson.get('coordinates', [[]])[0])} points>"
-            print(f"Regrid area request: {safe_body}")
+            logger.debug("Regrid area request: %s", safe_body)
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                try:
-                    print(f"Making Regrid POST /parcels/area request...")
-                    response = await client.post(
-                        url,
-                        json=body,
-                        headers={"Content-Type": "application/json"}
-                    )
-                    print(f"Regrid response status: {response.status_code}")
-                except httpx.TimeoutException:
-                    print(f"⚠️ Regrid request timed out after 30s")
-                    return []
-                except httpx.RequestError as e:
-                    print(f"⚠️ Regrid request error: {e}")
-                    return []
+            client = http_clients.get("regrid")
+            try:
+                logger.debug("Making Regrid POST /parcels/area request...")
+                response = await client.post(
+                    url,
+                    json=body,
+                    headers={"Content-Type": "application/json"}
+                )
+                logger.debug("Regrid response status: %s", response.status_code)
+            except httpx.TimeoutException:
+                logger.warning("⚠️ Regrid request timed out after 30s")
+                return []
+            except httpx.RequestError as e:
+                logger.warning("⚠️ Regrid request error: %s", e)
+                return []
                 
-                if response.status_code != 200:
-                    print(f"Regrid error ({response.status_code}): {response.text[:500]}")
-                    return []
+            if response.status_code != 200:
+                logger.warning("Regrid error (%s): %s", response.status_code, response.text[:500])
+                return []
                 
-                data = response.json()
-                print(f"Response keys: {list(data.keys())}")
+            data = response.json()
+            logger.debug("Response keys: %s", list(data.keys()))
                 
-                parcels_data = data.get("parcels", {})
-                if isinstance(parcels_data, dict):
-                    features = parcels_data.get("features", [])
-                else:
-                    features = []
+            parcels_data = data.get("parcels", {})
+            if isinstance(parcels_data, dict):
+                features = parcels_data.get("features", [])
+            else:
+                features = []
                 
-                print(f"Regrid returned {len(features)} parcels")
+            logger.debug("Regrid returned %s parcels", len(features))
                 
-                parcels = self.regrid._parse_response(parcels_data)
-                filtered_parcels = parcels
+            parcels = self.regrid._parse_response(parcels_data)
+            filtered_parcels = parcels
                 
-                print(f"Parsed {len(filtered_parcels)} parcels from area query")
+            logger.debug("Parsed %s parcels from area query", len(filtered_parcels))
                 
-                # Apply local filtering using LBCS codes AND keyword fallbacks
-                # This is needed because LBCS data coverage varies significantly by county
-                if lbcs_ranges and filtered_parcels:
-                    # Get keywords for fallback filtering if available
-                    category_id = None  # Will be set if we're filtering by category
-                    keywords = []
+            # Apply local filtering using LBCS codes AND keyword fallbacks
+            # This is needed because LBCS data coverage varies significantly by county
+            if lbcs_ranges and filtered_parcels:
+                # Get keywords for fallback filtering if available
+                category_id = None  # Will be set if we're filtering by category
+                keywords = []
                     
-                    # Try to get keywords from query context
-                    # This would need to be passed in, but for now extract from the LBCS ranges
-                    for cat_id, cat_info in PROPERTY_CATEGORIES.items():
-                        if cat_info.get("lbcs_codes") == lbcs_ranges:
-                            keywords = cat_info.get("keywords", [])
-                            category_id = cat_id
-                            break
+                # Try to get keywords from query context
+                # This would need to be passed in, but for now extract from the LBCS ranges
+                for cat_id, cat_info in PROPERTY_CATEGORIES.items():
+                    if cat_info.get("lbcs_codes") == lbcs_ranges:
+                        keywords = cat_info.get("keywords", [])
+                        category_id = cat_id
+                        break
                     
-                    lbcs_matched = []
-                    keyword_matched = []
-                    lbcs_unknown = 0
-                    lbcs_other = 0
+                lbcs_matched = []
+                keyword_matched = []
+                lbcs_unknown = 0
+                lbcs_other = 0
                     
-                    for parcel in filtered_parcels:
-                        lbcs = parcel.lbcs_activity
-                        matched_by_lbcs = False
+                for parcel in filtered_parcels:
+                    lbcs = parcel.lbcs_activity
+                    matched_by_lbcs = False
                         
-                        if lbcs:
-                            # Check if LBCS code is in any of the requested ranges
-                            for lbcs_min, lbcs_max in lbcs_ranges:
-                                if lbcs_min <= lbcs <= lbcs_max:
-                                    matched_by_lbcs = True
-                                    break
+                    if lbcs:
+                        # Check if LBCS code is in any of the requested ranges
+                        for lbcs_min, lbcs_max in lbcs_ranges:
+                            if lbcs_min <= lbcs <= lbcs_max:
+                                matched_by_lbcs = True
+                                break
                             
-                            if matched_by_lbcs:
-                                lbcs_matched.append(parcel)
-                            else:
-                                lbcs_other += 1
+                        if matched_by_lbcs:
+                            lbcs_matched.append(parcel)
                         else:
-                            # No LBCS data - try keyword matching on usedesc/land_use
-                            lbcs_unknown += 1
+                            lbcs_other += 1
+                    else:
+                        # No LBCS data - try keyword matching on usedesc/land_use
+                        lbcs_unknown += 1
                             
-                            if keywords:
-                                use_desc = (parcel.land_use or "").lower()
-                                for kw in keywords:
-                                    if kw.lower() in use_desc:
-                                        keyword_matched.append(parcel)
-                                        break
+                        if keywords:
+                            use_desc = (parcel.land_use or "").lower()
+                            for kw in keywords:
+                                if kw.lower() in use_desc:
+                                    keyword_matched.append(parcel)
+                                    break
                     
-                    print(f"LBCS filter: {len(lbcs_matched)} LBCS matched, {len(keyword_matched)} keyword matched, {lbcs_unknown} no LBCS, {lbcs_other} different type")
+                logger.debug("LBCS filter: %s LBCS matched, %s keyword matched, %s no LBCS, %s different type", len(lbcs_matched), len(keyword_matched), lbcs_unknown, lbcs_other)
                     
-                    # Combine LBCS matches with keyword matches (deduped)
-                    matched_ids = set(p.parcel_id for p in lbcs_matched)
-                    all_matched = lbcs_matched.copy()
-                    for p in keyword_matched:
-                        if p.parcel_id not in matched_ids:
-                            all_matched.append(p)
-                            matched_ids.add(p.parcel_id)
+                # Combine LBCS matches with keyword matches (deduped)
+                matched_ids = set(p.parcel_id for p in lbcs_matched)
+                all_matched = lbcs_matched.copy()
+                for p in keyword_matched:
+                    if p.parcel_id not in matched_ids:
+                        all_matched.append(p)
+                        matched_ids.add(p.parcel_id)
                     
-                    if all_matched:
-                        print(f"✅ Returning {len(all_matched)} matched parcels")
-                        return all_matched
-                    else:
-                        # No matches found - this is likely because:
-                        # 1. LBCS data coverage is limited (varies by county)
-                        # 2. The property type doesn't exist in this area
-                        print(f"⚠️ No parcels matched filters. LBCS coverage may be limited in this area.")
-                        return []  # Return empty, don't return unrelated parcels!
+                if all_matched:
+                    logger.info("✅ Returning %s matched parcels", len(all_matched))
+                    return all_matched
+                else:
+                    # No matches found - this is likely because:
+                    # 1. LBCS data coverage is limited (varies by county)
+                    # 2. The property type doesn't exist in this area
+                    logger.warning("⚠️ No parcels matched filters. LBCS coverage may be limited in this area.")
+                    return []  # Return empty, don't return unrelated parcels!
                 
-                return filtered_parcels
+            return filtered_parcels
                 
         except Exception as e:
-            logger.error(f"Regrid spatial query error: {e}")
+            logger.error("Regrid spatial query error: %s", e)
             import traceback
             traceback.print_exc()
             return []
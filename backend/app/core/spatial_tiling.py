@@ -0,0 +1,189 @@
+"""
+Spatial Tiling Planner
+
+Adaptive quadtree cover of a search polygon for Google Places Text Search.
+
+Text Search returns at most 60 results (3 pages) per query, so one circle
+around a large area's centroid under-samples it badly. The planner starts
+from the coarsest square cells whose search circle fits the radius limit,
+and callers split any cell that comes back saturated into four children.
+Each cell carries the circle (center + circumscribed radius) to search with.
+
+Geometry is done in a local equirectangular projection around the polygon
+centroid (meters), which is accurate enough for city/county-sized areas.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+import shapely
+from shapely.geometry import Polygon, MultiPolygon, box
+from shapely.prepared import prep
+
+METERS_PER_DEG_LAT = 110540.0
+METERS_PER_DEG_LNG_EQUATOR = 111320.0
+
+
+@dataclass
+class SearchCell:
+    """One quadtree cell: square in local meters plus its search circle."""
+    cell_id: str  # Quadtree path, e.g. "0.2.1"
+    depth: int
+    min_x: float
+    min_y: float
+    side_m: float
+    center_lat: float
+    center_lng: float
+    
+    @property
+    def radius_m(self) -> int:
+        """Radius of the circle circumscribing the square (covers its corners)."""
+        return int(math.ceil(self.side_m * math.sqrt(2) / 2))
+    
+    @property
+    def area_km2(self) -> float:
+        return self.side_m * self.side_m / 1e6
+
+
+class LocalProjection:
+    """Equirectangular lng/lat <-> meters around an origin."""
+    
+    def __init__(self, origin_lat: float, origin_lng: float):
+        self.origin_lat = origin_lat
+        self.origin_lng = origin_lng
+        self.m_per_deg_lng = METERS_PER_DEG_LNG_EQUATOR * math.cos(math.radians(origin_lat))
+    
+    def to_xy(self, lng: float, lat: float) -> Tuple[float, float]:
+        return (lng - self.origin_lng) * self.m_per_deg_lng, (lat - self.origin_lat) * METERS_PER_DEG_LAT
+    
+    def to_lnglat(self, x: float, y: float) -> Tuple[float, float]:
+        return self.origin_lng + x / self.m_per_deg_lng, self.origin_lat + y / METERS_PER_DEG_LAT
+    
+    def coords_to_xy(self, coords: np.ndarray) -> np.ndarray:
+        """Vectorized to_xy for shapely.transform (N x 2 array of lng, lat)."""
+        return np.column_stack((
+            (coords[:, 0] - self.origin_lng) * self.m_per_deg_lng,
+            (coords[:, 1] - self.origin_lat) * METERS_PER_DEG_LAT,
+        ))
+
+
+class QuadtreePlanner:
+    """Plans and subdivides square search cells covering a polygon."""
+    
+    def __init__(
+        self,
+        polygon: Union[Polygon, MultiPolygon],
+        max_radius_m: float,
+        min_side_m: float,
+    ):
+        self.polygon = polygon
+        centroid = polygon.centroid
+        self.projection = LocalProjection(centroid.y, centroid.x)
+        self.min_side_m = min_side_m
+        
+        # Polygon in local meters (for cell intersection tests)
+        self._polygon_m = shapely.transform(polygon, self.projection.coords_to_xy)
+        self._prepared = prep(self._polygon_m)
+        
+        # Largest square whose circumscribed circle fits max_radius_m
+        self.max_side_m = max_radius_m * math.sqrt(2)
+    
+    @property
+    def area_km2(self) -> float:
+        return self._polygon_m.area / 1e6
+    
+    def initial_cells(self) -> List[SearchCell]:
+        """Coarsest grid over the polygon bbox (one cell when the area is small enough)."""
+        min_x, min_y, max_x, max_y = self._polygon_m.bounds
+        extent = max(max_x - min_x, max_y - min_y, 1.0)
+        per_side = max(1, math.ceil(extent / self.max_side_m))
+        side = extent / per_side
+        
+        # Center the grid on the bbox
+        origin_x = (min_x + max_x) / 2 - side * per_side / 2
+        origin_y = (min_y + max_y) / 2 - side * per_side / 2
+        
+        cells = []
+        for i in range(per_side):
+            for j in range(per_side):
+                cell = self._make_cell(f"{i * per_side + j}", 0, origin_x + i * side, origin_y + j * side, side)
+                if cell:
+                    cells.append(cell)
+        return cells
+    
+    def spread_order(
+        self,
+        cells: List[SearchCell],
+        points: Sequence[Tuple[float, float]] = (),
+    ) -> List[SearchCell]:
+        """
+        Order cells so that any prefix of the list spans the polygon.
+        
+        Cells containing the given (lng, lat) points come first, most
+        points first. The rest follow farthest-first: each next cell is
+        the one farthest from every cell already ordered, so truncating
+        the list under a budget thins the cover evenly instead of
+        dropping one side of the polygon.
+        """
+        def center(cell: SearchCell) -> Tuple[float, float]:
+            return cell.min_x + cell.side_m / 2, cell.min_y + cell.side_m / 2
+        
+        hits = [0] * len(cells)
+        for lng, lat in points:
+            x, y = self.projection.to_xy(lng, lat)
+            for k, cell in enumerate(cells):
+                if cell.min_x <= x < cell.min_x + cell.side_m and cell.min_y <= y < cell.min_y + cell.side_m:
+                    hits[k] += 1
+                    break
+        
+        ordered = sorted((k for k in range(len(cells)) if hits[k]), key=lambda k: -hits[k])
+        rest = [k for k in range(len(cells)) if not hits[k]]
+        if not rest:
+            return [cells[k] for k in ordered]
+        
+        # Distance from each remaining cell to the nearest ordered one (or
+        # to the polygon centroid, the projection origin, when none is)
+        anchors = [center(cells[k]) for k in ordered] or [(0.0, 0.0)]
+        nearest = {
+            k: min(math.dist(center(cells[k]), anchor) for anchor in anchors)
+            for k in rest
+        }
+        while nearest:
+            pick = max(nearest, key=nearest.get) if ordered else min(nearest, key=nearest.get)
+            ordered.append(pick)
+            del nearest[pick]
+            picked = center(cells[pick])
+            for k in nearest:
+                nearest[k] = min(nearest[k], math.dist(center(cells[k]), picked))
+        return [cells[k] for k in ordered]
+    
+    def can_split(self, cell: SearchCell) -> bool:
+        return cell.side_m / 2 >= self.min_side_m
+    
+    def split(self, cell: SearchCell) -> List[SearchCell]:
+        """Four children of a cell, keeping only those that touch the polygon."""
+        half = cell.side_m / 2
+        children = []
+        for k, (dx, dy) in enumerate(((0, 0), (half, 0), (0, half), (half, half))):
+            child = self._make_cell(f"{cell.cell_id}.{k}", cell.depth + 1, cell.min_x + dx, cell.min_y + dy, half)
+            if child:
+                children.append(child)
+        return children
+    
+    def _make_cell(self, cell_id: str, depth: int, min_x: float, min_y: float, side: float):
+        square = box(min_x, min_y, min_x + side, min_y + side)
+        if not self._prepared.intersects(square):
+            return None
+        lng, lat = self.projection.to_lnglat(min_x + side / 2, min_y + side / 2)
+        return SearchCell(
+            cell_id=cell_id,
+            depth=depth,
+            min_x=min_x,
+            min_y=min_y,
+            side_m=side,
+            center_lat=lat,
+            center_lng=lng,
+        )
+
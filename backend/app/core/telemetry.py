@@ -0,0 +1,357 @@
+"""
+Pipeline Telemetry
+
+Structured spans around discovery pipeline stages (Regrid pagination,
+imagery, VLM scoring, LLM enrichment), replacing timing-by-log-line.
+
+    with telemetry.job(job_key, pipeline="regrid_first") as trace:
+        with telemetry.span("regrid.query", lbcs_field=field) as span:
+            parcels = await regrid_service.search_parcels_by_lbcs(...)
+            span.set(parcels=len(parcels))
+        ...
+        trace.breakdown()  # -> per-stage count / seconds / bytes / tokens / cost
+
+Spans carry job/parcel ids plus the numeric attributes bytes, tokens and
+cost_usd, which are summed per stage. Finished spans feed:
+
+- the per-job stage breakdown (sent in the `complete` SSE message)
+- Prometheus histograms / counters rendered at /metrics
+- OpenTelemetry, when opentelemetry-api (+ an SDK/exporter) is installed;
+  ids use the OTel formats (16-byte trace id, 8-byte span id) either way,
+  and recent job traces are kept as OTLP-shaped JSON for /usage/traces
+
+The current job and span live in contextvars, so services deep in the call
+stack attach their spans to whichever job is running without threading ids.
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+
+logger = logging.getLogger(__name__)
+
+try:
+    from opentelemetry import trace as otel_trace
+    OTEL_AVAILABLE = True
+except ImportError:
+    otel_trace = None
+    OTEL_AVAILABLE = False
+
+# Attributes summed per stage (everything else is a plain label)
+NUMERIC_ATTRIBUTES = ("bytes", "tokens", "cost_usd")
+
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+MAX_SPANS_PER_JOB = 5000
+MAX_FINISHED_JOBS = 100
+
+
+def _new_id(num_bytes: int) -> str:
+    return os.urandom(num_bytes).hex()
+
+
+@dataclass
+class Span:
+    """One timed stage; attributes end up on the OTel span and in stage totals."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    _otel: Any = field(default=None, repr=False)
+
+    def set(self, **attributes: Any) -> "Span":
+        """Set attributes (None values are skipped)."""
+        for key, value in attributes.items():
+            if value is not None:
+                self.attributes[key] = value
+        return self
+
+    def add(self, **amounts: float) -> "Span":
+        """Accumulate numeric attributes (bytes, tokens, cost_usd)."""
+        for key, amount in amounts.items():
+            if amount:
+                self.attributes[key] = self.attributes.get(key, 0) + amount
+        return self
+
+    @property
+    def duration_s(self) -> float:
+        return max(0, (self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON span shape."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+@dataclass
+class StageTotals:
+    count: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+    tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, span: Span) -> None:
+        self.count += 1
+        self.errors += 1 if span.error else 0
+        self.seconds += span.duration_s
+        self.bytes += int(span.attributes.get("bytes", 0))
+        self.tokens += int(span.attributes.get("tokens", 0))
+        self.cost_usd += float(span.attributes.get("cost_usd", 0.0))
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {"count": self.count, "seconds": round(self.seconds, 3)}
+        if self.errors:
+            result["errors"] = self.errors
+        if self.bytes:
+            result["bytes"] = self.bytes
+        if self.tokens:
+            result["tokens"] = self.tokens
+        if self.cost_usd:
+            result["cost_usd"] = round(self.cost_usd, 6)
+        return result
+
+
+@dataclass
+class JobTrace:
+    """All spans of one discovery job, plus per-stage totals."""
+    job_id: str
+    pipeline: str
+    trace_id: str = field(default_factory=lambda: _new_id(16))
+    root: Optional[Span] = None
+    spans: List[Span] = field(default_factory=list)
+    stages: Dict[str, StageTotals] = field(default_factory=dict)
+    dropped_spans: int = 0
+
+    def record(self, span: Span) -> None:
+        self.stages.setdefault(span.name, StageTotals()).add(span)
+        if len(self.spans) < MAX_SPANS_PER_JOB:
+            self.spans.append(span)
+        else:
+            self.dropped_spans += 1
+
+    def breakdown(self) -> Dict[str, Any]:
+        """Per-stage totals, slowest first, plus wall time so far."""
+        stages = sorted(self.stages.items(), key=lambda item: -item[1].seconds)
+        return {
+            "total_seconds": round(self.root.duration_s, 3) if self.root else None,
+            "stages": {name: totals.to_dict() for name, totals in stages},
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        spans = ([self.root] if self.root else []) + self.spans
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "worksight-api"}}]},
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [s.to_otlp() for s in spans],
+                }],
+            }],
+        }
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.n = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.total += value
+        self.n += 1
+
+
+_current_job: ContextVar[Optional[JobTrace]] = ContextVar("telemetry_job", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("telemetry_span", default=None)
+
+
+class Telemetry:
+    """Span recorder, per-job stage breakdowns and the Prometheus registry."""
+
+    def __init__(self):
+        self._durations: Dict[Tuple[str, str], _Histogram] = {}
+        self._totals: Dict[Tuple[str, str, str], float] = {}  # (metric, pipeline, stage) -> value
+        self._finished: "OrderedDict[str, JobTrace]" = OrderedDict()
+        self._tracer = otel_trace.get_tracer(__name__) if OTEL_AVAILABLE else None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def job(self, job_id: str, pipeline: str) -> Iterator[JobTrace]:
+        """Root span for a discovery job; spans opened inside attach to it."""
+        trace = JobTrace(job_id=job_id, pipeline=pipeline)
+        trace.root = self._start("job", trace.trace_id, None, {"job_id": job_id, "pipeline": pipeline})
+        previous_job, previous_span = _current_job.get(), _current_span.get()
+        # set() rather than reset(token): the job may wrap an async generator that is
+        # finalized from a different context
+        _current_job.set(trace)
+        _current_span.set(trace.root)
+        try:
+            yield trace
+        except BaseException as e:
+            trace.root.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._finish(trace.root, trace, record_stage=False)
+            self._observe(trace.pipeline, "job", trace.root)
+            _current_job.set(previous_job)
+            _current_span.set(previous_span)
+            self._finished[job_id] = trace
+            self._finished.move_to_end(job_id)
+            while len(self._finished) > MAX_FINISHED_JOBS:
+                self._finished.popitem(last=False)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Time a stage. Works outside a job too (metrics only, pipeline="none").
+
+        Args:
+            name: Stage name, dotted for sub-stages ("imagery.fetch")
+            **attributes: parcel_id, address, model, ... (None values skipped)
+        """
+        trace = _current_job.get()
+        parent = _current_span.get()
+        if trace:
+            attributes.setdefault("job_id", trace.job_id)
+        span = self._start(name, trace.trace_id if trace else _new_id(16), parent, attributes)
+        previous = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(previous)
+            self._finish(span, trace)
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    def current_breakdown(self) -> Optional[Dict[str, Any]]:
+        trace = _current_job.get()
+        return trace.breakdown() if trace else None
+
+    def _start(self, name: str, trace_id: str, parent: Optional[Span], attributes: Dict[str, Any]) -> Span:
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=_new_id(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.time_ns(),
+        )
+        span.set(**attributes)
+        if self._tracer:
+            context = otel_trace.set_span_in_context(parent._otel) if parent is not None and parent._otel else None
+            span._otel = self._tracer.start_span(name, context=context, start_time=span.start_ns)
+        return span
+
+    def _finish(self, span: Span, trace: Optional[JobTrace], record_stage: bool = True) -> None:
+        span.end_ns = time.time_ns()
+        if span._otel is not None:
+            try:
+                for key, value in span.attributes.items():
+                    span._otel.set_attribute(key, value if isinstance(value, (bool, int, float, str)) else str(value))
+                if span.error:
+                    span._otel.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, span.error))
+                span._otel.end(end_time=span.end_ns)
+            except Exception as e:
+                logger.debug("OpenTelemetry export failed for %s: %s", span.name, e)
+        if record_stage:
+            if trace:
+                trace.record(span)
+            self._observe(trace.pipeline if trace else "none", span.name, span)
+
+    def _observe(self, pipeline: str, stage: str, span: Span) -> None:
+        histogram = self._durations.get((pipeline, stage))
+        if histogram is None:
+            histogram = self._durations[(pipeline, stage)] = _Histogram(DURATION_BUCKETS)
+        histogram.observe(span.duration_s)
+        for metric in NUMERIC_ATTRIBUTES:
+            value = span.attributes.get(metric)
+            if value:
+                key = (metric, pipeline, stage)
+                self._totals[key] = self._totals.get(key, 0) + value
+        if span.error:
+            key = ("errors", pipeline, stage)
+            self._totals[key] = self._totals.get(key, 0) + 1
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def get_trace(self, job_id: str) -> Optional[JobTrace]:
+        """Finished (or, if still current, running) trace for a job."""
+        current = _current_job.get()
+        if current and current.job_id == job_id:
+            return current
+        return self._finished.get(job_id)
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = [
+            "# HELP worksight_stage_duration_seconds Discovery pipeline stage duration",
+            "# TYPE worksight_stage_duration_seconds histogram",
+        ]
+        for (pipeline, stage), histogram in sorted(self._durations.items()):
+            labels = f'pipeline="{pipeline}",stage="{stage}"'
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                lines.append(f'worksight_stage_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'worksight_stage_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.n}')
+            lines.append(f"worksight_stage_duration_seconds_sum{{{labels}}} {histogram.total:.6f}")
+            lines.append(f"worksight_stage_duration_seconds_count{{{labels}}} {histogram.n}")
+
+        counters = {
+            "bytes": ("worksight_stage_bytes_total", "Bytes transferred per stage (images, pages)"),
+            "tokens": ("worksight_stage_tokens_total", "LLM/VLM tokens per stage"),
+            "cost_usd": ("worksight_stage_cost_usd_total", "Provider-reported cost per stage in USD"),
+            "errors": ("worksight_stage_errors_total", "Stage spans that ended in an exception"),
+        }
+        for metric, (name, help_text) in counters.items():
+            rows = sorted((k, v) for k, v in self._totals.items() if k[0] == metric)
+            if not rows:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for (_, pipeline, stage), value in rows:
+                lines.append(f'{name}{{pipeline="{pipeline}",stage="{stage}"}} {value:g}')
+        return "\n".join(lines) + "\n"
+
+
+# Singleton instance
+telemetry = Telemetry()
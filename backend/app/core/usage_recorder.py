@@ -0,0 +1,222 @@
+"""
+Usage Recorder
+
+Buffers UsageLog rows in memory and writes them in bulk from a background
+thread on its own connection, instead of a db.add() + db.commit() on the
+caller's session for every billable call.
+
+- Flushes when USAGE_FLUSH_MAX_ROWS rows are buffered or every
+  USAGE_FLUSH_INTERVAL_SECONDS, whichever comes first
+- Failed flushes are retried; if the buffer exceeds USAGE_BUFFER_MAX_ROWS
+  the oldest rows are dropped and counted
+- close() (app shutdown / interpreter exit) flushes whatever is left
+- Each flush also adds the batch to usage_daily_rollups in the same
+  transaction, so the rollup never drifts from usage_logs
+"""
+
+import atexit
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone, date
+from decimal import Decimal
+from typing import Optional, Dict, Any, List, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.db.base import engine
+from app.models.usage_log import UsageLog
+from app.models.usage_daily_rollup import UsageDailyRollup
+
+logger = logging.getLogger(__name__)
+
+# Every buffered row carries every column so batches insert as one executemany
+USAGE_LOG_COLUMNS = [c.name for c in UsageLog.__table__.columns]
+
+
+def rollup_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Aggregate usage rows into (user_id, service, UTC day) rollup deltas."""
+    totals: Dict[Tuple[Any, str, date], Dict[str, Any]] = defaultdict(
+        lambda: {"request_count": 0, "api_calls": 0, "total_tokens": 0, "total_cost": Decimal("0")}
+    )
+    for row in rows:
+        created_at = row["created_at"]
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc)
+        bucket = totals[(row["user_id"], row["service"], created_at.date())]
+        bucket["request_count"] += 1
+        bucket["api_calls"] += row.get("api_calls") or 1
+        bucket["total_tokens"] += row.get("tokens_used") or 0
+        bucket["total_cost"] += Decimal(str(row.get("cost_estimate") or 0))
+    
+    now = datetime.now(timezone.utc)
+    return [
+        {"user_id": user_id, "service": service, "day": day, "updated_at": now, **values}
+        for (user_id, service, day), values in totals.items()
+    ]
+
+
+class UsageRecorder:
+    """In-memory UsageLog buffer with size/time-triggered bulk flushes."""
+    
+    def __init__(
+        self,
+        flush_max_rows: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+        buffer_max_rows: Optional[int] = None,
+    ):
+        self.flush_max_rows = flush_max_rows or settings.USAGE_FLUSH_MAX_ROWS
+        self.flush_interval_seconds = flush_interval_seconds or settings.USAGE_FLUSH_INTERVAL_SECONDS
+        self.buffer_max_rows = buffer_max_rows or settings.USAGE_BUFFER_MAX_ROWS
+        
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()  # Guards _buffer
+        self._flush_lock = threading.Lock()  # One flush at a time
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+        # Metrics
+        self._recorded = 0
+        self._flushed = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._dropped = 0
+        self._last_flush_at: Optional[datetime] = None
+        self._last_error: Optional[str] = None
+    
+    def record(self, **values: Any) -> UsageLog:
+        """
+        Buffer one usage row (UsageLog column values).
+        
+        Returns a transient UsageLog with id and created_at filled in, so
+        callers get the same object shape as before; it is not attached to
+        any session.
+        """
+        values.setdefault("id", uuid.uuid4())
+        values.setdefault("api_calls", 1)
+        values.setdefault("created_at", datetime.now(timezone.utc))
+        row = {column: values.get(column) for column in USAGE_LOG_COLUMNS}
+        
+        with self._lock:
+            self._buffer.append(row)
+            self._recorded += 1
+            self._trim_locked()
+            should_wake = len(self._buffer) >= self.flush_max_rows
+        
+        self._ensure_started()
+        if should_wake:
+            self._wake.set()
+        
+        return UsageLog(**row)
+    
+    def flush(self) -> int:
+        """Write all buffered rows now. Returns the number of rows written."""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+            
+            try:
+                with engine.begin() as conn:
+                    self._write(conn, rows)
+            except Exception as e:
+                self._failed_flushes += 1
+                self._last_error = str(e)
+                logger.warning("[Usage] Flush of %s rows failed, will retry: %s", len(rows), e)
+                with self._lock:
+                    self._buffer[:0] = rows  # Keep original order
+                    self._trim_locked()
+                return 0
+            
+            self._flushes += 1
+            self._flushed += len(rows)
+            self._last_flush_at = datetime.now(timezone.utc)
+            logger.debug("[Usage] Flushed %s usage rows", len(rows))
+            return len(rows)
+    
+    def _write(self, conn, rows: List[Dict[str, Any]]) -> None:
+        """Bulk insert one batch and fold it into the daily rollups (same transaction)."""
+        conn.execute(insert(UsageLog.__table__), rows)
+        
+        rollups = rollup_rows(rows)
+        if rollups:
+            table = UsageDailyRollup.__table__
+            stmt = pg_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "service", "day"],
+                set_={
+                    "request_count": table.c.request_count + stmt.excluded.request_count,
+                    "api_calls": table.c.api_calls + stmt.excluded.api_calls,
+                    "total_tokens": table.c.total_tokens + stmt.excluded.total_tokens,
+                    "total_cost": table.c.total_cost + stmt.excluded.total_cost,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            conn.execute(stmt, rollups)
+    
+    def close(self) -> None:
+        """Stop the flush thread and write out anything still buffered."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.flush_interval_seconds + 5)
+        self.flush()
+        with self._lock:
+            remaining = len(self._buffer)
+            self._buffer = []
+        if remaining:
+            self._dropped += remaining
+            logger.error("[Usage] %s usage rows could not be written at shutdown", remaining)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            buffered = len(self._buffer)
+        return {
+            "buffered": buffered,
+            "recorded": self._recorded,
+            "flushed": self._flushed,
+            "flushes": self._flushes,
+            "failed_flushes": self._failed_flushes,
+            "dropped": self._dropped,
+            "last_flush_at": self._last_flush_at.isoformat() if self._last_flush_at else None,
+            "last_error": self._last_error,
+        }
+    
+    def _trim_locked(self) -> None:
+        overflow = len(self._buffer) - self.buffer_max_rows
+        if overflow > 0:
+            del self._buffer[:overflow]
+            self._dropped += overflow
+            logger.error("[Usage] Buffer full, dropped %s oldest usage rows", overflow)
+    
+    def _ensure_started(self) -> None:
+        if self._thread is not None or self._stopped.is_set():
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="usage-recorder", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+    
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(timeout=self.flush_interval_seconds)
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error("[Usage] Flush thread error: %s", e)
+                time.sleep(1)
+
+
+# Singleton instance
+usage_recorder = UsageRecorder()
@@ -3,6 +3,10 @@ Usage Tracking Service
 
 Tracks API usage for monitoring and quota management.
 
+Rows are written through the buffered usage_recorder (bulk, own connection);
+the db argument on the log_* methods is kept for call-site compatibility and
+is no longer committed.
+
 BILLING MODELS:
 - OpenRouter: Per-token billing, returns actual cost in API response
 - Google Places: Per-request (~$17-32/1K) with $200 free credit/month
@@ -15,10 +19,13 @@ from typing import Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, text
 from decimal import Decimal
 
+from app.core.config import settings
 from app.models.usage_log import UsageLog
+from app.models.usage_daily_rollup import UsageDailyRollup
+from app.core.usage_recorder import usage_recorder
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +41,7 @@ SERVICE_INFO = {
     "google_places": {
         "billing": "per_request",
         "note": "$200 free credit/month, then ~$17-32/1K requests",
-        "estimate_per_call": 0.02,  # ~$20/1K average
+        "estimate_per_call": settings.PLACES_TEXT_SEARCH_COST_USD,  # Text Search price; Details are cheaper
     },
     "regrid": {
         "billing": "subscription",
@@ -59,7 +66,7 @@ class UsageTrackingService:
     
     def log_api_call(
         self,
-        db: Session,
+        db: Optional[Session],
         user_id: UUID,
         service: str,
         operation: Optional[str] = None,
@@ -90,7 +97,7 @@ class UsageTrackingService:
             # Free or subscription-based - no per-call cost
             cost_estimate = 0.0
         
-        log = UsageLog(
+        log = usage_recorder.record(
             user_id=user_id,
             service=service,
             operation=operation,
@@ -102,22 +109,19 @@ class UsageTrackingService:
             extra_data=metadata,
         )
         
-        db.add(log)
-        db.commit()
-        
         # Log differently based on billing type
         if actual_cost:
-            logger.info(f"[Usage] {service}: ${actual_cost:.4f} (actual) user={user_id}")
+            logger.info("[Usage] %s: $%.4f (actual) user=%s", service, actual_cost, user_id)
         elif cost_estimate > 0:
-            logger.info(f"[Usage] {service} x{api_calls}: ~${cost_estimate:.4f} (est) user={user_id}")
+            logger.info("[Usage] %s x%s: ~$%.4f (est) user=%s", service, api_calls, cost_estimate, user_id)
         else:
-            logger.info(f"[Usage] {service} x{api_calls} (quota/free) user={user_id}")
+            logger.info("[Usage] %s x%s (quota/free) user=%s", service, api_calls, user_id)
         
         return log
     
     def log_openrouter_call(
         self,
-        db: Session,
+        db: Optional[Session],
         user_id: UUID,
         model: str,
         tokens_used: int,
@@ -137,7 +141,7 @@ class UsageTrackingService:
             **(metadata or {}),
         }
         
-        log = UsageLog(
+        log = usage_recorder.record(
             user_id=user_id,
             service="openrouter",
             operation="vlm_analysis",
@@ -149,18 +153,15 @@ class UsageTrackingService:
             extra_data=log_metadata,
         )
         
-        db.add(log)
-        db.commit()
-        
         logger.info(
-            f"[Usage] OpenRouter {model}: {tokens_used} tokens, ${actual_cost:.6f} user={user_id}"
+            "[Usage] OpenRouter %s: %s tokens, $%.6f user=%s", model, tokens_used, actual_cost, user_id
         )
         
         return log
     
     def log_discovery_job(
         self,
-        db: Session,
+        db: Optional[Session],
         user_id: UUID,
         job_id: UUID,
         properties_found: int = 0,
@@ -168,6 +169,9 @@ class UsageTrackingService:
         properties_analyzed: int = 0,
         businesses_loaded: int = 0,
         vlm_total_cost: float = 0.0,  # Actual cost from OpenRouter
+        places_cost_est: Optional[float] = None,  # Places estimate from the job budget (default: per business loaded)
+        imagery_cost_est: float = 0.0,  # Static Maps estimate (from the job budget)
+        enrichment_cost_est: float = 0.0,  # LLM enrichment estimate (from the job budget) - metadata only, not billed
         metadata: Optional[Dict[str, Any]] = None
     ) -> UsageLog:
         """
@@ -175,15 +179,17 @@ class UsageTrackingService:
         
         Cost breakdown:
         - Regrid: Subscription (no per-call cost)
-        - Satellite: Free (raw tiles)
-        - Google Places: ~$0.02/call with $200 free credit
+        - Satellite: Static Maps estimate when a Google key is set, else free (ESRI tiles)
+        - Google Places: Text Search / Details calls at PLACES_*_COST_USD, with $200 free credit
         - VLM: Actual cost from OpenRouter
+        - Enrichment: Per-property estimate, recorded for reference only (not
+          in the total, like the /enrich endpoint)
         """
-        # Only Google Places has per-call cost estimate
-        places_cost_est = SERVICE_INFO["google_places"]["estimate_per_call"] * businesses_loaded
+        if places_cost_est is None:
+            places_cost_est = SERVICE_INFO["google_places"]["estimate_per_call"] * businesses_loaded
         
-        # Total cost = Places estimate + actual VLM cost
-        total_cost = places_cost_est + vlm_total_cost
+        # Total cost = estimates + actual VLM cost (counts toward USER_DAILY_BUDGET_USD)
+        total_cost = places_cost_est + imagery_cost_est + vlm_total_cost
         
         log_metadata = {
             "properties_found": properties_found,
@@ -193,13 +199,14 @@ class UsageTrackingService:
             "cost_breakdown": {
                 "google_places_est": round(places_cost_est, 4),
                 "vlm_actual": round(vlm_total_cost, 4),
+                "satellite_est": round(imagery_cost_est, 4),
+                "enrichment_est": round(enrichment_cost_est, 4),
                 "regrid": "subscription (no per-call)",
-                "satellite": "free (raw tiles)",
             },
             **(metadata or {}),
         }
         
-        log = UsageLog(
+        log = usage_recorder.record(
             user_id=user_id,
             service="discovery_pipeline",
             operation="discovery_job",
@@ -209,12 +216,9 @@ class UsageTrackingService:
             extra_data=log_metadata,
         )
         
-        db.add(log)
-        db.commit()
-        
         logger.info(
-            f"[Usage] Discovery job: {properties_found} properties, {businesses_loaded} businesses, "
-            f"${total_cost:.4f} total (Places ~${places_cost_est:.4f} + VLM ${vlm_total_cost:.4f}) user={user_id}"
+            "[Usage] Discovery job: %s properties, %s businesses, $%.4f total (Places ~$%.4f + VLM $%.4f) user=%s",
+            properties_found, businesses_loaded, total_cost, places_cost_est, vlm_total_cost, user_id
         )
         
         return log
@@ -225,35 +229,41 @@ class UsageTrackingService:
         user_id: UUID,
         days: int = 30
     ) -> Dict[str, Any]:
-        """Get usage summary for a user over the past N days."""
-        since = datetime.utcnow() - timedelta(days=days)
+        """Get usage summary for a user over the past N days (from daily rollups)."""
+        since_day = (datetime.utcnow() - timedelta(days=days)).date()
+        usage_recorder.flush()  # Include rows still sitting in the buffer
         
-        # Query usage logs
-        logs = db.query(UsageLog).filter(
-            UsageLog.user_id == user_id,
-            UsageLog.created_at >= since
+        results = db.query(
+            UsageDailyRollup.service,
+            func.sum(UsageDailyRollup.request_count).label("request_count"),
+            func.sum(UsageDailyRollup.api_calls).label("api_calls"),
+            func.sum(UsageDailyRollup.total_cost).label("total_cost"),
+            func.sum(UsageDailyRollup.total_tokens).label("total_tokens"),
+        ).filter(
+            UsageDailyRollup.user_id == user_id,
+            UsageDailyRollup.day >= since_day
+        ).group_by(
+            UsageDailyRollup.service
         ).all()
         
         # Aggregate by service
-        by_service = {}
-        for log in logs:
-            if log.service not in by_service:
-                by_service[log.service] = {
-                    "count": 0,
-                    "total_cost": 0.0,
-                    "total_tokens": 0,
-                    "billing": SERVICE_INFO.get(log.service, {}).get("billing", "unknown"),
-                }
-            by_service[log.service]["count"] += log.api_calls or 1
-            by_service[log.service]["total_cost"] += float(log.cost_estimate or 0)
-            by_service[log.service]["total_tokens"] += log.tokens_used or 0
+        by_service = {
+            r.service: {
+                "count": int(r.api_calls or 0),
+                "total_cost": float(r.total_cost or 0),
+                "total_tokens": int(r.total_tokens or 0),
+                "billing": SERVICE_INFO.get(r.service, {}).get("billing", "unknown"),
+            }
+            for r in results
+        }
         
-        total_cost = sum(float(log.cost_estimate or 0) for log in logs)
-        total_tokens = sum(log.tokens_used or 0 for log in logs)
+        total_requests = sum(int(r.request_count or 0) for r in results)
+        total_cost = sum(float(r.total_cost or 0) for r in results)
+        total_tokens = sum(int(r.total_tokens or 0) for r in results)
         
         return {
             "period_days": days,
-            "total_requests": len(logs),
+            "total_requests": total_requests,
             "total_cost_usd": round(total_cost, 4),
             "total_tokens": total_tokens,
             "by_service": by_service,
@@ -271,33 +281,84 @@ class UsageTrackingService:
         user_id: UUID,
         days: int = 7
     ) -> list:
-        """Get daily usage breakdown for a user."""
-        since = datetime.utcnow() - timedelta(days=days)
+        """Get daily usage breakdown for a user (from daily rollups)."""
+        since_day = (datetime.utcnow() - timedelta(days=days)).date()
+        usage_recorder.flush()  # Include rows still sitting in the buffer
         
-        # Query with date grouping
         results = db.query(
-            func.date(UsageLog.created_at).label("date"),
-            func.count(UsageLog.id).label("request_count"),
-            func.sum(UsageLog.cost_estimate).label("total_cost"),
-            func.sum(UsageLog.tokens_used).label("total_tokens"),
+            UsageDailyRollup.day.label("date"),
+            func.sum(UsageDailyRollup.request_count).label("request_count"),
+            func.sum(UsageDailyRollup.total_cost).label("total_cost"),
+            func.sum(UsageDailyRollup.total_tokens).label("total_tokens"),
         ).filter(
-            UsageLog.user_id == user_id,
-            UsageLog.created_at >= since
+            UsageDailyRollup.user_id == user_id,
+            UsageDailyRollup.day >= since_day
         ).group_by(
-            func.date(UsageLog.created_at)
+            UsageDailyRollup.day
         ).order_by(
-            func.date(UsageLog.created_at)
+            UsageDailyRollup.day
         ).all()
         
         return [
             {
                 "date": str(r.date),
-                "request_count": r.request_count,
+                "request_count": int(r.request_count or 0),
                 "total_cost_usd": round(float(r.total_cost or 0), 4),
-                "total_tokens": r.total_tokens or 0,
+                "total_tokens": int(r.total_tokens or 0),
             }
             for r in results
         ]
+    
+    def backfill_daily_rollups(
+        self,
+        db: Session,
+        days: Optional[int] = None,
+        user_id: Optional[UUID] = None,
+    ) -> int:
+        """
+        Rebuild usage_daily_rollups from usage_logs with one INSERT ... SELECT ... GROUP BY.
+        
+        Rows for the covered days are recomputed (not added to), so this is
+        safe to re-run. Returns the number of rollup rows written.
+        """
+        usage_recorder.flush()
+        
+        conditions = []
+        params: Dict[str, Any] = {}
+        if days is not None:
+            conditions.append("(created_at AT TIME ZONE 'UTC')::date >= :since_day")
+            params["since_day"] = (datetime.utcnow() - timedelta(days=days)).date()
+        if user_id is not None:
+            conditions.append("user_id = :user_id")
+            params["user_id"] = user_id
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        result = db.execute(text(f"""
+            INSERT INTO usage_daily_rollups
+                (user_id, service, day, request_count, api_calls, total_tokens, total_cost, updated_at)
+            SELECT
+                user_id,
+                service,
+                (created_at AT TIME ZONE 'UTC')::date AS day,
+                COUNT(*),
+                SUM(COALESCE(api_calls, 1)),
+                SUM(COALESCE(tokens_used, 0)),
+                SUM(COALESCE(cost_estimate, 0)),
+                NOW()
+            FROM usage_logs
+            {where}
+            GROUP BY user_id, service, (created_at AT TIME ZONE 'UTC')::date
+            ON CONFLICT (user_id, service, day) DO UPDATE SET
+                request_count = EXCLUDED.request_count,
+                api_calls = EXCLUDED.api_calls,
+                total_tokens = EXCLUDED.total_tokens,
+                total_cost = EXCLUDED.total_cost,
+                updated_at = EXCLUDED.updated_at
+        """), params)
+        db.commit()
+        
+        logger.info("[Usage] Backfilled %s daily rollup rows", result.rowcount)
+        return result.rowcount
 
 
 # Singleton instance
@@ -0,0 +1,101 @@
+"""
+Authenticated User Cache
+
+In-process TTL + LRU cache of User rows for get_current_user, so polling and
+per-tile endpoints don't check out a pooled connection just to load the
+caller on every request.
+
+- Entries are detached column snapshots keyed by user id; relationships are
+  never cached and lazy-load through the request session as before
+- get_current_user merges the snapshot into the request session with
+  load=False (no SELECT), so endpoints can keep mutating and committing
+  current_user; the snapshot itself is never modified
+- The TTL bounds how long a change made outside the API (deactivation in
+  the DB) takes to apply; /settings changes invalidate immediately
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.models.user import User
+
+
+class UserCache:
+    """TTL + LRU cache of detached User snapshots."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.USER_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or settings.USER_CACHE_MAX_ENTRIES
+        # user id -> (expires_at, snapshot)
+        self._entries: "OrderedDict[str, Tuple[float, User]]" = OrderedDict()
+        # Settings endpoints run in the threadpool, auth dependencies on the event loop
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, user_id: str) -> Optional[User]:
+        """Cached snapshot (detached - merge it before use in a session), or None."""
+        if not self.enabled:
+            return None
+        key = str(user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user: User) -> None:
+        """Snapshot a loaded User's columns."""
+        if not self.enabled:
+            return
+        snapshot = User(**{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs})
+        make_transient_to_detached(snapshot)
+        key = str(user.id)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id) -> None:
+        """Drop a user's entry (call after committing changes to the row)."""
+        with self._lock:
+            if self._entries.pop(str(user_id), None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate_pct": round(100.0 * self.hits / total, 1) if total else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+# Singleton instance
+user_cache = UserCache()
@@ -11,11 +11,13 @@ through a single API with the same OpenAI SDK interface.
 import logging
 import json
 import base64
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.core.openrouter_client_pool import openrouter_client_pool
+from app.core.telemetry import telemetry
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,15 @@ MEDIUM SCORE (40-79): Moderate paved areas with some wear visible, or properties
 LOW SCORE (0-39): Small paved areas, newly paved/well-maintained surfaces, or properties that are mostly buildings and landscaping with minimal pavement."""
 
 
+SYSTEM_PROMPT = """You are a commercial property analyst specializing in pavement and surface condition assessment. 
+
+You analyze satellite imagery of properties to score them as potential leads for pavement maintenance, sealcoating, and repair services.
+
+The image shows a property with a RED BOUNDARY LINE indicating the exact parcel boundaries. Focus your analysis on what's INSIDE this boundary.
+
+Always respond with valid JSON only, no markdown formatting."""
+
+
 @dataclass
 class VLMObservations:
     """Structured observations from VLM analysis."""
@@ -60,6 +71,7 @@ class VLMAnalysisResult:
     raw_response: Optional[Dict[str, Any]]
     usage: Optional[VLMUsageInfo] = None  # Actual usage/cost from OpenRouter
     error_message: Optional[str] = None
+    cached: bool = False  # Served from VLM result cache (no API call, no cost)
     
     @classmethod
     def from_error(cls, error: str) -> 'VLMAnalysisResult':
@@ -84,50 +96,24 @@ class VLMAnalysisService:
     OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
     
     def __init__(self):
-        self.default_client: Optional[AsyncOpenAI] = None
         if settings.OPENROUTER_API_KEY:
-            # OpenRouter uses the same OpenAI SDK interface with different base_url
-            self.default_client = AsyncOpenAI(
-                base_url=self.OPENROUTER_BASE_URL,
-                api_key=settings.OPENROUTER_API_KEY,
-            )
             logger.info("VLM Analysis Service initialized with OpenRouter (system key)")
         else:
             logger.warning("OPENROUTER_API_KEY not set - VLM analysis requires user's own key")
     
     def _get_client(self, user_api_key: Optional[str] = None) -> Optional[AsyncOpenAI]:
-        """Get OpenAI client - uses user's key if provided, otherwise system key."""
+        """Get pooled OpenAI client - uses user's key if provided, otherwise system key."""
         if user_api_key:
             logger.info("  [VLM] Using user's own OpenRouter API key")
-            return AsyncOpenAI(
-                base_url=self.OPENROUTER_BASE_URL,
-                api_key=user_api_key,
-            )
-        return self.default_client
+            return openrouter_client_pool.get(user_api_key, self.OPENROUTER_BASE_URL)
+        return openrouter_client_pool.get(settings.OPENROUTER_API_KEY, self.OPENROUTER_BASE_URL)
     
-    async def analyze_property(
+    def build_prompts(
         self,
-        image_base64: str,
         scoring_prompt: Optional[str] = None,
         property_context: Optional[Dict[str, Any]] = None,
-        user_api_key: Optional[str] = None,  # User's own OpenRouter key
-    ) -> VLMAnalysisResult:
-        """
-        Analyze a property satellite image and score it as a lead.
-        
-        Args:
-            image_base64: Base64-encoded JPEG image of the property
-            scoring_prompt: User's criteria for scoring (uses default if None)
-            property_context: Optional dict with Regrid data (address, owner, etc.)
-            user_api_key: User's own OpenRouter API key (optional, uses system key if not provided)
-            
-        Returns:
-            VLMAnalysisResult with score, reasoning, and observations
-        """
-        client = self._get_client(user_api_key)
-        if not client:
-            return VLMAnalysisResult.from_error("No OpenRouter API key available (set your own in Settings)")
-        
+    ) -> Tuple[str, str]:
+        """Build the (system, user) prompt pair sent alongside the image."""
         # Use default prompt if not provided
         effective_prompt = scoring_prompt or DEFAULT_SCORING_PROMPT
         
@@ -146,14 +132,6 @@ class VLMAnalysisService:
             if context_parts:
                 context_str = " | ".join(context_parts)
         
-        system_prompt = """You are a commercial property analyst specializing in pavement and surface condition assessment. 
-
-You analyze satellite imagery of properties to score them as potential leads for pavement maintenance, sealcoating, and repair services.
-
-The image shows a property with a RED BOUNDARY LINE indicating the exact parcel boundaries. Focus your analysis on what's INSIDE this boundary.
-
-Always respond with valid JSON only, no markdown formatting."""
-
         user_prompt = f"""{effective_prompt}
 
 Property context: {context_str}
@@ -171,9 +149,61 @@ Analyze the satellite image and respond with this exact JSON structure:
         "visible_issues": ["<list>", "<of>", "<observed issues>"]
     }}
 }}"""
+        
+        return SYSTEM_PROMPT, user_prompt
+    
+    async def analyze_property(
+        self,
+        image_base64: str,
+        scoring_prompt: Optional[str] = None,
+        property_context: Optional[Dict[str, Any]] = None,
+        user_api_key: Optional[str] = None,  # User's own OpenRouter key
+        image_detail: str = "high",  # "low" or "high" - see VLMImagePreprocessor policy
+    ) -> VLMAnalysisResult:
+        """
+        Analyze a property satellite image and score it as a lead.
+        
+        Args:
+            image_base64: Base64-encoded JPEG image of the property
+            scoring_prompt: User's criteria for scoring (uses default if None)
+            property_context: Optional dict with Regrid data (address, owner, etc.)
+            user_api_key: User's own OpenRouter API key (optional, uses system key if not provided)
+            image_detail: Image detail level sent to the model ("low" or "high")
+            
+        Returns:
+            VLMAnalysisResult with score, reasoning, and observations
+        """
+        with telemetry.span(
+            "vlm",
+            model=self.DEFAULT_MODEL,
+            detail=image_detail,
+            address=(property_context or {}).get("address"),
+        ) as span:
+            span.add(bytes=len(image_base64))
+            result = await self._analyze_property(
+                image_base64, scoring_prompt, property_context, user_api_key, image_detail,
+            )
+            span.set(success=result.success)
+            if result.usage:
+                span.add(tokens=result.usage.total_tokens, cost_usd=result.usage.cost)
+            return result
+    
+    async def _analyze_property(
+        self,
+        image_base64: str,
+        scoring_prompt: Optional[str],
+        property_context: Optional[Dict[str, Any]],
+        user_api_key: Optional[str],
+        image_detail: str,
+    ) -> VLMAnalysisResult:
+        client = self._get_client(user_api_key)
+        if not client:
+            return VLMAnalysisResult.from_error("No OpenRouter API key available (set your own in Settings)")
+        
+        system_prompt, user_prompt = self.build_prompts(scoring_prompt, property_context)
 
         try:
-            logger.info(f"  [VLM] Sending image to {self.DEFAULT_MODEL} via OpenRouter...")
+            logger.info("  [VLM] Sending image to %s via OpenRouter (detail=%s)...", self.DEFAULT_MODEL, image_detail)
             
             response = await client.chat.completions.create(
                 model=self.DEFAULT_MODEL,
@@ -187,7 +217,7 @@ Analyze the satellite image and respond with this exact JSON structure:
                                 "type": "image_url",
                                 "image_url": {
                                     "url": f"data:image/jpeg;base64,{image_base64}",
-                                    "detail": "high"
+                                    "detail": image_detail
                                 }
                             }
                         ]
@@ -207,11 +237,11 @@ Analyze the satellite image and respond with this exact JSON structure:
                     total_tokens=getattr(response.usage, 'total_tokens', 0) or 0,
                     cost=getattr(response.usage, 'cost', 0) or 0.0,
                 )
-                logger.info(f"  [VLM] Usage: {usage_info.total_tokens} tokens, ${usage_info.cost:.6f}")
+                logger.info("  [VLM] Usage: %s tokens, $%.6f", usage_info.total_tokens, usage_info.cost)
             
             # Parse response
             content = response.choices[0].message.content
-            logger.info(f"  [VLM] Raw response: {content[:200]}...")
+            logger.info("  [VLM] Raw response: %s...", content[:200])
             
             # Clean up response (remove markdown if present)
             content = content.strip()
@@ -246,18 +276,18 @@ Analyze the satellite image and respond with this exact JSON structure:
                 usage=usage_info,
             )
             
-            logger.info(f"  [VLM] Analysis complete: score={result.lead_score}, confidence={result.confidence}%")
-            logger.info(f"  [VLM] Reasoning: {result.reasoning}")
+            logger.info("  [VLM] Analysis complete: score=%s, confidence=%s%%", result.lead_score, result.confidence)
+            logger.info("  [VLM] Reasoning: %s", result.reasoning)
             if usage_info:
-                logger.info(f"  [VLM] Cost: ${usage_info.cost:.6f} ({usage_info.total_tokens} tokens)")
+                logger.info("  [VLM] Cost: $%.6f (%s tokens)", usage_info.cost, usage_info.total_tokens)
             
             return result
             
         except json.JSONDecodeError as e:
-            logger.error(f"  [VLM] Failed to parse response as JSON: {e}")
+            logger.error("  [VLM] Failed to parse response as JSON: %s", e)
             return VLMAnalysisResult.from_error(f"Invalid JSON response: {e}")
         except Exception as e:
-            logger.error(f"  [VLM] Analysis failed: {e}")
+            logger.error("  [VLM] Analysis failed: %s", e)
             return VLMAnalysisResult.from_error(str(e))
 
 
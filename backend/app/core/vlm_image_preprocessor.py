@@ -0,0 +1,334 @@
+"""
+VLM Image Preprocessor
+
+Prepares property imagery before it is sent to the VLM:
+1. Crops the mosaic to the parcel polygon bbox (plus padding)
+2. Resizes to a target tile budget
+3. Picks JPEG quality and detail level from a parcel-area policy
+
+Token estimates follow OpenAI's image accounting (85 base tokens plus
+170 per 512px tile at "high" detail, flat 85 at "low"), which is what
+OpenRouter bills for GPT-4o image inputs.
+"""
+
+import base64
+import io
+import logging
+import math
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, List, Tuple, Union
+
+from PIL import Image
+from shapely.geometry import Polygon, MultiPolygon
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# OpenAI image token accounting
+TILE_SIZE_PX = 512
+BASE_IMAGE_TOKENS = 85
+TOKENS_PER_TILE = 170
+HIGH_DETAIL_MAX_SIDE_PX = 2048
+HIGH_DETAIL_SHORT_SIDE_PX = 768
+LOW_DETAIL_SIDE_PX = 512
+
+# Legacy behaviour (no preprocessing)
+BASELINE_JPEG_QUALITY = 95
+BASELINE_DETAIL = "high"
+
+EARTH_RADIUS_M = 6378137.0
+
+
+@dataclass
+class ImagePolicy:
+    """Detail level and encoding settings for one parcel-area tier."""
+    max_area_m2: Optional[float]  # None = no upper bound
+    detail: str  # "low" or "high"
+    max_tiles: int
+    jpeg_quality: int
+
+
+@dataclass
+class PreparedVLMImage:
+    """Image ready for VLM submission plus the savings versus the raw mosaic."""
+    image_base64: str
+    detail: str
+    jpeg_quality: int
+    width: int
+    height: int
+    original_width: int
+    original_height: int
+    cropped: bool
+    size_bytes: int
+    estimated_tokens: int
+    baseline_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(self.baseline_tokens - self.estimated_tokens, 0)
+
+    @property
+    def savings_pct(self) -> float:
+        if not self.baseline_tokens:
+            return 0.0
+        return 100.0 * self.tokens_saved / self.baseline_tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Metadata without the image payload."""
+        data = asdict(self)
+        data.pop("image_base64")
+        data["tokens_saved"] = self.tokens_saved
+        return data
+
+
+def estimate_image_tokens(width: int, height: int, detail: str = "high") -> int:
+    """Estimate prompt tokens billed for an image of the given size."""
+    if detail == "low":
+        return BASE_IMAGE_TOKENS
+
+    w, h = _normalize_high_detail_size(width, height)
+    tiles = math.ceil(w / TILE_SIZE_PX) * math.ceil(h / TILE_SIZE_PX)
+    return BASE_IMAGE_TOKENS + TOKENS_PER_TILE * tiles
+
+
+def _normalize_high_detail_size(width: int, height: int) -> Tuple[int, int]:
+    """Apply the provider-side downscale: fit in 2048², then shortest side to 768."""
+    scale = min(1.0, HIGH_DETAIL_MAX_SIDE_PX / max(width, height))
+    w, h = width * scale, height * scale
+    scale = min(1.0, HIGH_DETAIL_SHORT_SIDE_PX / min(w, h))
+    return max(1, int(w * scale)), max(1, int(h * scale))
+
+
+def _fit_to_tile_budget(width: int, height: int, max_tiles: int) -> Tuple[int, int]:
+    """
+    Largest size (never upscaled) whose high-detail tile count fits max_tiles.
+
+    Tries every cols x rows grid within the budget and keeps the one that
+    allows the biggest scale factor.
+    """
+    w, h = _normalize_high_detail_size(width, height)
+    max_tiles = max(1, max_tiles)
+
+    best_scale = 0.0
+    for cols in range(1, max_tiles + 1):
+        rows = max_tiles // cols
+        scale = min(1.0, cols * TILE_SIZE_PX / w, rows * TILE_SIZE_PX / h)
+        best_scale = max(best_scale, scale)
+
+    return max(1, int(w * best_scale)), max(1, int(h * best_scale))
+
+
+def _lnglat_to_mercator(lng: float, lat: float) -> Tuple[float, float]:
+    """Convert WGS84 lng/lat to Web Mercator meters (EPSG:3857)."""
+    x = EARTH_RADIUS_M * math.radians(lng)
+    y = EARTH_RADIUS_M * math.log(math.tan(math.pi / 4 + math.radians(lat) / 2))
+    return x, y
+
+
+class VLMImagePreprocessor:
+    """Crop, resize and encode property imagery for VLM analysis."""
+
+    def __init__(
+        self,
+        policy: Optional[List[Dict[str, Any]]] = None,
+        crop_padding_percent: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        raw_policy = policy if policy is not None else settings.VLM_IMAGE_POLICY
+        self.policy: List[ImagePolicy] = sorted(
+            (ImagePolicy(**tier) for tier in raw_policy),
+            key=lambda p: p.max_area_m2 if p.max_area_m2 is not None else float("inf"),
+        )
+        self.crop_padding_percent = (
+            crop_padding_percent if crop_padding_percent is not None
+            else settings.VLM_IMAGE_CROP_PADDING_PERCENT
+        )
+        self.enabled = enabled if enabled is not None else settings.VLM_IMAGE_PREPROCESSING_ENABLED
+
+        # Running totals for savings reporting
+        self._images_processed = 0
+        self._baseline_tokens = 0
+        self._estimated_tokens = 0
+        self._prepared_bytes = 0
+
+    def policy_for_area(self, area_m2: Optional[float]) -> ImagePolicy:
+        """Pick the policy tier for a parcel area (unknown area gets the largest tier)."""
+        if area_m2 is not None:
+            for tier in self.policy:
+                if tier.max_area_m2 is None or area_m2 <= tier.max_area_m2:
+                    return tier
+        return self.policy[-1]
+
+    def prepare(
+        self,
+        image: Image.Image,
+        polygon: Optional[Union[Polygon, MultiPolygon]] = None,
+        bounds_mercator: Optional[Dict[str, float]] = None,
+        area_m2: Optional[float] = None,
+    ) -> PreparedVLMImage:
+        """
+        Prepare an image for VLM submission.
+
+        Args:
+            image: Mosaic as produced by PolygonImageryService
+            polygon: Parcel polygon in (lng, lat); enables cropping with bounds_mercator
+            bounds_mercator: Image extent in Web Mercator (left/right/bottom/top)
+            area_m2: Parcel area used to select the policy tier
+
+        Returns:
+            PreparedVLMImage with base64 payload, detail level and token estimates
+        """
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        original_width, original_height = image.size
+        baseline_tokens = estimate_image_tokens(original_width, original_height, BASELINE_DETAIL)
+
+        if not self.enabled:
+            image_bytes = self._encode_jpeg(image, BASELINE_JPEG_QUALITY)
+            return self._build_result(
+                image, image_bytes, BASELINE_DETAIL, BASELINE_JPEG_QUALITY,
+                original_width, original_height, False, baseline_tokens,
+            )
+
+        cropped = False
+        if polygon is not None and bounds_mercator:
+            crop_box = self._polygon_crop_box(image.size, polygon, bounds_mercator)
+            if crop_box:
+                image = image.crop(crop_box)
+                cropped = True
+
+        tier = self.policy_for_area(area_m2)
+
+        if tier.detail == "low":
+            scale = min(1.0, LOW_DETAIL_SIDE_PX / max(image.size))
+            target = (max(1, int(image.size[0] * scale)), max(1, int(image.size[1] * scale)))
+        else:
+            target = _fit_to_tile_budget(image.size[0], image.size[1], tier.max_tiles)
+
+        if target != image.size:
+            image = image.resize(target, Image.LANCZOS)
+
+        image_bytes = self._encode_jpeg(image, tier.jpeg_quality)
+        return self._build_result(
+            image, image_bytes, tier.detail, tier.jpeg_quality,
+            original_width, original_height, cropped, baseline_tokens,
+        )
+
+    def prepare_base64(
+        self,
+        image_base64: str,
+        polygon: Optional[Union[Polygon, MultiPolygon]] = None,
+        bounds_mercator: Optional[Dict[str, float]] = None,
+        area_m2: Optional[float] = None,
+    ) -> PreparedVLMImage:
+        """Same as prepare() for an already-encoded image (e.g. stored satellite_image_base64)."""
+        image = Image.open(io.BytesIO(base64.b64decode(image_base64)))
+        return self.prepare(image, polygon=polygon, bounds_mercator=bounds_mercator, area_m2=area_m2)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cumulative token/byte savings since startup."""
+        saved = max(self._baseline_tokens - self._estimated_tokens, 0)
+        return {
+            "images_processed": self._images_processed,
+            "baseline_tokens": self._baseline_tokens,
+            "estimated_tokens": self._estimated_tokens,
+            "tokens_saved": saved,
+            "savings_pct": round(100.0 * saved / self._baseline_tokens, 1) if self._baseline_tokens else 0.0,
+            "prepared_bytes": self._prepared_bytes,
+        }
+
+    def _build_result(
+        self,
+        image: Image.Image,
+        image_bytes: bytes,
+        detail: str,
+        jpeg_quality: int,
+        original_width: int,
+        original_height: int,
+        cropped: bool,
+        baseline_tokens: int,
+    ) -> PreparedVLMImage:
+        estimated_tokens = estimate_image_tokens(image.size[0], image.size[1], detail)
+
+        self._images_processed += 1
+        self._baseline_tokens += baseline_tokens
+        self._estimated_tokens += estimated_tokens
+        self._prepared_bytes += len(image_bytes)
+
+        return PreparedVLMImage(
+            image_base64=base64.b64encode(image_bytes).decode("utf-8"),
+            detail=detail,
+            jpeg_quality=jpeg_quality,
+            width=image.size[0],
+            height=image.size[1],
+            original_width=original_width,
+            original_height=original_height,
+            cropped=cropped,
+            size_bytes=len(image_bytes),
+            estimated_tokens=estimated_tokens,
+            baseline_tokens=baseline_tokens,
+        )
+
+    def _polygon_crop_box(
+        self,
+        image_size: Tuple[int, int],
+        polygon: Union[Polygon, MultiPolygon],
+        bounds_mercator: Dict[str, float],
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Pixel box around the polygon bbox plus padding, clamped to the image."""
+        img_width, img_height = image_size
+        left = bounds_mercator["left"]
+        right = bounds_mercator["right"]
+        bottom = bounds_mercator["bottom"]
+        top = bounds_mercator["top"]
+        if right <= left or top <= bottom:
+            return None
+
+        minx, miny, maxx, maxy = polygon.bounds
+        mx0, my0 = _lnglat_to_mercator(minx, miny)
+        mx1, my1 = _lnglat_to_mercator(maxx, maxy)
+
+        px0 = (mx0 - left) / (right - left) * img_width
+        px1 = (mx1 - left) / (right - left) * img_width
+        py0 = (top - my1) / (top - bottom) * img_height
+        py1 = (top - my0) / (top - bottom) * img_height
+
+        # The polygon must lie inside the image; if it doesn't, the stated
+        # bounds don't match the image and a crop would clip the parcel
+        tolerance = 2
+        if px0 < -tolerance or py0 < -tolerance or px1 > img_width + tolerance or py1 > img_height + tolerance:
+            logger.warning(
+                "⚠️ Polygon bbox (%.0f, %.0f, %.0f, %.0f) extends past the %sx%s image - not cropping",
+                px0, py0, px1, py1, img_width, img_height,
+            )
+            return None
+
+        pad_x = (px1 - px0) * self.crop_padding_percent / 100
+        pad_y = (py1 - py0) * self.crop_padding_percent / 100
+
+        box = (
+            max(0, int(math.floor(px0 - pad_x))),
+            max(0, int(math.floor(py0 - pad_y))),
+            min(img_width, int(math.ceil(px1 + pad_x))),
+            min(img_height, int(math.ceil(py1 + pad_y))),
+        )
+
+        # Polygon outside the image or degenerate - keep the full mosaic
+        if box[2] - box[0] < 16 or box[3] - box[1] < 16:
+            return None
+        if box == (0, 0, img_width, img_height):
+            return None
+        return box
+
+    @staticmethod
+    def _encode_jpeg(image: Image.Image, quality: int) -> bytes:
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=quality)
+        return buffer.getvalue()
+
+
+# Singleton instance
+vlm_image_preprocessor = VLMImagePreprocessor()
@@ -0,0 +1,234 @@
+"""
+VLM Result Cache Service
+
+Persistent cache for VLM lead scores keyed by (image hash, prompt hash, model).
+Re-running discovery over the same area, or re-analyzing a property whose
+imagery and scoring prompt have not changed, returns the stored score
+instead of paying for another GPT-4o call.
+
+- Image hash: sha256 of the decoded JPEG bytes actually sent to the model
+- Prompt hash: sha256 of system prompt + user prompt (incl. property context) + detail level
+- Model: VLMAnalysisService.DEFAULT_MODEL
+
+Callers go through analyze_property(), which mirrors
+VLMAnalysisService.analyze_property() and adds a bypass_cache flag.
+"""
+
+import base64
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any
+
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.core.vlm_analysis_service import (
+    vlm_analysis_service,
+    VLMAnalysisResult,
+    VLMObservations,
+    VLMUsageInfo,
+)
+from app.db.base import SessionLocal
+from app.models.vlm_result_cache import VLMResultCache
+
+logger = logging.getLogger(__name__)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class VLMResultCacheService:
+    """Cache-through wrapper around VLMAnalysisService.analyze_property()."""
+    
+    def __init__(self, enabled: Optional[bool] = None, ttl_days: Optional[int] = None):
+        self.enabled = enabled if enabled is not None else settings.VLM_RESULT_CACHE_ENABLED
+        self.ttl_days = ttl_days if ttl_days is not None else settings.VLM_RESULT_CACHE_TTL_DAYS
+        
+        # Counters since startup
+        self._hits = 0
+        self._misses = 0
+        self._bypasses = 0
+        self._stores = 0
+        self._errors = 0
+        self._cost_saved = 0.0
+    
+    def build_key(
+        self,
+        image_base64: str,
+        scoring_prompt: Optional[str] = None,
+        property_context: Optional[Dict[str, Any]] = None,
+        image_detail: str = "high",
+        model: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Compute image/prompt hashes and the combined cache key."""
+        model = model or vlm_analysis_service.DEFAULT_MODEL
+        image_hash = _sha256(base64.b64decode(image_base64))
+        system_prompt, user_prompt = vlm_analysis_service.build_prompts(scoring_prompt, property_context)
+        prompt_hash = _sha256(f"{system_prompt}\n\x00{user_prompt}\n\x00{image_detail}".encode("utf-8"))
+        return {
+            "cache_key": _sha256(f"{image_hash}:{prompt_hash}:{model}".encode("utf-8")),
+            "image_hash": image_hash,
+            "prompt_hash": prompt_hash,
+            "model": model,
+        }
+    
+    async def analyze_property(
+        self,
+        image_base64: str,
+        scoring_prompt: Optional[str] = None,
+        property_context: Optional[Dict[str, Any]] = None,
+        user_api_key: Optional[str] = None,
+        image_detail: str = "high",
+        bypass_cache: bool = False,
+    ) -> VLMAnalysisResult:
+        """
+        Score a property image, serving from cache when possible.
+        
+        Args:
+            Same as VLMAnalysisService.analyze_property(), plus:
+            bypass_cache: Skip the lookup and always call the model
+                (the fresh result still refreshes the cache entry)
+            
+        Returns:
+            VLMAnalysisResult; cached results have cached=True and zero-cost usage
+        """
+        key = None
+        if self.enabled:
+            try:
+                key = self.build_key(image_base64, scoring_prompt, property_context, image_detail)
+            except Exception as e:
+                self._errors += 1
+                logger.warning("  [VLM cache] Could not build cache key: %s", e)
+        
+        if key and not bypass_cache:
+            cached = self.get(key["cache_key"])
+            if cached:
+                return cached
+        elif key and bypass_cache:
+            self._bypasses += 1
+            logger.info("  [VLM cache] Bypassed by request")
+        
+        result = await vlm_analysis_service.analyze_property(
+            image_base64=image_base64,
+            scoring_prompt=scoring_prompt,
+            property_context=property_context,
+            user_api_key=user_api_key,
+            image_detail=image_detail,
+        )
+        
+        if key and result.success:
+            self.put(key, result)
+        
+        return result
+    
+    def get(self, cache_key: str) -> Optional[VLMAnalysisResult]:
+        """Look up a cached result; counts a hit or a miss."""
+        db = SessionLocal()
+        try:
+            entry = db.query(VLMResultCache).filter(VLMResultCache.cache_key == cache_key).first()
+            if entry and self.ttl_days and entry.created_at:
+                if entry.created_at < datetime.now(timezone.utc) - timedelta(days=self.ttl_days):
+                    entry = None
+            
+            if not entry:
+                self._misses += 1
+                return None
+            
+            entry.hit_count = (entry.hit_count or 0) + 1
+            entry.last_hit_at = datetime.now(timezone.utc)
+            db.commit()
+            
+            self._hits += 1
+            self._cost_saved += float(entry.cost or 0)
+            logger.info("  [VLM cache] HIT %s score=%s (saved $%.6f)", cache_key[:12], entry.lead_score, float(entry.cost or 0))
+            return self._to_result(entry)
+        except Exception as e:
+            db.rollback()
+            self._errors += 1
+            self._misses += 1
+            logger.warning("  [VLM cache] Lookup failed: %s", e)
+            return None
+        finally:
+            db.close()
+    
+    def put(self, key: Dict[str, str], result: VLMAnalysisResult) -> None:
+        """Store (or refresh) a successful result."""
+        obs = result.observations
+        usage = result.usage
+        values = {
+            "cache_key": key["cache_key"],
+            "image_hash": key["image_hash"],
+            "prompt_hash": key["prompt_hash"],
+            "model": key["model"],
+            "lead_score": result.lead_score,
+            "confidence": result.confidence,
+            "reasoning": result.reasoning,
+            "observations": {
+                "paved_area_pct": obs.paved_area_pct,
+                "building_pct": obs.building_pct,
+                "landscaping_pct": obs.landscaping_pct,
+                "condition": obs.condition,
+                "visible_issues": obs.visible_issues,
+            } if obs else None,
+            "raw_response": result.raw_response,
+            "prompt_tokens": usage.prompt_tokens if usage else None,
+            "completion_tokens": usage.completion_tokens if usage else None,
+            "cost": usage.cost if usage else None,
+        }
+        
+        db = SessionLocal()
+        try:
+            stmt = insert(VLMResultCache).values(**values)
+            update_cols = {k: stmt.excluded[k] for k in values if k != "cache_key"}
+            update_cols["created_at"] = datetime.now(timezone.utc)
+            stmt = stmt.on_conflict_do_update(index_elements=["cache_key"], set_=update_cols)
+            db.execute(stmt)
+            db.commit()
+            self._stores += 1
+        except Exception as e:
+            db.rollback()
+            self._errors += 1
+            logger.warning("  [VLM cache] Store failed: %s", e)
+        finally:
+            db.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters since startup."""
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "ttl_days": self.ttl_days,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate_pct": round(100.0 * self._hits / lookups, 1) if lookups else 0.0,
+            "bypasses": self._bypasses,
+            "stores": self._stores,
+            "errors": self._errors,
+            "cost_saved": round(self._cost_saved, 6),
+        }
+    
+    @staticmethod
+    def _to_result(entry: VLMResultCache) -> VLMAnalysisResult:
+        obs_data = entry.observations or {}
+        return VLMAnalysisResult(
+            success=True,
+            lead_score=entry.lead_score,
+            confidence=entry.confidence,
+            reasoning=entry.reasoning or "",
+            observations=VLMObservations(
+                paved_area_pct=obs_data.get("paved_area_pct", 0),
+                building_pct=obs_data.get("building_pct", 0),
+                landscaping_pct=obs_data.get("landscaping_pct", 0),
+                condition=obs_data.get("condition", "unknown"),
+                visible_issues=obs_data.get("visible_issues", []),
+            ),
+            raw_response=entry.raw_response,
+            usage=VLMUsageInfo(),  # No tokens spent on a hit
+            cached=True,
+        )
+
+
+# Singleton instance
+vlm_result_cache_service = VLMResultCacheService()
@@ -1,8 +1,11 @@
+import logging
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 database_url = settings.DATABASE_URL
 db_schema = settings.DB_SCHEMA
 
@@ -61,7 +64,7 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 Base.metadata.schema = db_schema if db_schema != "public" else None
 
-print(f"[DB] Schema: {db_schema}")
+logger.info("[DB] Schema: %s", db_schema)
 
 
 def get_db():
@@ -1,15 +1,49 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
 import os
 from app.core.config import settings
+from app.core.logging_config import setup_logging, shutdown_logging
+
+# Before the service imports below, so their import-time logging goes through the queue
+setup_logging()
+
+from app.core.openrouter_client_pool import openrouter_client_pool
+from app.core.usage_recorder import usage_recorder
+from app.core.county_service import county_service
+from app.core.http_client_manager import http_clients
+from app.core.telemetry import telemetry
+from app.core.progress_bus import progress_bus
+from app.core.job_worker import job_worker
 from app.api.v1.router import api_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup: shared outbound HTTP clients, county autocomplete index from the bundled gazetteer
+    http_clients.open()
+    county_service.load_gazetteer(required=settings.ENVIRONMENT != "development")
+    # Single-process deployments can run queued jobs here instead of in python -m app.worker
+    if settings.JOB_WORKER_IN_PROCESS:
+        job_worker.start()
+    yield
+    # Shutdown: drain running queued jobs, stop background progress jobs, write buffered usage rows, release pooled connections, flush queued log records
+    if settings.JOB_WORKER_IN_PROCESS:
+        await job_worker.stop()
+    await progress_bus.close()
+    usage_recorder.close()
+    await openrouter_client_pool.close()
+    await http_clients.close()
+    shutdown_logging()
+
+
 app = FastAPI(
     title="WorkSight API",
     description="Property discovery, analysis, and lead enrichment API",
     version="2.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -82,6 +116,12 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus scrape endpoint (pipeline stage histograms and counters)."""
+    return PlainTextResponse(telemetry.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
 # Mount static files for CV images
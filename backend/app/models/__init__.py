@@ -5,7 +5,11 @@ from app.models.business import Business
 from app.models.property_business import PropertyBusiness
 from app.models.deal import Deal
 from app.models.usage_log import UsageLog
+from app.models.usage_daily_rollup import UsageDailyRollup
 from app.models.scoring_prompt import ScoringPrompt
+from app.models.vlm_result_cache import VLMResultCache
+from app.models.geocode_cache import GeocodeCacheEntry
+from app.models.background_job import BackgroundJob
 
 __all__ = [
     "User",
@@ -14,5 +18,9 @@ __all__ = [
     "PropertyBusiness",
     "Deal",
     "UsageLog",
+    "UsageDailyRollup",
     "ScoringPrompt",
+    "VLMResultCache",
+    "GeocodeCacheEntry",
+    "BackgroundJob",
 ]
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, String, Integer, SmallInteger, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+
+from app.db.base import Base
+
+
+class BackgroundJob(Base):
+    """Queued discovery / parcel processing job (see app.core.job_queue)."""
+
+    __tablename__ = "background_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String(50), nullable=False)  # "discovery", "process_parcels"
+    payload = Column(JSONB, nullable=False)  # Handler arguments
+    priority = Column(SmallInteger, nullable=False, default=10)  # Lower runs first (0 = interactive)
+
+    # Lifecycle: queued -> running -> completed | failed | cancelled
+    status = Column(String(20), nullable=False, default="queued")
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    attempts = Column(Integer, nullable=False, default=0)  # Claims so far (requeued if its worker dies)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    worker_id = Column(String(100), nullable=True)  # host:pid of the worker running it
+
+    progress = Column(JSONB, nullable=True)  # Latest progress event (for polling without the SSE stream)
+    result = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<BackgroundJob {self.kind} {self.status} user={self.user_id}>"
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, String, Integer, Numeric, Text, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.db.base import Base
+
+
+class GeocodeCacheEntry(Base):
+    """
+    Cached forward/reverse geocoding results keyed by normalized query.
+    
+    Only coordinates and the place ID are kept (Google's terms allow caching
+    lat/lng for up to 30 days and place IDs indefinitely); the rest of the
+    geocoder response is not stored.
+    """
+    
+    __tablename__ = "geocode_cache"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)  # sha256(direction:query)
+    direction = Column(String(10), nullable=False)  # "forward" or "reverse"
+    query = Column(Text, nullable=False)  # Normalized address, or "lat,lng" rounded for reverse
+    
+    # Result (lat/lng/place_id are null for a cached ZERO_RESULTS)
+    status = Column(String(30), nullable=False)  # Geocoder status: OK, ZERO_RESULTS
+    lat = Column(Numeric(10, 7), nullable=True)
+    lng = Column(Numeric(10, 7), nullable=True)
+    place_id = Column(String(255), nullable=True)
+    
+    # Hit tracking / expiry
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<GeocodeCacheEntry {self.direction} '{self.query}' {self.status}>"
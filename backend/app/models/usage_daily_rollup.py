@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, Integer, BigInteger, Numeric, ForeignKey, Date, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class UsageDailyRollup(Base):
+    """Per-user, per-service daily usage totals (maintained from usage_logs)."""
+    
+    __tablename__ = "usage_daily_rollups"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    service = Column(String(50), primary_key=True)
+    day = Column(Date, primary_key=True, index=True)  # UTC day of UsageLog.created_at
+    
+    # Totals
+    request_count = Column(Integer, nullable=False, default=0)  # Number of usage_logs rows
+    api_calls = Column(Integer, nullable=False, default=0)  # Sum of api_calls (NULL counted as 1)
+    total_tokens = Column(BigInteger, nullable=False, default=0)
+    total_cost = Column(Numeric(14, 6), nullable=False, default=0)
+    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<UsageDailyRollup {self.day} {self.service} user={self.user_id}>"
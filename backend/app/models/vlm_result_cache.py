@@ -0,0 +1,40 @@
+from sqlalchemy import Column, String, Integer, Numeric, Text, DateTime
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+
+from app.db.base import Base
+
+
+class VLMResultCache(Base):
+    """Cached VLM lead scores keyed by (image hash, prompt hash, model)."""
+    
+    __tablename__ = "vlm_result_cache"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)  # sha256(image_hash:prompt_hash:model)
+    
+    # Key components (kept for inspection / targeted invalidation)
+    image_hash = Column(String(64), nullable=False, index=True)
+    prompt_hash = Column(String(64), nullable=False)
+    model = Column(String(100), nullable=False)
+    
+    # Result
+    lead_score = Column(Integer, nullable=False)
+    confidence = Column(Integer, nullable=False)
+    reasoning = Column(Text, nullable=True)
+    observations = Column(JSONB, nullable=True)
+    raw_response = Column(JSONB, nullable=True)
+    
+    # Original cost (what a hit saves)
+    prompt_tokens = Column(Integer, nullable=True)
+    completion_tokens = Column(Integer, nullable=True)
+    cost = Column(Numeric(10, 6), nullable=True)
+    
+    # Hit tracking
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    last_hit_at = Column(DateTime(timezone=True), nullable=True)
+    
+    def __repr__(self):
+        return f"<VLMResultCache {self.cache_key[:12]} score={self.lead_score} model={self.model}>"
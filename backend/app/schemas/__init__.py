@@ -25,6 +25,7 @@ from app.schemas.discovery import (
     AreaType,
     DiscoveryFilters,
     DiscoveryRequest,
+    DiscoveryJobRequest,
     DiscoveryStep,
     DiscoveryProgress,
     DiscoveryJobResponse,
@@ -80,6 +81,7 @@ __all__ = [
     "AreaType",
     "DiscoveryFilters",
     "DiscoveryRequest",
+    "DiscoveryJobRequest",
     "DiscoveryStep",
     "DiscoveryProgress",
     "DiscoveryJobResponse",
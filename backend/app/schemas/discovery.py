@@ -105,6 +105,8 @@ class DiscoveryFilters(BaseModel):
     min_match_score: float = Field(default=50.0, ge=0, le=100, description="Minimum business match confidence")
     max_lots: int = Field(default=10, ge=1, le=1000, description="Maximum parking lots to process (for testing, use low values)")
     max_businesses: int = Field(default=10, ge=1, le=500, description="Maximum businesses to load (for testing, use low values)")
+    bypass_vlm_cache: bool = Field(default=False, description="Always call the VLM, ignoring cached scores for identical image + prompt")
+    max_budget_usd: Optional[float] = Field(default=None, ge=0, description="Spend cap for this job in USD (defaults to DISCOVERY_JOB_BUDGET_USD, 0 = no job cap; the user's daily budget still applies)")
 
 
 # ============ Discovery Request ============
@@ -171,6 +173,23 @@ class DiscoveryRequest(BaseModel):
     )
 
 
+class DiscoveryJobRequest(BaseModel):
+    """Queue a discovery job for the worker (POST /discover/jobs)."""
+    area_polygon: Dict[str, Any] = Field(..., description="GeoJSON Polygon or MultiPolygon to search")
+    mode: DiscoveryMode = DiscoveryMode.BUSINESS_FIRST
+    filters: DiscoveryFilters = Field(default_factory=DiscoveryFilters)
+    tiers: Optional[List[BusinessTierEnum]] = None
+    business_type_ids: Optional[List[str]] = None
+    scoring_prompt: Optional[str] = Field(default=None, max_length=2000)
+    city: Optional[str] = None
+    state: Optional[str] = None
+    job_titles: Optional[List[str]] = None
+    industries: Optional[List[str]] = None
+    property_categories: Optional[List[PropertyCategoryEnum]] = None
+    min_acres: Optional[float] = Field(default=None, ge=0)
+    max_acres: Optional[float] = Field(default=None, ge=0)
+
+
 # ============ Discovery Job Status ============
 
 class DiscoveryStep(str, Enum):
@@ -0,0 +1,40 @@
+"""
+Background job worker process: python -m app.worker
+
+Runs queued discovery and parcel processing jobs (see app.core.job_worker).
+Start as many as needed; they coordinate through the background_jobs table.
+SIGTERM/SIGINT stop claiming and drain running jobs for up to
+JOB_SHUTDOWN_GRACE_SECONDS (see JobWorker._shutdown).
+"""
+
+import asyncio
+import signal
+
+from app.core.logging_config import setup_logging, shutdown_logging
+
+setup_logging()
+
+from app.core.openrouter_client_pool import openrouter_client_pool
+from app.core.usage_recorder import usage_recorder
+from app.core.http_client_manager import http_clients
+from app.core.progress_bus import progress_bus
+from app.core.job_worker import job_worker
+
+
+async def main() -> None:
+    http_clients.open()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, job_worker.request_stop)
+    try:
+        await job_worker.run()
+    finally:
+        await progress_bus.close()
+        usage_recorder.close()
+        await openrouter_client_pool.close()
+        await http_clients.close()
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
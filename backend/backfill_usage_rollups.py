@@ -0,0 +1,48 @@
+"""
+Backfill usage_daily_rollups from usage_logs.
+
+Run once after applying migrations/create_usage_daily_rollups.sql; the
+usage recorder keeps the rollups current from then on. Safe to re-run:
+covered days are recomputed from usage_logs, not added to.
+
+Usage:
+    python backfill_usage_rollups.py                 # Rebuild all history
+    python backfill_usage_rollups.py --days 30       # Only the last 30 days
+    python backfill_usage_rollups.py --user <uuid>   # Only one user
+"""
+import sys
+from uuid import UUID
+
+from app.db.base import SessionLocal
+from app.core.usage_tracking_service import usage_tracking_service
+
+
+def main():
+    args = sys.argv[1:]
+    days = None
+    user_id = None
+    
+    if "--days" in args:
+        days = int(args[args.index("--days") + 1])
+    if "--user" in args:
+        user_id = UUID(args[args.index("--user") + 1])
+    
+    scope = f"last {days} days" if days is not None else "all history"
+    if user_id:
+        scope += f", user {user_id}"
+    print(f"Backfilling usage_daily_rollups ({scope})...")
+    
+    db = SessionLocal()
+    try:
+        rows = usage_tracking_service.backfill_daily_rollups(db, days=days, user_id=user_id)
+        print(f"✅ Wrote {rows} rollup rows")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Backfill failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
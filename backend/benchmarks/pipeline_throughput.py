@@ -0,0 +1,428 @@
+"""
+Pipeline throughput benchmark (offline).
+
+Drives the real pipelines end-to-end against recorded / synthetic
+provider stand-ins (see benchmarks.replay_providers), so no Regrid,
+Google or OpenRouter quota is spent:
+
+- search:     SearchService.search - category by ZIP (Regrid query) and drawn polygon
+- tiles:      RegridTileService.query_parcels_in_area over a polygon (MVT tiles)
+- enrichment: LLMEnrichmentService.enrich for N addresses
+- discovery:  DiscoveryOrchestrator regrid-first stream (imagery, VLM, enrichment, DB writes)
+
+Reports parcels/sec, p50/p95 latency, peak RSS and DB round-trips per
+parcel per scenario, and compares against a previous run to catch
+regressions across commits.
+
+Usage (from backend/):
+    python -m benchmarks.pipeline_throughput                                   # all scenarios
+    python -m benchmarks.pipeline_throughput --scenario tiles --latency all=none
+    python -m benchmarks.pipeline_throughput --latency openrouter=lognormal:4000:0.5 --latency regrid=fixed:100
+    python -m benchmarks.pipeline_throughput --fixtures benchmarks/fixtures/providers           # replay recordings
+    python -m benchmarks.pipeline_throughput --fixtures benchmarks/fixtures/providers --record  # record (real quota!)
+    python -m benchmarks.pipeline_throughput --output results.json --history benchmark_history.jsonl
+    python -m benchmarks.pipeline_throughput --baseline results.json --tolerance 0.15    # exit 1 on regression
+
+Latency specs (ms): none, fixed:MS, uniform:LO:HI, lognormal:MEDIAN:SIGMA;
+"all=SPEC" applies to every provider.
+
+Provider rate limits and retries stay on (the stand-ins sit beneath
+them), so throughput includes quota pacing; --no-limits measures the
+pipelines alone.
+
+The discovery scenario writes Property rows and needs a scratch
+database (DATABASE_URL). It runs as a dedicated benchmark user whose
+properties are deleted before each run, and is skipped when the
+database is unreachable. Peak RSS is the process high-water mark - run
+one --scenario per process to attribute it to a single pipeline.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Callable, Awaitable
+
+from sqlalchemy import event, text
+
+from app.core.config import settings
+from app.core.http_client_manager import http_clients
+from benchmarks.replay_providers import ReplayEnvironment, parse_latency_overrides
+
+SCENARIOS = ("search", "tiles", "enrichment", "discovery")
+
+BENCHMARK_USER_EMAIL = "pipeline-benchmark@worksight.invalid"
+
+# Metric -> True if higher is better
+TRACKED_METRICS = {
+    "parcels_per_sec": True,
+    "p95_ms": False,
+    "db_round_trips_per_parcel": False,
+    "peak_rss_mb": False,
+}
+
+NOISY_LOGGERS = ("app", "httpx", "httpcore", "openai", "benchmarks")
+
+
+@dataclass
+class ScenarioResult:
+    """Raw measurements for one scenario."""
+    name: str
+    parcels: int = 0
+    wall_s: float = 0.0
+    latencies_s: List[float] = field(default_factory=list)
+    db_round_trips: int = 0
+    skipped: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.skipped:
+            return {"skipped": self.skipped}
+        return {
+            "parcels": self.parcels,
+            "operations": len(self.latencies_s),
+            "wall_s": round(self.wall_s, 3),
+            "parcels_per_sec": round(self.parcels / self.wall_s, 2) if self.wall_s else None,
+            "p50_ms": _percentile_ms(self.latencies_s, 50),
+            "p95_ms": _percentile_ms(self.latencies_s, 95),
+            "db_round_trips": self.db_round_trips,
+            "db_round_trips_per_parcel": round(self.db_round_trips / self.parcels, 2) if self.parcels else None,
+            "peak_rss_mb": _peak_rss_mb(),
+            **self.extra,
+        }
+
+
+def _percentile_ms(values: List[float], pct: int) -> Optional[float]:
+    if not values:
+        return None
+    if len(values) == 1:
+        return round(values[0] * 1000, 1)
+    return round(statistics.quantiles(values, n=100, method="inclusive")[pct - 1] * 1000, 1)
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class RoundTripCounter:
+    """Counts statements sent over every connection of the app engine."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+
+_ROUND_TRIPS: Optional[RoundTripCounter] = None
+
+
+def _git_revision() -> Dict[str, Any]:
+    def git(*args: str) -> Optional[str]:
+        try:
+            return subprocess.run(["git", *args], capture_output=True, text=True, timeout=10).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+    return {"commit": git("rev-parse", "--short", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+async def _timed(operation: Awaitable) -> tuple:
+    start = time.perf_counter()
+    result = await operation
+    return result, time.perf_counter() - start
+
+
+# ----------------------------------------------------------------------------
+# Scenarios
+# ----------------------------------------------------------------------------
+
+async def run_search(args: argparse.Namespace, env: ReplayEnvironment, result: ScenarioResult) -> None:
+    from app.core.search_service import SearchService, SearchQuery, SearchType, SearchFilters
+
+    service = SearchService()
+    polygon = env.grid.area_polygon(args.area_cells)
+    queries = [
+        SearchQuery(search_type=SearchType.CATEGORY, zip_code="78701", filters=SearchFilters(category_id="multifamily"), limit=500),
+        SearchQuery(search_type=SearchType.POLYGON, polygon_geojson=polygon, filters=SearchFilters(category_id="multifamily")),
+    ]
+    for i in range(args.iterations):
+        search, elapsed = await _timed(service.search(queries[i % len(queries)]))
+        result.latencies_s.append(elapsed)
+        result.parcels += len(search.parcels)
+
+
+async def run_tiles(args: argparse.Namespace, env: ReplayEnvironment, result: ScenarioResult) -> None:
+    from app.core.arcgis_parcel_service import RegridTileService
+
+    service = RegridTileService()
+    polygon = env.grid.area_polygon(args.area_cells)
+    for _ in range(args.iterations):
+        parcels, elapsed = await _timed(service.query_parcels_in_area(polygon, limit=100_000))
+        result.latencies_s.append(elapsed)
+        result.parcels += len(parcels)
+
+
+async def run_enrichment(args: argparse.Namespace, env: ReplayEnvironment, result: ScenarioResult) -> None:
+    from app.core.llm_enrichment_service import LLMEnrichmentService
+
+    service = LLMEnrichmentService()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    successes = 0
+
+    async def enrich_one(n: int) -> None:
+        nonlocal successes
+        async with semaphore:
+            enrichment, elapsed = await _timed(service.enrich(
+                address=f"{100 + n} Benchmark Ave, Austin, TX 78701",
+                property_type="multi_family",
+                owner_name=f"Bench Holdings {n} LLC",
+            ))
+            result.latencies_s.append(elapsed)
+            successes += 1 if enrichment.success else 0
+
+    await asyncio.gather(*(enrich_one(n) for n in range(args.enrichments)))
+    result.parcels = args.enrichments
+    result.extra["enriched"] = successes
+
+
+async def run_discovery(args: argparse.Namespace, env: ReplayEnvironment, result: ScenarioResult) -> None:
+    from app.db.base import SessionLocal
+    from app.core.discovery_orchestrator import DiscoveryOrchestrator, DiscoveryMode
+    from app.core.security import get_password_hash
+    from app.models.property import Property
+    from app.models.user import User
+    from app.schemas.discovery import DiscoveryFilters
+
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+    except Exception as e:
+        db.close()
+        result.skipped = f"database unreachable ({type(e).__name__})"
+        return
+
+    try:
+        user = db.query(User).filter(User.email == BENCHMARK_USER_EMAIL).first()
+        if user is None:
+            user = User(email=BENCHMARK_USER_EMAIL, hashed_password=get_password_hash(uuid.uuid4().hex), company_name="Benchmark")
+            db.add(user)
+            db.commit()
+        # Fresh start - otherwise already-saved parcels are skipped on the next run
+        db.query(Property).filter(Property.user_id == user.id).delete(synchronize_session=False)
+        db.commit()
+        user_id = user.id
+
+        area = {**env.grid.area_polygon(args.area_cells), "properties": {"zip_code": "78701", "state": "TX"}}
+        filters = DiscoveryFilters(max_lots=args.max_lots, bypass_vlm_cache=True)
+
+        # User setup above is not part of the measured run
+        if _ROUND_TRIPS:
+            result.extra["db_round_trips_offset"] = _ROUND_TRIPS.count
+        parcel_started: Optional[float] = None
+        stages = None
+        async for message in DiscoveryOrchestrator().stream_discovery(
+            job_id=uuid.uuid4(),
+            user_id=user_id,
+            area_polygon=area,
+            filters=filters,
+            db=db,
+            mode=DiscoveryMode.REGRID_FIRST,
+            property_categories=["multi_family"],
+        ):
+            kind = message.get("type")
+            now = time.perf_counter()
+            if kind in ("processing", "complete") and parcel_started is not None:
+                result.latencies_s.append(now - parcel_started)
+            if kind == "processing":
+                parcel_started = now
+                result.parcels += 1
+            elif kind == "complete":
+                stages = message.get("stages")
+                result.extra["stats"] = message.get("stats")
+            elif kind == "error":
+                result.extra["error"] = message.get("message")
+        if stages:
+            result.extra["stages"] = stages
+    finally:
+        db.close()
+
+
+SCENARIO_RUNNERS: Dict[str, Callable[..., Awaitable[None]]] = {
+    "search": run_search,
+    "tiles": run_tiles,
+    "enrichment": run_enrichment,
+    "discovery": run_discovery,
+}
+
+
+# ----------------------------------------------------------------------------
+
+def _configure(args: argparse.Namespace) -> None:
+    if not args.record:
+        # Stand-ins accept any credential; never send (or log) the real ones
+        for name in ("REGRID_API_KEY", "REGRID_TILESERVER_TOKEN", "GOOGLE_MAPS_KEY", "GOOGLE_PLACES_KEY", "OPENROUTER_API_KEY"):
+            setattr(settings, name, "replay")
+    if args.no_limits:
+        settings.PROVIDER_LIMITS_ENABLED = False
+    # Replayed calls cost nothing; a spend cap would only cut the measured run short
+    settings.DISCOVERY_JOB_BUDGET_USD = 0
+    settings.USER_DAILY_BUDGET_USD = 0
+    if not args.verbose:
+        for name in NOISY_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+
+async def _run_scenario(name: str, args: argparse.Namespace, env: ReplayEnvironment) -> ScenarioResult:
+    result = ScenarioResult(name)
+    env.reset_counters()
+    trips_before = _ROUND_TRIPS.count if _ROUND_TRIPS else 0
+    start = time.perf_counter()
+    await SCENARIO_RUNNERS[name](args, env, result)
+    result.wall_s = time.perf_counter() - start
+    if _ROUND_TRIPS:
+        offset = result.extra.pop("db_round_trips_offset", trips_before)
+        result.db_round_trips = _ROUND_TRIPS.count - offset
+    result.extra["providers"] = env.get_stats()
+    return result
+
+
+async def _run_all(args: argparse.Namespace, env: ReplayEnvironment) -> Dict[str, ScenarioResult]:
+    results = {}
+    try:
+        for name in args.scenario or SCENARIOS:
+            print(f"Running {name}...")
+            results[name] = await _run_scenario(name, args, env)
+    finally:
+        await http_clients.close()
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Tracked metrics that moved the wrong way by more than tolerance."""
+    regressions = []
+    for name, scenario in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before or "skipped" in scenario or "skipped" in before:
+            continue
+        for metric, higher_is_better in TRACKED_METRICS.items():
+            old, new = before.get(metric), scenario.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (higher_is_better and change < -tolerance) or (not higher_is_better and change > tolerance):
+                regressions.append(f"{name}.{metric}: {old} -> {new} ({change:+.0%})")
+    return regressions
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    global _ROUND_TRIPS
+    _configure(args)
+
+    from app.db.base import engine
+    _ROUND_TRIPS = RoundTripCounter(engine)
+
+    env = ReplayEnvironment(
+        fixtures_dir=args.fixtures,
+        latency=parse_latency_overrides(args.latency),
+        record=args.record,
+        strict=args.strict,
+        seed=args.seed,
+    )
+    http_clients.transport_factory = env.transport_factory
+    print(f"Fixtures: {len(env.store)} recorded responses" + (" (recording)" if args.record else ""))
+    print("Latency: " + ", ".join(f"{p}={spec}" for p, spec in env.latency.items()))
+
+    scenario_results = asyncio.run(_run_all(args, env))
+
+    results: Dict[str, Any] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **_git_revision(),
+        "config": {
+            "latency": {p: str(spec) for p, spec in env.latency.items()},
+            "fixtures": args.fixtures,
+            "provider_limits": settings.PROVIDER_LIMITS_ENABLED,
+            "iterations": args.iterations,
+            "area_cells": args.area_cells,
+            "enrichments": args.enrichments,
+            "concurrency": args.concurrency,
+            "max_lots": args.max_lots,
+        },
+        "scenarios": {name: r.to_dict() for name, r in scenario_results.items()},
+    }
+
+    print("")
+    print("=" * 60)
+    for name, scenario in results["scenarios"].items():
+        if "skipped" in scenario:
+            print(f"  {name}: skipped - {scenario['skipped']}")
+            continue
+        print(
+            f"  {name}: {scenario['parcels']} parcels in {scenario['wall_s']}s "
+            f"({scenario['parcels_per_sec']}/s), p50 {scenario['p50_ms']}ms, p95 {scenario['p95_ms']}ms, "
+            f"db {scenario['db_round_trips_per_parcel']}/parcel, rss {scenario['peak_rss_mb']}MB"
+        )
+    print("=" * 60)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Offline pipeline throughput benchmark with provider stand-ins")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="Scenario to run (repeatable, default all)")
+    parser.add_argument("--iterations", type=int, default=10, help="Calls per search / tiles scenario")
+    parser.add_argument("--area-cells", type=int, default=20, help="Search polygon width in synthetic parcels")
+    parser.add_argument("--enrichments", type=int, default=10, help="Addresses to enrich")
+    parser.add_argument("--concurrency", type=int, default=5, help="Concurrent enrichments")
+    parser.add_argument("--max-lots", type=int, default=10, help="Parcels per discovery job")
+    parser.add_argument("--latency", action="append", default=[], metavar="PROVIDER=SPEC", help="Override a provider latency distribution")
+    parser.add_argument("--fixtures", default=None, help="Directory of recorded provider responses")
+    parser.add_argument("--record", action="store_true", help="Call real providers and append responses to --fixtures")
+    parser.add_argument("--strict", action="store_true", help="Fail requests with no recorded fixture instead of synthesizing")
+    parser.add_argument("--no-limits", action="store_true", help="Disable provider rate limits / retries")
+    parser.add_argument("--seed", type=int, default=0, help="Latency sampling seed")
+    parser.add_argument("--output", default=None, help="Write results as JSON")
+    parser.add_argument("--history", default=None, help="Append results to a JSONL history file")
+    parser.add_argument("--baseline", default=None, help="Previous --output file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative regression vs --baseline")
+    parser.add_argument("--verbose", action="store_true", help="Keep application logging")
+    args = parser.parse_args(argv)
+
+    if args.record and not args.fixtures:
+        parser.error("--record needs --fixtures")
+
+    results = run(args)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.history:
+        with open(args.history, "a") as f:
+            f.write(json.dumps(results) + "\n")
+        print(f"Appended to {args.history}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        print(f"Baseline {baseline.get('commit')} ({baseline.get('timestamp')}): "
+              + (f"{len(regressions)} regression(s)" if regressions else "no regressions"))
+        for line in regressions:
+            print(f"  ✗ {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,657 @@
+"""
+Offline provider stand-ins for the pipeline benchmarks.
+
+ReplayTransport sits where the network transport normally goes in
+http_clients (beneath the provider rate limits / retries), so every
+service call runs its real request-building and parsing code:
+
+- Recorded responses from a fixtures directory are replayed first
+  (one <provider>.jsonl file per provider, keyed by method, URL,
+  query and body with tokens/keys stripped)
+- Anything not recorded is answered by a deterministic synthetic
+  stand-in: Regrid query/area/point/typeahead, Regrid MVT tiles, Google
+  Places/Geocoding/Static Maps, an OpenAI-compatible chat completions
+  stub (VLM scores and enrichment JSON) and property web pages
+- Each response is delayed by the provider's latency distribution
+
+Record mode forwards to the real network and appends every response to
+the fixtures directory (real keys needed, real quota spent).
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import logging
+import math
+import os
+import random
+import re
+import threading
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+from urllib.parse import parse_qsl
+
+import httpx
+import mapbox_vector_tile
+import mercantile
+from PIL import Image
+
+from app.core.http_client_manager import ProviderConfig, network_transport
+
+logger = logging.getLogger(__name__)
+
+# Query / body keys that carry credentials - never part of a fixture key or file
+SECRET_KEYS = {"token", "key", "api_key", "apikey"}
+
+DEFAULT_LATENCY = {
+    "regrid": "lognormal:250:0.4",
+    "tiles": "lognormal:60:0.5",
+    "google": "lognormal:120:0.4",
+    "openrouter": "lognormal:2500:0.35",
+    "web": "lognormal:400:0.6",
+    "census": "lognormal:150:0.3",
+    "apollo": "lognormal:300:0.3",
+    "default": "fixed:50",
+}
+
+STANDIN_WEBSITE = "https://benchmark-property.example"
+
+
+# ----------------------------------------------------------------------------
+# Latency distributions
+# ----------------------------------------------------------------------------
+
+@dataclass
+class LatencySpec:
+    """Response delay in ms: none, fixed:MS, uniform:LO:HI or lognormal:MEDIAN:SIGMA."""
+    kind: str = "none"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, text: str) -> "LatencySpec":
+        parts = text.strip().lower().split(":")
+        kind, numbers = parts[0], [float(p) for p in parts[1:]]
+        expected = {"none": 0, "fixed": 1, "uniform": 2, "lognormal": 2}
+        if kind not in expected or len(numbers) != expected[kind]:
+            raise ValueError(f"Bad latency spec '{text}' (none, fixed:MS, uniform:LO:HI, lognormal:MEDIAN:SIGMA)")
+        return cls(kind, *numbers)
+
+    def sample_s(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            ms = self.a
+        elif self.kind == "uniform":
+            ms = rng.uniform(self.a, self.b)
+        elif self.kind == "lognormal":
+            ms = rng.lognormvariate(math.log(self.a), self.b) if self.a > 0 else 0.0
+        else:
+            ms = 0.0
+        return ms / 1000.0
+
+    def __str__(self) -> str:
+        if self.kind == "none":
+            return "none"
+        if self.kind == "fixed":
+            return f"fixed:{self.a:g}"
+        return f"{self.kind}:{self.a:g}:{self.b:g}"
+
+
+def parse_latency_overrides(values: Iterable[str]) -> Dict[str, LatencySpec]:
+    """Parse repeated PROVIDER=SPEC arguments on top of DEFAULT_LATENCY."""
+    specs = {name: LatencySpec.parse(spec) for name, spec in DEFAULT_LATENCY.items()}
+    for value in values:
+        name, _, spec = value.partition("=")
+        if not spec:
+            raise ValueError(f"Expected PROVIDER=SPEC, got '{value}'")
+        if name == "all":
+            specs = {provider: LatencySpec.parse(spec) for provider in specs}
+        else:
+            specs[name] = LatencySpec.parse(spec)
+    return specs
+
+
+# ----------------------------------------------------------------------------
+# Recorded fixtures
+# ----------------------------------------------------------------------------
+
+def _response(request: httpx.Request, status: int, content_type: Optional[str], content: bytes) -> httpx.Response:
+    """Unread streaming response, like a network transport returns (so stream wrappers see it closed)."""
+    headers = {"Content-Type": content_type or "application/octet-stream", "Content-Length": str(len(content))}
+    return httpx.Response(status, headers=headers, stream=httpx.ByteStream(content), request=request)
+
+
+def fixture_key(request: httpx.Request) -> str:
+    """Stable request key with credentials stripped."""
+    query = sorted((k, v) for k, v in parse_qsl(request.url.query.decode("utf-8")) if k.lower() not in SECRET_KEYS)
+    key = f"{request.method} {request.url.scheme}://{request.url.host}{request.url.path}"
+    if query:
+        key += "?" + "&".join(f"{k}={v}" for k, v in query)
+    body = request.content
+    if body:
+        try:
+            data = json.loads(body)
+            if isinstance(data, dict):
+                data = {k: v for k, v in data.items() if k.lower() not in SECRET_KEYS}
+            body = json.dumps(data, sort_keys=True).encode("utf-8")
+        except ValueError:
+            pass
+        key += " #" + hashlib.sha256(body).hexdigest()[:16]
+    return key
+
+
+class FixtureStore:
+    """Recorded responses, one JSONL file per provider."""
+
+    def __init__(self, directory: Optional[str]):
+        self.directory = directory
+        self._responses: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        if directory and os.path.isdir(directory):
+            for filename in sorted(os.listdir(directory)):
+                if filename.endswith(".jsonl"):
+                    self._load(filename[:-len(".jsonl")], os.path.join(directory, filename))
+
+    def _load(self, provider: str, path: str) -> None:
+        entries = self._responses.setdefault(provider, {})
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries[entry["key"]] = entry
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._responses.values())
+
+    def lookup(self, provider: str, request: httpx.Request) -> Optional[httpx.Response]:
+        entry = self._responses.get(provider, {}).get(fixture_key(request))
+        if entry is None:
+            return None
+        return _response(request, entry["status"], entry.get("content_type"), base64.b64decode(entry["body_b64"]))
+
+    def save(self, provider: str, request: httpx.Request, response: httpx.Response) -> None:
+        if not self.directory:
+            return
+        entry = {
+            "key": fixture_key(request),
+            "status": response.status_code,
+            "content_type": response.headers.get("content-type"),
+            "body_b64": base64.b64encode(response.content).decode("ascii"),
+        }
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, f"{provider}.jsonl"), "a") as f:
+                f.write(json.dumps(entry) + "\n")
+            self._responses.setdefault(provider, {})[entry["key"]] = entry
+
+
+# ----------------------------------------------------------------------------
+# Synthetic stand-ins
+# ----------------------------------------------------------------------------
+
+USEDESC_BY_STRUCTURE = [
+    (1200, "APARTMENTS 5+ UNITS"),
+    (1250, "CONDOMINIUM"),
+    (2100, "RETAIL STORE"),
+    (2200, "OFFICE BUILDING"),
+    (2600, "WAREHOUSE"),
+    (1100, "SINGLE FAMILY RESIDENCE"),
+]
+
+
+class SyntheticParcelGrid:
+    """Deterministic grid of square parcels around a center point."""
+
+    def __init__(self, center_lat: float = 30.2672, center_lng: float = -97.7431,
+                 size: int = 60, cell_deg: float = 0.0015, seed: int = 7):
+        self.size = size
+        self.cell = cell_deg
+        self.west = center_lng - size * cell_deg / 2
+        self.south = center_lat - size * cell_deg / 2
+        self.seed = seed
+        self._features: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        return (self.west, self.south, self.west + self.size * self.cell, self.south + self.size * self.cell)
+
+    def area_polygon(self, cells: int) -> Dict[str, Any]:
+        """GeoJSON square covering cells x cells parcels at the grid center."""
+        half = cells * self.cell / 2
+        lng, lat = self.west + self.size * self.cell / 2, self.south + self.size * self.cell / 2
+        ring = [[lng - half, lat - half], [lng + half, lat - half], [lng + half, lat + half],
+                [lng - half, lat + half], [lng - half, lat - half]]
+        return {"type": "Polygon", "coordinates": [ring]}
+
+    def _ring(self, i: int, j: int) -> List[List[float]]:
+        inset = self.cell * 0.05
+        w = self.west + i * self.cell + inset
+        s = self.south + j * self.cell + inset
+        e = w + self.cell - 2 * inset
+        n = s + self.cell - 2 * inset
+        return [[w, s], [e, s], [e, n], [w, n], [w, s]]
+
+    def feature(self, i: int, j: int) -> Dict[str, Any]:
+        cached = self._features.get((i, j))
+        if cached:
+            return cached
+        rng = random.Random(self.seed * 1_000_003 + i * 1009 + j)
+        base_code, usedesc = USEDESC_BY_STRUCTURE[rng.randrange(len(USEDESC_BY_STRUCTURE))]
+        structure = base_code + rng.randrange(0, 50)
+        # Roughly half the parcels carry activity codes, matching real county coverage
+        activity = structure if rng.random() < 0.5 else None
+        uuid = f"bench-{self.seed}-{i:04d}-{j:04d}"
+        fields = {
+            "ll_uuid": uuid,
+            "parcelnumb": f"{i:04d}{j:04d}",
+            "address": f"{100 + i * 10 + j} Benchmark Ave",
+            "scity": "Austin",
+            "state2": "TX",
+            "szip5": "78701",
+            "geoid": "48453",
+            "owner": f"Bench Holdings {rng.randrange(1, 40)} LLC",
+            "ll_gisacre": round(rng.uniform(0.3, 6.0), 3),
+            "usedesc": usedesc,
+            "usecode": str(base_code),
+            "zoning": "MF-3" if base_code < 2000 else "CS",
+            "lbcs_structure": structure,
+            "lbcs_activity": activity,
+            "yearbuilt": rng.randrange(1960, 2020),
+        }
+        feature = {
+            "type": "Feature",
+            "id": i * self.size + j,
+            "geometry": {"type": "Polygon", "coordinates": [self._ring(i, j)]},
+            "properties": {"headline": fields["address"], "ll_uuid": uuid, "fields": fields},
+        }
+        self._features[(i, j)] = feature
+        return feature
+
+    def cells_in(self, west: float, south: float, east: float, north: float) -> Iterable[Tuple[int, int]]:
+        i0 = max(0, int((west - self.west) / self.cell))
+        i1 = min(self.size - 1, int((east - self.west) / self.cell))
+        j0 = max(0, int((south - self.south) / self.cell))
+        j1 = min(self.size - 1, int((north - self.south) / self.cell))
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                yield i, j
+
+    def all_cells(self) -> Iterable[Tuple[int, int]]:
+        return self.cells_in(*self.bounds)
+
+    def cell_at(self, lat: float, lng: float) -> Optional[Tuple[int, int]]:
+        i, j = int((lng - self.west) / self.cell), int((lat - self.south) / self.cell)
+        if 0 <= i < self.size and 0 <= j < self.size:
+            return i, j
+        return None
+
+
+def _field_filters(params: Dict[str, str]) -> List[Tuple[str, str, str]]:
+    filters = []
+    for key, value in params.items():
+        match = re.fullmatch(r"fields\[(\w+)\]\[(\w+)\]", key)
+        if match:
+            filters.append((match.group(1), match.group(2), value))
+    return filters
+
+
+def _matches(fields: Dict[str, Any], filters: List[Tuple[str, str, str]]) -> bool:
+    for name, op, value in filters:
+        actual = fields.get(name)
+        if actual is None:
+            return False
+        if op == "eq":
+            if str(actual).lower() != str(value).lower():
+                return False
+        elif op == "ilike":
+            if str(value).strip("%").lower() not in str(actual).lower():
+                return False
+        elif op in ("gte", "lte"):
+            try:
+                actual_f, value_f = float(actual), float(value)
+            except (TypeError, ValueError):
+                return False
+            if (op == "gte" and actual_f < value_f) or (op == "lte" and actual_f > value_f):
+                return False
+    return True
+
+
+def _json(status: int, data: Any) -> Tuple[int, str, bytes]:
+    return status, "application/json", json.dumps(data).encode("utf-8")
+
+
+class SyntheticProviders:
+    """Deterministic answers for every provider the pipelines call."""
+
+    def __init__(self, grid: Optional[SyntheticParcelGrid] = None):
+        self.grid = grid or SyntheticParcelGrid()
+        self._images: Dict[Tuple[int, int], bytes] = {}
+        self._lock = threading.Lock()
+
+    def respond(self, request: httpx.Request) -> Tuple[int, str, bytes]:
+        host, path = request.url.host, request.url.path
+        params = dict(parse_qsl(request.url.query.decode("utf-8")))
+        if host == "app.regrid.com":
+            return self._regrid(request, path, params)
+        if host == "tiles.regrid.com":
+            return self._tile(path)
+        if host == "maps.googleapis.com":
+            return self._google(path, params)
+        if host == "openrouter.ai" and path.endswith("/chat/completions"):
+            return self._chat(request)
+        if request.method == "GET":
+            return self._web_page(request)
+        return 404, "text/plain", b"not found"
+
+    # Regrid ---------------------------------------------------------------
+
+    def _regrid(self, request: httpx.Request, path: str, params: Dict[str, str]) -> Tuple[int, str, bytes]:
+        if path.endswith("/parcels/query"):
+            cells = self.grid.all_cells()
+            if params.get("bbox"):
+                west, south, east, north = (float(v) for v in params["bbox"].split(","))
+                cells = self.grid.cells_in(west, south, east, north)
+            filters = _field_filters(params)
+            matched = [f for f in (self.grid.feature(i, j) for i, j in cells) if _matches(f["properties"]["fields"], filters)]
+            skip, limit = int(params.get("skip", 0)), int(params.get("limit", 1000))
+            return _json(200, {"parcels": {"type": "FeatureCollection", "features": matched[skip:skip + limit]}})
+        if path.endswith("/parcels/area"):
+            body = json.loads(request.content or b"{}")
+            coordinates = [c for ring in body.get("geojson", {}).get("coordinates", []) for c in ring]
+            if not coordinates:
+                return _json(400, {"message": "geojson required"})
+            lngs, lats = [c[0] for c in coordinates], [c[1] for c in coordinates]
+            cells = self.grid.cells_in(min(lngs), min(lats), max(lngs), max(lats))
+            features = [self.grid.feature(i, j) for i, j in cells][:int(body.get("limit", 1000))]
+            return _json(200, {"parcels": {"type": "FeatureCollection", "features": features}})
+        if path.endswith("/parcels/point"):
+            cell = self.grid.cell_at(float(params.get("lat", 0)), float(params.get("lon", 0)))
+            if cell is None:
+                return _json(404, {"message": "no parcel"})
+            return _json(200, {"parcels": {"type": "FeatureCollection", "features": [self.grid.feature(*cell)]}})
+        if path.endswith("/typeahead"):
+            return _json(200, [])
+        return _json(404, {"message": "unknown endpoint"})
+
+    def _tile(self, path: str) -> Tuple[int, str, bytes]:
+        match = re.search(r"/(\d+)/(\d+)/(\d+)\.mvt$", path)
+        if not match:
+            return 404, "text/plain", b""
+        tile = mercantile.Tile(int(match.group(2)), int(match.group(3)), int(match.group(1)))
+        bounds = mercantile.bounds(tile)
+        width, height = bounds.east - bounds.west, bounds.north - bounds.south
+
+        def to_tile(lng: float, lat: float) -> Tuple[int, int]:
+            # Tile pixel space with y down, as RegridTileService reads it
+            return round((lng - bounds.west) / width * 4096), round((bounds.north - lat) / height * 4096)
+
+        features = []
+        for i, j in self.grid.cells_in(bounds.west, bounds.south, bounds.east, bounds.north):
+            feature = self.grid.feature(i, j)
+            ring = [to_tile(lng, lat) for lng, lat in feature["geometry"]["coordinates"][0]]
+            fields = feature["properties"]["fields"]
+            features.append({
+                "geometry": "POLYGON ((" + ", ".join(f"{x} {y}" for x, y in ring) + "))",
+                "properties": {k: fields[k] for k in ("ll_uuid", "parcelnumb", "address", "owner")},
+            })
+        if not features:
+            return 204, "application/vnd.mapbox-vector-tile", b""
+        content = mapbox_vector_tile.encode([{"name": "parcels", "features": features}])
+        return 200, "application/vnd.mapbox-vector-tile", content
+
+    # Google ---------------------------------------------------------------
+
+    def _place(self, index: int, lat: float, lng: float) -> Dict[str, Any]:
+        return {
+            "place_id": f"bench-place-{index}",
+            "name": f"Benchmark Property {index}",
+            "formatted_address": f"{100 + index} Benchmark Ave, Austin, TX 78701, USA",
+            "geometry": {"location": {"lat": lat + index * 0.0002, "lng": lng + index * 0.0002}},
+            "types": ["point_of_interest", "establishment"],
+            "business_status": "OPERATIONAL",
+            "rating": 4.2,
+            "user_ratings_total": 40 + index,
+        }
+
+    def _google(self, path: str, params: Dict[str, str]) -> Tuple[int, str, bytes]:
+        west, south, east, north = self.grid.bounds
+        lat, lng = (south + north) / 2, (west + east) / 2
+        if params.get("location"):
+            lat, lng = (float(v) for v in params["location"].split(","))
+        if path.endswith("/place/textsearch/json") or path.endswith("/place/nearbysearch/json"):
+            return _json(200, {"status": "OK", "results": [self._place(n, lat, lng) for n in range(3)]})
+        if path.endswith("/place/details/json"):
+            suffix = params.get("place_id", "").rsplit("-", 1)[-1]
+            index = int(suffix) if suffix.isdigit() else 0
+            place = self._place(index, lat, lng)
+            place.update({
+                "formatted_phone_number": f"(512) 555-01{index:02d}",
+                "international_phone_number": f"+1 512-555-01{index:02d}",
+                "website": f"{STANDIN_WEBSITE}/property/{index}",
+            })
+            return _json(200, {"status": "OK", "result": place})
+        if path.endswith("/geocode/json"):
+            return _json(200, {"status": "OK", "results": [{
+                "formatted_address": "100 Benchmark Ave, Austin, TX 78701, USA",
+                "geometry": {"location": {"lat": lat, "lng": lng}, "location_type": "ROOFTOP"},
+                "address_components": [],
+            }]})
+        if path.endswith("/staticmap"):
+            size = params.get("size", "640x640").split("x")
+            scale = int(params.get("scale", 1))
+            return 200, "image/jpeg", self._image(int(size[0]) * scale, int(size[1]) * scale)
+        return _json(404, {"status": "NOT_FOUND"})
+
+    def _image(self, width: int, height: int) -> bytes:
+        with self._lock:
+            cached = self._images.get((width, height))
+            if cached is None:
+                # Noise compresses like real imagery, so encode/decode costs are realistic
+                noise = Image.frombytes("L", (width, height), random.Random(width * height).randbytes(width * height))
+                img = Image.merge("RGB", (noise, noise.point(lambda v: v // 2 + 60), noise.point(lambda v: v // 3 + 40)))
+                buffer = io.BytesIO()
+                img.save(buffer, format="JPEG", quality=85)
+                cached = self._images[(width, height)] = buffer.getvalue()
+            return cached
+
+    # OpenRouter -----------------------------------------------------------
+
+    def _chat(self, request: httpx.Request) -> Tuple[int, str, bytes]:
+        body = json.loads(request.content or b"{}")
+        prompt = json.dumps(body.get("messages", []))
+        digest = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+        if "lead_score" in prompt:
+            answer = {
+                "lead_score": 35 + digest % 60,
+                "confidence": 60 + digest % 35,
+                "reasoning": "Synthetic benchmark response: visible cracking and faded striping on the main lot.",
+                "observations": {
+                    "paved_area_pct": 30 + digest % 50,
+                    "building_pct": 20 + digest % 30,
+                    "landscaping_pct": 10 + digest % 20,
+                    "condition": ["excellent", "good", "fair", "poor", "critical"][digest % 5],
+                    "visible_issues": ["cracking", "faded striping"],
+                },
+            }
+        else:
+            # One object answering every enrichment prompt (strategy, page analysis, verification, selection)
+            contact = {
+                "name": "Jordan Bench",
+                "title": "Property Manager",
+                "phone": "(512) 555-0100",
+                "email": "jordan@benchmark-property.example",
+                "company": "Bench Property Management",
+                "is_decision_maker": True,
+            }
+            answer = {
+                "strategies": [
+                    {"action": "search_google", "query": "Benchmark Property Austin TX"},
+                    {"action": "visit_url", "url": f"{STANDIN_WEBSITE}/"},
+                ],
+                "is_correct_property": True,
+                "confidence": 0.9,
+                "reason": "Address matches",
+                "property_name": "Benchmark Property",
+                "contacts_found": [contact],
+                "management_company": contact["company"],
+                "management_phone": contact["phone"],
+                "management_email": contact["email"],
+                "links_to_follow": [],
+                "selected_contact": contact,
+                "verification": "Listed as property manager on the property website",
+                "sources_validated": ["Google Places", "Website"],
+                "validated_contacts": [{**contact, "sources_found": ["Google Places", "Website"], "validation_confidence": 0.9}],
+                "best_decision_maker": {**contact, "confidence": 0.9, "reasoning": "Manager of record"},
+                "found_match": False,
+            }
+        content = json.dumps(answer)
+        prompt_tokens = len(prompt) // 4 + (765 if "image_url" in prompt else 0)
+        completion_tokens = len(content) // 4
+        return _json(200, {
+            "id": f"gen-bench-{digest:x}",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body.get("model", "stub"),
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "cost": round((prompt_tokens * 0.15 + completion_tokens * 0.6) / 1_000_000, 8),
+            },
+        })
+
+    # Web ------------------------------------------------------------------
+
+    def _web_page(self, request: httpx.Request) -> Tuple[int, str, bytes]:
+        html = f"""<html><head><title>Benchmark Property - {request.url.host}</title></head>
+<body><h1>Benchmark Property</h1><h2>Contact the leasing office</h2>
+<p>Managed by Bench Property Management. Call (512) 555-0100 or email
+<a href="mailto:jordan@benchmark-property.example">jordan@benchmark-property.example</a>.</p>
+<p>Jordan Bench, Property Manager</p><a href="/contact">Contact</a>
+{'<p>' + ' '.join(['Spacious units close to downtown.'] * 200) + '</p>'}
+</body></html>"""
+        return 200, "text/html; charset=utf-8", html.encode("utf-8")
+
+
+# ----------------------------------------------------------------------------
+# Transport
+# ----------------------------------------------------------------------------
+
+@dataclass
+class ReplayCounters:
+    requests: int = 0
+    fixture_hits: int = 0
+    synthetic: int = 0
+    recorded: int = 0
+    bytes: int = 0
+    latency_s: float = 0.0
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answers one provider's requests from fixtures, stand-ins or (record mode) the network."""
+
+    def __init__(
+        self,
+        provider: str,
+        store: FixtureStore,
+        synthetic: SyntheticProviders,
+        latency: LatencySpec,
+        counters: ReplayCounters,
+        upstream: Optional[httpx.AsyncBaseTransport] = None,
+        strict: bool = False,
+        seed: int = 0,
+    ):
+        self.provider = provider
+        self.store = store
+        self.synthetic = synthetic
+        self.latency = latency
+        self.counters = counters
+        self.upstream = upstream
+        self.strict = strict
+        self._rng = random.Random(f"{seed}:{provider}")
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        self.counters.requests += 1
+
+        if self.upstream is not None:
+            response = await self.upstream.handle_async_request(request)
+            await response.aread()
+            self.store.save(self.provider, request, response)
+            self.counters.recorded += 1
+            self.counters.bytes += len(response.content)
+            # Body is already decoded - drop content-encoding / length headers
+            return _response(request, response.status_code, response.headers.get("content-type"), response.content)
+
+        delay = self.latency.sample_s(self._rng)
+        if delay:
+            self.counters.latency_s += delay
+            await asyncio.sleep(delay)
+
+        response = self.store.lookup(self.provider, request)
+        if response is not None:
+            self.counters.fixture_hits += 1
+        elif self.strict:
+            raise httpx.ConnectError(f"No recorded fixture for {fixture_key(request)}", request=request)
+        else:
+            status, content_type, content = self.synthetic.respond(request)
+            self.counters.synthetic += 1
+            response = _response(request, status, content_type, content)
+        self.counters.bytes += int(response.headers["Content-Length"])
+        return response
+
+    async def aclose(self) -> None:
+        if self.upstream is not None:
+            await self.upstream.aclose()
+
+
+class ReplayEnvironment:
+    """Builds ReplayTransports for http_clients.transport_factory and keeps their counters."""
+
+    def __init__(
+        self,
+        fixtures_dir: Optional[str] = None,
+        latency: Optional[Dict[str, LatencySpec]] = None,
+        record: bool = False,
+        strict: bool = False,
+        grid: Optional[SyntheticParcelGrid] = None,
+        seed: int = 0,
+    ):
+        self.store = FixtureStore(fixtures_dir)
+        self.synthetic = SyntheticProviders(grid)
+        self.latency = latency or parse_latency_overrides([])
+        self.record = record
+        self.strict = strict
+        self.seed = seed
+        self.counters: Dict[str, ReplayCounters] = {}
+
+    @property
+    def grid(self) -> SyntheticParcelGrid:
+        return self.synthetic.grid
+
+    def transport_factory(self, provider: str, cfg: ProviderConfig) -> httpx.AsyncBaseTransport:
+        counters = self.counters.setdefault(provider, ReplayCounters())
+        return ReplayTransport(
+            provider,
+            self.store,
+            self.synthetic,
+            self.latency.get(provider) or self.latency.get("default") or LatencySpec(),
+            counters,
+            upstream=network_transport(cfg) if self.record else None,
+            strict=self.strict,
+            seed=self.seed,
+        )
+
+    def reset_counters(self) -> None:
+        for counters in self.counters.values():
+            for name, value in vars(ReplayCounters()).items():
+                setattr(counters, name, value)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            provider: {**vars(c), "latency_s": round(c.latency_s, 2)}
+            for provider, c in sorted(self.counters.items())
+            if c.requests
+        }
@@ -0,0 +1,296 @@
+"""
+Surface association micro-benchmark.
+
+Runs PropertyAssociationService.associate_with_property_boundary over
+saved segmentation fixtures and times it against the previous scalar
+implementation (one contains / buffered intersects / intersection /
+distance call per surface). Both paths must agree on every surface
+before a timing is reported.
+
+Usage (from backend/):
+    python -m benchmarks.surface_association                        # all saved fixtures
+    python -m benchmarks.surface_association --repeat 50 --output results.json
+    python -m benchmarks.surface_association --write-fixture benchmarks/fixtures/surface_association/site.json --surfaces 800
+
+Fixture format (JSON): business_location [lat, lng], property_boundary
+(WKT), buildings and surfaces as lists of {wkt, class_name, confidence,
+area_m2}.
+"""
+
+import argparse
+import glob
+import json
+import logging
+import math
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple
+
+from shapely import wkt
+from shapely.affinity import rotate
+from shapely.geometry import Point, Polygon, box
+
+from app.core.property_association_service import PropertyAssociationService
+
+DEFAULT_FIXTURE_GLOB = "benchmarks/fixtures/surface_association/*.json"
+M_PER_DEG = 111000
+
+
+@dataclass
+class FixturePolygon:
+    """Saved segmentation output with the fields the service reads from DetectedPolygon."""
+    polygon: Polygon
+    class_name: str
+    confidence: float
+    area_m2: Optional[float]
+    pixel_points: List[dict] = field(default_factory=list)
+
+
+def _load_fixture(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        raw = json.load(f)
+
+    def polygons(items: List[Dict[str, Any]]) -> List[FixturePolygon]:
+        return [
+            FixturePolygon(
+                polygon=wkt.loads(item["wkt"]),
+                class_name=item.get("class_name", "paved"),
+                confidence=item.get("confidence", 1.0),
+                area_m2=item.get("area_m2"),
+            )
+            for item in items
+        ]
+
+    return {
+        "name": path,
+        "business_location": tuple(raw["business_location"]),
+        "property_boundary": wkt.loads(raw["property_boundary"]),
+        "buildings": polygons(raw["buildings"]),
+        "surfaces": polygons(raw["surfaces"]),
+    }
+
+
+def _legacy_associate(
+    service: PropertyAssociationService,
+    buildings: List[FixturePolygon],
+    paved_surfaces: List[FixturePolygon],
+    property_boundary: Polygon,
+    business_location: Tuple[float, float],
+) -> List[Tuple[bool, str, Optional[float], str]]:
+    """The per-surface scalar loop the vectorized path replaced."""
+    valid_surfaces = [p for p in paved_surfaces if p.area_m2 and p.area_m2 >= service.MIN_AREA_M2]
+
+    lat, lng = business_location
+    point = Point(lng, lat)
+    business_building = None
+    min_distance = float("inf")
+    for building in buildings:
+        distance = building.polygon.distance(point)
+        if distance < min_distance:
+            min_distance = distance
+            business_building = building
+
+    boundary_buffered = property_boundary.buffer(0.00002)
+    rows = []
+    for surface in valid_surfaces:
+        is_within = property_boundary.contains(surface.polygon.centroid)
+        is_intersecting = boundary_buffered.intersects(surface.polygon)
+        if is_intersecting:
+            try:
+                intersection = surface.polygon.intersection(boundary_buffered)
+                intersection_pct = (intersection.area / surface.polygon.area * 100) if surface.polygon.area > 0 else 0
+            except Exception:
+                intersection_pct = 0
+        else:
+            intersection_pct = 0
+
+        is_associated = is_within or intersection_pct > 30
+
+        dist_to_building = None
+        area_type = "unknown"
+        if business_building:
+            dist_to_building = service._distance_between_m(surface.polygon, business_building.polygon)
+            area_type = service._classify_area_type(surface, business_building)
+
+        if is_associated:
+            reason = "within_property_boundary" if is_within else f"intersects_boundary_{intersection_pct:.0f}pct"
+        else:
+            reason = f"minimal_intersection_{intersection_pct:.0f}pct" if intersection_pct > 0 else "outside_property_boundary"
+
+        rows.append((is_associated, reason, dist_to_building, area_type))
+    return rows
+
+
+def _vectorized_associate(
+    service: PropertyAssociationService,
+    buildings: List[FixturePolygon],
+    paved_surfaces: List[FixturePolygon],
+    property_boundary: Polygon,
+    business_location: Tuple[float, float],
+) -> List[Tuple[bool, str, Optional[float], str]]:
+    _, areas = service.associate_with_property_boundary(buildings, paved_surfaces, property_boundary, business_location)
+    return [(a.is_associated, a.association_reason, a.distance_to_building_m, a.area_type) for a in areas]
+
+
+def _mismatches(legacy: List[Tuple], vectorized: List[Tuple]) -> int:
+    if len(legacy) != len(vectorized):
+        return abs(len(legacy) - len(vectorized))
+    count = 0
+    for old, new in zip(legacy, vectorized):
+        same_distance = (
+            old[2] is None and new[2] is None
+            or old[2] is not None and new[2] is not None and math.isclose(old[2], new[2], rel_tol=1e-9, abs_tol=1e-6)
+        )
+        if old[0] != new[0] or old[1] != new[1] or old[3] != new[3] or not same_distance:
+            count += 1
+    return count
+
+
+def _time(fn, repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    service = PropertyAssociationService()
+    paths = sorted(glob.glob(args.fixtures))
+    if not paths:
+        print(f"No fixtures matched {args.fixtures}")
+        return {"fixtures": []}
+
+    rows = []
+    for path in paths:
+        fixture = _load_fixture(path)
+        call_args = (
+            service,
+            fixture["buildings"],
+            fixture["surfaces"],
+            fixture["property_boundary"],
+            fixture["business_location"],
+        )
+
+        mismatches = _mismatches(_legacy_associate(*call_args), _vectorized_associate(*call_args))
+        legacy_ms = statistics.median(_time(lambda: _legacy_associate(*call_args), args.repeat))
+        vectorized_ms = statistics.median(_time(lambda: _vectorized_associate(*call_args), args.repeat))
+
+        row = {
+            "fixture": path,
+            "surfaces": len(fixture["surfaces"]),
+            "buildings": len(fixture["buildings"]),
+            "legacy_ms": round(legacy_ms, 3),
+            "vectorized_ms": round(vectorized_ms, 3),
+            "speedup": round(legacy_ms / vectorized_ms, 1) if vectorized_ms else None,
+            "mismatches": mismatches,
+        }
+        rows.append(row)
+        print(
+            f"{path}: {row['surfaces']} surfaces, {row['buildings']} buildings  "
+            f"legacy {row['legacy_ms']:.2f}ms -> vectorized {row['vectorized_ms']:.2f}ms "
+            f"({row['speedup']}x)  mismatches={mismatches}"
+        )
+
+    summary = {
+        "fixtures": len(rows),
+        "surfaces": sum(r["surfaces"] for r in rows),
+        "legacy_ms": round(sum(r["legacy_ms"] for r in rows), 3),
+        "vectorized_ms": round(sum(r["vectorized_ms"] for r in rows), 3),
+        "mismatches": sum(r["mismatches"] for r in rows),
+    }
+    summary["speedup"] = round(summary["legacy_ms"] / summary["vectorized_ms"], 1) if summary["vectorized_ms"] else None
+
+    print("")
+    print("=" * 60)
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+    print("=" * 60)
+
+    return {"summary": summary, "fixtures": rows}
+
+
+def write_synthetic_fixture(path: str, surfaces: int, buildings: int, seed: int) -> None:
+    """
+    Write a synthetic site: a ~150x100m parcel with the business building
+    inside, surrounded by paved blobs inside, straddling and outside the
+    boundary (roughly the mix segmentation produces on commercial sites).
+    """
+    rng = random.Random(seed)
+    lat, lng = 33.4484, -112.0740
+    m_lng = 1 / (M_PER_DEG * math.cos(math.radians(lat)))
+    m_lat = 1 / M_PER_DEG
+
+    def rect(cx_m: float, cy_m: float, w_m: float, h_m: float, angle: float = 0.0) -> Polygon:
+        poly = box(
+            lng + (cx_m - w_m / 2) * m_lng, lat + (cy_m - h_m / 2) * m_lat,
+            lng + (cx_m + w_m / 2) * m_lng, lat + (cy_m + h_m / 2) * m_lat,
+        )
+        return rotate(poly, angle, origin="centroid") if angle else poly
+
+    def item(poly: Polygon, w_m: float, h_m: float, class_name: str) -> Dict[str, Any]:
+        return {
+            "wkt": poly.wkt,
+            "class_name": class_name,
+            "confidence": round(rng.uniform(0.4, 0.99), 3),
+            "area_m2": round(w_m * h_m, 1),
+        }
+
+    boundary = rect(0, 0, 150, 100)
+    building_items = [item(rect(10, 15, 40, 30), 40, 30, "building")]
+    for _ in range(buildings - 1):
+        w, h = rng.uniform(10, 40), rng.uniform(10, 40)
+        building_items.append(item(rect(rng.uniform(-200, 200), rng.uniform(-200, 200), w, h), w, h, "building"))
+
+    surface_items = []
+    for _ in range(surfaces):
+        if rng.random() < 0.1:
+            # Road-like strips
+            w, h = rng.uniform(60, 200), rng.uniform(6, 12)
+        else:
+            w, h = rng.uniform(3, 40), rng.uniform(3, 40)
+        cx, cy = rng.uniform(-180, 180), rng.uniform(-140, 140)
+        surface_items.append(item(rect(cx, cy, w, h, rng.choice([0, 0, 15, 30, 45])), w, h, "paved"))
+
+    with open(path, "w") as f:
+        json.dump({
+            "business_location": [lat + 15 * m_lat, lng + 10 * m_lng],
+            "property_boundary": boundary.wkt,
+            "buildings": building_items,
+            "surfaces": surface_items,
+        }, f)
+    print(f"Wrote {surfaces} surfaces, {buildings} buildings to {path}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark vectorized surface-to-parcel association")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURE_GLOB, help=f"Glob of fixture files (default: {DEFAULT_FIXTURE_GLOB})")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per path per fixture (median reported)")
+    parser.add_argument("--output", default=None, help="Write full results as JSON")
+    parser.add_argument("--write-fixture", default=None, help="Write a synthetic fixture to this path and exit")
+    parser.add_argument("--surfaces", type=int, default=400, help="Surfaces in a synthetic fixture")
+    parser.add_argument("--buildings", type=int, default=25, help="Buildings in a synthetic fixture")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for a synthetic fixture")
+    args = parser.parse_args(argv)
+
+    if args.write_fixture:
+        write_synthetic_fixture(args.write_fixture, args.surfaces, args.buildings, args.seed)
+        return
+
+    # Per-surface debug logs would dominate the timings
+    logging.getLogger("app.core.property_association_service").setLevel(logging.WARNING)
+
+    results = run(args)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,188 @@
+"""
+VLM image policy benchmark.
+
+Scores a saved image set twice - once at full resolution (JPEG q95,
+detail=high, the pre-preprocessing behaviour) and once through
+VLMImagePreprocessor - and reports score drift against token savings.
+
+Usage (from backend/):
+    python -m benchmarks.vlm_image_policy --dry-run              # token estimates only, no API calls
+    python -m benchmarks.vlm_image_policy --limit 10             # score 10 images both ways
+    python -m benchmarks.vlm_image_policy --area-m2 1500 --output results.json
+
+Scoring needs OPENROUTER_API_KEY (or --api-key) and spends real credits:
+two VLM calls per image.
+"""
+
+import argparse
+import asyncio
+import base64
+import glob
+import io
+import json
+import os
+import statistics
+import sys
+from typing import Optional, List, Dict, Any
+
+from PIL import Image
+
+from app.core.vlm_analysis_service import vlm_analysis_service
+from app.core.vlm_image_preprocessor import (
+    VLMImagePreprocessor,
+    estimate_image_tokens,
+    BASELINE_JPEG_QUALITY,
+    BASELINE_DETAIL,
+)
+
+DEFAULT_IMAGE_GLOB = "storage/cv_images/*/property_boundary.jpg"
+
+
+def _load_images(pattern: str, limit: Optional[int]) -> List[str]:
+    paths = sorted(glob.glob(pattern))
+    return paths[:limit] if limit else paths
+
+
+def _encode_baseline(img: Image.Image) -> str:
+    buffer = io.BytesIO()
+    img.convert("RGB").save(buffer, format="JPEG", quality=BASELINE_JPEG_QUALITY)
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+async def _score(image_base64: str, detail: str, prompt: Optional[str], api_key: Optional[str]) -> Dict[str, Any]:
+    result = await vlm_analysis_service.analyze_property(
+        image_base64=image_base64,
+        scoring_prompt=prompt,
+        user_api_key=api_key,
+        image_detail=detail,
+    )
+    return {
+        "success": result.success,
+        "lead_score": result.lead_score if result.success else None,
+        "confidence": result.confidence if result.success else None,
+        "prompt_tokens": result.usage.prompt_tokens if result.usage else None,
+        "cost": result.usage.cost if result.usage else None,
+        "error": result.error_message,
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    preprocessor = VLMImagePreprocessor(enabled=True)
+    paths = _load_images(args.images, args.limit)
+    if not paths:
+        print(f"No images matched {args.images}")
+        return {"images": []}
+
+    rows = []
+    for path in paths:
+        img = Image.open(path)
+        img.load()
+        prepared = preprocessor.prepare(img, area_m2=args.area_m2)
+
+        row: Dict[str, Any] = {
+            "image": path,
+            "original_size": f"{img.size[0]}x{img.size[1]}",
+            "prepared_size": f"{prepared.width}x{prepared.height}",
+            "detail": prepared.detail,
+            "jpeg_quality": prepared.jpeg_quality,
+            "baseline_tokens_est": estimate_image_tokens(img.size[0], img.size[1], BASELINE_DETAIL),
+            "prepared_tokens_est": prepared.estimated_tokens,
+            "prepared_bytes": prepared.size_bytes,
+        }
+
+        if not args.dry_run:
+            baseline, candidate = await asyncio.gather(
+                _score(_encode_baseline(img), BASELINE_DETAIL, args.prompt, args.api_key),
+                _score(prepared.image_base64, prepared.detail, args.prompt, args.api_key),
+            )
+            row["baseline"] = baseline
+            row["prepared"] = candidate
+            if baseline["success"] and candidate["success"]:
+                row["score_delta"] = candidate["lead_score"] - baseline["lead_score"]
+
+        rows.append(row)
+        _print_row(row)
+
+    summary = _summarize(rows)
+    print("")
+    print("=" * 60)
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+    print("=" * 60)
+
+    return {"summary": summary, "images": rows}
+
+
+def _print_row(row: Dict[str, Any]) -> None:
+    line = (
+        f"{os.path.basename(os.path.dirname(row['image']))[:8]}  "
+        f"{row['original_size']} -> {row['prepared_size']} ({row['detail']}, q{row['jpeg_quality']})  "
+        f"tokens {row['baseline_tokens_est']} -> {row['prepared_tokens_est']}"
+    )
+    if "score_delta" in row:
+        line += (
+            f"  score {row['baseline']['lead_score']} -> {row['prepared']['lead_score']}"
+            f" (Δ{row['score_delta']:+d})"
+        )
+    elif "baseline" in row:
+        line += f"  error: {row['baseline']['error'] or row['prepared']['error']}"
+    print(line)
+
+
+def _summarize(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    baseline_tokens = sum(r["baseline_tokens_est"] for r in rows)
+    prepared_tokens = sum(r["prepared_tokens_est"] for r in rows)
+    summary: Dict[str, Any] = {
+        "images": len(rows),
+        "baseline_tokens_est": baseline_tokens,
+        "prepared_tokens_est": prepared_tokens,
+        "token_savings_pct": round(100.0 * (baseline_tokens - prepared_tokens) / baseline_tokens, 1) if baseline_tokens else 0.0,
+    }
+
+    deltas = [r["score_delta"] for r in rows if "score_delta" in r]
+    if deltas:
+        abs_deltas = [abs(d) for d in deltas]
+        summary.update({
+            "scored_pairs": len(deltas),
+            "mean_score_delta": round(statistics.mean(deltas), 2),
+            "mean_abs_score_delta": round(statistics.mean(abs_deltas), 2),
+            "max_abs_score_delta": max(abs_deltas),
+            "quality_bucket_agreement_pct": round(100.0 * sum(
+                1 for r in rows if "score_delta" in r
+                and _quality_bucket(r["baseline"]["lead_score"]) == _quality_bucket(r["prepared"]["lead_score"])
+            ) / len(deltas), 1),
+        })
+        baseline_cost = sum(r["baseline"]["cost"] or 0 for r in rows if "baseline" in r)
+        prepared_cost = sum(r["prepared"]["cost"] or 0 for r in rows if "prepared" in r)
+        summary["baseline_cost"] = round(baseline_cost, 6)
+        summary["prepared_cost"] = round(prepared_cost, 6)
+
+    return summary
+
+
+def _quality_bucket(score: int) -> str:
+    """Same high/medium/low split the orchestrators store as lead_quality."""
+    return "high" if score >= 70 else "medium" if score >= 40 else "low"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare VLM scores: full-resolution vs preprocessed images")
+    parser.add_argument("--images", default=DEFAULT_IMAGE_GLOB, help=f"Glob of saved images (default: {DEFAULT_IMAGE_GLOB})")
+    parser.add_argument("--limit", type=int, default=None, help="Max images to process")
+    parser.add_argument("--area-m2", type=float, default=None, help="Parcel area for policy tier selection (default: largest tier)")
+    parser.add_argument("--prompt", default=None, help="Scoring prompt (default: DEFAULT_SCORING_PROMPT)")
+    parser.add_argument("--api-key", default=None, help="OpenRouter key (default: OPENROUTER_API_KEY)")
+    parser.add_argument("--dry-run", action="store_true", help="Only report token estimates, no VLM calls")
+    parser.add_argument("--output", default=None, help="Write full results as JSON")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
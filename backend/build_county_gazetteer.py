@@ -0,0 +1,70 @@
+"""
+Build the bundled county gazetteer (data/us_counties.tsv).
+
+CountyService loads this file at startup for /search/counties
+autocomplete (required outside development). The deploy workflow runs this
+when the file is missing; re-run when the Census county list changes (rare).
+
+Usage:
+    python build_county_gazetteer.py            # From the Census Bureau API
+    python build_county_gazetteer.py --kml      # From the local counties KML layer (usakmls/counties.kml)
+    python build_county_gazetteer.py --output /tmp/us_counties.tsv
+"""
+import asyncio
+import csv
+import sys
+from pathlib import Path
+
+from app.core.boundary_service import get_boundary_service
+from app.core.county_service import CountyService, county_from_fips
+
+
+def counties_from_kml():
+    """Counties from the KML layer (NAMELSAD is the "Dallas County" form the Census API uses)."""
+    features = get_boundary_service().get_layer("counties", use_cache=False).get("features", [])
+    counties = []
+    for feature in features:
+        props = feature.get("properties", {})
+        fips = props.get("GEOID") or props.get("id")
+        name = props.get("NAMELSAD") or props.get("NAME")
+        if fips and name and len(fips) == 5:
+            counties.append(county_from_fips(fips, name))
+    return counties
+
+
+def write_gazetteer(counties, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, delimiter="\t", lineterminator="\n")
+        writer.writerow(["fips", "name"])
+        for county in sorted(counties, key=lambda c: c.fips):
+            writer.writerow([county.fips, county.name])
+
+
+def main():
+    args = sys.argv[1:]
+    output = Path(args[args.index("--output") + 1]) if "--output" in args else CountyService.GAZETTEER_PATH
+    
+    if "--kml" in args:
+        print("Reading counties from the KML layer...")
+        counties = counties_from_kml()
+    else:
+        print("Fetching counties from the Census Bureau API...")
+        counties = asyncio.run(CountyService().fetch_census_counties())
+    
+    if not counties:
+        print("❌ No counties found - nothing written")
+        sys.exit(1)
+    
+    write_gazetteer(counties, output)
+    print(f"✅ Wrote {len(counties)} counties to {output}")
+    
+    # Sanity check: the file loads and the index answers
+    service = CountyService()
+    loaded = service.load_gazetteer(output)
+    sample = asyncio.run(service.search_counties("dallas", 3))
+    print(f"   Reloaded {loaded} counties; 'dallas' -> {[c.full_name for c in sample]}")
+
+
+if __name__ == "__main__":
+    main()
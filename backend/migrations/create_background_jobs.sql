@@ -0,0 +1,29 @@
+-- Create background_jobs table in worksightdev schema
+-- Postgres-backed job queue for discovery and parcel processing, consumed by
+-- worker processes (python -m app.worker) with SELECT ... FOR UPDATE SKIP LOCKED
+CREATE TABLE IF NOT EXISTS worksightdev.background_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id UUID NOT NULL REFERENCES worksightdev.users(id) ON DELETE CASCADE,
+    kind VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL,
+    priority SMALLINT NOT NULL DEFAULT 10,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    cancel_requested BOOLEAN NOT NULL DEFAULT FALSE,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    worker_id VARCHAR(100),
+    progress JSONB,
+    result JSONB,
+    error TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    heartbeat_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+-- Create indexes
+-- Claim order: priority, then age, over queued jobs only
+CREATE INDEX IF NOT EXISTS idx_background_jobs_queued ON worksightdev.background_jobs(priority, created_at) WHERE status = 'queued';
+-- Per-user running counts (concurrency limit, fair share) and stale-job sweeps
+CREATE INDEX IF NOT EXISTS idx_background_jobs_running ON worksightdev.background_jobs(user_id, heartbeat_at) WHERE status = 'running';
+CREATE INDEX IF NOT EXISTS idx_background_jobs_user_created ON worksightdev.background_jobs(user_id, created_at DESC);
@@ -0,0 +1,20 @@
+-- Create geocode_cache table in worksightdev schema
+-- Caches forward (normalized address) and reverse (rounded lat,lng) geocoding results
+-- (coordinates and place ID only, for at most 30 days per Google's caching terms)
+CREATE TABLE IF NOT EXISTS worksightdev.geocode_cache (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    cache_key VARCHAR(64) NOT NULL,
+    direction VARCHAR(10) NOT NULL,
+    query TEXT NOT NULL,
+    status VARCHAR(30) NOT NULL,
+    lat NUMERIC(10, 7),
+    lng NUMERIC(10, 7),
+    place_id VARCHAR(255),
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+-- Create indexes
+CREATE UNIQUE INDEX IF NOT EXISTS idx_geocode_cache_cache_key ON worksightdev.geocode_cache(cache_key);
+CREATE INDEX IF NOT EXISTS idx_geocode_cache_expires_at ON worksightdev.geocode_cache(expires_at);
@@ -0,0 +1,18 @@
+-- Create usage_daily_rollups table in worksightdev schema
+-- Per-user, per-service, per-day totals of usage_logs. Kept current by the
+-- usage recorder on every flush; rebuild with: python backfill_usage_rollups.py
+CREATE TABLE IF NOT EXISTS worksightdev.usage_daily_rollups (
+    user_id UUID NOT NULL REFERENCES worksightdev.users(id) ON DELETE CASCADE,
+    service VARCHAR(50) NOT NULL,
+    day DATE NOT NULL,
+    request_count INTEGER NOT NULL DEFAULT 0,
+    api_calls INTEGER NOT NULL DEFAULT 0,
+    total_tokens BIGINT NOT NULL DEFAULT 0,
+    total_cost NUMERIC(14, 6) NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (user_id, service, day)
+);
+
+-- Create indexes
+CREATE INDEX IF NOT EXISTS idx_usage_daily_rollups_user_day ON worksightdev.usage_daily_rollups(user_id, day);
+CREATE INDEX IF NOT EXISTS idx_usage_daily_rollups_day ON worksightdev.usage_daily_rollups(day);
@@ -0,0 +1,25 @@
+-- Create vlm_result_cache table in worksightdev schema
+-- Caches VLM lead scores keyed by sha256(image_hash:prompt_hash:model)
+CREATE TABLE IF NOT EXISTS worksightdev.vlm_result_cache (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    cache_key VARCHAR(64) NOT NULL,
+    image_hash VARCHAR(64) NOT NULL,
+    prompt_hash VARCHAR(64) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    lead_score INTEGER NOT NULL,
+    confidence INTEGER NOT NULL,
+    reasoning TEXT,
+    observations JSONB,
+    raw_response JSONB,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER,
+    cost NUMERIC(10, 6),
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_hit_at TIMESTAMPTZ
+);
+
+-- Create indexes
+CREATE UNIQUE INDEX IF NOT EXISTS idx_vlm_result_cache_cache_key ON worksightdev.vlm_result_cache(cache_key);
+CREATE INDEX IF NOT EXISTS idx_vlm_result_cache_image_hash ON worksightdev.vlm_result_cache(image_hash);
+CREATE INDEX IF NOT EXISTS idx_vlm_result_cache_created_at ON worksightdev.vlm_result_cache(created_at);
@@ -0,0 +1,8 @@
+-- Stop storing Google geocoder content in worksightdev.geocode_cache
+-- Google's terms allow caching lat/lng for at most 30 days and place IDs
+-- indefinitely; the full response and formatted address are not cached
+ALTER TABLE worksightdev.geocode_cache DROP COLUMN IF EXISTS result;
+ALTER TABLE worksightdev.geocode_cache DROP COLUMN IF EXISTS formatted_address;
+
+-- Remove entries already past their TTL (the app purges these hourly from now on)
+DELETE FROM worksightdev.geocode_cache WHERE expires_at <= NOW();